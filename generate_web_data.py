@@ -1,18 +1,22 @@
 import sys
 import os
 import json
+import argparse
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src_integrated to path
 sys.path.append(os.path.join(os.getcwd(), 'src_integrated'))
 
 from envs.grid_world import GridWorld
+from envs.map_spec import add_map_arguments, map_spec_from_args
 from algorithms.dp.value_iteration import ValueIterationAgent
 from algorithms.dp.policy_iteration import PolicyIterationAgent
 from algorithms.dp.truncated_policy_iteration import TruncatedPolicyIterationAgent
 from algorithms.temporal_difference.q_learning import QLearningAgent
 from algorithms.approximation.td_linear import TDLinearAgent
 from utils.features import FeatureExtractor
+from utils.frame_recorder import FrameRecorder
 
 def serialize_grid(data_dict, rows=5, cols=5):
     """Convert dictionary {(r,c): val} to 2D list."""
@@ -23,11 +27,22 @@ def serialize_grid(data_dict, rows=5, cols=5):
         grid[r][c] = val
     return grid
 
-def get_v_star(env):
-    """Calculate V* using high-precision Value Iteration."""
+def get_v_stars(map_spec, rewards):
+    """
+    V* for each r_forbidden value via high-precision Value Iteration.
+    
+    Only the first reward is solved from scratch; later ones re-plan
+    from the previous V*, touching just the states the change affects.
+    """
+    env = GridWorld(map_spec=map_spec)
+    env.r_forbidden = rewards[0]
     agent = ValueIterationAgent(env, theta=1e-8)
     agent.train()
-    return agent.V
+    v_stars = {rewards[0]: dict(agent.V)}
+    for r_forbidden in rewards[1:]:
+        agent.replan(env.edit(r_forbidden=r_forbidden))
+        v_stars[r_forbidden] = dict(agent.V)
+    return v_stars
 
 def calculate_error(V, V_star):
     """Calculate max absolute error."""
@@ -38,9 +53,26 @@ def calculate_error(V, V_star):
             max_err = err
     return float(max_err)
 
+class FrameHistory:
+    """Per-iteration V and policy grids of a DP run, delta-encoded."""
+    
+    def __init__(self, env):
+        self.env = env
+        self.model = env.get_model()
+        self.values = FrameRecorder()
+        self.policies = FrameRecorder()
+    
+    def record(self, agent):
+        shape = (self.env.rows, self.env.cols)
+        self.values.record(self.model.to_array(agent.V).reshape(shape))
+        self.policies.record(self.model.to_array(agent.policy, dtype=np.uint8).reshape(shape))
+    
+    def result(self, errors):
+        return {"value_frames": self.values, "policy_frames": self.policies, "errors": errors}
+
 def run_vi(env, v_star):
     agent = ValueIterationAgent(env)
-    history = []
+    history = FrameHistory(env)
     errors = []
     
     states = env.get_all_states()
@@ -64,75 +96,58 @@ def run_vi(env, v_star):
         
         agent._derive_policy()
         
-        history.append({
-            "V": serialize_grid(agent.V),
-            "policy": serialize_grid(agent.policy)
-        })
+        history.record(agent)
         errors.append(calculate_error(agent.V, v_star))
         
         if delta < agent.theta:
             break
             
-    return {"frames": history, "errors": errors}
+    return history.result(errors)
 
 def run_pi(env, v_star):
     agent = PolicyIterationAgent(env)
-    history = []
+    history = FrameHistory(env)
     errors = []
     
     while True:
         agent._policy_evaluation()
         policy_stable = agent._policy_improvement()
         
-        history.append({
-            "V": serialize_grid(agent.V),
-            "policy": serialize_grid(agent.policy)
-        })
+        history.record(agent)
         errors.append(calculate_error(agent.V, v_star))
         
         if policy_stable:
             break
-    return {"frames": history, "errors": errors}
+    return history.result(errors)
 
 def run_tpi(env, k, v_star):
     agent = TruncatedPolicyIterationAgent(env, k=k)
-    history = []
+    history = FrameHistory(env)
     errors = []
     
     while True:
-        agent._policy_evaluation(agent.k)
-        policy_stable = agent._policy_improvement()
+        done = agent.iterate()
         
-        history.append({
-            "V": serialize_grid(agent.V),
-            "policy": serialize_grid(agent.policy)
-        })
+        history.record(agent)
         errors.append(calculate_error(agent.V, v_star))
         
-        if policy_stable:
+        if done:
             break
-    return {"frames": history, "errors": errors}
+    result = history.result(errors)
+    result["backups"] = agent.stats.backups
+    return result
 
 def run_q_learning(env, epsilon):
-    agent = QLearningAgent(env)
-    def behavior_policy(agent, state):
-        if np.random.rand() < epsilon:
-            return np.random.choice(agent.actions)
-        else:
-            return agent.predict(state)
-            
-    agent.train(num_episodes=500, behavior_policy=behavior_policy)
+    agent = QLearningAgent(env, q_table='array')
+    agent.train_vectorized(num_episodes=512, num_envs=64, epsilon=epsilon)
     
-    V = {}
-    policy = {}
-    for state in env.get_all_states():
-        q_vals = agent.get_q(state)
-        V[state] = np.max(q_vals)
-        policy[state] = np.argmax(q_vals)
+    model = agent.Q.model
+    V = model.to_dict(agent.Q.state_values())
+    policy = model.to_dict(agent.Q.greedy_actions())
         
     return {
-        "V": serialize_grid(V),
-        "policy": serialize_grid(policy)
+        "V": serialize_grid(V, env.rows, env.cols),
+        "policy": serialize_grid(policy, env.rows, env.cols)
     }
 
 def run_td_linear(env, feature_type, order):
@@ -142,7 +157,7 @@ def run_td_linear(env, feature_type, order):
         elif order == 2: actual_order = 6
         elif order == 3: actual_order = 10
     
-    fe = FeatureExtractor(feature_type=feature_type, order=actual_order)
+    fe = FeatureExtractor(feature_type=feature_type, order=actual_order, grid_size=env.grid_size)
     agent = TDLinearAgent(env, fe)
     agent.train(num_episodes=500)
     
@@ -151,54 +166,173 @@ def run_td_linear(env, feature_type, order):
         V[state] = agent.get_value(state)
         
     return {
-        "V": serialize_grid(V)
+        "V": serialize_grid(V, env.rows, env.cols)
     }
 
-def main():
-    data = {}
+def serialize_env(env):
+    """Layout of the map, so the dashboard does not assume the 5x5 homework grid."""
+    return {
+        "rows": env.rows,
+        "cols": env.cols,
+        "forbidden": [list(s) for s in env.forbidden_states],
+        "targets": [list(s) for s in env.target_states]
+    }
+
+def build_jobs(map_spec, rewards):
+    """
+    List the independent experiments as (path, func, args) jobs.
     
-    for r_forbidden in [-1, -10]:
-        print(f"Processing Reward: {r_forbidden}")
-        env = GridWorld()
-        env.r_forbidden = r_forbidden
-        
-        # Calculate Ground Truth
-        print("  Calculating V*...")
-        v_star = get_v_star(env)
-        
+    path is where the result goes in RL_DATA, e.g. ("-1", "tpi", "9").
+    Jobs needing V* get the string "v_star" in args, resolved per reward.
+    """
+    jobs = []
+    for r_forbidden in rewards:
         key = str(r_forbidden)
-        data[key] = {}
-        
-        print("  Running VI...")
-        data[key]["vi"] = run_vi(env, v_star)
-        
-        print("  Running PI...")
-        data[key]["pi"] = run_pi(env, v_star)
-        
-        print("  Running TPI...")
-        data[key]["tpi"] = {}
-        for k in [3, 9, 27, 81]:
-            print(f"    k={k}")
-            data[key]["tpi"][str(k)] = run_tpi(env, k, v_star)
-        
-        print("  Running Q-Learning...")
-        data[key]["q_learning"] = {}
+        jobs.append(((key, "vi"), run_vi, ("v_star",)))
+        jobs.append(((key, "pi"), run_pi, ("v_star",)))
+        for k in [3, 9, 27, 81, 'adaptive']:
+            jobs.append(((key, "tpi", str(k)), run_tpi, (k, "v_star")))
         for eps in [0.1, 0.2, 0.5]:
-            data[key]["q_learning"][str(eps)] = run_q_learning(env, eps)
-            
-        print("  Running TD-Linear...")
-        data[key]["td_linear"] = {}
+            jobs.append(((key, "q_learning", str(eps)), run_q_learning, (eps,)))
         for order in [1, 2, 3]:
-            data[key]["td_linear"][f"poly_{order}"] = run_td_linear(env, 'polynomial', order)
+            jobs.append(((key, "td_linear", f"poly_{order}"), run_td_linear, ('polynomial', order)))
         for order in [1, 2, 3]:
-            data[key]["td_linear"][f"fourier_{order}"] = run_td_linear(env, 'fourier', order)
+            jobs.append(((key, "td_linear", f"fourier_{order}"), run_td_linear, ('fourier', order)))
+    return jobs
+
+def run_job(map_spec, r_forbidden, v_star, seed, func, args):
+    """Run one job in a fresh env with its own seed; safe to call in a worker process."""
+    np.random.seed(seed)
+    env = GridWorld(map_spec=map_spec)
+    env.r_forbidden = r_forbidden
+    args = [v_star if a == "v_star" else a for a in args]
+    return func(env, *args)
 
-    with open('web/data.js', 'w') as f:
+def expand_frames(node):
+    """Replace FrameRecorders by the {"frames": [{"V", "policy"}, ...]} JSON layout."""
+    if not isinstance(node, dict):
+        return node
+    if "value_frames" in node:
+        frames = [
+            {"V": v.tolist(), "policy": p.tolist()}
+            for v, p in zip(node["value_frames"], node["policy_frames"])
+        ]
+        out = {"frames": frames, "errors": node["errors"]}
+        if "backups" in node:
+            out["backups"] = node["backups"]
+        return out
+    return {k: expand_frames(v) for k, v in node.items()}
+
+def write_js(data, path):
+    """Legacy single-file export: `const RL_DATA = {...};`, works from file://."""
+    data = expand_frames(data)
+    with open(path, 'w') as f:
         f.write("const RL_DATA = ")
         json.dump(data, f)
         f.write(";")
+
+def write_chunk(frames, path, dtype):
+    """Append frames one by one, so a FrameRecorder is never fully expanded."""
+    with open(path, 'wb') as f:
+        for frame in frames:
+            np.asarray(frame, dtype=dtype).tofile(f)
+
+def write_binary(data, out_dir):
+    """
+    Chunked export for the dashboard: a small JSON manifest plus one
+    float32 value chunk and one uint8 policy chunk per experiment.
+    
+    Chunks hold all frames of an experiment as [frames, rows, cols],
+    little-endian and C order, so web/script.js can view them as typed
+    arrays without parsing. Convergence errors stay in the manifest.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    
+    def export(node, path):
+        if "value_frames" in node:
+            values = node["value_frames"]
+            policies = node["policy_frames"]
+            entry = {"kind": "frames", "errors": node["errors"]}
+            if "backups" in node:
+                entry["backups"] = node["backups"]
+        elif "V" in node:
+            values = [node["V"]]
+            policies = [node["policy"]] if "policy" in node else None
+            entry = {"kind": "snapshot"}
+        else:
+            return {k: export(v, path + [k]) for k, v in node.items()}
         
-    print("Done! Data saved to web/data.js")
+        name = "_".join(path)
+        entry["frames"] = len(values)
+        entry["values"] = f"{name}.f32"
+        write_chunk(values, os.path.join(out_dir, entry["values"]), '<f4')
+        entry["policy"] = None
+        if policies is not None:
+            entry["policy"] = f"{name}.u8"
+            write_chunk(policies, os.path.join(out_dir, entry["policy"]), np.uint8)
+        return entry
+    
+    manifest = {
+        "format": 1,
+        "env": data["env"],
+        "entries": {k: export(v, [k]) for k, v in data.items() if k != "env"}
+    }
+    with open(os.path.join(out_dir, "manifest.json"), 'w') as f:
+        json.dump(manifest, f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate web/data.js for the dashboard.")
+    add_map_arguments(parser)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="Worker processes for the experiment jobs (1 runs them in-process)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Base seed; each job gets its own stream derived from it")
+    # data.js is what the published dashboard loads, so it stays the default;
+    # the binary export is for maps too large for one JS file and is not committed
+    parser.add_argument('--format', choices=['binary', 'js'], default='js',
+                        help="js: single web/data.js, the committed data (also works when opening "
+                             "index.html from disk); binary: web/data/manifest.json + typed-array "
+                             "chunks, loaded lazily and preferred by the page when present")
+    args = parser.parse_args()
+    map_spec = map_spec_from_args(args)
+    rewards = [-1, -10]
+    
+    data = {"env": serialize_env(GridWorld(map_spec=map_spec))}
+    
+    # Calculate Ground Truth
+    print(f"Calculating V* for rewards {rewards}...")
+    v_stars = get_v_stars(map_spec, rewards)
+    
+    jobs = build_jobs(map_spec, rewards)
+    # One seed per job, fixed by its position in the job list, so results
+    # do not depend on the number of workers or on scheduling order.
+    seeds = [int(ss.generate_state(1)[0]) for ss in np.random.SeedSequence(args.seed).spawn(len(jobs))]
+    job_args = [
+        (map_spec, int(path[0]), v_stars[int(path[0])], seed, func, fargs)
+        for (path, func, fargs), seed in zip(jobs, seeds)
+    ]
+    
+    print(f"Running {len(jobs)} jobs on {args.workers} worker(s)...")
+    if args.workers == 1:
+        results = [run_job(*a) for a in job_args]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(run_job, *a) for a in job_args]
+            results = [f.result() for f in futures]
+    
+    # Merge in job order so the output is identical for any worker count
+    for (path, _, _), result in zip(jobs, results):
+        node = data
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = result
+
+    if args.format == 'binary':
+        write_binary(data, 'web/data')
+        print("Done! Data saved to web/data/")
+    else:
+        write_js(data, 'web/data.js')
+        print("Done! Data saved to web/data.js")
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,11 @@
-﻿def policy_iteration(env, gamma, theta, initial_policy, track_convergence=False):
+﻿from utils.frame_recorder import FrameRecorder
+
+def policy_iteration(env, gamma, theta, initial_policy, track_convergence=False):
     """策略迭代算法"""
     policy = initial_policy.copy()
     V = {state: 0.0 for state in env.get_all_states()}
     iterations = 0
-    convergence_history = []  # 记录每次外层迭代的状态值
+    convergence_history = FrameRecorder()  # 记录每次外层迭代的状态值
     
     while True:
         iterations += 1
@@ -21,7 +23,7 @@
                 break
         
         if track_convergence:
-            convergence_history.append(V.copy())
+            convergence_history.record(V)
         
         # 策略改进（Policy Improvement）
         policy_stable = True
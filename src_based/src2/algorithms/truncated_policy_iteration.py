@@ -1,9 +1,11 @@
-﻿def truncated_policy_iteration(env, gamma, theta, initial_policy, x_eval_steps, track_convergence=False):
+﻿from utils.frame_recorder import FrameRecorder
+
+def truncated_policy_iteration(env, gamma, theta, initial_policy, x_eval_steps, track_convergence=False):
     """截断式策略迭代算法"""
     policy = initial_policy.copy()
     V = {state: 0.0 for state in env.get_all_states()}
     iterations = 0
-    convergence_history = []  # 记录每次外层迭代的状态值
+    convergence_history = FrameRecorder()  # 记录每次外层迭代的状态值
     
     while True:
         iterations += 1
@@ -16,7 +18,7 @@
                 V[state] = env.get_expected_return(state, action, V, gamma)
         
         if track_convergence:
-            convergence_history.append(V.copy())
+            convergence_history.record(V)
         
         # 策略改进（Policy Improvement）
         policy_stable = True
@@ -1,8 +1,10 @@
-﻿def value_iteration(env, gamma, theta, track_convergence=False):
+﻿from utils.frame_recorder import FrameRecorder
+
+def value_iteration(env, gamma, theta, track_convergence=False):
     """值迭代算法"""
     V = {state: 0.0 for state in env.get_all_states()}
     iterations = 0
-    convergence_history = []  # 记录每次迭代的状态值
+    convergence_history = FrameRecorder()  # 记录每次迭代的状态值
     
     while True:
         delta = 0
@@ -16,7 +18,7 @@
             delta = max(delta, abs(v - V[state]))
         
         if track_convergence:
-            convergence_history.append(V.copy())
+            convergence_history.record(V)
         
         if delta < theta:
             break
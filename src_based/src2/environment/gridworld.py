@@ -18,6 +18,8 @@
         self.r_forbidden = -10
         self.r_target = 1
         self.r_otherstep = 0
+        
+        self._build_predecessor_index()
 
     def get_state_id(self, r, c):
         return r * self.grid_size[1] + c
@@ -76,6 +78,29 @@
         # 普通格子
         return self.r_otherstep
     
+    def _build_predecessor_index(self):
+        """构建反向转移索引（CSR 格式）：状态 s' 的前驱 (s, a) 位于
+        pred_states / pred_actions 的 [pred_indptr[s'], pred_indptr[s'+1]) 区间"""
+        buckets = [[] for _ in range(self.num_states)]
+        for s in range(self.num_states):
+            for a in range(self.num_actions):
+                next_state, _ = self.get_transition_model(s, a)
+                buckets[next_state].append((s, a))
+        
+        self.pred_indptr = [0]
+        self.pred_states = []
+        self.pred_actions = []
+        for bucket in buckets:
+            for s, a in bucket:
+                self.pred_states.append(s)
+                self.pred_actions.append(a)
+            self.pred_indptr.append(len(self.pred_states))
+    
+    def get_predecessors(self, state_id):
+        """返回所有能一步转移到 state_id 的 (状态, 动作) 对"""
+        start, end = self.pred_indptr[state_id], self.pred_indptr[state_id + 1]
+        return list(zip(self.pred_states[start:end], self.pred_actions[start:end]))
+    
     def get_expected_return(self, state_id, action_idx, V, gamma):
         """计算在状态state采取动作action的期望回报（确定性环境）"""
         next_state, _ = self.get_transition_model(state_id, action_idx)
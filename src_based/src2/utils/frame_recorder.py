@@ -0,0 +1,57 @@
+class FrameRecorder:
+    """
+    收敛过程记录器：按关键帧 + 稀疏增量存储每次迭代的状态值字典。
+
+    每一帧只保存相对上一帧发生变化的状态及其新值，每隔 keyframe_interval
+    帧保存一次完整的关键帧。读取时从最近的关键帧开始回放增量重建，
+    内存开销随变化的状态数增长，而不是 迭代次数 × |S|。
+
+    对外表现为一个由字典组成的列表（len、下标、迭代），可直接作为
+    visualizer 中的 convergence_history 使用。
+    """
+
+    def __init__(self, keyframe_interval=50):
+        self.keyframe_interval = keyframe_interval
+        self._frames = []      # 每帧：(是否关键帧, 字典)
+        self._keyframes = []   # 关键帧在 _frames 中的下标
+        self._last = None
+
+    def record(self, V):
+        """记录一帧（会复制 V，调用方可继续原地修改）"""
+        since_key = len(self._frames) - self._keyframes[-1] if self._keyframes else None
+        if since_key is not None and since_key < self.keyframe_interval:
+            delta = {s: v for s, v in V.items() if self._last.get(s) != v}
+            if len(delta) < len(V):
+                self._frames.append((False, delta))
+                self._last.update(delta)
+                return
+
+        self._keyframes.append(len(self._frames))
+        self._frames.append((True, dict(V)))
+        self._last = dict(V)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __getitem__(self, i):
+        n = len(self._frames)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("frame index out of range")
+
+        # 找到 i 之前（含）最近的关键帧，再依次应用增量
+        k = max(j for j in self._keyframes if j <= i)
+        frame = dict(self._frames[k][1])
+        for j in range(k + 1, i + 1):
+            frame.update(self._frames[j][1])
+        return frame
+
+    def __iter__(self):
+        frame = None
+        for is_key, data in self._frames:
+            if is_key:
+                frame = dict(data)
+            else:
+                frame.update(data)
+            yield dict(frame)
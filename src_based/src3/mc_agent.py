@@ -1,17 +1,20 @@
 import numpy as np
 
 class MCAgent:
-    def __init__(self, env, epsilon=0.1, gamma=0.9, alpha=0.01):
+    def __init__(self, env, epsilon=0.1, gamma=0.9, alpha=0.01, first_visit=False):
         self.env = env
         self.epsilon = epsilon
         self.gamma = gamma
-        self.alpha = alpha # Learning rate
+        self.alpha = alpha # Learning rate, or 'mean' for 1/N(s, a) (sample average)
+        self.first_visit = first_visit # Only update at the first visit of (s, a) in an episode
         self.num_states = env.rows * env.cols
         self.num_actions = len(env.actions)
         
         # Q-values: (num_states, num_actions)
         # Initialize with zeros (or small random values if needed, but zeros is standard for this)
         self.Q = np.zeros((self.num_states, self.num_actions))
+        # Visit counts N(s, a) for alpha='mean'
+        self.N = np.zeros((self.num_states, self.num_actions), dtype=int)
         
         # For policy extraction
         self.policy = np.zeros((self.num_states, self.num_actions))
@@ -72,16 +75,35 @@ class MCAgent:
         return episode
 
     def update(self, episode):
-        G = 0
-        # First-visit or Every-visit?
-        # For constant alpha, Every-visit is natural and simpler.
+        states, actions, rewards = (np.array(x) for x in zip(*episode))
+        
+        # Returns G_t, computed backwards
+        G = np.zeros(len(episode))
+        g = 0
         for t in range(len(episode) - 1, -1, -1):
-            state_idx, action, reward = episode[t]
-            G = self.gamma * G + reward
+            g = self.gamma * g + rewards[t]
+            G[t] = g
+        
+        # Which time steps to update: all of them (every-visit), or only
+        # the first occurrence of each (s, a) pair (first-visit)
+        if self.first_visit:
+            pairs = states * self.num_actions + actions
+            _, first = np.unique(pairs, return_index=True)
+            mask = np.zeros(len(episode), dtype=bool)
+            mask[first] = True
+        else:
+            mask = np.ones(len(episode), dtype=bool)
+        
+        steps = zip(states.tolist(), actions.tolist(), G.tolist(), mask.tolist())
+        for state_idx, action, g, update in reversed(list(steps)):
+            if not update:
+                continue
+            self.N[state_idx, action] += 1
+            step = 1.0 / self.N[state_idx, action] if self.alpha == 'mean' else self.alpha
             
             # Update Q
-            # Q(S, A) <- Q(S, A) + alpha * (G - Q(S, A))
-            self.Q[state_idx, action] += self.alpha * (G - self.Q[state_idx, action])
+            # Q(S, A) <- Q(S, A) + step * (G - Q(S, A))
+            self.Q[state_idx, action] += step * (g - self.Q[state_idx, action])
 
     def get_optimal_policy_map(self):
         # Returns a grid of best actions and values
@@ -23,32 +23,27 @@ def compute_ground_truth(env, gamma=0.9, theta=1e-6):
             
     return V
 
-def generate_episodes(env, num_episodes=500, steps_per_episode=500):
+def generate_episodes(env, num_episodes=500, steps_per_episode=500, seed=None):
+    """
+    seed: numpy.random.default_rng 的种子, 相同种子生成相同的轨迹。
+    """
     episodes = []
     states = env.get_all_states()
     
-    for _ in range(num_episodes):
+    # 所有随机数一次性抽取, 避免每步调用一次 np.random
+    # 随机起始状态
+    rng = np.random.default_rng(seed)
+    start_idx = rng.integers(len(states), size=num_episodes).tolist()
+    # 每条轨迹的全部动作: 第一步是随机起始动作 (根据提示 "随机状态-动作对"),
+    # 之后的策略是均匀随机的, 所以同样是均匀抽取
+    action_idx = rng.integers(len(env.actions), size=(num_episodes, steps_per_episode)).tolist()
+    
+    for s_idx, actions in zip(start_idx, action_idx):
         episode = []
-        # 随机起始状态
-        s_idx = np.random.randint(len(states))
         curr_s = states[s_idx]
         
-        # 随机起始动作 (根据提示 "随机状态-动作对")
-        # 实际上, 我们只需要执行这第一个动作。
-        # 但随后的动作遵循策略。
-        # 让我们模拟轨迹。
-        
-        # 第一步: 随机动作
-        a_start = np.random.choice(env.actions)
-        next_s, r = env.step(curr_s, a_start)
-        episode.append((curr_s, r, next_s))
-        curr_s = next_s
-        
-        # 剩余步骤
-        for _ in range(steps_per_episode - 1):
-            # 策略是均匀随机的
-            a = np.random.choice(env.actions)
-            next_s, r = env.step(curr_s, a)
+        for a_idx in actions:
+            next_s, r = env.step(curr_s, env.actions[a_idx])
             episode.append((curr_s, r, next_s))
             curr_s = next_s
             
@@ -3,8 +3,8 @@ from core.base_agent import BaseAgent
 from .sgd_optimizer import SGDOptimizer
 
 class TDLinearAgent(BaseAgent):
-    def __init__(self, env, feature_extractor, gamma=0.9, optimizer=None):
-        super().__init__(env)
+    def __init__(self, env, feature_extractor, gamma=0.9, optimizer=None, seed=None):
+        super().__init__(env, seed)
         self.feature_extractor = feature_extractor
         self.gamma = gamma
         self.w = np.zeros(feature_extractor.get_feature_dim())
@@ -32,6 +32,7 @@ class TDLinearAgent(BaseAgent):
                 if val > best_val:
                     best_val = val
                     best_action = action_idx
+            self.stats.model_calls += len(self.env.action_space)
             return best_action
         else:
             raise NotImplementedError("Prediction requires a model for Value-based agents")
@@ -46,14 +47,17 @@ class TDLinearAgent(BaseAgent):
             state = self.env.reset()
             done = False
             steps = 0
-            while not done and steps < max_steps:
-                steps += 1
-                # Random policy for evaluation (as per HW6 usually)
-                action = np.random.choice(self.env.action_space)
-                next_state, reward, done, _ = self.env.step(action)
-                
-                self.update(state, reward, next_state)
-                state = next_state
+            with self.stats.phase('episodes'):
+                while not done and steps < max_steps:
+                    steps += 1
+                    # Random policy for evaluation (as per HW6 usually)
+                    action = self.rng.choice(self.env.action_space)
+                    next_state, reward, done, _ = self.env.step(action)
+                    
+                    self.update(state, reward, next_state)
+                    state = next_state
+            self.stats.env_steps += steps
+            self.stats.updates += steps
 
     def update(self, state, reward, next_state):
         phi_s = self.feature_extractor.get_features(state)
@@ -1,63 +1,93 @@
 import numpy as np
+from algorithms.dp import vectorized
 
-def solve_closed_form(env, policy=None, gamma=0.9):
+# Above this many states 'auto' switches to the sparse path. A dense P
+# needs 8 * n^2 bytes (80 MB at n = 10^4) and np.linalg.solve is O(n^3).
+DENSE_MAX_STATES = 2000
+
+def solve_closed_form(env, policy=None, gamma=0.9, method='auto'):
     """
     Evaluate a policy using the closed-form solution: V = (I - gamma * P)^-1 * R
-    
+
     Args:
         env: The GridWorld environment.
-        policy: A dictionary {state: action}, a function mapping state to action, 
+        policy: A dictionary {state: action}, a function mapping state to action,
                 or None for Uniform Random Policy.
         gamma: Discount factor.
-        
+        method: 'dense' (np.linalg.solve), 'sparse' (scipy.sparse CSR with a
+                direct solver, GMRES if that fails), or 'auto' to pick 'dense'
+                for small state spaces. 'sparse' falls back to 'dense' when
+                scipy is not installed.
+
     Returns:
         V: Dictionary mapping state -> value.
     """
-    states = env.get_all_states()
-    n = len(states)
-    state_to_idx = {s: i for i, s in enumerate(states)}
-    
+    model = env.get_model()
+    states = model.states
+    n = model.n_states
+
+    if policy is None:
+        # Uniform Random Policy
+        actions = None
+    elif isinstance(policy, dict):
+        # Deterministic Policy
+        actions = np.array([policy.get(s) for s in states], dtype=int)
+    elif callable(policy):
+        actions = np.array([policy(s) for s in states], dtype=int)
+    else:
+        raise ValueError("Policy must be a dict, callable, or None")
+
+    if method == 'auto':
+        method = 'dense' if n <= DENSE_MAX_STATES else 'sparse'
+
+    V_vec = None
+    if method == 'sparse':
+        V_vec = _solve_sparse(model, actions, gamma)
+    elif method != 'dense':
+        raise ValueError(f"Unknown method: {method}")
+
+    if V_vec is None:
+        V_vec = _solve_dense(model, actions, gamma)
+
+    return model.to_dict(V_vec)
+
+def _solve_dense(model, actions, gamma):
+    n = model.n_states
+    rows, cols, probs, R = vectorized.policy_transition_triplets(model, actions)
     P = np.zeros((n, n))
-    R = np.zeros(n)
-    
-    for s in states:
-        s_idx = state_to_idx[s]
-        
-        if policy is None:
-            # Uniform Random Policy
-            actions = env.action_space
-            prob = 1.0 / len(actions)
-            for action in actions:
-                next_state, reward = env.get_transition_model(s, action)
-                ns_idx = state_to_idx[next_state]
-                P[s_idx, ns_idx] += prob
-                R[s_idx] += prob * reward
-        else:
-            # Deterministic Policy
-            if isinstance(policy, dict):
-                action = policy.get(s)
-            elif callable(policy):
-                action = policy(s)
-            else:
-                raise ValueError("Policy must be a dict, callable, or None")
-                
-            # Get transition dynamics
-            next_state, reward = env.get_transition_model(s, action)
-            ns_idx = state_to_idx[next_state]
-            
-            P[s_idx, ns_idx] = 1.0
-            R[s_idx] = reward
-        
+    np.add.at(P, (rows, cols), probs)
+
     # Solve (I - gamma * P) * V = R
     I = np.eye(n)
     A = I - gamma * P
-    
+
     # V = A^-1 * R
     try:
-        V_vec = np.linalg.solve(A, R)
+        return np.linalg.solve(A, R)
     except np.linalg.LinAlgError:
         # Fallback if singular
-        V_vec = np.linalg.lstsq(A, R, rcond=None)[0]
-        
-    V = {s: V_vec[state_to_idx[s]] for s in states}
-    return V
+        return np.linalg.lstsq(A, R, rcond=None)[0]
+
+def _solve_sparse(model, actions, gamma):
+    """Returns V, or None if scipy is unavailable."""
+    try:
+        import scipy.sparse as sp
+        from scipy.sparse.linalg import spsolve, gmres
+    except ImportError:
+        return None
+
+    P, R = vectorized.policy_transition_matrix(model, actions)
+    A = (sp.identity(model.n_states, format='csr') - gamma * P).tocsc()
+
+    V_vec = spsolve(A, R)
+    if np.all(np.isfinite(V_vec)):
+        return V_vec
+
+    # Direct factorization failed; A is strictly diagonally dominant for
+    # gamma < 1, so a Krylov method converges.
+    try:
+        V_vec, _ = gmres(A, R, rtol=1e-10, atol=0.0)
+    except TypeError:
+        # SciPy < 1.12 names the relative tolerance `tol`
+        V_vec, _ = gmres(A, R, tol=1e-10, atol=0.0)
+    return V_vec
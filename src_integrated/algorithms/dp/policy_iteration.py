@@ -1,11 +1,29 @@
 import numpy as np
 from core.base_agent import BaseAgent
+from core.instrumentation import timed
+from algorithms.dp import vectorized
 
 class PolicyIterationAgent(BaseAgent):
-    def __init__(self, env, gamma=0.9, theta=1e-4):
+    def __init__(self, env, gamma=0.9, theta=1e-4, backend='python', eval_method='solve', omega=1.0):
+        """
+        Args:
+            env: The environment.
+            gamma: Discount factor.
+            theta: Convergence threshold for policy evaluation.
+            backend: 'python' for in-place sweeps over the state dict, or
+                     'numpy' for matrix-form evaluation over env.get_model().
+            eval_method: Policy evaluation for the 'numpy' backend, 'solve'
+                         (sparse linear solve), 'sweep' (vectorized sweeps),
+                         'sor' (red-black over-relaxation) or 'anderson'
+                         (Anderson-accelerated sweeps); see vectorized.py.
+            omega: Relaxation factor for eval_method='sor'.
+        """
         super().__init__(env)
         self.gamma = gamma
         self.theta = theta
+        self.backend = backend
+        self.eval_method = eval_method
+        self.omega = omega
         self.V = {state: 0.0 for state in env.get_all_states()}
         # Initialize random policy
         self.policy = {state: np.random.choice(env.action_space) for state in env.get_all_states()}
@@ -16,6 +34,11 @@ class PolicyIterationAgent(BaseAgent):
         Args:
             v_star: Optimal value function (dict) for error calculation.
         """
+        if self.backend == 'numpy':
+            return self._train_vectorized(v_star)
+        elif self.backend != 'python':
+            raise ValueError(f"Unknown backend: {self.backend}")
+
         iteration = 0
         history = [] 
         
@@ -38,8 +61,102 @@ class PolicyIterationAgent(BaseAgent):
         
         return self.V, self.policy, history
 
-    def _policy_evaluation(self):
-        states = self.env.get_all_states()
+    def _train_vectorized(self, v_star=None):
+        model = self.env.get_model()
+        V = model.to_array(self.V)
+        policy = model.to_array(self.policy, dtype=int)
+        v_star_arr = model.to_array(v_star) if v_star else None
+        history = []
+        # Iterative evaluations are only accurate to about theta. SOR's error
+        # also changes sign between iterations, so without this tolerance
+        # actions with tied Q-values keep swapping and the loop never ends.
+        tol = 1e-12 if self.eval_method == 'solve' else self.theta
+        
+        while True:
+            with self.stats.phase('evaluation'):
+                V, sweeps = vectorized.policy_evaluation(
+                    model, policy, self.gamma, self.theta, V=V, method=self.eval_method, omega=self.omega
+                )
+            with self.stats.phase('improvement'):
+                policy, policy_stable = vectorized.policy_improvement(model, V, self.gamma, policy, tol)
+            # A direct solve reports one sweep
+            self.stats.backups += (sweeps + 1) * model.n_states
+            
+            if v_star_arr is not None:
+                history.append(float(np.max(np.abs(V - v_star_arr))))
+            else:
+                history.append(float(V.sum()))
+            
+            if policy_stable:
+                break
+        
+        self.V = model.to_dict(V)
+        self.policy = model.to_dict(policy)
+        return self.V, self.policy, history
+
+    def replan(self, changed_states, v_star=None):
+        """
+        Re-converge after an environment edit, starting from the current V
+        and policy.
+
+        Under the old policy, V can only change at states whose action
+        chain runs into a changed state, so the first evaluation is limited
+        to those before the regular loop resumes. The loop then starts from
+        an evaluated V, so its first evaluation converges in a sweep or so;
+        only the numpy backend with eval_method='solve' still does one full
+        linear solve there.
+        Args:
+            changed_states: States returned by env.edit(...).
+            v_star: Optimal value function (dict) for error calculation.
+        """
+        upstream = self._upstream_states(changed_states)
+        if self.backend == 'numpy':
+            self._restricted_evaluation_vectorized(upstream)
+        else:
+            self._policy_evaluation(upstream)
+        return self.train(v_star)
+
+    @timed('evaluation')
+    def _restricted_evaluation_vectorized(self, states):
+        """Vectorized sweeps over the given states only, all other values fixed."""
+        model = self.env.get_model()
+        ids = np.array([model.state_to_idx[s] for s in states], dtype=np.int64)
+        next_state, reward = vectorized.policy_transition(model, model.to_array(self.policy, dtype=int))
+        next_state, reward = next_state[ids], reward[ids]
+        V = model.to_array(self.V)
+        
+        while True:
+            V_new = reward + self.gamma * V[next_state]
+            delta = float(np.max(np.abs(V_new - V[ids]), initial=0.0))
+            V[ids] = V_new
+            self.stats.backups += len(ids)
+            if delta < self.theta:
+                break
+        self.V = model.to_dict(V)
+
+    def _upstream_states(self, changed_states):
+        """States whose path under the current policy reaches a changed state."""
+        model = self.env.get_model()
+        indptr = model.pred_indptr.tolist()
+        pred_state = model.pred_state.tolist()
+        pred_action = model.pred_action.tolist()
+        policy = model.to_array(self.policy, dtype=int).tolist()
+        
+        seen = {model.state_to_idx[s] for s in changed_states}
+        stack = list(seen)
+        while stack:
+            s2 = stack.pop()
+            for k in range(indptr[s2], indptr[s2 + 1]):
+                s = pred_state[k]
+                if policy[s] == pred_action[k] and s not in seen:
+                    seen.add(s)
+                    stack.append(s)
+        return [model.states[i] for i in sorted(seen)]
+
+    @timed('evaluation')
+    def _policy_evaluation(self, states=None):
+        if states is None:
+            states = self.env.get_all_states()
         max_delta = 0
         
         while True:
@@ -51,11 +168,14 @@ class PolicyIterationAgent(BaseAgent):
                 self.V[state] = reward + self.gamma * self.V[next_state]
                 delta = max(delta, abs(v - self.V[state]))
             
+            self.stats.backups += len(states)
+            self.stats.model_calls += len(states)
             max_delta = max(max_delta, delta)
             if delta < self.theta:
                 break
         return max_delta
 
+    @timed('improvement')
     def _policy_improvement(self):
         policy_stable = True
         states = self.env.get_all_states()
@@ -80,7 +200,9 @@ class PolicyIterationAgent(BaseAgent):
             
             if old_action != self.policy[state]:
                 policy_stable = False
-                
+        
+        self.stats.backups += len(states)
+        self.stats.model_calls += len(states) * len(actions)
         return policy_stable
 
     def predict(self, state):
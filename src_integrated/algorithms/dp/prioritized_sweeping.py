@@ -0,0 +1,144 @@
+import heapq
+import numpy as np
+from core.base_agent import BaseAgent
+from algorithms.dp import vectorized
+
+def prioritized_sweep(model, V, gamma=0.9, theta=1e-4, states=None, max_backups=None):
+    """
+    Back up states one at a time in order of their Bellman residual
+    |max_a [r + gamma * V(s')] - V(s)| until no residual exceeds theta.
+
+    Actions that keep s in place (the target's 'stay', wall bumps) are
+    valued at r / (1 - gamma), their exact value when repeated forever,
+    as in vectorized._jacobi_terms(). Otherwise such states would only
+    converge at rate gamma, one pop (and predecessor recheck) at a time.
+    The fixed point is unchanged: V*(s) is the larger of the best
+    self-loop value and the best action leaving s.
+
+    After a backup only the predecessors of the updated state can change
+    their residual, so only those are re-examined.
+
+    Args:
+        model: TabularModel of the environment.
+        V: Initial value array [S].
+        gamma: Discount factor.
+        theta: Only states with a residual above theta are backed up.
+        states: Optional state ids to seed the queue with. By default every
+                state is checked; pass the states touched by an edit when V
+                was already converged elsewhere.
+        max_backups: Optional cap on the number of backups.
+
+    Returns:
+        V: Value array [S].
+        backups: Bellman evaluations max_a [r + gamma * V(s')] performed:
+                 the initial residual of every seed state, the update of
+                 every popped state and the residual recomputed for each of
+                 its predecessors. This is the unit VI's sweeps are counted
+                 in (S per sweep), so the two can be compared on work done.
+    """
+    V0 = np.array(V, dtype=float)
+    seeds = np.arange(model.n_states) if states is None else np.asarray(states, dtype=np.int64)
+    # Q(s, a) = reward + discount * V(s'), with self-loops solved exactly
+    loop = model.next_state == np.arange(model.n_states)[:, None]
+    reward = np.where(loop, model.reward / (1.0 - gamma), model.reward)
+    discount = np.where(loop, 0.0, gamma)
+    q = reward[seeds] + discount[seeds] * V0[model.next_state[seeds]]
+    residual = np.abs(q.max(axis=1) - V0[seeds])
+
+    # Plain lists: the loop touches a few entries at a time, where
+    # NumPy scalar indexing costs more than it saves.
+    next_state = model.next_state.tolist()
+    reward = reward.tolist()
+    discount = discount.tolist()
+    predecessors = _predecessor_lists(model)
+    V = V0.tolist()
+    priority = [0.0] * model.n_states
+    heap = []
+    for s, p in zip(seeds.tolist(), residual.tolist()):
+        if p > theta:
+            priority[s] = p
+            heap.append((-p, s))
+    heapq.heapify(heap)
+
+    def bellman(s):
+        return max(r + g * V[s2] for s2, r, g in zip(next_state[s], reward[s], discount[s]))
+
+    backups = len(seeds)
+    while heap and (max_backups is None or backups < max_backups):
+        neg_p, s = heapq.heappop(heap)
+        if -neg_p != priority[s]:
+            continue # stale entry, s was re-queued with a newer residual
+
+        v = bellman(s)
+        priority[s] = 0.0
+        backups += 1
+        if v == V[s]:
+            continue
+        V[s] = v
+
+        backups += len(predecessors[s])
+        for p in predecessors[s]:
+            res = abs(bellman(p) - V[p])
+            if res > theta:
+                priority[p] = res
+                heapq.heappush(heap, (-res, p))
+            else:
+                priority[p] = 0.0
+
+    return np.array(V), backups
+
+def _predecessor_lists(model):
+    """
+    preds[s'] = distinct states s != s' with next_state[s, a] == s' for some a.
+    s' itself is left out: with self-loops solved exactly its own backup
+    does not depend on V(s').
+    """
+    indptr = model.pred_indptr.tolist()
+    pred_state = model.pred_state.tolist()
+    # dict.fromkeys drops repeats (e.g. several actions bumping into a wall)
+    return [[s for s in dict.fromkeys(pred_state[indptr[i]:indptr[i + 1]]) if s != i]
+            for i in range(model.n_states)]
+
+class PrioritizedSweepingAgent(BaseAgent):
+    """
+    Asynchronous value iteration driven by prioritized_sweep().
+
+    States whose residual is below theta are never backed up, which on
+    sparse-reward maps leaves most of the grid untouched until the value
+    frontier reaches it. Self-loop actions are valued exactly (see
+    prioritized_sweep()), so the target and wall-adjacent cells settle in
+    one backup instead of a geometric series of them.
+    """
+
+    def __init__(self, env, gamma=0.9, theta=1e-4, max_backups=None):
+        """
+        Args:
+            env: The environment.
+            gamma: Discount factor.
+            theta: Only states with a Bellman residual above theta are backed up.
+            max_backups: Optional cap on the number of backups
+                         (Bellman evaluations, see prioritized_sweep()).
+        """
+        super().__init__(env)
+        self.gamma = gamma
+        self.theta = theta
+        self.max_backups = max_backups
+        self.V = {state: 0.0 for state in env.get_all_states()}
+        self.policy = {} # state -> action_idx
+
+    def train(self):
+        """
+        Executes prioritized sweeping until every residual is at most theta.
+        """
+        model = self.env.get_model()
+        with self.stats.phase('sweeps'):
+            V, backups = prioritized_sweep(
+                model, model.to_array(self.V), self.gamma, self.theta, max_backups=self.max_backups
+            )
+        self.stats.backups += backups
+        self.V = model.to_dict(V)
+        self.policy = model.to_dict(vectorized.greedy_policy(model, V, self.gamma))
+        return self.V, self.policy
+
+    def predict(self, state):
+        return self.policy.get(state, 0) # Default to 0 if not found
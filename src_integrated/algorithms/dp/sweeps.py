@@ -0,0 +1,167 @@
+"""
+Bellman sweeps on a TabularModel with a selectable update ordering.
+
+The same engine backs value iteration (max over actions), evaluation of a
+deterministic policy and evaluation of the uniform random policy, so
+orderings can be compared on equal terms:
+
+    jacobi           every state from the previous sweep's values (vectorized)
+    gauss_seidel     in place, one state at a time in state-id (row-major) order
+    red_black        checkerboard: all (r + c) even cells, then all odd cells,
+                     each half vectorized and written back before the next
+    target_distance  in place, one state at a time, nearest to a target first
+"""
+import time
+from collections import deque
+import numpy as np
+
+ORDERINGS = ('jacobi', 'gauss_seidel', 'red_black', 'target_distance')
+
+def run_sweeps(model, gamma=0.9, theta=1e-4, policy='optimal', ordering='jacobi',
+               V=None, max_iter=None, targets=None):
+    """
+    Repeat Bellman sweeps until max_s |V_new(s) - V(s)| < theta.
+
+    Args:
+        model: TabularModel of the environment.
+        gamma: Discount factor.
+        theta: Convergence threshold on the per-sweep residual.
+        policy: 'optimal' for value iteration, None for the uniform random
+                policy, or a deterministic action array [S].
+        ordering: One of ORDERINGS.
+        V: Optional initial value array [S]. Defaults to zeros.
+        max_iter: Optional cap on the number of sweeps.
+        targets: State ids the 'target_distance' ordering measures from.
+                 Defaults to the states reached with the highest reward.
+
+    Returns:
+        V: Value array [S].
+        history: {"residual": [...], "time": [...]} per sweep, time being
+                 the wall-clock seconds elapsed since the first sweep began.
+    """
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Unknown ordering: {ordering}")
+    mode = _backup_mode(policy)
+    V = np.zeros(model.n_states) if V is None else np.array(V, dtype=float)
+    if ordering in ('jacobi', 'red_black'):
+        blocks = [np.arange(model.n_states)] if ordering == 'jacobi' else checkerboard_blocks(model)
+        sweep = _block_sweep(model, gamma, policy, mode, blocks)
+    else:
+        order = np.arange(model.n_states)
+        if ordering == 'target_distance':
+            order = target_distance_order(model, targets)
+        sweep = _sequential_sweep(model, gamma, policy, mode, order)
+
+    history = {"residual": [], "time": []}
+    start = time.perf_counter()
+    while max_iter is None or len(history["residual"]) < max_iter:
+        V, delta = sweep(V)
+        history["residual"].append(delta)
+        history["time"].append(time.perf_counter() - start)
+        if delta < theta:
+            break
+    return V, history
+
+def compare_orderings(model, gamma=0.9, theta=1e-4, policy='optimal', orderings=ORDERINGS, **kwargs):
+    """
+    Run every ordering from the same start and return {ordering: history}.
+    Extra keyword arguments are passed to run_sweeps().
+    """
+    return {
+        ordering: run_sweeps(model, gamma, theta, policy, ordering, **kwargs)[1]
+        for ordering in orderings
+    }
+
+def target_distance_order(model, targets=None):
+    """
+    State ids sorted by the number of steps needed to reach a target
+    (breadth-first over the predecessor index); unreachable states last.
+    """
+    if targets is None:
+        best = model.reward.max()
+        targets = np.unique(model.next_state[model.reward == best])
+    indptr = model.pred_indptr.tolist()
+    pred_state = model.pred_state.tolist()
+
+    dist = [-1] * model.n_states
+    queue = deque()
+    for t in np.asarray(targets).tolist():
+        dist[t] = 0
+        queue.append(t)
+    while queue:
+        s2 = queue.popleft()
+        for s in pred_state[indptr[s2]:indptr[s2 + 1]]:
+            if dist[s] < 0:
+                dist[s] = dist[s2] + 1
+                queue.append(s)
+
+    dist = np.array(dist)
+    dist[dist < 0] = model.n_states
+    return np.argsort(dist, kind='stable')
+
+def _backup_mode(policy):
+    if isinstance(policy, str):
+        if policy != 'optimal':
+            raise ValueError(f"Unknown policy: {policy}")
+        return 'max'
+    return 'mean' if policy is None else 'policy'
+
+def checkerboard_blocks(model):
+    """State ids of the (r + c) even and the (r + c) odd cells of a grid."""
+    parity = np.array([(r + c) % 2 for r, c in model.states])
+    return [np.flatnonzero(parity == 0), np.flatnonzero(parity == 1)]
+
+def _block_sweep(model, gamma, policy, mode, blocks):
+    """Sweep that updates each block of states at once, block after block."""
+    # Per block: the successor and reward tables restricted to it
+    tables = []
+    for idx in blocks:
+        if mode != 'policy':
+            tables.append((idx, model.next_state[idx], model.reward[idx]))
+        else:
+            a = np.asarray(policy)[idx]
+            tables.append((idx, model.next_state[idx, a], model.reward[idx, a]))
+
+    def sweep(V):
+        delta = 0.0
+        for idx, next_state, reward in tables:
+            new = reward + gamma * V[next_state]
+            if mode == 'max':
+                new = new.max(axis=1)
+            elif mode == 'mean':
+                new = new.mean(axis=1)
+            delta = max(delta, float(np.max(np.abs(new - V[idx]))))
+            if len(tables) == 1:
+                return new, delta
+            V[idx] = new
+        return V, delta
+
+    return sweep
+
+def _sequential_sweep(model, gamma, policy, mode, order):
+    """In-place sweep over the states in the given order, in plain Python."""
+    order = np.asarray(order).tolist()
+    if mode != 'policy':
+        next_state = model.next_state.tolist()
+        reward = model.reward.tolist()
+        reduce = max if mode == 'max' else (lambda q: sum(q) / len(q))
+    else:
+        s_idx = np.arange(model.n_states)
+        a = np.asarray(policy)
+        next_state = model.next_state[s_idx, a].tolist()
+        reward = model.reward[s_idx, a].tolist()
+        reduce = None
+
+    def sweep(V):
+        V = V.tolist()
+        delta = 0.0
+        for s in order:
+            if reduce is None:
+                v = reward[s] + gamma * V[next_state[s]]
+            else:
+                v = reduce([r + gamma * V[s2] for s2, r in zip(next_state[s], reward[s])])
+            delta = max(delta, abs(v - V[s]))
+            V[s] = v
+        return np.array(V), delta
+
+    return sweep
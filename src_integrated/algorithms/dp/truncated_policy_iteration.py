@@ -1,22 +1,43 @@
 import numpy as np
 from core.base_agent import BaseAgent
+from core.instrumentation import timed
+from algorithms.dp import vectorized
 
 class TruncatedPolicyIterationAgent(BaseAgent):
-    def __init__(self, env, gamma=0.9, theta=1e-4, k=10):
+    def __init__(self, env, gamma=0.9, theta=1e-4, k=10, eval_method='sweep', omega=1.0, k_max=1000):
         """
         Args:
             env: The environment.
             gamma: Discount factor.
             theta: Convergence threshold for early stopping (optional).
-            k: Number of policy evaluation steps per iteration.
+            k: Number of policy evaluation steps per iteration, or
+               'adaptive' to choose it per iteration (see _adaptive_tol()).
+            eval_method: 'sweep' for in-place sweeps over the state dict, or
+                         'sor' / 'anderson' for k accelerated sweeps over
+                         env.get_model() (see vectorized.policy_evaluation()).
+            omega: Relaxation factor for eval_method='sor'.
+            k_max: Cap on evaluation sweeps per iteration when k='adaptive'.
         """
+        if k != 'adaptive' and k < 1:
+            raise ValueError(f"k must be a positive number of sweeps or 'adaptive', got {k}")
+        if k_max < 1:
+            raise ValueError(f"k_max must be at least 1, got {k_max}")
         super().__init__(env)
         self.gamma = gamma
         self.theta = theta
         self.k = k
+        self.eval_method = eval_method
+        self.omega = omega
+        self.k_max = k_max
         self.V = {state: 0.0 for state in env.get_all_states()}
         # Initialize random policy
         self.policy = {state: np.random.choice(env.action_space) for state in env.get_all_states()}
+        
+        # Per-iteration detail; totals are in self.stats
+        self.sweeps_per_iteration = []
+        self.eval_residual = None     # last sweep's max |V_new - V|
+        self.bellman_residual = None  # max_s |max_a Q(s, a) - V(s)| at the last improvement
+        self.n_changed = None         # actions changed by the last improvement
 
     def train(self, v_star=None):
         """
@@ -29,8 +50,7 @@ class TruncatedPolicyIterationAgent(BaseAgent):
         
         while True:
             iteration += 1
-            self._policy_evaluation(self.k)
-            policy_stable = self._policy_improvement()
+            done = self.iterate()
             
             if v_star:
                 # Calculate Max Error ||V - V*||_inf
@@ -41,14 +61,52 @@ class TruncatedPolicyIterationAgent(BaseAgent):
                 total_value = sum(self.V.values())
                 history.append(total_value)
             
-            if policy_stable:
+            if done:
                 break
         
         return self.V, self.policy, history
 
-    def _policy_evaluation(self, k):
+    def iterate(self):
+        """
+        One truncated evaluation followed by one improvement.
+        Returns:
+            done: True once the policy is stable (and, in adaptive mode,
+                  its evaluation has converged to theta).
+        """
+        if self.k == 'adaptive':
+            self._policy_evaluation(self.k_max, tol=self._adaptive_tol())
+        else:
+            self._policy_evaluation(self.k)
+        policy_stable = self._policy_improvement()
+        if self.k == 'adaptive':
+            return policy_stable and self.eval_residual < self.theta
+        return policy_stable
+
+    def _adaptive_tol(self):
+        """
+        Evaluation target for the next iteration.
+
+        Evaluating precisely is wasted while the policy is still changing
+        a lot, so the sweeps stop once the residual has dropped below
+        (fraction of states whose action just changed) * Bellman residual.
+        The first iteration gets a single sweep, and a stable policy is
+        evaluated down to theta.
+        """
+        if self.bellman_residual is None:
+            return float('inf')
+        fraction = min(0.5, self.n_changed / len(self.V))
+        return max(self.theta, fraction * self.bellman_residual)
+
+    @timed('evaluation')
+    def _policy_evaluation(self, k, tol=None):
+        """At most k sweeps, stopping early once a sweep changes V by less than tol (default theta)."""
+        tol = self.theta if tol is None else tol
+        if self.eval_method != 'sweep':
+            return self._policy_evaluation_accelerated(k, tol)
         states = self.env.get_all_states()
         max_delta = 0
+        delta = float('inf')
+        sweeps = 0
         
         for _ in range(k):
             delta = 0
@@ -59,16 +117,42 @@ class TruncatedPolicyIterationAgent(BaseAgent):
                 self.V[state] = reward + self.gamma * self.V[next_state]
                 delta = max(delta, abs(v - self.V[state]))
             max_delta = max(max_delta, delta)
+            sweeps += 1
             
             # Optional: Early stopping if it converges faster than k steps
-            if delta < self.theta:
+            if delta < tol:
                 break
+        
+        self.stats.backups += sweeps * len(states)
+        self.stats.model_calls += sweeps * len(states)
+        self.sweeps_per_iteration.append(sweeps)
+        self.eval_residual = delta
         return max_delta
 
+    def _policy_evaluation_accelerated(self, k, tol):
+        model = self.env.get_model()
+        V_old = model.to_array(self.V)
+        policy = model.to_array(self.policy, dtype=int)
+        V, sweeps = vectorized.policy_evaluation(
+            model, policy, self.gamma, tol, V=V_old,
+            method=self.eval_method, max_iter=k, omega=self.omega
+        )
+        self.V = model.to_dict(V)
+        
+        self.stats.backups += sweeps * model.n_states
+        self.sweeps_per_iteration.append(sweeps)
+        # Residual of the evaluated policy after the final sweep
+        next_state, reward = vectorized.policy_transition(model, policy)
+        self.eval_residual = float(np.max(np.abs(reward + self.gamma * V[next_state] - V)))
+        return float(np.max(np.abs(V - V_old)))
+
+    @timed('improvement')
     def _policy_improvement(self):
         policy_stable = True
         states = self.env.get_all_states()
         actions = self.env.action_space
+        n_changed = 0
+        residual = 0
         
         for state in states:
             old_action = self.policy[state]
@@ -86,10 +170,16 @@ class TruncatedPolicyIterationAgent(BaseAgent):
                     best_action = action
             
             self.policy[state] = best_action
+            residual = max(residual, abs(best_q - self.V[state]))
             
             if old_action != self.policy[state]:
                 policy_stable = False
-                
+                n_changed += 1
+        
+        self.stats.backups += len(states)
+        self.stats.model_calls += len(states) * len(actions)
+        self.n_changed = n_changed
+        self.bellman_residual = residual
         return policy_stable
 
     def predict(self, state):
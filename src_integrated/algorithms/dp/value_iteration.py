@@ -1,11 +1,28 @@
 import numpy as np
 from core.base_agent import BaseAgent
+from algorithms.dp import vectorized, sweeps
+from algorithms.dp.prioritized_sweeping import prioritized_sweep
 
 class ValueIterationAgent(BaseAgent):
-    def __init__(self, env, gamma=0.9, theta=1e-4):
+    def __init__(self, env, gamma=0.9, theta=1e-4, backend='python', ordering='jacobi'):
+        """
+        Args:
+            env: The environment.
+            gamma: Discount factor.
+            theta: Convergence threshold.
+            backend: 'python' for in-place sweeps over the state dict,
+                     'numpy' for synchronous array sweeps over env.get_model(),
+                     or 'sweeps' for the sweeps engine with the given ordering.
+            ordering: Update ordering for the 'sweeps' backend, one of
+                      sweeps.ORDERINGS. Per-sweep residuals and wall time
+                      end up in self.sweep_history.
+        """
         super().__init__(env)
         self.gamma = gamma
         self.theta = theta
+        self.backend = backend
+        self.ordering = ordering
+        self.sweep_history = None
         self.V = {state: 0.0 for state in env.get_all_states()}
         self.policy = {} # state -> action_idx
 
@@ -13,31 +30,88 @@ class ValueIterationAgent(BaseAgent):
         """
         Executes Value Iteration.
         """
+        if self.backend == 'numpy':
+            return self._train_vectorized()
+        elif self.backend == 'sweeps':
+            return self._train_sweeps()
+        elif self.backend != 'python':
+            raise ValueError(f"Unknown backend: {self.backend}")
+
         states = self.env.get_all_states()
         actions = self.env.action_space
         
-        iteration = 0
-        while True:
-            delta = 0
-            iteration += 1
+        with self.stats.phase('sweeps'):
+            iteration = 0
+            while True:
+                delta = 0
+                iteration += 1
             
-            for state in states:
-                v = self.V[state]
-                # Bellman Optimality Equation
-                # V(s) = max_a [ r + gamma * V(s') ]
-                q_values = []
-                for action in actions:
-                    next_state, reward = self.env.get_transition_model(state, action)
-                    q_val = reward + self.gamma * self.V[next_state]
-                    q_values.append(q_val)
+                for state in states:
+                    v = self.V[state]
+                    # Bellman Optimality Equation
+                    # V(s) = max_a [ r + gamma * V(s') ]
+                    q_values = []
+                    for action in actions:
+                        next_state, reward = self.env.get_transition_model(state, action)
+                        q_val = reward + self.gamma * self.V[next_state]
+                        q_values.append(q_val)
                 
-                self.V[state] = max(q_values)
-                delta = max(delta, abs(v - self.V[state]))
+                    self.V[state] = max(q_values)
+                    delta = max(delta, abs(v - self.V[state]))
             
-            if delta < self.theta:
-                break
+                self.stats.backups += len(states)
+                self.stats.model_calls += len(states) * len(actions)
+                if delta < self.theta:
+                    break
                 
-        self._derive_policy()
+        with self.stats.phase('policy'):
+            self._derive_policy()
+        return self.V, self.policy
+
+    def _train_vectorized(self):
+        model = self.env.get_model()
+        V0 = model.to_array(self.V)
+        with self.stats.phase('sweeps'):
+            V, policy, iterations = vectorized.value_iteration(model, self.gamma, self.theta, V=V0)
+        self.stats.backups += iterations * model.n_states
+        
+        self.V = model.to_dict(V)
+        self.policy = model.to_dict(policy)
+        return self.V, self.policy
+
+    def _train_sweeps(self):
+        model = self.env.get_model()
+        targets = [model.state_to_idx[s] for s in self.env.target_states]
+        with self.stats.phase('sweeps'):
+            V, self.sweep_history = sweeps.run_sweeps(
+                model, self.gamma, self.theta, ordering=self.ordering,
+                V=model.to_array(self.V), targets=targets
+            )
+        self.stats.backups += len(self.sweep_history["residual"]) * model.n_states
+        
+        self.V = model.to_dict(V)
+        self.policy = model.to_dict(vectorized.greedy_policy(model, V, self.gamma))
+        return self.V, self.policy
+
+    def replan(self, changed_states):
+        """
+        Re-converge after an environment edit, starting from the current V.
+
+        Only the changed states are queued; prioritized sweeping then
+        propagates the update backwards to the states it actually affects.
+        Args:
+            changed_states: States returned by env.edit(...).
+        """
+        model = self.env.get_model()
+        seeds = [model.state_to_idx[s] for s in changed_states]
+        with self.stats.phase('replan'):
+            V, backups = prioritized_sweep(
+                model, model.to_array(self.V), self.gamma, self.theta, states=seeds
+            )
+        self.stats.backups += backups
+
+        self.V = model.to_dict(V)
+        self.policy = model.to_dict(vectorized.greedy_policy(model, V, self.gamma))
         return self.V, self.policy
 
     def _derive_policy(self):
@@ -57,6 +131,7 @@ class ValueIterationAgent(BaseAgent):
                     best_action = action
             
             self.policy[state] = best_action
+        self.stats.model_calls += len(states) * len(actions)
 
     def predict(self, state):
         return self.policy.get(state, 0) # Default to 0 if not found
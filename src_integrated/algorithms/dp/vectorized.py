@@ -0,0 +1,441 @@
+"""
+Vectorized dynamic programming on a TabularModel.
+
+All functions work on arrays indexed by state id (see core.tabular_model),
+so a full Bellman sweep is a handful of NumPy operations instead of
+|S|*|A| Python-level model queries.
+"""
+import warnings
+import numpy as np
+
+# Default cap on the sweeps of sor_evaluation() and anderson_evaluation()
+MAX_ACCELERATED_SWEEPS = 10000
+
+def q_values(model, V, gamma):
+    """Q[s, a] = R[s, a] + gamma * V[next(s, a)]"""
+    return model.reward + gamma * V[model.next_state]
+
+def greedy_policy(model, V, gamma):
+    """Greedy action per state; ties go to the lowest action index."""
+    return np.argmax(q_values(model, V, gamma), axis=1)
+
+def value_iteration(model, gamma=0.9, theta=1e-4, V=None, max_iter=None):
+    """
+    Synchronous (Jacobi) value iteration.
+
+    Args:
+        model: TabularModel of the environment.
+        gamma: Discount factor.
+        theta: Stop once max_s |V_new(s) - V(s)| < theta.
+        V: Optional initial value array [S]. Defaults to zeros.
+        max_iter: Optional cap on the number of sweeps.
+
+    Returns:
+        V: Value array [S].
+        policy: Greedy action array [S].
+        iterations: Number of sweeps performed.
+    """
+    V = np.zeros(model.n_states) if V is None else np.array(V, dtype=float)
+    # Action-major copies: reducing over a short trailing axis is several
+    # times slower than an elementwise maximum across contiguous rows.
+    next_state = np.ascontiguousarray(model.next_state.T)
+    reward = np.ascontiguousarray(model.reward.T)
+    Q = np.empty(next_state.shape)
+    V_new = np.empty_like(V)
+    diff = np.empty_like(V)
+
+    iterations = 0
+    while max_iter is None or iterations < max_iter:
+        iterations += 1
+        # Q = R + gamma * V[next], without temporaries
+        np.take(V, next_state, out=Q)
+        Q *= gamma
+        Q += reward
+        Q.max(axis=0, out=V_new)
+
+        np.subtract(V_new, V, out=diff)
+        delta = np.max(np.abs(diff, out=diff))
+        V, V_new = V_new, V
+        if delta < theta:
+            break
+
+    return V, greedy_policy(model, V, gamma), iterations
+
+def policy_transition(model, policy):
+    """
+    Successor ids and rewards under a deterministic policy.
+
+    Args:
+        model: TabularModel of the environment.
+        policy: Action array [S].
+
+    Returns:
+        next_state: int array [S].
+        reward: float array [S].
+    """
+    rows = np.arange(model.n_states)
+    return model.next_state[rows, policy], model.reward[rows, policy]
+
+def policy_transition_triplets(model, policy=None):
+    """
+    COO triplets of the policy-induced transition matrix.
+
+    Args:
+        model: TabularModel of the environment.
+        policy: Action array [S], or None for the uniform random policy.
+
+    Returns:
+        rows, cols, probs: Entries of P_pi; duplicates are meant to be summed.
+        reward: Expected one-step reward array R_pi [S].
+    """
+    if policy is None:
+        n_states, n_actions = model.next_state.shape
+        rows = np.repeat(np.arange(n_states), n_actions)
+        cols = model.next_state.ravel()
+        probs = np.full(rows.shape, 1.0 / n_actions)
+        return rows, cols, probs, model.reward.mean(axis=1)
+
+    next_state, reward = policy_transition(model, policy)
+    return np.arange(model.n_states), next_state, np.ones(model.n_states), reward
+
+def policy_transition_matrix(model, policy=None):
+    """
+    Sparse CSR matrix P_pi [S, S] and reward vector R_pi [S] of a
+    deterministic policy, or of the uniform random policy if policy is None.
+    Requires scipy.
+    """
+    import scipy.sparse as sp
+
+    rows, cols, probs, reward = policy_transition_triplets(model, policy)
+    n = model.n_states
+    P = sp.csr_matrix((probs, (rows, cols)), shape=(n, n))
+    return P, reward
+
+def policy_evaluation(model, policy, gamma=0.9, theta=1e-4, V=None, method='solve', max_iter=None,
+                      omega=1.0, memory=10):
+    """
+    Evaluate a deterministic policy.
+
+    Args:
+        model: TabularModel of the environment.
+        policy: Action array [S].
+        gamma: Discount factor.
+        theta: Convergence threshold for the iterative methods.
+        V: Optional initial value array [S] for the iterative methods.
+        method: 'solve' for a sparse direct solve of (I - gamma * P_pi) V = R_pi,
+                'sweep' for synchronous sweeps V <- R_pi + gamma * V[next_pi],
+                'sor' for red-black successive over-relaxation (see sor_evaluation()),
+                'anderson' for Anderson-accelerated sweeps (see anderson_evaluation()).
+                'solve' falls back to 'sweep' when scipy is not installed.
+        max_iter: Optional cap on the number of sweeps. 'sor' and 'anderson'
+                  stop after MAX_ACCELERATED_SWEEPS by default.
+        omega: Relaxation factor for method='sor'.
+        memory: Number of past iterates mixed by method='anderson'.
+
+    Returns:
+        V: Value array [S].
+        iterations: Number of sweeps performed (1 for a direct solve).
+    """
+    if method == 'solve':
+        try:
+            import scipy.sparse as sp
+            from scipy.sparse.linalg import spsolve
+        except ImportError:
+            method = 'sweep'
+        else:
+            P, R = policy_transition_matrix(model, policy)
+            A = sp.identity(model.n_states, format='csr') - gamma * P
+            return spsolve(A.tocsc(), R), 1
+
+    if method == 'sor':
+        return sor_evaluation(model, policy, gamma, theta, V, omega, max_iter)
+    if method == 'anderson':
+        return anderson_evaluation(model, policy, gamma, theta, V, memory, max_iter)
+    if method != 'sweep':
+        raise ValueError(f"Unknown evaluation method: {method}")
+
+    next_state, reward = policy_transition(model, policy)
+    V = np.zeros(model.n_states) if V is None else np.array(V, dtype=float)
+    iterations = 0
+    while max_iter is None or iterations < max_iter:
+        iterations += 1
+        V_new = reward + gamma * V[next_state]
+        delta = np.max(np.abs(V_new - V))
+        V = V_new
+        if delta < theta:
+            break
+    return V, iterations
+
+def _jacobi_terms(model, policy, gamma):
+    """
+    Split V = R_pi + gamma * P_pi V into its off-diagonal part and the
+    diagonal, so V[s] = (reward[s] + off[s] * V[next[s]]) / diag[s].
+
+    States whose action keeps them in place (the target's 'stay', walls)
+    get off = 0 and are solved exactly in one update instead of
+    converging at rate gamma.
+    """
+    next_state, reward = policy_transition(model, policy)
+    loop = next_state == np.arange(model.n_states)
+    off = np.where(loop, 0.0, gamma)
+    diag = np.where(loop, 1.0 - gamma, 1.0)
+    return next_state, reward, off, diag
+
+def _red_black_blocks(model, policy, gamma):
+    """Per checkerboard half: (state ids, successors, reward / diag, off / diag)."""
+    from algorithms.dp.sweeps import checkerboard_blocks
+
+    next_state, reward, off, diag = _jacobi_terms(model, policy, gamma)
+    return [(idx, next_state[idx], reward[idx] / diag[idx], off[idx] / diag[idx])
+            for idx in checkerboard_blocks(model)]
+
+def _red_black_sweep(blocks, V, omega=1.0):
+    """One in-place SOR sweep over the checkerboard halves; returns max |step|."""
+    delta = 0.0
+    for idx, nxt, r, g in blocks:
+        step = omega * (r + g * V[nxt] - V[idx])
+        V[idx] += step
+        delta = max(delta, float(np.max(np.abs(step))))
+    return delta
+
+def sor_evaluation(model, policy, gamma=0.9, theta=1e-4, V=None, omega=1.0, max_iter=None):
+    """
+    Successive over-relaxation for (I - gamma * P_pi) V = R_pi.
+
+    Each sweep updates the two checkerboard halves of the grid in turn,
+    every half vectorized:
+        V[s] <- (1 - omega) V[s] + omega * (r + off V[s']) / diag
+    with the diagonal of I - gamma * P_pi divided out (see _jacobi_terms()).
+    omega = 1 is red-black Gauss-Seidel. omega in (1, 2) can speed up
+    2-cycles between neighbouring cells, but along the long chains of a
+    greedy policy the over-shoot compounds from cell to cell and the
+    iterates can blow up.
+
+    With omega = 1 the iterates never leave |V| <= max(|V_0|, max|r| / (1 - gamma)).
+    Over-relaxation may overshoot that bound a little. Once an iterate
+    goes past 10 times the bound (or turns nan), a RuntimeWarning is
+    issued and evaluation restarts from V_0 with omega = 1.
+
+    Args:
+        max_iter: Cap on the number of sweeps, restarts included.
+                  None means MAX_ACCELERATED_SWEEPS.
+
+    Returns:
+        V: Value array [S].
+        iterations: Number of sweeps performed.
+    """
+    blocks = _red_black_blocks(model, policy, gamma)
+    V0 = np.zeros(model.n_states) if V is None else np.array(V, dtype=float)
+    V = V0.copy()
+    max_iter = MAX_ACCELERATED_SWEEPS if max_iter is None else max_iter
+    bound = _value_bound(model, V0, gamma)
+    iterations = 0
+    while iterations < max_iter:
+        iterations += 1
+        delta = _red_black_sweep(blocks, V, omega)
+        if delta < theta:
+            break
+        if omega != 1.0 and not np.max(np.abs(V)) <= bound: # also catches nan
+            warnings.warn(f"SOR with omega={omega} diverged after {iterations} sweeps; "
+                          "restarting with omega=1", RuntimeWarning, stacklevel=2)
+            omega = 1.0
+            V = V0.copy()
+    return V, iterations
+
+def _value_bound(model, V0, gamma):
+    """10 times the largest |V| a contracting sweep can reach from V0."""
+    bound = max(float(np.max(np.abs(V0), initial=0.0)), float(np.max(np.abs(model.reward))) / (1.0 - gamma))
+    return 10.0 * bound + 1e-12
+
+def anderson_evaluation(model, policy, gamma=0.9, theta=1e-4, V=None, memory=10, max_iter=None):
+    """
+    Anderson acceleration of the red-black Gauss-Seidel sweep V <- T(V)
+    used by sor_evaluation() with omega = 1.
+
+    The next iterate mixes the last `memory` sweep results with weights
+    that minimize the combined residual T(V) - V in the least-squares
+    sense, a small dense problem of size memory per sweep. This mainly
+    removes the slow modes of cycles between cells, which plain sweeps
+    only shrink by gamma^2 per sweep.
+
+    Args:
+        max_iter: Cap on the number of sweeps. None means MAX_ACCELERATED_SWEEPS.
+
+    Returns:
+        V: Value array [S].
+        iterations: Number of sweeps (applications of T) performed.
+    """
+    blocks = _red_black_blocks(model, policy, gamma)
+    V = np.zeros(model.n_states) if V is None else np.array(V, dtype=float)
+    max_iter = MAX_ACCELERATED_SWEEPS if max_iter is None else max_iter
+    # Ring buffers of the last `memory` differences of F = T(V) - V and of T(V)
+    dF = np.zeros((memory, model.n_states))
+    dG = np.zeros((memory, model.n_states))
+    G_prev = F_prev = None
+    iterations = 0
+    while iterations < max_iter:
+        iterations += 1
+        G = V.copy()
+        if _red_black_sweep(blocks, G) < theta:
+            V = G
+            break
+        F = G - V
+
+        if F_prev is None:
+            V = G
+        else:
+            slot = (iterations - 2) % memory
+            np.subtract(F, F_prev, out=dF[slot])
+            np.subtract(G, G_prev, out=dG[slot])
+            k = min(iterations - 1, memory)
+            # Least squares min |F - dF^T coef| via the k x k normal equations
+            coef = np.linalg.lstsq(dF[:k] @ dF[:k].T, dF[:k] @ F, rcond=None)[0]
+            V = G - coef @ dG[:k]
+        G_prev, F_prev = G, F
+    return V, iterations
+
+def policy_improvement(model, V, gamma, policy=None, tol=1e-12):
+    """
+    Greedy improvement as a single argmax over the Q array.
+
+    If the current policy is given, a state keeps its action whenever that
+    action is still within tol of the best q-value. This stops policy
+    iteration from cycling between actions that only differ by round-off.
+
+    Returns:
+        new_policy: Action array [S].
+        stable: True if no action changed.
+    """
+    Q = q_values(model, V, gamma)
+    new_policy = np.argmax(Q, axis=1)
+    if policy is None:
+        return new_policy, False
+
+    rows = np.arange(model.n_states)
+    keep = Q[rows, policy] >= Q[rows, new_policy] - tol
+    new_policy[keep] = policy[keep]
+    return new_policy, bool(keep.all())
+
+def batch_policy_evaluation(model, policies, gamma=0.9, theta=1e-6, method='sweep', max_iter=None):
+    """
+    Evaluate K deterministic policies at once.
+
+    Args:
+        model: TabularModel of the environment.
+        policies: Action array [K, S].
+        gamma: Discount factor.
+        theta: Convergence threshold for method='sweep' (max over all K).
+        method: 'sweep' for synchronous sweeps on a [K, S] value matrix, or
+                'solve' for one sparse solve of the block-diagonal system
+                holding all K policies. 'solve' falls back to 'sweep' when
+                scipy is not installed.
+        max_iter: Optional cap on the number of sweeps.
+
+    Returns:
+        V: Value array [K, S].
+        iterations: Number of sweeps performed (1 for a direct solve).
+    """
+    policies = np.atleast_2d(np.asarray(policies, dtype=np.int64))
+    K, n = policies.shape
+    next_state = model.next_state[np.arange(n), policies]
+    reward = model.reward[np.arange(n), policies]
+
+    if method == 'solve':
+        try:
+            import scipy.sparse as sp
+            from scipy.sparse.linalg import spsolve
+        except ImportError:
+            method = 'sweep'
+        else:
+            # Policy k occupies rows/cols [k * S, (k + 1) * S)
+            offsets = (np.arange(K) * n)[:, None]
+            rows = (offsets + np.arange(n)).ravel()
+            cols = (offsets + next_state).ravel()
+            P = sp.csr_matrix((np.ones(K * n), (rows, cols)), shape=(K * n, K * n))
+            A = sp.identity(K * n, format='csr') - gamma * P
+            return spsolve(A.tocsc(), reward.ravel()).reshape(K, n), 1
+
+    if method != 'sweep':
+        raise ValueError(f"Unknown evaluation method: {method}")
+
+    # Flat indices into the [K, S] value matrix
+    flat_next = (np.arange(K) * n)[:, None] + next_state
+    V = np.zeros((K, n))
+    iterations = 0
+    while max_iter is None or iterations < max_iter:
+        iterations += 1
+        V_new = reward + gamma * V.ravel()[flat_next]
+        delta = np.max(np.abs(V_new - V))
+        V = V_new
+        if delta < theta:
+            break
+    return V, iterations
+
+def batch_value_iteration(model, gammas=0.9, rewards=None, theta=1e-4, V=None, max_iter=None):
+    """
+    Value iteration for B (gamma, reward table) configurations at once,
+    sharing the transition table of model.
+
+    Each configuration stops once its own max |V_new - V| < theta and is
+    dropped from later sweeps, so the result matches B separate
+    value_iteration() calls.
+
+    Args:
+        model: TabularModel providing next_state.
+        gammas: Discount factor per configuration, array [B] or a scalar.
+        rewards: Reward tables [B, S, A], e.g. stacked
+                 GridWorld.reward_table(...) results. Defaults to
+                 model.reward for every configuration.
+        theta: Convergence threshold.
+        V: Optional initial value array [B, S]. Defaults to zeros.
+        max_iter: Optional cap on the number of sweeps.
+
+    Returns:
+        V: Value array [B, S].
+        policy: Greedy action array [B, S].
+        iterations: Sweeps performed per configuration, int array [B].
+    """
+    gammas = np.atleast_1d(np.asarray(gammas, dtype=float))
+    if rewards is None:
+        rewards = np.broadcast_to(model.reward, (len(gammas),) + model.reward.shape)
+    rewards = np.asarray(rewards, dtype=float)
+    if len(gammas) == 1:
+        gammas = np.repeat(gammas, len(rewards))
+    if len(gammas) != len(rewards):
+        raise ValueError(f"Got {len(gammas)} gammas for {len(rewards)} reward tables")
+
+    B, n = len(gammas), model.n_states
+    V_out = np.zeros((B, n)) if V is None else np.array(V, dtype=float)
+    iterations = np.zeros(B, dtype=np.int64)
+
+    # Action-major layout as in value_iteration(): [B, A, S]
+    next_state = np.ascontiguousarray(model.next_state.T)
+    reward = np.ascontiguousarray(rewards.transpose(0, 2, 1))
+    Q_buf = np.empty(reward.shape)
+    # V and V_new are prefixes of two swapped buffers, rows as in active
+    buffers = [V_out.copy(), np.empty((B, n))]
+    active = np.arange(B)
+    sweeps = 0
+    while active.size and (max_iter is None or sweeps < max_iter):
+        sweeps += 1
+        k = active.size
+        V, V_new = buffers[0][:k], buffers[1][:k]
+        Q = Q_buf[:k]
+        np.take(V, next_state, axis=1, out=Q)
+        Q *= gammas[active, None, None]
+        Q += reward
+        Q.max(axis=1, out=V_new)
+
+        delta = np.abs(V_new - V).max(axis=1)
+        iterations[active] = sweeps
+        V_out[active] = V_new
+        running = delta >= theta
+        if not running.all():
+            # Drop converged configurations from the working arrays
+            active = active[running]
+            reward = reward[running]
+            buffers[1][:active.size] = V_new[running]
+        buffers.reverse()
+
+    Q = rewards + gammas[:, None, None] * V_out[:, model.next_state]
+    return V_out, np.argmax(Q, axis=2), iterations
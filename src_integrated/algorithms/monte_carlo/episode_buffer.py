@@ -0,0 +1,64 @@
+import numpy as np
+
+class EpisodeBuffer:
+    """
+    One episode as preallocated arrays, reused across episodes.
+
+    States are stored as state ids of env.get_model(), so the update can
+    index the Q array directly.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity: Maximum episode length.
+        """
+        self.capacity = capacity
+        self._states = np.zeros(capacity, dtype=np.int32)
+        self._actions = np.zeros(capacity, dtype=np.int8)
+        self._rewards = np.zeros(capacity, dtype=np.float32)
+        self.length = 0
+
+    def clear(self):
+        self.length = 0
+
+    def append(self, state_id, action, reward):
+        t = self.length
+        self._states[t] = state_id
+        self._actions[t] = action
+        self._rewards[t] = reward
+        self.length = t + 1
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def states(self):
+        return self._states[:self.length]
+
+    @property
+    def actions(self):
+        return self._actions[:self.length]
+
+    @property
+    def rewards(self):
+        return self._rewards[:self.length]
+
+def discounted_returns(rewards, gamma):
+    """
+    G_t = r_t + gamma * G_{t+1} for every t, as a float64 array.
+
+    Uses scipy.signal.lfilter (a first-order IIR filter run over the
+    reversed rewards) when scipy is installed, a plain loop otherwise.
+    """
+    rewards = np.asarray(rewards, dtype=np.float64)
+    try:
+        from scipy.signal import lfilter
+    except ImportError:
+        G = np.empty_like(rewards)
+        g = 0.0
+        for t, r in zip(range(len(rewards) - 1, -1, -1), rewards[::-1].tolist()):
+            g = r + gamma * g
+            G[t] = g
+        return G
+    return lfilter([1.0], [1.0, -gamma], rewards[::-1])[::-1]
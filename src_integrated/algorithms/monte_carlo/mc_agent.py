@@ -1,18 +1,42 @@
 import numpy as np
 from core.base_agent import BaseAgent
+from core.q_table import QTable, greedy_action, v_error
+from .episode_buffer import EpisodeBuffer, discounted_returns
 
 class MCAgent(BaseAgent):
-    def __init__(self, env, epsilon=0, gamma=0.9, alpha=0.01):
-        super().__init__(env)
+    def __init__(self, env, epsilon=0, gamma=0.9, alpha=0.01, q_table='dict', q_dtype=np.float64, seed=None,
+                 first_visit=False):
+        """
+        Args:
+            alpha: Constant step size, or 'mean' for 1 / N(s, a), making
+                   Q(s, a) the plain average of the returns seen so far.
+            q_table: 'dict' for a lazily filled {state: q_values} dict, or
+                     'array' for a dense QTable over env.get_model().
+            q_dtype: dtype of the 'array' Q-table.
+            seed: Seed of the agent's random stream (see utils.rng.RandomPool).
+            first_visit: Update each (s, a) once per episode, with the return
+                         from its first visit, instead of at every visit.
+        """
+        super().__init__(env, seed)
         self.epsilon = epsilon
         self.gamma = gamma
         self.alpha = alpha
+        self.first_visit = first_visit
         
         # Q-table: state -> [q_val_action_0, q_val_action_1, ...]
         # Since states are tuples, we can use a dict or map tuples to indices.
-        # Let's use a dict for flexibility.
-        self.Q = {} 
+        # The dict is the flexible default; QTable keeps the same interface.
+        if q_table == 'array':
+            self.Q = QTable(env.get_model(), dtype=q_dtype)
+        elif q_table == 'dict':
+            self.Q = {}
+        else:
+            raise ValueError(f"Unknown q_table: {q_table}")
         self.actions = env.action_space
+        # Episodes are recorded as state ids of this model
+        self.model = env.get_model()
+        # N(s, a): updates applied so far, for alpha='mean'
+        self.visits = np.zeros((self.model.n_states, len(self.actions)), dtype=np.int64)
 
     def get_q(self, state):
         if state not in self.Q:
@@ -20,55 +44,60 @@ class MCAgent(BaseAgent):
         return self.Q[state]
 
     def predict(self, state):
-        # Greedy action
-        q_values = self.get_q(state)
-        # Random tie-breaking
-        max_q = np.max(q_values)
-        best_actions = np.where(q_values == max_q)[0]
-        return np.random.choice(best_actions)
+        # Greedy action, random tie-breaking
+        return greedy_action(self.get_q(state), self.rng)
 
     def choose_action(self, state):
         # Epsilon-greedy
-        if np.random.rand() < self.epsilon:
-            return np.random.choice(self.actions)
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(self.actions)
         else:
             return self.predict(state)
 
-    def train(self, num_episodes=1000, max_steps=100, exploring_starts=True, v_star=None):
+    def train(self, num_episodes=1000, max_steps=100, exploring_starts=True, v_star=None, eval_every=1):
+        """
+        Args:
+            v_star: Optimal value function (dict) for error calculation.
+            eval_every: With v_star, compute the error every eval_every
+                        episodes (and after the last one) only; history then
+                        holds one entry per evaluation.
+        """
         history = []
-        all_states = self.env.get_all_states()
+        v_star_array = self.Q.model.to_array(v_star) if v_star and isinstance(self.Q, QTable) else None
+        # The exploring start adds one step
+        buffer = EpisodeBuffer(max_steps + 1)
         
-        for _ in range(num_episodes):
-            episode = self._generate_episode(max_steps, exploring_starts)
-            self.update(episode)
+        for episode_idx in range(num_episodes):
+            with self.stats.phase('episodes'):
+                episode = self._generate_episode(buffer, max_steps, exploring_starts)
+            with self.stats.phase('update'):
+                self.update(episode)
+            self.stats.env_steps += len(episode)
             
             if v_star:
-                # Calculate Max Error ||V_approx - V*||_inf
-                # V_approx(s) = max_a Q(s, a)
-                max_error = 0
-                for s in all_states:
-                    q_values = self.get_q(s)
-                    v_approx = np.max(q_values)
-                    error = abs(v_approx - v_star[s])
-                    if error > max_error:
-                        max_error = error
-                history.append(max_error)
+                if (episode_idx + 1) % eval_every == 0 or episode_idx == num_episodes - 1:
+                    # Calculate Max Error ||V_approx - V*||_inf
+                    # V_approx(s) = max_a Q(s, a)
+                    with self.stats.phase('evaluation'):
+                        history.append(v_error(self.Q, v_star, v_star_array))
             else:
                 # Track episode length (steps) as a proxy for error/performance
                 history.append(len(episode))
         return history
 
-    def _generate_episode(self, max_steps, exploring_starts):
-        episode = []
+    def _generate_episode(self, buffer, max_steps, exploring_starts):
+        """Play one episode into buffer (cleared first) and return it."""
+        buffer.clear()
+        state_to_idx = self.model.state_to_idx
         
         if exploring_starts:
             # Randomly select any state from the observation space
             all_states = self.env.observation_space
-            start_idx = np.random.randint(len(all_states))
+            start_idx = self.rng.integers(len(all_states))
             state = all_states[start_idx]
             
             # Randomly select a first action
-            action = np.random.choice(self.actions)
+            action = self.rng.choice(self.actions)
             
             # Set environment to this state
             # Note: We need to manually set the state in the environment
@@ -76,10 +105,10 @@ class MCAgent(BaseAgent):
             
             # Execute the first step
             next_state, reward, done, _ = self.env.step(action)
-            episode.append((state, action, reward))
+            buffer.append(state_to_idx[state], action, reward)
             
             if done:
-                return episode
+                return buffer
                 
             state = next_state
         else:
@@ -88,21 +117,93 @@ class MCAgent(BaseAgent):
         for _ in range(max_steps):
             action = self.choose_action(state)
             next_state, reward, done, _ = self.env.step(action)
-            episode.append((state, action, reward))
+            buffer.append(state_to_idx[state], action, reward)
             
             if done:
                 break
             state = next_state
             
-        return episode
+        return buffer
 
     def update(self, episode):
-        G = 0
-        # Every-visit MC
-        for t in range(len(episode) - 1, -1, -1):
-            state, action, reward = episode[t]
-            G = self.gamma * G + reward
-            
-            q_values = self.get_q(state)
-            # Q(S, A) <- Q(S, A) + alpha * (G - Q(S, A))
-            q_values[action] += self.alpha * (G - q_values[action])
+        """
+        MC update of Q from an EpisodeBuffer.
+
+        Every-visit updates are applied for t = T-1, ..., 0 as if one after
+        another: Q(S, A) <- Q(S, A) + alpha * (G - Q(S, A)). First-visit
+        keeps only the first occurrence of each (S, A) in the episode.
+        """
+        n_actions = len(self.actions)
+        G = discounted_returns(episode.rewards, self.gamma)
+        pairs = episode.states.astype(np.int64) * n_actions + episode.actions
+        if self.first_visit:
+            # np.unique reports the first occurrence of each pair; the
+            # updates then touch distinct pairs, so their order is irrelevant
+            pairs, first = np.unique(pairs, return_index=True)
+            G = G[first]
+        else:
+            # Visits in the order they are applied (latest first)
+            pairs, G = pairs[::-1], G[::-1]
+        
+        self.stats.updates += len(pairs)
+        if not isinstance(self.Q, QTable):
+            states = self.model.states
+            visits = self.visits.reshape(-1)
+            for p, g in zip(pairs.tolist(), G.tolist()):
+                s, action = divmod(p, n_actions)
+                q_values = self.get_q(states[s])
+                visits[p] += 1
+                step = 1.0 / visits[p] if self.alpha == 'mean' else self.alpha
+                q_values[action] += step * (g - q_values[action])
+            return
+        
+        if self.alpha == 'mean':
+            _mean_update(self.Q.array.reshape(-1), self.visits.reshape(-1), pairs, G)
+        else:
+            np.add.at(self.visits.reshape(-1), pairs, 1)
+            _grouped_update(self.Q.array.reshape(-1), pairs, G, self.alpha)
+
+def _mean_update(Q, visits, pairs, targets):
+    """
+    Incremental-mean update Q[p] <- Q[p] + (target - Q[p]) / N[p], with
+    N[p] incremented first, for each (p, target). The order does not
+    matter: a pair visited k more times ends at the mean of its old
+    N[p] returns and the k new ones.
+
+    Args:
+        Q: Flat Q array [S * A], updated in place.
+        visits: Flat visit counts N [S * A], updated in place.
+        pairs: int array of flat indices s * A + a.
+        targets: Returns matching pairs.
+    """
+    keys, inverse, counts = np.unique(pairs, return_inverse=True, return_counts=True)
+    sums = np.bincount(inverse, weights=targets, minlength=len(keys))
+    visits[keys] += counts
+    Q[keys] += (sums - counts * Q[keys]) / visits[keys]
+
+def _grouped_update(Q, pairs, targets, alpha):
+    """
+    Apply Q[p] <- Q[p] + alpha * (target - Q[p]) for each (p, target) in
+    order, with one scatter per distinct p.
+
+    A pair visited k times ends at (1 - alpha)^k * Q[p] plus, for its j-th
+    visit (j = 0..k-1), alpha * (1 - alpha)^(k - 1 - j) * target_j.
+
+    Args:
+        Q: Flat Q array [S * A], updated in place.
+        pairs: int array of flat indices s * A + a, in update order.
+        targets: Returns matching pairs.
+        alpha: Step size.
+    """
+    if len(pairs) == 0:
+        return
+    order = np.argsort(pairs, kind='stable')
+    pairs = pairs[order]
+    starts = np.flatnonzero(np.r_[True, pairs[1:] != pairs[:-1]])
+    counts = np.diff(np.r_[starts, len(pairs)])
+    # Visits still to come in the same pair after each visit
+    remaining = np.repeat(starts + counts, counts) - 1 - np.arange(len(pairs))
+    weighted = alpha * (1.0 - alpha) ** remaining * targets[order]
+    
+    keys = pairs[starts]
+    Q[keys] = (1.0 - alpha) ** counts * Q[keys] + np.add.reduceat(weighted, starts)
@@ -1,12 +1,26 @@
 import numpy as np
 from core.base_agent import BaseAgent
+from core.q_table import QTable, greedy_action, v_error
+from envs.vector_grid_world import VectorGridWorld
 
 class QLearningAgent(BaseAgent):
-    def __init__(self, env, gamma=0.9, alpha=0.1):
-        super().__init__(env)
+    def __init__(self, env, gamma=0.9, alpha=0.1, q_table='dict', q_dtype=np.float64, seed=None):
+        """
+        Args:
+            q_table: 'dict' for a lazily filled {state: q_values} dict, or
+                     'array' for a dense QTable over env.get_model().
+            q_dtype: dtype of the 'array' Q-table.
+            seed: Seed of the agent's random stream (see utils.rng.RandomPool).
+        """
+        super().__init__(env, seed)
         self.gamma = gamma
         self.alpha = alpha
-        self.Q = {}
+        if q_table == 'array':
+            self.Q = QTable(env.get_model(), dtype=q_dtype)
+        elif q_table == 'dict':
+            self.Q = {}
+        else:
+            raise ValueError(f"Unknown q_table: {q_table}")
         self.actions = env.action_space
 
     def get_q(self, state):
@@ -15,55 +29,120 @@ class QLearningAgent(BaseAgent):
         return self.Q[state]
 
     def predict(self, state):
-        # Greedy policy
-        q_values = self.get_q(state)
-        max_q = np.max(q_values)
-        best_actions = np.where(q_values == max_q)[0]
-        return np.random.choice(best_actions)
+        # Greedy policy, random tie-breaking
+        return greedy_action(self.get_q(state), self.rng)
 
-    def train(self, num_episodes=1000, max_steps=100, behavior_policy=None, v_star=None):
+    def train(self, num_episodes=1000, max_steps=100, behavior_policy=None, v_star=None, eval_every=1):
         """
         Train using Q-Learning.
         Args:
             behavior_policy: A function that takes (agent, state) and returns an action.
                              Implements Strategy Pattern.
             v_star: Optimal value function (dict) for error calculation.
+            eval_every: With v_star, compute the error every eval_every
+                        episodes (and after the last one) only; history then
+                        holds one entry per evaluation.
         """
         if behavior_policy is None:
             behavior_policy = self._epsilon_greedy_policy
 
         history = []
-        all_states = self.env.get_all_states()
+        v_star_array = self.Q.model.to_array(v_star) if v_star and isinstance(self.Q, QTable) else None
         
-        for _ in range(num_episodes):
+        for episode_idx in range(num_episodes):
             state = self.env.reset()
             steps = 0
             
-            for _ in range(max_steps):
-                steps += 1
-                action = behavior_policy(self, state)
-                next_state, reward, done, _ = self.env.step(action)
-                
-                self.update(state, action, reward, next_state)
-                
-                if done:
-                    break
-                state = next_state
+            with self.stats.phase('episodes'):
+                for _ in range(max_steps):
+                    steps += 1
+                    action = behavior_policy(self, state)
+                    next_state, reward, done, _ = self.env.step(action)
+                    
+                    self.update(state, action, reward, next_state)
+                    
+                    if done:
+                        break
+                    state = next_state
+            self.stats.env_steps += steps
+            self.stats.updates += steps
             
             if v_star:
-                # Calculate Max Error ||V_approx - V*||_inf
-                max_error = 0
-                for s in all_states:
-                    q_values = self.get_q(s)
-                    v_approx = np.max(q_values)
-                    error = abs(v_approx - v_star[s])
-                    if error > max_error:
-                        max_error = error
-                history.append(max_error)
+                if (episode_idx + 1) % eval_every == 0 or episode_idx == num_episodes - 1:
+                    # Calculate Max Error ||V_approx - V*||_inf
+                    with self.stats.phase('evaluation'):
+                        history.append(v_error(self.Q, v_star, v_star_array))
             else:
                 history.append(steps)
         return history
 
+    def train_vectorized(self, num_episodes=1000, max_steps=100, num_envs=64, epsilon=0.1,
+                         v_star=None, eval_every=1):
+        """
+        Epsilon-greedy Q-Learning on num_envs parallel streams (VectorGridWorld).
+
+        Episodes run in rounds of num_envs at a time, all of them stepped
+        together; the exploration coins and random actions of a round are
+        drawn up front. Needs q_table='array'.
+
+        All streams read Q as it was at the start of the tick. Streams that
+        took the same (s, a) in one tick share the same TD target (the
+        environment is deterministic), so their k updates are applied as
+        one step of size 1 - (1 - alpha)^k, which is what k sequential
+        updates of size alpha would give.
+
+        Args:
+            num_episodes: Number of episodes, rounded up to whole rounds.
+            num_envs: Number of parallel streams N.
+            epsilon: Exploration rate of the behavior policy.
+            v_star: Optimal value function (dict) for error calculation.
+            eval_every: With v_star, compute the error every eval_every
+                        rounds (and after the last one) only.
+        Returns:
+            history: Max error per evaluation with v_star, otherwise the
+                     number of steps per round.
+        """
+        if not isinstance(self.Q, QTable):
+            raise ValueError("train_vectorized() needs q_table='array'")
+        venv = VectorGridWorld(self.env, num_envs)
+        Q = self.Q.array
+        rng = self.rng.generator
+        n_actions = Q.shape[1]
+        num_rounds = -(-num_episodes // num_envs)
+
+        history = []
+        v_star_array = self.Q.model.to_array(v_star) if v_star else None
+
+        for round_idx in range(num_rounds):
+            states = venv.reset()
+            explore = rng.random((max_steps, num_envs)) < epsilon
+            random_actions = rng.integers(n_actions, size=(max_steps, num_envs))
+
+            with self.stats.phase('episodes'):
+                for t in range(max_steps):
+                    greedy = self.Q.greedy_actions(states, rng)
+                    actions = np.where(explore[t], random_actions[t], greedy)
+
+                    next_states, rewards, _, _ = venv.step(actions)
+                    td_error = rewards + self.gamma * Q[next_states].max(axis=1) - Q[states, actions]
+
+                    flat, first, counts = np.unique(
+                        states * n_actions + actions, return_index=True, return_counts=True
+                    )
+                    step = 1.0 - (1.0 - self.alpha) ** counts
+                    Q.reshape(-1)[flat] += step * td_error[first]
+                    states = next_states
+            self.stats.env_steps += max_steps * num_envs
+            self.stats.updates += max_steps * num_envs
+
+            if v_star:
+                if (round_idx + 1) % eval_every == 0 or round_idx == num_rounds - 1:
+                    with self.stats.phase('evaluation'):
+                        history.append(v_error(self.Q, v_star, v_star_array))
+            else:
+                history.append(max_steps * num_envs)
+        return history
+
     def update(self, state, action, reward, next_state):
         q_values = self.get_q(state)
         next_q_values = self.get_q(next_state)
@@ -76,7 +155,7 @@ class QLearningAgent(BaseAgent):
     # --- Built-in policies ---
     @staticmethod
     def _epsilon_greedy_policy(agent, state, epsilon=0.1):
-        if np.random.rand() < epsilon:
-            return np.random.choice(agent.actions)
+        if agent.rng.random() < epsilon:
+            return agent.rng.choice(agent.actions)
         else:
             return agent.predict(state)
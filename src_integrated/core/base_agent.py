@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
+from core.instrumentation import Instrumentation
+from utils.rng import RandomPool
 
 class BaseAgent(ABC):
     """
     Abstract base class for Reinforcement Learning agents.
     """
     
-    def __init__(self, env):
+    def __init__(self, env, seed=None):
         self.env = env
+        # Work done by train(); see core.instrumentation
+        self.stats = Instrumentation()
+        # Random stream of this agent; see utils.rng
+        self.rng = RandomPool(seed)
 
     @abstractmethod
     def predict(self, state):
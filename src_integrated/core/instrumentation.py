@@ -0,0 +1,64 @@
+import time
+import functools
+from contextlib import contextmanager
+
+class Instrumentation:
+    """
+    Work counters and per-phase wall time of one agent, so algorithms can
+    be compared on cost-to-accuracy rather than on iteration counts.
+
+    Counters:
+        backups: Bellman backups (one state's value recomputed from its successors).
+        env_steps: Calls to env.step().
+        model_calls: Calls to env.get_transition_model().
+        updates: Learned-parameter updates (one Q-value or one weight vector step).
+
+    Usage:
+        with agent.stats.phase('evaluation'):
+            ...
+            agent.stats.backups += n
+        agent.stats.to_dict()
+    """
+
+    COUNTERS = ('backups', 'env_steps', 'model_calls', 'updates')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.phase_time = {}  # phase name -> accumulated seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Add the wall time of the with-block to phase `name`. Phases should not nest."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_time[name] = self.phase_time.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def wall_time(self):
+        return sum(self.phase_time.values())
+
+    def to_dict(self):
+        """Plain dict (JSON-serializable) of counters, rates and phase times."""
+        wall = self.wall_time
+        record = {name: getattr(self, name) for name in self.COUNTERS}
+        record["wall_time"] = wall
+        record["backups_per_sec"] = self.backups / wall if wall > 0 else None
+        record["updates_per_sec"] = self.updates / wall if wall > 0 else None
+        record["phases"] = dict(self.phase_time)
+        return record
+
+def timed(phase):
+    """Method decorator: count the call's wall time towards self.stats phase `phase`."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.stats.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
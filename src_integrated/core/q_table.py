@@ -0,0 +1,121 @@
+import numpy as np
+
+class QTable:
+    """
+    Dense action-value table Q[S, A] indexed by integer state ids.
+
+    It also behaves like the {state: q_values} dict the agents used
+    before: indexing with an environment state returns a writable view of
+    that state's row, so code such as `Q[state][action] += x` updates the
+    array in place. Every state of the model is present from the start.
+    """
+
+    def __init__(self, model, dtype=np.float64):
+        """
+        Args:
+            model: TabularModel providing the state <-> id mapping.
+            dtype: Array dtype, e.g. np.float32 to halve memory on large maps.
+        """
+        self.model = model
+        self.array = np.zeros((model.n_states, model.n_actions), dtype=dtype)
+
+    # --- dict view ---
+
+    def __getitem__(self, state):
+        return self.array[self.model.state_to_idx[state]]
+
+    def __setitem__(self, state, q_values):
+        self.array[self.model.state_to_idx[state]] = q_values
+
+    def __contains__(self, state):
+        return state in self.model.state_to_idx
+
+    def __iter__(self):
+        return iter(self.model.states)
+
+    def __len__(self):
+        return self.model.n_states
+
+    def keys(self):
+        return list(self.model.states)
+
+    def values(self):
+        return list(self.array)
+
+    def items(self):
+        return list(zip(self.model.states, self.array))
+
+    def get(self, state, default=None):
+        return self[state] if state in self else default
+
+    # --- vectorized helpers ---
+
+    def state_values(self):
+        """V(s) = max_a Q(s, a), as an array [S]."""
+        return self.array.max(axis=1)
+
+    def greedy_actions(self, states=None, rng=None):
+        """
+        argmax_a Q(s, a) for many states at once.
+
+        Args:
+            states: Optional int array of state ids. Defaults to all states.
+            rng: Optional numpy.random.Generator. With it, ties are broken
+                 uniformly at random; without it they go to the lowest action.
+        Returns:
+            actions: int array, one action per state.
+        """
+        q = self.array if states is None else self.array[states]
+        if rng is None:
+            return q.argmax(axis=1)
+        ties = q == q.max(axis=1, keepdims=True)
+        actions = ties.argmax(axis=1)
+        # Noise only for the rows that actually have a tie
+        tied = np.flatnonzero(ties.sum(axis=1) > 1)
+        if len(tied):
+            noise = np.where(ties[tied], rng.random((len(tied), q.shape[1])), -1.0)
+            actions[tied] = noise.argmax(axis=1)
+        return actions
+
+def greedy_action(q_values, rng):
+    """
+    argmax of one row of Q-values with random tie-breaking.
+
+    Works on a Python list copy of the row: for a handful of actions this
+    is several times faster than np.max / np.where / np.random.choice.
+
+    Args:
+        q_values: 1-D array (or list) of action values.
+        rng: utils.rng.RandomPool used when several actions tie.
+    Returns:
+        action: int index of a best action.
+    """
+    q = q_values.tolist() if hasattr(q_values, 'tolist') else q_values
+    best = max(q)
+    if q.count(best) == 1:
+        return q.index(best)
+    return rng.choice([a for a, v in enumerate(q) if v == best])
+
+def v_error(Q, v_star, v_star_array=None):
+    """
+    max_s |max_a Q(s, a) - V*(s)| for a QTable or a {state: q_values} dict.
+
+    Args:
+        Q: QTable or dict.
+        v_star: Optimal value function (dict).
+        v_star_array: Optional v_star as an array indexed by state id; pass
+                      it when calling repeatedly to skip the conversion.
+    """
+    if isinstance(Q, QTable):
+        if v_star_array is None:
+            v_star_array = Q.model.to_array(v_star)
+        return float(np.max(np.abs(Q.state_values() - v_star_array)))
+
+    # Unvisited states have Q = 0 in the dict backend
+    max_error = 0
+    for s, v in v_star.items():
+        v_approx = np.max(Q[s]) if s in Q else 0.0
+        error = abs(v_approx - v)
+        if error > max_error:
+            max_error = error
+    return max_error
@@ -0,0 +1,82 @@
+import numpy as np
+
+class TabularModel:
+    """
+    Array view of a deterministic, finite MDP.
+
+    States are numbered 0..S-1 and actions 0..A-1, so model-based algorithms
+    can read the dynamics directly instead of querying the environment
+    once per (s, a) pair.
+
+    Attributes:
+        states: List of environment states, indexed by state id.
+        state_to_idx: Dict mapping environment state -> state id.
+        next_state: int array [S, A] with the successor state id.
+        reward: float array [S, A] with the immediate reward.
+        pred_indptr, pred_state, pred_action: Reverse transition index in
+            CSR layout, built on first use. The (s, a) pairs leading into
+            s' are pred_state[k], pred_action[k] for
+            k in range(pred_indptr[s'], pred_indptr[s' + 1]), ordered by
+            (s, a).
+    """
+
+    def __init__(self, states, next_state, reward):
+        self.states = list(states)
+        self.state_to_idx = {s: i for i, s in enumerate(self.states)}
+        self.next_state = np.asarray(next_state, dtype=np.int64)
+        self.reward = np.asarray(reward, dtype=float)
+        self._pred = None
+
+    @property
+    def n_states(self):
+        return self.next_state.shape[0]
+
+    @property
+    def n_actions(self):
+        return self.next_state.shape[1]
+
+    @property
+    def pred_indptr(self):
+        return self._predecessor_index()[0]
+
+    @property
+    def pred_state(self):
+        return self._predecessor_index()[1]
+
+    @property
+    def pred_action(self):
+        return self._predecessor_index()[2]
+
+    def _predecessor_index(self):
+        if self._pred is None:
+            flat = self.next_state.ravel()
+            # Stable sort keeps the (s, a) order within each successor
+            order = np.argsort(flat, kind='stable')
+            counts = np.bincount(flat, minlength=self.n_states)
+            indptr = np.zeros(self.n_states + 1, dtype=np.int64)
+            np.cumsum(counts, out=indptr[1:])
+            pred_state, pred_action = np.divmod(order, self.n_actions)
+            self._pred = (indptr, pred_state, pred_action)
+        return self._pred
+
+    def predecessors(self, s):
+        """
+        (s, a) pairs with next_state[s, a] == s', for a state id s'.
+        Returns:
+            states: int array of predecessor state ids.
+            actions: int array of the matching actions.
+        """
+        indptr, pred_state, pred_action = self._predecessor_index()
+        start, end = indptr[s], indptr[s + 1]
+        return pred_state[start:end], pred_action[start:end]
+
+    def to_array(self, values, default=0.0, dtype=float):
+        """Convert a dict {state: value} to an array indexed by state id."""
+        arr = np.full(self.n_states, default, dtype=dtype)
+        for s, v in values.items():
+            arr[self.state_to_idx[s]] = v
+        return arr
+
+    def to_dict(self, arr):
+        """Convert an array indexed by state id to a dict {state: value}."""
+        return dict(zip(self.states, arr.tolist()))
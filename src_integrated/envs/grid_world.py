@@ -1,33 +1,66 @@
 import numpy as np
 from core.base_env import BaseEnvironment
+from core.tabular_model import TabularModel
+from envs.map_spec import MapSpec
+
+REWARD_FIELDS = ('r_boundary', 'r_forbidden', 'r_target', 'r_step')
+
+def _model_field(name):
+    """Attribute that drops the cached transition model when reassigned."""
+    attr = '_' + name
+    
+    def getter(self):
+        return getattr(self, attr)
+    
+    def setter(self, value):
+        setattr(self, attr, value)
+        self.invalidate_model()
+    
+    return property(getter, setter)
 
 class GridWorld(BaseEnvironment):
-    def __init__(self, grid_size=(5, 5)):
-        self.grid_size = grid_size
-        self.rows, self.cols = grid_size
-        
-        # Define special states (0-indexed)
-        # Using coordinates from src2/src5 but ensuring 0-indexing
-        # src2: forbidden: [(1,1), (1,2), (2,2), (3,3), (3,1), (4,1)] (seems to be 0-indexed already or mixed?)
-        # src5: obstacle_states = [(2, 2), (2, 3), (3, 3), (4, 2), (4, 4), (5, 2)] (1-indexed)
-        # Let's map src5 (1-indexed) to 0-indexed:
-        # (2,2)->(1,1), (2,3)->(1,2), (3,3)->(2,2), (4,2)->(3,1), (4,4)->(3,3), (5,2)->(4,1)
-        # This matches src2 exactly!
-        
-        self.forbidden_states = [
-            (1, 1), (1, 2), 
-            (2, 2), 
-            (3, 1), (3, 3), 
-            (4, 1)
-        ]
+    # Attributes the cached tabular model depends on
+    rows = _model_field('rows')
+    cols = _model_field('cols')
+    forbidden_states = _model_field('forbidden_states')
+    target_states = _model_field('target_states')
+    r_boundary = _model_field('r_boundary')
+    r_forbidden = _model_field('r_forbidden')
+    r_target = _model_field('r_target')
+    r_step = _model_field('r_step')
+
+    def __init__(self, grid_size=(5, 5), map_spec=None):
+        """
+        Args:
+            grid_size: (rows, cols) of the grid. Ignored if map_spec is given.
+            map_spec: Optional MapSpec with size, forbidden and target cells.
+                      Defaults to the homework layout (MapSpec.default())
+                      placed on a grid of grid_size, cropped to it; if the
+                      target falls outside, the bottom-right cell is the target.
+        """
+        if map_spec is None:
+            default = MapSpec.default()
+            rows, cols = grid_size
+            inside = lambda cells: [(r, c) for r, c in cells if r < rows and c < cols]
+            forbidden, targets = inside(default.forbidden_states), inside(default.target_states)
+            if not targets:
+                # Grid too small for the homework target: use the bottom-right cell
+                targets = [(rows - 1, cols - 1)]
+                forbidden = [s for s in forbidden if s not in targets]
+            map_spec = MapSpec(rows, cols, forbidden, targets)
         
-        # Target: src5 (4,3) -> (3,2) in 0-indexed. src2 says (3,2). Matches.
-        self.target_state = (3, 2)
+        self.grid_size = map_spec.grid_size
+        self.rows, self.cols = map_spec.grid_size
+        self.forbidden_states = list(map_spec.forbidden_states)
+        self.target_states = list(map_spec.target_states)
         
         self.actions = ['up', 'down', 'left', 'right', 'stay']
         self.action_map = {
             0: 'up', 1: 'down', 2: 'left', 3: 'right', 4: 'stay'
         }
+        self.action_deltas = {
+            'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1), 'stay': (0, 0)
+        }
         
         # Rewards
         self.r_boundary = -1
@@ -36,6 +69,20 @@ class GridWorld(BaseEnvironment):
         self.r_step = 0
         
         self.state = None
+        self._model = None
+        self._cells = None
+
+    @property
+    def target_state(self):
+        """The first target; kept for code written against single-target maps."""
+        return self.target_states[0]
+
+    @target_state.setter
+    def target_state(self, value):
+        self.target_states = [value]
+
+    def to_map_spec(self):
+        return MapSpec(self.rows, self.cols, self.forbidden_states, self.target_states)
 
     @property
     def action_space(self):
@@ -59,43 +106,12 @@ class GridWorld(BaseEnvironment):
         if self.state is None:
             self.reset()
             
-        r, c = self.state
-        action = self.action_map[action_idx]
-        
-        next_r, next_c = r, c
-        hit_wall = False
+        next_state, reward = self._move(self.state, action_idx)
         
-        if action == 'up':
-            next_r -= 1
-        elif action == 'down':
-            next_r += 1
-        elif action == 'left':
-            next_c -= 1
-        elif action == 'right':
-            next_c += 1
-        elif action == 'stay':
-            pass
-            
-        # Boundary check
-        if next_r < 0 or next_r >= self.rows or next_c < 0 or next_c >= self.cols:
-            hit_wall = True
-            next_r, next_c = r, c # Stay in place
-            
-        next_state = (next_r, next_c)
-        reward = self.r_step
+        # In the original HW3, the task is continuous (can stay at target to get +1 repeatedly).
+        # So we should NOT terminate at target.
         done = False
         
-        if hit_wall:
-            reward = self.r_boundary
-        elif next_state in self.forbidden_states:
-            reward = self.r_forbidden
-        elif next_state == self.target_state:
-            reward = self.r_target
-            # done = True 
-            # In the original HW3, the task is continuous (can stay at target to get +1 repeatedly).
-            # So we should NOT terminate at target.
-            done = False
-            
         self.state = next_state
         return next_state, reward, done, {}
 
@@ -109,8 +125,8 @@ class GridWorld(BaseEnvironment):
         for r, c in self.forbidden_states:
             grid[r, c] = 'X'
         
-        tr, tc = self.target_state
-        grid[tr, tc] = 'T'
+        for tr, tc in self.target_states:
+            grid[tr, tc] = 'T'
         
         # Mark agent
         if self.state is not None:
@@ -126,18 +142,137 @@ class GridWorld(BaseEnvironment):
     def get_all_states(self):
         return self.observation_space
 
+    def get_model(self):
+        """
+        Returns the TabularModel of the grid, building it on first use.
+        
+        The model is cached until a layout or reward attribute is reassigned.
+        Call invalidate_model() after mutating forbidden_states in place.
+        """
+        if self._model is None:
+            self._model = self._build_model()
+        return self._model
+
+    def invalidate_model(self):
+        self._model = None
+        self._cells = None
+
+    def edit(self, add_forbidden=(), remove_forbidden=(), **rewards):
+        """
+        Change forbidden cells and/or rewards, e.g.
+        env.edit(r_forbidden=-10) or env.edit(add_forbidden=[(2, 3)]).
+
+        Args:
+            add_forbidden: Cells to mark as forbidden.
+            remove_forbidden: Cells to make free again.
+            **rewards: New values for r_boundary, r_forbidden, r_target, r_step.
+        Returns:
+            changed: States with at least one (s, a) whose transition or
+                     reward changed. Values elsewhere only change through
+                     these, so they are what a re-planner has to revisit.
+        """
+        self._check_reward_names(rewards)
+        add_forbidden = list(add_forbidden)
+        self._cell_mask(add_forbidden) # raises before anything is changed
+
+        old = self.get_model()
+        removed = set(remove_forbidden)
+        forbidden = [s for s in self.forbidden_states if s not in removed]
+        forbidden += [s for s in add_forbidden if s not in forbidden]
+        self.forbidden_states = forbidden
+        for name, value in rewards.items():
+            setattr(self, name, value)
+
+        new = self.get_model()
+        changed = np.any((old.next_state != new.next_state) | (old.reward != new.reward), axis=1)
+        return [new.states[i] for i in np.flatnonzero(changed)]
+
+    def reward_table(self, **rewards):
+        """
+        Reward array [S, A] of this layout with some reward values replaced,
+        e.g. env.reward_table(r_forbidden=-10). The env itself is unchanged.
+        Stack several for vectorized.batch_value_iteration().
+        """
+        self._check_reward_names(rewards)
+        params = {name: getattr(self, name) for name in REWARD_FIELDS}
+        params.update(rewards)
+        next_state, hit_wall = self._transitions()
+        return self._reward_array(next_state, hit_wall, **params)
+
+    @staticmethod
+    def _check_reward_names(rewards):
+        unknown = set(rewards) - set(REWARD_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown reward attribute(s): {sorted(unknown)}")
+
+    def _build_model(self):
+        next_state, hit_wall = self._transitions()
+        params = {name: getattr(self, name) for name in REWARD_FIELDS}
+        reward = self._reward_array(next_state, hit_wall, **params)
+        return TabularModel(self.observation_space, next_state, reward)
+
+    def _transitions(self):
+        rows, cols = self.rows, self.cols
+        r = np.repeat(np.arange(rows), cols)
+        c = np.tile(np.arange(cols), rows)
+        deltas = np.array([self.action_deltas[self.action_map[a]] for a in self.action_space])
+        
+        next_r = r[:, None] + deltas[:, 0]
+        next_c = c[:, None] + deltas[:, 1]
+        hit_wall = (next_r < 0) | (next_r >= rows) | (next_c < 0) | (next_c >= cols)
+        next_r = np.where(hit_wall, r[:, None], next_r)
+        next_c = np.where(hit_wall, c[:, None], next_c)
+        return next_r * cols + next_c, hit_wall
+
+    def _reward_array(self, next_state, hit_wall, r_boundary, r_forbidden, r_target, r_step):
+        forbidden = self._cell_mask(self.forbidden_states)
+        target = self._cell_mask(self.target_states)
+        
+        # Precedence: wall, then forbidden, then target
+        reward = np.full(next_state.shape, r_step, dtype=float)
+        reward[target[next_state]] = r_target
+        reward[forbidden[next_state]] = r_forbidden
+        reward[hit_wall] = r_boundary
+        return reward
+
+    def _cell_mask(self, cells):
+        mask = np.zeros(self.rows * self.cols, dtype=bool)
+        if len(cells):
+            cells = np.asarray(cells)
+            # A flat index would silently wrap (0, 7) onto another row
+            outside = (cells < 0).any(axis=1) | (cells[:, 0] >= self.rows) | (cells[:, 1] >= self.cols)
+            if outside.any():
+                raise ValueError(f"Cell {tuple(cells[outside][0].tolist())} is outside the {self.rows}x{self.cols} grid")
+            mask[cells[:, 0] * self.cols + cells[:, 1]] = True
+        return mask
+
     def get_transition_model(self, state, action_idx):
         """
         Returns (next_state, reward) for a deterministic environment.
         Used by DP algorithms.
         """
-        # Temporarily save current state
-        saved_state = self.state
+        return self._move(state, action_idx)
+
+    def _move(self, state, action_idx):
+        """Single-transition counterpart of _build_model(), in plain Python."""
+        if self._cells is None:
+            self._cells = (
+                set(self.forbidden_states), set(self.target_states), self.rows, self.cols,
+                self.r_boundary, self.r_forbidden, self.r_target, self.r_step,
+            )
+        forbidden, targets, rows, cols, r_boundary, r_forbidden, r_target, r_step = self._cells
         
-        self.state = state
-        next_state, reward, _, _ = self.step(action_idx)
+        r, c = state
+        dr, dc = self.action_deltas[self.action_map[action_idx]]
+        next_r, next_c = r + dr, c + dc
         
-        # Restore state
-        self.state = saved_state
+        # Boundary check
+        if next_r < 0 or next_r >= rows or next_c < 0 or next_c >= cols:
+            return state, r_boundary
         
-        return next_state, reward
+        next_state = (next_r, next_c)
+        if next_state in forbidden:
+            return next_state, r_forbidden
+        if next_state in targets:
+            return next_state, r_target
+        return next_state, r_step
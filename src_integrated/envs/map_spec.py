@@ -0,0 +1,132 @@
+import numpy as np
+
+class MapSpec:
+    """
+    Layout of a GridWorld: size, forbidden cells and target cells.
+
+    Text maps use one character per cell, one line per row:
+        '.' free cell, 'X' forbidden cell, 'T' target cell.
+    This is the same notation GridWorld.render() prints.
+    """
+
+    FREE, FORBIDDEN, TARGET = '.', 'X', 'T'
+
+    def __init__(self, rows, cols, forbidden_states=(), target_states=((0, 0),)):
+        self.rows = rows
+        self.cols = cols
+        self.forbidden_states = [(int(r), int(c)) for r, c in forbidden_states]
+        self.target_states = [(int(r), int(c)) for r, c in target_states]
+        if not self.target_states:
+            raise ValueError("A map needs at least one target state")
+        for r, c in self.forbidden_states + self.target_states:
+            if not (0 <= r < rows and 0 <= c < cols):
+                raise ValueError(f"Cell {(r, c)} is outside the {rows}x{cols} grid")
+
+    @property
+    def grid_size(self):
+        return (self.rows, self.cols)
+
+    @classmethod
+    def default(cls):
+        """The 5x5 map of the course homework (0-indexed)."""
+        # Using coordinates from src2/src5 but ensuring 0-indexing
+        # src5: obstacle_states = [(2, 2), (2, 3), (3, 3), (4, 2), (4, 4), (5, 2)] (1-indexed)
+        # maps to the 0-indexed cells of src2 below; target src5 (4,3) -> (3,2).
+        return cls(5, 5,
+                   forbidden_states=[(1, 1), (1, 2), (2, 2), (3, 1), (3, 3), (4, 1)],
+                   target_states=[(3, 2)])
+
+    @classmethod
+    def from_array(cls, grid):
+        """
+        Build a map from a 2D array of cell characters ('.', 'X', 'T')
+        or integer codes (0 free, 1 forbidden, 2 target).
+        """
+        grid = np.asarray(grid)
+        if grid.ndim != 2:
+            raise ValueError("Map array must be 2D")
+        if grid.dtype.kind in 'iub':
+            forbidden = grid == 1
+            target = grid == 2
+        else:
+            forbidden = grid == cls.FORBIDDEN
+            target = grid == cls.TARGET
+        rows, cols = grid.shape
+        return cls(rows, cols,
+                   forbidden_states=list(zip(*np.nonzero(forbidden))),
+                   target_states=list(zip(*np.nonzero(target))))
+
+    @classmethod
+    def from_text(cls, text):
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if len({len(line) for line in lines}) != 1:
+            raise ValueError("All map rows must have the same length")
+        return cls.from_array([list(line) for line in lines])
+
+    @classmethod
+    def load(cls, path):
+        """Load a text map (see class docstring) or a .npy array of codes."""
+        if str(path).endswith('.npy'):
+            return cls.from_array(np.load(path))
+        with open(path) as f:
+            return cls.from_text(f.read())
+
+    @classmethod
+    def random(cls, rows, cols, obstacle_density=0.2, n_targets=1, seed=None):
+        """
+        Procedurally generate a map.
+
+        Args:
+            rows, cols: Grid size.
+            obstacle_density: Probability of each cell being forbidden.
+            n_targets: Number of targets, placed on distinct free cells.
+            seed: Seed for numpy.random.default_rng; the same seed gives the same map.
+        """
+        rng = np.random.default_rng(seed)
+        forbidden = rng.random((rows, cols)) < obstacle_density
+        free = np.flatnonzero(~forbidden)
+        if len(free) < n_targets:
+            raise ValueError("Not enough free cells for the requested targets")
+        targets = rng.choice(free, size=n_targets, replace=False)
+        return cls(rows, cols,
+                   forbidden_states=list(zip(*np.nonzero(forbidden))),
+                   target_states=[divmod(int(t), cols) for t in targets])
+
+    def to_array(self):
+        grid = np.full((self.rows, self.cols), self.FREE, dtype='<U1')
+        for r, c in self.forbidden_states:
+            grid[r, c] = self.FORBIDDEN
+        for r, c in self.target_states:
+            grid[r, c] = self.TARGET
+        return grid
+
+    def to_text(self):
+        return '\n'.join(''.join(row) for row in self.to_array()) + '\n'
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write(self.to_text())
+
+def add_map_arguments(parser):
+    """Register the map selection options shared by the command-line scripts."""
+    group = parser.add_argument_group('map')
+    group.add_argument('--map', dest='map_path', default=None,
+                       help="Text ('.', 'X', 'T') or .npy map file")
+    group.add_argument('--size', type=int, nargs=2, metavar=('ROWS', 'COLS'), default=None,
+                       help="Generate a random map of this size")
+    group.add_argument('--density', type=float, default=0.2,
+                       help="Obstacle density of a generated map")
+    group.add_argument('--targets', type=int, default=1,
+                       help="Number of targets of a generated map")
+    group.add_argument('--map-seed', type=int, default=0,
+                       help="Seed of a generated map")
+    return parser
+
+def map_spec_from_args(args):
+    """MapSpec selected by add_map_arguments() options; the homework map by default."""
+    if args.map_path is not None:
+        return MapSpec.load(args.map_path)
+    if args.size is not None:
+        rows, cols = args.size
+        return MapSpec.random(rows, cols, args.density, args.targets, seed=args.map_seed)
+    return MapSpec.default()
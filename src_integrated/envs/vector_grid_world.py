@@ -0,0 +1,65 @@
+import numpy as np
+from core.base_env import BaseEnvironment
+
+class VectorGridWorld(BaseEnvironment):
+    """
+    N independent copies of a GridWorld stepped together.
+
+    Agent positions are held as integer state ids (see env.get_model()) in
+    one array, and a step is a lookup into the precomputed transition
+    tables, so stepping N agents costs a few NumPy operations instead of N
+    Python calls.
+    """
+
+    def __init__(self, env, num_envs):
+        """
+        Args:
+            env: The GridWorld to replicate; its tabular model is shared.
+            num_envs: Number of parallel agents N.
+        """
+        self.env = env
+        self.num_envs = num_envs
+        self.model = env.get_model()
+        self.start_state = self.model.state_to_idx[env.reset()]
+        self.states = np.full(num_envs, self.start_state, dtype=np.int64)
+
+    @property
+    def action_space(self):
+        return self.env.action_space
+
+    @property
+    def observation_space(self):
+        return self.env.observation_space
+
+    def reset(self, states=None):
+        """
+        Reset all agents to the env's start state, or to the given state ids.
+        Returns:
+            states: int array [N] of state ids.
+        """
+        if states is None:
+            self.states[:] = self.start_state
+        else:
+            self.states[:] = states
+        return self.states.copy()
+
+    def step(self, actions):
+        """
+        Args:
+            actions: int array [N] of action indices.
+        Returns:
+            next_states: int array [N] of state ids.
+            rewards: float array [N].
+            dones: bool array [N]. Always False, the task is continuing.
+            info: Empty dict.
+        """
+        rewards = self.model.reward[self.states, actions]
+        self.states = self.model.next_state[self.states, actions]
+        dones = np.zeros(self.num_envs, dtype=bool)
+        return self.states.copy(), rewards, dones, {}
+
+    def render(self):
+        counts = np.bincount(self.states, minlength=self.model.n_states)
+        print("\nVectorGridWorld (agents per cell):")
+        print(counts.reshape(self.env.rows, self.env.cols))
+        print("")
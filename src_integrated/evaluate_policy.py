@@ -3,7 +3,7 @@ import os
 from envs.grid_world import GridWorld
 from utils.plotting import plot_value_function
 
-def evaluate_policy(env, policy=None, gamma=0.9, theta=1e-6, method='iterative'):
+def evaluate_policy(env, policy=None, gamma=0.9, theta=1e-6, method='iterative', ordering='gauss_seidel'):
     """
     Calculates the state-value function V_pi for a given policy.
     
@@ -13,7 +13,9 @@ def evaluate_policy(env, policy=None, gamma=0.9, theta=1e-6, method='iterative')
                 or None for Uniform Random Policy.
         gamma: Discount factor.
         theta: Convergence threshold (for iterative method).
-        method: 'iterative' or 'closed_form'.
+        method: 'iterative', 'sweeps' or 'closed_form'.
+        ordering: Update ordering for method='sweeps', one of
+                  algorithms.dp.sweeps.ORDERINGS.
         
     Returns:
         V: Dictionary mapping state -> value.
@@ -21,6 +23,15 @@ def evaluate_policy(env, policy=None, gamma=0.9, theta=1e-6, method='iterative')
     if method == 'closed_form':
         from algorithms.dp.closed_form import solve_closed_form
         return solve_closed_form(env, policy, gamma)
+    if method == 'sweeps':
+        from algorithms.dp.sweeps import run_sweeps
+        model = env.get_model()
+        if policy is not None:
+            get_action = policy.get if isinstance(policy, dict) else policy
+            policy = np.array([get_action(s) for s in model.states])
+        targets = [model.state_to_idx[s] for s in env.target_states]
+        V, _ = run_sweeps(model, gamma, theta, policy, ordering, targets=targets)
+        return model.to_dict(V)
 
     states = env.get_all_states()
     actions = env.action_space
@@ -65,6 +76,38 @@ def evaluate_policy(env, policy=None, gamma=0.9, theta=1e-6, method='iterative')
             
     return V
 
+def evaluate_policies(env, policies, gamma=0.9, theta=1e-6, method='iterative'):
+    """
+    Calculates V_pi for a stack of deterministic policies in one batch.
+    
+    The tabular model is built once and shared by all K policies.
+    
+    Args:
+        env: The GridWorld environment.
+        policies: Action array [K, S] indexed by the state ids of
+                  env.get_model(), or a list of K dictionaries {state: action}.
+        gamma: Discount factor.
+        theta: Convergence threshold (for iterative method).
+        method: 'iterative' (vectorized sweeps on a [K, S] value matrix) or
+                'closed_form' (one sparse block-diagonal solve).
+        
+    Returns:
+        V: Value array [K, S] indexed like policies.
+    """
+    from algorithms.dp import vectorized
+
+    model = env.get_model()
+    if len(policies) and isinstance(policies[0], dict):
+        policies = np.stack([model.to_array(p, dtype=int) for p in policies])
+    
+    if method == 'closed_form':
+        V, _ = vectorized.batch_policy_evaluation(model, policies, gamma, method='solve')
+    elif method == 'iterative':
+        V, _ = vectorized.batch_policy_evaluation(model, policies, gamma, theta, method='sweep')
+    else:
+        raise ValueError(f"Unknown method: {method}")
+    return V
+
 def main():
     print("=== Policy Evaluation Tool ===")
     
@@ -79,12 +122,12 @@ def main():
     # 1. Calculate Ground Truth for Random Policy (Iterative)
     print("Calculating value for Random Policy (Iterative)...")
     V_random_iter = evaluate_policy(env, policy=None, method='iterative')
-    plot_value_function(V_random_iter, title="Random Policy Value (Iterative)", save_path=os.path.join(result_dir, 'random_policy_value_iterative.png'))
+    plot_value_function(V_random_iter, env.rows, env.cols, title="Random Policy Value (Iterative)", save_path=os.path.join(result_dir, 'random_policy_value_iterative.png'))
     
     # 2. Calculate Ground Truth for Random Policy (Closed Form)
     print("Calculating value for Random Policy (Closed Form)...")
     V_random_closed = evaluate_policy(env, policy=None, method='closed_form')
-    plot_value_function(V_random_closed, title="Random Policy Value (Closed Form)", save_path=os.path.join(result_dir, 'random_policy_value_closed_form.png'))
+    plot_value_function(V_random_closed, env.rows, env.cols, title="Random Policy Value (Closed Form)", save_path=os.path.join(result_dir, 'random_policy_value_closed_form.png'))
     
     # 手动定义最优策略 (Optimal Policy)
     # 对应图示中的箭头方向
@@ -106,14 +149,14 @@ def main():
     V_optimal = evaluate_policy(env, policy=optimal_policy, method='closed_form')
     # 保存结果
     plot_value_function(
-        V_optimal, 
+        V_optimal, env.rows, env.cols,
         title="Optimal Policy Value closed-form", 
         save_path=os.path.join(result_dir, 'optimal_policy_value_closed_form.png')
     )
     
     V_optimal = evaluate_policy(env, policy=optimal_policy, method='iterative')
     plot_value_function(
-        V_optimal, 
+        V_optimal, env.rows, env.cols,
         title="Optimal Policy Value Iterative", 
         save_path=os.path.join(result_dir, 'optimal_policy_value_iterative.png')
     )
@@ -1,6 +1,9 @@
+import argparse
+import json
 import numpy as np
 import os
 from envs.grid_world import GridWorld
+from envs.map_spec import add_map_arguments, map_spec_from_args
 from algorithms.dp.value_iteration import ValueIterationAgent
 from algorithms.dp.policy_iteration import PolicyIterationAgent
 from algorithms.dp.truncated_policy_iteration import TruncatedPolicyIterationAgent
@@ -8,11 +11,14 @@ from algorithms.monte_carlo.mc_agent import MCAgent
 from algorithms.temporal_difference.q_learning import QLearningAgent
 from algorithms.approximation.td_linear import TDLinearAgent
 from algorithms.approximation.sgd_optimizer import SGDOptimizer
+from core.q_table import QTable
 from utils.features import FeatureExtractor
 from utils.plotting import plot_value_function
 
 def get_v_from_q(agent, env):
     """Helper to extract V from Q-table"""
+    if isinstance(agent.Q, QTable):
+        return agent.Q.model.to_dict(agent.Q.state_values())
     V = {}
     for state in env.get_all_states():
         q_values = agent.get_q(state)
@@ -27,6 +33,12 @@ def get_v_from_approx(agent, env):
     return V
 
 def main():
+    parser = argparse.ArgumentParser(description="Run every agent on a GridWorld map.")
+    add_map_arguments(parser)
+    parser.add_argument('--backend', choices=['python', 'numpy'], default='python',
+                        help="Backend of the DP agents")
+    args = parser.parse_args()
+
     print("=== Unified Reinforcement Learning Framework ===")
     
     # Setup result directory
@@ -36,64 +48,78 @@ def main():
     print(f"Results will be saved to: {result_dir}")
 
     # 1. Initialize Environment
-    env = GridWorld()
-    print("\nEnvironment Initialized: 5x5 GridWorld")
+    env = GridWorld(map_spec=map_spec_from_args(args))
+    print(f"\nEnvironment Initialized: {env.rows}x{env.cols} GridWorld")
     
     # 2. Run Value Iteration (DP)
     print("\n--- Running Value Iteration ---")
-    vi_agent = ValueIterationAgent(env)
+    vi_agent = ValueIterationAgent(env, backend=args.backend)
     V_vi, policy_vi = vi_agent.train()
     print("Value Iteration Converged.")
-    plot_value_function(V_vi, title="VI Value Function", save_path=os.path.join(result_dir, 'vi_value_function.png'))
+    plot_value_function(V_vi, env.rows, env.cols, title="VI Value Function", save_path=os.path.join(result_dir, 'vi_value_function.png'))
     
     # 3. Run Policy Iteration (DP)
     print("\n--- Running Policy Iteration ---")
-    pi_agent = PolicyIterationAgent(env)
+    pi_agent = PolicyIterationAgent(env, backend=args.backend)
     V_pi, policy_pi, _ = pi_agent.train()
     print("Policy Iteration Converged.")
-    plot_value_function(V_pi, title="PI Value Function", save_path=os.path.join(result_dir, 'pi_value_function.png'))
+    plot_value_function(V_pi, env.rows, env.cols, title="PI Value Function", save_path=os.path.join(result_dir, 'pi_value_function.png'))
     
     # 3.5. Run Truncated Policy Iteration (DP)
     print("\n--- Running Truncated Policy Iteration ---")
     tpi_agent = TruncatedPolicyIterationAgent(env, k=10)
     V_tpi, policy_tpi, _ = tpi_agent.train()
     print("Truncated Policy Iteration Converged.")
-    plot_value_function(V_tpi, title="Truncated PI Value Function", save_path=os.path.join(result_dir, 'tpi_value_function.png'))
+    plot_value_function(V_tpi, env.rows, env.cols, title="Truncated PI Value Function", save_path=os.path.join(result_dir, 'tpi_value_function.png'))
     
     # 4. Run Monte Carlo
     print("\n--- Running Monte Carlo Agent ---")
     # User requested epsilon=0 (Greedy with Exploring Starts) to match original HW3 performance
     # Increased alpha to 0.05 for faster convergence
-    mc_agent = MCAgent(env, epsilon=0, alpha=0.05) 
+    mc_agent = MCAgent(env, epsilon=0, alpha=0.05, q_table='array')
     mc_agent.train(num_episodes=20000, max_steps=200) 
     print("MC Training Completed.")
     V_mc = get_v_from_q(mc_agent, env)
-    plot_value_function(V_mc, title="MC Value Function", save_path=os.path.join(result_dir, 'mc_value_function.png'))
+    plot_value_function(V_mc, env.rows, env.cols, title="MC Value Function", save_path=os.path.join(result_dir, 'mc_value_function.png'))
     
     # 5. Run Q-Learning
     print("\n--- Running Q-Learning Agent ---")
-    ql_agent = QLearningAgent(env)
+    ql_agent = QLearningAgent(env, q_table='array')
     # Strategy Pattern: Define a custom behavior policy
     def custom_epsilon_greedy(agent, state):
         epsilon = 0.2 # Higher exploration
-        if np.random.rand() < epsilon:
-            return np.random.choice(agent.actions)
+        if agent.rng.random() < epsilon:
+            return agent.rng.choice(agent.actions)
         return agent.predict(state)
         
     ql_agent.train(num_episodes=5000, behavior_policy=custom_epsilon_greedy)
     print("Q-Learning Training Completed.")
     V_ql = get_v_from_q(ql_agent, env)
-    plot_value_function(V_ql, title="Q-Learning Value Function", save_path=os.path.join(result_dir, 'q_learning_value_function.png'))
+    plot_value_function(V_ql, env.rows, env.cols, title="Q-Learning Value Function", save_path=os.path.join(result_dir, 'q_learning_value_function.png'))
     
     # 6. Run TD Linear Approximation
     print("\n--- Running TD Linear Approximation ---")
-    features = FeatureExtractor(feature_type='fourier', order=3, grid_size=(5,5))
+    features = FeatureExtractor(feature_type='fourier', order=3, grid_size=env.grid_size)
     optimizer = SGDOptimizer(learning_rate=0.01, decay_type='inverse')
     td_agent = TDLinearAgent(env, features, optimizer=optimizer)
     td_agent.train(num_episodes=5000)
     print("TD Linear Training Completed.")
     V_td = get_v_from_approx(td_agent, env)
-    plot_value_function(V_td, title="TD Linear Value Function", save_path=os.path.join(result_dir, 'td_linear_value_function.png'))
+    plot_value_function(V_td, env.rows, env.cols, title="TD Linear Value Function", save_path=os.path.join(result_dir, 'td_linear_value_function.png'))
+    
+    # 7. Cost summary
+    agents = {
+        "VI": vi_agent, "PI": pi_agent, "Truncated PI": tpi_agent,
+        "MC": mc_agent, "Q-Learning": ql_agent, "TD Linear": td_agent
+    }
+    stats = {name: agent.stats.to_dict() for name, agent in agents.items()}
+    print("\n--- Cost Summary ---")
+    print(f"{'Agent':<14}{'backups':>10}{'env_steps':>11}{'model_calls':>13}{'updates':>10}{'time (s)':>10}")
+    for name, record in stats.items():
+        print(f"{name:<14}{record['backups']:>10}{record['env_steps']:>11}"
+              f"{record['model_calls']:>13}{record['updates']:>10}{record['wall_time']:>10.2f}")
+    with open(os.path.join(result_dir, 'agent_stats.json'), 'w') as f:
+        json.dump(stats, f, indent=2)
     
     print("\nAll algorithms executed successfully. Check the 'result' folder for plots.")
 
@@ -0,0 +1,97 @@
+import numpy as np
+
+class FrameRecorder:
+    """
+    Stores a sequence of equally shaped arrays (e.g. V or the policy after
+    every iteration) as keyframes plus sparse deltas.
+
+    A frame is stored as a delta, the indices and new values of the cells
+    that changed since the previous frame, unless that would not be smaller
+    than the frame itself or keyframe_interval frames have passed since
+    the last keyframe. Frames are rebuilt on demand from the nearest
+    keyframe, so memory grows with the number of changed cells rather than
+    iterations * |S|.
+
+    Usage:
+        recorder = FrameRecorder()
+        for ...:
+            recorder.record(V)
+        recorder[i]          # frame i as a new array
+        for frame in recorder: ...   # sequential replay, one delta per step
+    """
+
+    def __init__(self, keyframe_interval=50, atol=0.0):
+        """
+        Args:
+            keyframe_interval: Upper bound on frames between keyframes, which
+                               bounds the cost of random access.
+            atol: Changes of at most atol are not stored. Deltas are taken
+                  against the reconstructed previous frame, so the error
+                  stays below atol instead of accumulating.
+        """
+        self.keyframe_interval = keyframe_interval
+        self.atol = atol
+        self._frames = []        # per frame: ('key', array) or ('delta', idx, values)
+        self._keyframes = []     # indices of keyframes in _frames
+        self._last = None
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def shape(self):
+        return None if self._last is None else self._last.shape
+
+    @property
+    def nbytes(self):
+        """Bytes held by the stored keyframes and deltas."""
+        return sum(sum(a.nbytes for a in f[1:]) for f in self._frames)
+
+    def record(self, frame):
+        frame = np.asarray(frame)
+        if self._last is not None and frame.shape != self._last.shape:
+            raise ValueError(f"Frame shape {frame.shape} != {self._last.shape}")
+
+        since_key = len(self._frames) - self._keyframes[-1] if self._keyframes else None
+        if since_key is not None and since_key < self.keyframe_interval:
+            flat_new = frame.ravel()
+            flat_last = self._last.ravel()
+            if self.atol > 0:
+                changed = np.flatnonzero(np.abs(flat_new - flat_last) > self.atol)
+            else:
+                changed = np.flatnonzero(flat_new != flat_last)
+            # int32 index + value per changed cell
+            if changed.size * (4 + frame.itemsize) < frame.nbytes:
+                values = flat_new[changed].copy()
+                self._frames.append(('delta', changed.astype(np.int32), values))
+                flat_last[changed] = values
+                return
+
+        self._keyframes.append(len(self._frames))
+        self._frames.append(('key', frame.copy()))
+        self._last = frame.copy()
+
+    def __getitem__(self, i):
+        n = len(self._frames)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("frame index out of range")
+
+        # Latest keyframe at or before i
+        k = self._keyframes[np.searchsorted(self._keyframes, i, side='right') - 1]
+        frame = self._frames[k][1].copy()
+        flat = frame.ravel()
+        for j in range(k + 1, i + 1):
+            _, idx, values = self._frames[j]
+            flat[idx] = values
+        return frame
+
+    def __iter__(self):
+        frame = None
+        for entry in self._frames:
+            if entry[0] == 'key':
+                frame = entry[1].copy()
+            else:
+                frame.ravel()[entry[1]] = entry[2]
+            yield frame.copy()
@@ -20,7 +20,8 @@ def plot_value_function(V, rows=5, cols=5, title="Value Function", save_path=Non
         grid = V.reshape((rows, cols))
         
     plt.figure(figsize=(8, 6))
-    sns.heatmap(grid, annot=True, fmt=".2f", cmap="viridis")
+    # Cell annotations are unreadable (and slow to draw) on large maps
+    sns.heatmap(grid, annot=rows * cols <= 400, fmt=".2f", cmap="viridis")
     plt.title(title)
     if save_path:
         plt.savefig(save_path)
@@ -0,0 +1,44 @@
+import numpy as np
+
+class RandomPool:
+    """
+    Seeded random numbers for per-step sampling loops.
+
+    Uniforms are drawn from a numpy.random.Generator in blocks and handed
+    out one at a time as Python floats, which costs a fraction of a call to
+    np.random.rand() or np.random.choice(). Bulk draws for vectorized code
+    go through `generator` directly.
+
+    Each agent owns its pool, so with a fixed seed its stream does not
+    depend on what other code draws.
+    """
+
+    def __init__(self, seed=None, block_size=4096):
+        """
+        Args:
+            seed: Seed for numpy.random.default_rng. None derives one from
+                  the global np.random state, so np.random.seed() still
+                  makes a run reproducible.
+            block_size: Number of uniforms drawn per refill.
+        """
+        if seed is None:
+            seed = np.random.randint(2**32, dtype=np.uint32)
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._uniforms = iter(())
+
+    def random(self):
+        """Uniform float in [0, 1)."""
+        try:
+            return next(self._uniforms)
+        except StopIteration:
+            self._uniforms = iter(self.generator.random(self.block_size).tolist())
+            return next(self._uniforms)
+
+    def integers(self, n):
+        """Uniform int in [0, n)."""
+        return int(self.random() * n)
+
+    def choice(self, seq):
+        """Uniformly chosen element of a non-empty sequence or array."""
+        return seq[int(self.random() * len(seq))]
@@ -1 +1 @@
-const RL_DATA = {"-1": {"vi": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 1.0, 1.0, 1.9, 0.71], [0.0, 0.0, 1.9, 1.71, 1.539]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 1, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.9, 0.71, 0.639], [0.0, 1.9, 1.9, 2.71, 1.439], [0.0, 1.71, 2.71, 2.439, 2.1951]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 1, 1], [0, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.71, 0.639, 0.5751000000000001], [0.0, 0.71, 2.71, 1.439, 1.2951000000000001], [0.71, 2.71, 2.71, 3.439, 2.0951], [0.639, 2.439, 3.439, 3.0951, 2.78559]], "policy": [[1, 2, 2, 1, 1], [0, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.5751000000000001, 0.5175900000000001], [0.0, 0.639, 1.439, 1.2951000000000001, 1.1655900000000001], [0.639, 1.439, 3.439, 2.0951, 1.88559], [1.439, 3.439, 3.439, 4.0951, 2.6855900000000004], [1.2951000000000001, 3.0951, 4.0951, 3.6855900000000004, 3.3170310000000005]], "policy": [[1, 2, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.5175900000000001, 1.1655900000000001, 1.049031], [0.5751000000000001, 1.2951000000000001, 2.0951, 1.88559, 1.6970310000000002], [1.2951000000000001, 2.0951, 4.0951, 2.6855900000000004, 2.4170310000000006], [2.0951, 4.0951, 4.0951, 4.68559, 3.2170310000000004], [1.88559, 3.6855900000000004, 4.68559, 4.217031, 3.7953279000000006]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.5175900000000001, 0.4658310000000001, 1.049031, 1.6970310000000002, 1.5273279000000002], [1.1655900000000001, 1.88559, 2.6855900000000004, 2.4170310000000006, 2.1753279000000005], [1.88559, 2.6855900000000004, 4.68559, 3.2170310000000004, 2.8953279000000003], [2.6855900000000004, 4.68559, 4.68559, 5.217031, 3.6953279000000006], [2.4170310000000006, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[1.049031, 0.9441279, 1.5273279000000002, 2.1753279000000005, 1.9577951100000006], [1.6970310000000002, 2.4170310000000006, 3.2170310000000004, 2.8953279000000003, 2.6057951100000003], [2.4170310000000006, 3.2170310000000004, 5.217031, 3.6953279000000006, 3.3257951100000005], [3.2170310000000004, 5.217031, 5.217031, 5.6953279000000006, 4.12579511], [2.8953279000000003, 4.6953279000000006, 5.6953279000000006, 5.12579511, 4.613215599]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[1.5273279000000002, 1.3745951100000002, 1.9577951100000006, 2.6057951100000003, 2.3452155990000003], [2.1753279000000005, 2.8953279000000003, 3.6953279000000006, 3.3257951100000005, 2.9932155990000004], [2.8953279000000003, 3.6953279000000006, 5.6953279000000006, 4.12579511, 3.713215599], [3.6953279000000006, 5.6953279000000006, 5.6953279000000006, 6.12579511, 4.5132155990000005], [3.3257951100000005, 5.12579511, 6.12579511, 5.5132155990000005, 4.961894039100001]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[1.9577951100000006, 1.7620155990000006, 2.3452155990000003, 2.9932155990000004, 2.6938940391000004], [2.6057951100000003, 3.3257951100000005, 4.12579511, 3.713215599, 3.3418940391], [3.3257951100000005, 4.12579511, 6.12579511, 4.5132155990000005, 4.0618940391], [4.12579511, 6.12579511, 6.12579511, 6.5132155990000005, 4.861894039100001], [3.713215599, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.3452155990000003, 2.1106940391, 2.713215599, 3.3418940391, 3.00770463519], [2.9932155990000004, 3.713215599, 4.5132155990000005, 4.0618940391, 3.65570463519], [3.713215599, 4.5132155990000005, 6.5132155990000005, 4.861894039100001, 4.375704635190001], [4.5132155990000005, 6.5132155990000005, 6.5132155990000005, 6.861894039100001, 5.175704635190001], [4.0618940391, 5.861894039100001, 6.861894039100001, 6.175704635190001, 5.558134171671001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.6938940391000004, 2.4418940391, 3.0618940391000002, 3.65570463519, 3.290134171671], [3.3418940391, 4.0618940391, 4.861894039100001, 4.375704635190001, 3.9381341716710008], [4.0618940391, 4.861894039100001, 6.861894039100001, 5.175704635190001, 4.6581341716710005], [4.861894039100001, 6.861894039100001, 6.861894039100001, 7.175704635190001, 5.458134171671], [4.375704635190001, 6.175704635190001, 7.175704635190001, 6.458134171671, 5.812320754503901]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.00770463519, 2.7557046351900003, 3.375704635190001, 3.9381341716710008, 3.5443207545039006], [3.65570463519, 4.375704635190001, 5.175704635190001, 4.6581341716710005, 4.192320754503901], [4.375704635190001, 5.175704635190001, 7.175704635190001, 5.458134171671, 4.9123207545039005], [5.175704635190001, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.7123207545039], [4.6581341716710005, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.290134171671, 3.038134171671001, 3.6581341716710005, 4.192320754503901, 3.7730886790535108], [3.9381341716710008, 4.6581341716710005, 5.458134171671, 4.9123207545039005, 4.42108867905351], [4.6581341716710005, 5.458134171671, 7.458134171671, 5.7123207545039, 5.14108867905351], [5.458134171671, 7.458134171671, 7.458134171671, 7.7123207545039, 5.94108867905351], [4.9123207545039005, 6.7123207545039, 7.7123207545039, 6.94108867905351, 6.246979811148159]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.5443207545039006, 3.2923207545039004, 3.9123207545039005, 4.42108867905351, 3.9789798111481596], [4.192320754503901, 4.9123207545039005, 5.7123207545039, 5.14108867905351, 4.62697981114816], [4.9123207545039005, 5.7123207545039, 7.7123207545039, 5.94108867905351, 5.3469798111481595], [5.7123207545039, 7.7123207545039, 7.7123207545039, 7.94108867905351, 6.146979811148159], [5.14108867905351, 6.94108867905351, 7.94108867905351, 7.146979811148159, 6.432281830033343]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.7730886790535108, 3.5210886790535105, 4.14108867905351, 4.62697981114816, 4.164281830033344], [4.42108867905351, 5.14108867905351, 5.94108867905351, 5.3469798111481595, 4.812281830033344], [5.14108867905351, 5.94108867905351, 7.94108867905351, 6.146979811148159, 5.532281830033344], [5.94108867905351, 7.94108867905351, 7.94108867905351, 8.14697981114816, 6.332281830033344], [5.3469798111481595, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.9789798111481596, 3.7269798111481593, 4.3469798111481595, 4.812281830033344, 4.33105364703001], [4.62697981114816, 5.3469798111481595, 6.146979811148159, 5.532281830033344, 4.9790536470300095], [5.3469798111481595, 6.146979811148159, 8.14697981114816, 6.332281830033344, 5.69905364703001], [6.146979811148159, 8.14697981114816, 8.14697981114816, 8.332281830033345, 6.499053647030011], [5.532281830033344, 7.332281830033344, 8.332281830033345, 7.499053647030011, 6.74914828232701]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.164281830033344, 3.9122818300333435, 4.532281830033344, 4.9790536470300095, 4.481148282327009], [4.812281830033344, 5.532281830033344, 6.332281830033344, 5.69905364703001, 5.12914828232701], [5.532281830033344, 6.332281830033344, 8.332281830033345, 6.499053647030011, 5.84914828232701], [6.332281830033344, 8.332281830033345, 8.332281830033345, 8.49905364703001, 6.649148282327009], [5.69905364703001, 7.499053647030011, 8.49905364703001, 7.649148282327009, 6.884233454094308]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.33105364703001, 4.079053647030009, 4.69905364703001, 5.12914828232701, 4.616233454094309], [4.9790536470300095, 5.69905364703001, 6.499053647030011, 5.84914828232701, 5.26423345409431], [5.69905364703001, 6.499053647030011, 8.49905364703001, 6.649148282327009, 5.9842334540943085], [6.499053647030011, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.7842334540943074], [5.84914828232701, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.481148282327009, 4.229148282327009, 4.84914828232701, 5.26423345409431, 4.7378101086848785], [5.12914828232701, 5.84914828232701, 6.649148282327009, 5.9842334540943085, 5.385810108684878], [5.84914828232701, 6.649148282327009, 8.649148282327008, 6.7842334540943074, 6.105810108684877], [6.649148282327009, 8.649148282327008, 8.649148282327008, 8.784233454094307, 6.905810108684877], [5.9842334540943085, 7.7842334540943074, 8.784233454094307, 7.905810108684877, 7.115229097816389]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.616233454094309, 4.364233454094309, 4.9842334540943085, 5.385810108684878, 4.84722909781639], [5.26423345409431, 5.9842334540943085, 6.7842334540943074, 6.105810108684877, 5.49522909781639], [5.9842334540943085, 6.7842334540943074, 8.784233454094307, 6.905810108684877, 6.2152290978163895], [6.7842334540943074, 8.784233454094307, 8.784233454094307, 8.905810108684877, 7.015229097816389], [6.105810108684877, 7.905810108684877, 8.905810108684877, 8.01522909781639, 7.213706188034751]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.7378101086848785, 4.485810108684878, 5.105810108684877, 5.49522909781639, 4.945706188034751], [5.385810108684878, 6.105810108684877, 6.905810108684877, 6.2152290978163895, 5.5937061880347505], [6.105810108684877, 6.905810108684877, 8.905810108684877, 7.015229097816389, 6.31370618803475], [6.905810108684877, 8.905810108684877, 8.905810108684877, 9.01522909781639, 7.113706188034751], [6.2152290978163895, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[4.84722909781639, 4.595229097816389, 5.2152290978163895, 5.5937061880347505, 5.034335569231276], [5.49522909781639, 6.2152290978163895, 7.015229097816389, 6.31370618803475, 5.682335569231276], [6.2152290978163895, 7.015229097816389, 9.01522909781639, 7.113706188034751, 6.402335569231276], [7.015229097816389, 9.01522909781639, 9.01522909781639, 9.113706188034751, 7.202335569231277], [6.31370618803475, 8.113706188034751, 9.113706188034751, 8.202335569231277, 7.38210201230815]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[4.945706188034751, 4.693706188034751, 5.31370618803475, 5.682335569231276, 5.114102012308148], [5.5937061880347505, 6.31370618803475, 7.113706188034751, 6.402335569231276, 5.762102012308149], [6.31370618803475, 7.113706188034751, 9.113706188034751, 7.202335569231277, 6.482102012308149], [7.113706188034751, 9.113706188034751, 9.113706188034751, 9.202335569231277, 7.282102012308149], [6.402335569231276, 8.202335569231277, 9.202335569231277, 8.28210201230815, 7.453891811077335]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.034335569231276, 4.782335569231275, 5.402335569231276, 5.762102012308149, 5.185891811077334], [5.682335569231276, 6.402335569231276, 7.202335569231277, 6.482102012308149, 5.833891811077335], [6.402335569231276, 7.202335569231277, 9.202335569231277, 7.282102012308149, 6.553891811077334], [7.202335569231277, 9.202335569231277, 9.202335569231277, 9.28210201230815, 7.353891811077334], [6.482102012308149, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.114102012308148, 4.862102012308148, 5.482102012308149, 5.833891811077335, 5.250502629969601], [5.762102012308149, 6.482102012308149, 7.282102012308149, 6.553891811077334, 5.898502629969601], [6.482102012308149, 7.282102012308149, 9.28210201230815, 7.353891811077334, 6.618502629969601], [7.282102012308149, 9.28210201230815, 9.28210201230815, 9.353891811077334, 7.4185026299696], [6.553891811077334, 8.353891811077334, 9.353891811077334, 8.4185026299696, 7.57665236697264]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.185891811077334, 4.933891811077334, 5.553891811077334, 5.898502629969601, 5.308652366972641], [5.833891811077335, 6.553891811077334, 7.353891811077334, 6.618502629969601, 5.956652366972642], [6.553891811077334, 7.353891811077334, 9.353891811077334, 7.4185026299696, 6.6766523669726405], [7.353891811077334, 9.353891811077334, 9.353891811077334, 9.4185026299696, 7.47665236697264], [6.618502629969601, 8.4185026299696, 9.4185026299696, 8.47665236697264, 7.628987130275377]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.250502629969601, 4.998502629969601, 5.618502629969601, 5.956652366972642, 5.360987130275378], [5.898502629969601, 6.618502629969601, 7.4185026299696, 6.6766523669726405, 6.008987130275377], [6.618502629969601, 7.4185026299696, 9.4185026299696, 7.47665236697264, 6.728987130275376], [7.4185026299696, 9.4185026299696, 9.4185026299696, 9.47665236697264, 7.528987130275377], [6.6766523669726405, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.308652366972641, 5.056652366972641, 5.6766523669726405, 6.008987130275377, 5.408088417247839], [5.956652366972642, 6.6766523669726405, 7.47665236697264, 6.728987130275376, 6.056088417247839], [6.6766523669726405, 7.47665236697264, 9.47665236697264, 7.528987130275377, 6.7760884172478395], [7.47665236697264, 9.47665236697264, 9.47665236697264, 9.528987130275377, 7.57608841724784], [6.728987130275376, 8.528987130275377, 9.528987130275377, 8.57608841724784, 7.718479575523056]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.360987130275378, 5.108987130275376, 5.728987130275376, 6.056088417247839, 5.4504795755230555], [6.008987130275377, 6.728987130275376, 7.528987130275377, 6.7760884172478395, 6.098479575523056], [6.728987130275376, 7.528987130275377, 9.528987130275377, 7.57608841724784, 6.818479575523057], [7.528987130275377, 9.528987130275377, 9.528987130275377, 9.57608841724784, 7.618479575523056], [6.7760884172478395, 8.57608841724784, 9.57608841724784, 8.618479575523056, 7.756631617970751]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.408088417247839, 5.1560884172478385, 5.7760884172478395, 6.098479575523056, 5.488631617970751], [6.056088417247839, 6.7760884172478395, 7.57608841724784, 6.818479575523057, 6.136631617970751], [6.7760884172478395, 7.57608841724784, 9.57608841724784, 7.618479575523056, 6.85663161797075], [7.57608841724784, 9.57608841724784, 9.57608841724784, 9.618479575523056, 7.656631617970751], [6.818479575523057, 8.618479575523056, 9.618479575523056, 8.656631617970751, 7.790968456173676]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.4504795755230555, 5.198479575523056, 5.818479575523057, 6.136631617970751, 5.522968456173676], [6.098479575523056, 6.818479575523057, 7.618479575523056, 6.85663161797075, 6.170968456173675], [6.818479575523057, 7.618479575523056, 9.618479575523056, 7.656631617970751, 6.890968456173676], [7.618479575523056, 9.618479575523056, 9.618479575523056, 9.656631617970751, 7.690968456173676], [6.85663161797075, 8.656631617970751, 9.656631617970751, 8.690968456173676, 7.821871610556309]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.488631617970751, 5.236631617970751, 5.85663161797075, 6.170968456173675, 5.553871610556308], [6.136631617970751, 6.85663161797075, 7.656631617970751, 6.890968456173676, 6.201871610556308], [6.85663161797075, 7.656631617970751, 9.656631617970751, 7.690968456173676, 6.921871610556309], [7.656631617970751, 9.656631617970751, 9.656631617970751, 9.690968456173676, 7.72187161055631], [6.890968456173676, 8.690968456173676, 9.690968456173676, 8.72187161055631, 7.849684449500679]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.522968456173676, 5.270968456173676, 5.890968456173676, 6.201871610556308, 5.581684449500678], [6.170968456173675, 6.890968456173676, 7.690968456173676, 6.921871610556309, 6.229684449500678], [6.890968456173676, 7.690968456173676, 9.690968456173676, 7.72187161055631, 6.949684449500679], [7.690968456173676, 9.690968456173676, 9.690968456173676, 9.72187161055631, 7.749684449500679], [6.921871610556309, 8.72187161055631, 9.72187161055631, 8.749684449500679, 7.874716004550611]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.553871610556308, 5.301871610556308, 5.921871610556309, 6.229684449500678, 5.60671600455061], [6.201871610556308, 6.921871610556309, 7.72187161055631, 6.949684449500679, 6.254716004550611], [6.921871610556309, 7.72187161055631, 9.72187161055631, 7.749684449500679, 6.974716004550611], [7.72187161055631, 9.72187161055631, 9.72187161055631, 9.749684449500679, 7.77471600455061], [6.949684449500679, 8.749684449500679, 9.749684449500679, 8.77471600455061, 7.89724440409555]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.581684449500678, 5.329684449500678, 5.949684449500679, 6.254716004550611, 5.62924440409555], [6.229684449500678, 6.949684449500679, 7.749684449500679, 6.974716004550611, 6.27724440409555], [6.949684449500679, 7.749684449500679, 9.749684449500679, 7.77471600455061, 6.997244404095549], [7.749684449500679, 9.749684449500679, 9.749684449500679, 9.77471600455061, 7.797244404095549], [6.974716004550611, 8.77471600455061, 9.77471600455061, 8.797244404095549, 7.9175199636859945]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.60671600455061, 5.354716004550611, 5.974716004550611, 6.27724440409555, 5.649519963685996], [6.254716004550611, 6.974716004550611, 7.77471600455061, 6.997244404095549, 6.297519963685994], [6.974716004550611, 7.77471600455061, 9.77471600455061, 7.797244404095549, 7.017519963685994], [7.77471600455061, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.817519963685994], [6.997244404095549, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.62924440409555, 5.37724440409555, 5.997244404095549, 6.297519963685994, 5.6677679673173955], [6.27724440409555, 6.997244404095549, 7.797244404095549, 7.017519963685994, 6.315767967317395], [6.997244404095549, 7.797244404095549, 9.797244404095549, 7.817519963685994, 7.035767967317395], [7.797244404095549, 9.797244404095549, 9.797244404095549, 9.817519963685994, 7.835767967317395], [7.017519963685994, 8.817519963685994, 9.817519963685994, 8.835767967317395, 7.952191170585656]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.649519963685996, 5.397519963685994, 6.017519963685994, 6.315767967317395, 5.684191170585656], [6.297519963685994, 7.017519963685994, 7.817519963685994, 7.035767967317395, 6.332191170585656], [7.017519963685994, 7.817519963685994, 9.817519963685994, 7.835767967317395, 7.0521911705856555], [7.817519963685994, 9.817519963685994, 9.817519963685994, 9.835767967317395, 7.852191170585655], [7.035767967317395, 8.835767967317395, 9.835767967317395, 8.852191170585655, 7.96697205352709]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.6677679673173955, 5.415767967317395, 6.035767967317395, 6.332191170585656, 5.698972053527091], [6.315767967317395, 7.035767967317395, 7.835767967317395, 7.0521911705856555, 6.34697205352709], [7.035767967317395, 7.835767967317395, 9.835767967317395, 7.852191170585655, 7.06697205352709], [7.835767967317395, 9.835767967317395, 9.835767967317395, 9.852191170585655, 7.866972053527091], [7.0521911705856555, 8.852191170585655, 9.852191170585655, 8.86697205352709, 7.980274848174382]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.684191170585656, 5.432191170585655, 6.0521911705856555, 6.34697205352709, 5.712274848174381], [6.332191170585656, 7.0521911705856555, 7.852191170585655, 7.06697205352709, 6.360274848174381], [7.0521911705856555, 7.852191170585655, 9.852191170585655, 7.866972053527091, 7.080274848174382], [7.852191170585655, 9.852191170585655, 9.852191170585655, 9.86697205352709, 7.880274848174382], [7.06697205352709, 8.86697205352709, 9.86697205352709, 8.880274848174382, 7.992247363356944]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.698972053527091, 5.44697205352709, 6.06697205352709, 6.360274848174381, 5.724247363356943], [6.34697205352709, 7.06697205352709, 7.866972053527091, 7.080274848174382, 6.372247363356943], [7.06697205352709, 7.866972053527091, 9.86697205352709, 7.880274848174382, 7.092247363356944], [7.866972053527091, 9.86697205352709, 9.86697205352709, 9.880274848174382, 7.892247363356944], [7.080274848174382, 8.880274848174382, 9.880274848174382, 8.892247363356944, 8.00302262702125]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.712274848174381, 5.4602748481743815, 6.080274848174382, 6.372247363356943, 5.735022627021249], [6.360274848174381, 7.080274848174382, 7.880274848174382, 7.092247363356944, 6.38302262702125], [7.080274848174382, 7.880274848174382, 9.880274848174382, 7.892247363356944, 7.103022627021249], [7.880274848174382, 9.880274848174382, 9.880274848174382, 9.892247363356944, 7.903022627021249], [7.092247363356944, 8.892247363356944, 9.892247363356944, 8.90302262702125, 8.012720364319124]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.724247363356943, 5.472247363356944, 6.092247363356944, 6.38302262702125, 5.744720364319125], [6.372247363356943, 7.092247363356944, 7.892247363356944, 7.103022627021249, 6.392720364319125], [7.092247363356944, 7.892247363356944, 9.892247363356944, 7.903022627021249, 7.112720364319125], [7.892247363356944, 9.892247363356944, 9.892247363356944, 9.90302262702125, 7.912720364319124], [7.103022627021249, 8.90302262702125, 9.90302262702125, 8.912720364319124, 8.021448327887212]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.735022627021249, 5.48302262702125, 6.103022627021249, 6.392720364319125, 5.753448327887212], [6.38302262702125, 7.103022627021249, 7.903022627021249, 7.112720364319125, 6.401448327887212], [7.103022627021249, 7.903022627021249, 9.90302262702125, 7.912720364319124, 7.1214483278872125], [7.903022627021249, 9.90302262702125, 9.90302262702125, 9.912720364319124, 7.921448327887212], [7.112720364319125, 8.912720364319124, 9.912720364319124, 8.921448327887212, 8.02930349509849]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.744720364319125, 5.4927203643191245, 6.112720364319125, 6.401448327887212, 5.761303495098491], [6.392720364319125, 7.112720364319125, 7.912720364319124, 7.1214483278872125, 6.4093034950984915], [7.112720364319125, 7.912720364319124, 9.912720364319124, 7.921448327887212, 7.129303495098491], [7.912720364319124, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.929303495098491], [7.1214483278872125, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.753448327887212, 5.501448327887212, 6.1214483278872125, 6.4093034950984915, 5.768373145588643], [6.401448327887212, 7.1214483278872125, 7.921448327887212, 7.129303495098491, 6.416373145588643], [7.1214483278872125, 7.921448327887212, 9.921448327887212, 7.929303495098491, 7.136373145588642], [7.921448327887212, 9.921448327887212, 9.921448327887212, 9.929303495098491, 7.936373145588643], [7.129303495098491, 8.929303495098491, 9.929303495098491, 8.936373145588643, 8.042735831029779]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.761303495098491, 5.509303495098491, 6.129303495098491, 6.416373145588643, 5.774735831029778], [6.4093034950984915, 7.129303495098491, 7.929303495098491, 7.136373145588642, 6.422735831029779], [7.129303495098491, 7.929303495098491, 9.929303495098491, 7.936373145588643, 7.142735831029779], [7.929303495098491, 9.929303495098491, 9.929303495098491, 9.936373145588643, 7.942735831029779], [7.136373145588642, 8.936373145588643, 9.936373145588643, 8.942735831029779, 8.048462247926802]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.768373145588643, 5.516373145588642, 6.136373145588642, 6.422735831029779, 5.780462247926801], [6.416373145588643, 7.136373145588642, 7.936373145588643, 7.142735831029779, 6.428462247926801], [7.136373145588642, 7.936373145588643, 9.936373145588643, 7.942735831029779, 7.148462247926801], [7.936373145588643, 9.936373145588643, 9.936373145588643, 9.942735831029779, 7.948462247926802], [7.142735831029779, 8.942735831029779, 9.942735831029779, 8.948462247926802, 8.053616023134122]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.774735831029778, 5.522735831029778, 6.142735831029779, 6.428462247926801, 5.785616023134121], [6.422735831029779, 7.142735831029779, 7.942735831029779, 7.148462247926801, 6.433616023134121], [7.142735831029779, 7.942735831029779, 9.942735831029779, 7.948462247926802, 7.153616023134122], [7.942735831029779, 9.942735831029779, 9.942735831029779, 9.948462247926802, 7.953616023134122], [7.148462247926801, 8.948462247926802, 9.948462247926802, 8.953616023134122, 8.05825442082071]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.780462247926801, 5.528462247926801, 6.148462247926801, 6.433616023134121, 5.790254420820709], [6.428462247926801, 7.148462247926801, 7.948462247926802, 7.153616023134122, 6.4382544208207095], [7.148462247926801, 7.948462247926802, 9.948462247926802, 7.953616023134122, 7.15825442082071], [7.948462247926802, 9.948462247926802, 9.948462247926802, 9.953616023134122, 7.95825442082071], [7.153616023134122, 8.953616023134122, 9.953616023134122, 8.95825442082071, 8.06242897873864]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.785616023134121, 5.533616023134122, 6.153616023134122, 6.4382544208207095, 5.7944289787386385], [6.433616023134121, 7.153616023134122, 7.953616023134122, 7.15825442082071, 6.442428978738639], [7.153616023134122, 7.953616023134122, 9.953616023134122, 7.95825442082071, 7.162428978738639], [7.953616023134122, 9.953616023134122, 9.953616023134122, 9.95825442082071, 7.9624289787386395], [7.15825442082071, 8.95825442082071, 9.95825442082071, 8.96242897873864, 8.066186080864776]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.790254420820709, 5.53825442082071, 6.15825442082071, 6.442428978738639, 5.798186080864776], [6.4382544208207095, 7.15825442082071, 7.95825442082071, 7.162428978738639, 6.446186080864775], [7.15825442082071, 7.95825442082071, 9.95825442082071, 7.9624289787386395, 7.166186080864776], [7.95825442082071, 9.95825442082071, 9.95825442082071, 9.96242897873864, 7.966186080864777], [7.162428978738639, 8.96242897873864, 9.96242897873864, 8.966186080864777, 8.0695674727783]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.7944289787386385, 5.54242897873864, 6.162428978738639, 6.446186080864775, 5.801567472778298], [6.442428978738639, 7.162428978738639, 7.9624289787386395, 7.166186080864776, 6.449567472778298], [7.162428978738639, 7.9624289787386395, 9.96242897873864, 7.966186080864777, 7.169567472778299], [7.9624289787386395, 9.96242897873864, 9.96242897873864, 9.966186080864777, 7.9695674727783], [7.166186080864776, 8.966186080864777, 9.966186080864777, 8.9695674727783, 8.07261072550047]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.798186080864776, 5.546186080864775, 6.166186080864776, 6.449567472778298, 5.804610725500469], [6.446186080864775, 7.166186080864776, 7.966186080864777, 7.169567472778299, 6.452610725500469], [7.166186080864776, 7.966186080864777, 9.966186080864777, 7.9695674727783, 7.17261072550047], [7.966186080864777, 9.966186080864777, 9.966186080864777, 9.9695674727783, 7.97261072550047], [7.169567472778299, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.801567472778298, 5.549567472778299, 6.169567472778299, 6.452610725500469, 5.807349652950423], [6.449567472778298, 7.169567472778299, 7.9695674727783, 7.17261072550047, 6.4553496529504235], [7.169567472778299, 7.9695674727783, 9.9695674727783, 7.97261072550047, 7.175349652950423], [7.9695674727783, 9.9695674727783, 9.9695674727783, 9.97261072550047, 7.975349652950424], [7.17261072550047, 8.97261072550047, 9.97261072550047, 8.975349652950424, 8.077814687655382]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.804610725500469, 5.552610725500469, 6.17261072550047, 6.4553496529504235, 5.809814687655381], [6.452610725500469, 7.17261072550047, 7.97261072550047, 7.175349652950423, 6.4578146876553815], [7.17261072550047, 7.97261072550047, 9.97261072550047, 7.975349652950424, 7.177814687655382], [7.97261072550047, 9.97261072550047, 9.97261072550047, 9.975349652950424, 7.977814687655382], [7.175349652950423, 8.975349652950424, 9.975349652950424, 8.977814687655382, 8.080033218889843]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.807349652950423, 5.555349652950423, 6.175349652950423, 6.4578146876553815, 5.812033218889844], [6.4553496529504235, 7.175349652950423, 7.975349652950424, 7.177814687655382, 6.460033218889844], [7.175349652950423, 7.975349652950424, 9.975349652950424, 7.977814687655382, 7.180033218889844], [7.975349652950424, 9.975349652950424, 9.975349652950424, 9.977814687655382, 7.980033218889844], [7.177814687655382, 8.977814687655382, 9.977814687655382, 8.980033218889844, 8.08202989700086]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.809814687655381, 5.557814687655381, 6.177814687655382, 6.460033218889844, 5.81402989700086], [6.4578146876553815, 7.177814687655382, 7.977814687655382, 7.180033218889844, 6.46202989700086], [7.177814687655382, 7.977814687655382, 9.977814687655382, 7.980033218889844, 7.182029897000859], [7.977814687655382, 9.977814687655382, 9.977814687655382, 9.980033218889844, 7.98202989700086], [7.180033218889844, 8.980033218889844, 9.980033218889844, 8.98202989700086, 8.083826907300775]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.812033218889844, 5.560033218889844, 6.180033218889844, 6.46202989700086, 5.815826907300774], [6.460033218889844, 7.180033218889844, 7.980033218889844, 7.182029897000859, 6.463826907300773], [7.180033218889844, 7.980033218889844, 9.980033218889844, 7.98202989700086, 7.183826907300774], [7.980033218889844, 9.980033218889844, 9.980033218889844, 9.98202989700086, 7.983826907300774], [7.182029897000859, 8.98202989700086, 9.98202989700086, 8.983826907300774, 8.085444216570696]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.81402989700086, 5.562029897000859, 6.182029897000859, 6.463826907300773, 5.817444216570696], [6.46202989700086, 7.182029897000859, 7.98202989700086, 7.183826907300774, 6.465444216570696], [7.182029897000859, 7.98202989700086, 9.98202989700086, 7.983826907300774, 7.185444216570697], [7.98202989700086, 9.98202989700086, 9.98202989700086, 9.983826907300774, 7.985444216570697], [7.183826907300774, 8.983826907300774, 9.983826907300774, 8.985444216570697, 8.086899794913627]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.815826907300774, 5.563826907300774, 6.183826907300774, 6.465444216570696, 5.8188997949136265], [6.463826907300773, 7.183826907300774, 7.983826907300774, 7.185444216570697, 6.466899794913627], [7.183826907300774, 7.983826907300774, 9.983826907300774, 7.985444216570697, 7.186899794913627], [7.983826907300774, 9.983826907300774, 9.983826907300774, 9.985444216570697, 7.986899794913628], [7.185444216570697, 8.985444216570697, 9.985444216570697, 8.986899794913628, 8.088209815422266]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.817444216570696, 5.565444216570697, 6.185444216570697, 6.466899794913627, 5.820209815422264], [6.465444216570696, 7.185444216570697, 7.985444216570697, 7.186899794913627, 6.468209815422265], [7.185444216570697, 7.985444216570697, 9.985444216570697, 7.986899794913628, 7.188209815422265], [7.985444216570697, 9.985444216570697, 9.985444216570697, 9.986899794913628, 7.988209815422264], [7.186899794913627, 8.986899794913628, 9.986899794913628, 8.988209815422264, 8.089388833880038]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8188997949136265, 5.566899794913628, 6.186899794913627, 6.468209815422265, 5.821388833880039], [6.466899794913627, 7.186899794913627, 7.986899794913628, 7.188209815422265, 6.469388833880039], [7.186899794913627, 7.986899794913628, 9.986899794913628, 7.988209815422264, 7.189388833880038], [7.986899794913628, 9.986899794913628, 9.986899794913628, 9.988209815422264, 7.989388833880039], [7.188209815422265, 8.988209815422264, 9.988209815422264, 8.989388833880039, 8.090449950492035]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.820209815422264, 5.568209815422264, 6.188209815422265, 6.469388833880039, 5.822449950492035], [6.468209815422265, 7.188209815422265, 7.988209815422264, 7.189388833880038, 6.470449950492035], [7.188209815422265, 7.988209815422264, 9.988209815422264, 7.989388833880039, 7.190449950492035], [7.988209815422264, 9.988209815422264, 9.988209815422264, 9.989388833880039, 7.990449950492035], [7.189388833880038, 8.989388833880039, 9.989388833880039, 8.990449950492035, 8.091404955442831]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.821388833880039, 5.569388833880039, 6.189388833880038, 6.470449950492035, 5.8234049554428315], [6.469388833880039, 7.189388833880038, 7.989388833880039, 7.190449950492035, 6.471404955442832], [7.189388833880038, 7.989388833880039, 9.989388833880039, 7.990449950492035, 7.191404955442832], [7.989388833880039, 9.989388833880039, 9.989388833880039, 9.990449950492035, 7.991404955442832], [7.190449950492035, 8.990449950492035, 9.990449950492035, 8.991404955442832, 8.09226445989855]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.822449950492035, 5.570449950492034, 6.190449950492035, 6.471404955442832, 5.824264459898549], [6.470449950492035, 7.190449950492035, 7.990449950492035, 7.191404955442832, 6.472264459898549], [7.190449950492035, 7.990449950492035, 9.990449950492035, 7.991404955442832, 7.192264459898548], [7.990449950492035, 9.990449950492035, 9.990449950492035, 9.991404955442832, 7.992264459898548], [7.191404955442832, 8.991404955442832, 9.991404955442832, 8.992264459898548, 8.093038013908693]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8234049554428315, 5.571404955442832, 6.191404955442832, 6.472264459898549, 5.825038013908694], [6.471404955442832, 7.191404955442832, 7.991404955442832, 7.192264459898548, 6.473038013908694], [7.191404955442832, 7.991404955442832, 9.991404955442832, 7.992264459898548, 7.193038013908693], [7.991404955442832, 9.991404955442832, 9.991404955442832, 9.992264459898548, 7.993038013908693], [7.192264459898548, 8.992264459898548, 9.992264459898548, 8.993038013908693, 8.093734212517823]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.824264459898549, 5.572264459898549, 6.192264459898548, 6.473038013908694, 5.825734212517824], [6.472264459898549, 7.192264459898548, 7.992264459898548, 7.193038013908693, 6.473734212517824], [7.192264459898548, 7.992264459898548, 9.992264459898548, 7.993038013908693, 7.193734212517824], [7.992264459898548, 9.992264459898548, 9.992264459898548, 9.993038013908693, 7.993734212517824], [7.193038013908693, 8.993038013908693, 9.993038013908693, 8.993734212517824, 8.094360791266041]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.825038013908694, 5.573038013908693, 6.193038013908693, 6.473734212517824, 5.826360791266042], [6.473038013908694, 7.193038013908693, 7.993038013908693, 7.193734212517824, 6.474360791266042], [7.193038013908693, 7.993038013908693, 9.993038013908693, 7.993734212517824, 7.194360791266042], [7.993038013908693, 9.993038013908693, 9.993038013908693, 9.993734212517824, 7.9943607912660415], [7.193734212517824, 8.993734212517824, 9.993734212517824, 8.994360791266041, 8.094924712139438]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.825734212517824, 5.573734212517824, 6.193734212517824, 6.474360791266042, 5.826924712139438], [6.473734212517824, 7.193734212517824, 7.993734212517824, 7.194360791266042, 6.474924712139438], [7.193734212517824, 7.993734212517824, 9.993734212517824, 7.9943607912660415, 7.1949247121394375], [7.993734212517824, 9.993734212517824, 9.993734212517824, 9.994360791266041, 7.994924712139438], [7.194360791266042, 8.994360791266041, 9.994360791266041, 8.994924712139438, 8.095432240925495]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.826360791266042, 5.574360791266042, 6.194360791266042, 6.474924712139438, 5.827432240925494], [6.474360791266042, 7.194360791266042, 7.9943607912660415, 7.1949247121394375, 6.475432240925494], [7.194360791266042, 7.9943607912660415, 9.994360791266041, 7.994924712139438, 7.195432240925495], [7.9943607912660415, 9.994360791266041, 9.994360791266041, 9.994924712139438, 7.995432240925494], [7.1949247121394375, 8.994924712139438, 9.994924712139438, 8.995432240925494, 8.095889016832945]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.826924712139438, 5.574924712139437, 6.1949247121394375, 6.475432240925494, 5.827889016832945], [6.474924712139438, 7.1949247121394375, 7.994924712139438, 7.195432240925495, 6.475889016832945], [7.1949247121394375, 7.994924712139438, 9.994924712139438, 7.995432240925494, 7.195889016832945], [7.994924712139438, 9.994924712139438, 9.994924712139438, 9.995432240925494, 7.995889016832944], [7.195432240925495, 8.995432240925494, 9.995432240925494, 8.995889016832944, 8.09630011514965]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.827432240925494, 5.575432240925494, 6.195432240925495, 6.475889016832945, 5.828300115149651], [6.475432240925494, 7.195432240925495, 7.995432240925494, 7.195889016832945, 6.476300115149651], [7.195432240925495, 7.995432240925494, 9.995432240925494, 7.995889016832944, 7.19630011514965], [7.995432240925494, 9.995432240925494, 9.995432240925494, 9.995889016832944, 7.99630011514965], [7.195889016832945, 8.995889016832944, 9.995889016832944, 8.99630011514965, 8.096670103634684]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.827889016832945, 5.575889016832946, 6.195889016832945, 6.476300115149651, 5.8286701036346855], [6.475889016832945, 7.195889016832945, 7.995889016832944, 7.19630011514965, 6.476670103634685], [7.195889016832945, 7.995889016832944, 9.995889016832944, 7.99630011514965, 7.196670103634685], [7.995889016832944, 9.995889016832944, 9.995889016832944, 9.99630011514965, 7.996670103634685], [7.19630011514965, 8.99630011514965, 9.99630011514965, 8.996670103634685, 8.097003093271217]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.828300115149651, 5.5763001151496505, 6.19630011514965, 6.476670103634685, 5.829003093271217], [6.476300115149651, 7.19630011514965, 7.99630011514965, 7.196670103634685, 6.477003093271216], [7.19630011514965, 7.99630011514965, 9.99630011514965, 7.996670103634685, 7.197003093271216], [7.99630011514965, 9.99630011514965, 9.99630011514965, 9.996670103634685, 7.997003093271216], [7.196670103634685, 8.996670103634685, 9.996670103634685, 8.997003093271216, 8.097302783944095]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8286701036346855, 5.576670103634685, 6.196670103634685, 6.477003093271216, 5.829302783944095], [6.476670103634685, 7.196670103634685, 7.996670103634685, 7.197003093271216, 6.477302783944094], [7.196670103634685, 7.996670103634685, 9.996670103634685, 7.997003093271216, 7.197302783944094], [7.996670103634685, 9.996670103634685, 9.996670103634685, 9.997003093271216, 7.997302783944095], [7.197003093271216, 8.997003093271216, 9.997003093271216, 8.997302783944095, 8.097572505549685]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829003093271217, 5.577003093271217, 6.197003093271216, 6.477302783944094, 5.829572505549685], [6.477003093271216, 7.197003093271216, 7.997003093271216, 7.197302783944094, 6.477572505549685], [7.197003093271216, 7.997003093271216, 9.997003093271216, 7.997302783944095, 7.197572505549686], [7.997003093271216, 9.997003093271216, 9.997003093271216, 9.997302783944095, 7.997572505549686], [7.197302783944094, 8.997302783944095, 9.997302783944095, 8.997572505549686, 8.097815254994718]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829302783944095, 5.577302783944095, 6.197302783944094, 6.477572505549685, 5.829815254994717], [6.477302783944094, 7.197302783944094, 7.997302783944095, 7.197572505549686, 6.477815254994717], [7.197302783944094, 7.997302783944095, 9.997302783944095, 7.997572505549686, 7.197815254994717], [7.997302783944095, 9.997302783944095, 9.997302783944095, 9.997572505549686, 7.997815254994718], [7.197572505549686, 8.997572505549686, 9.997572505549686, 8.997815254994718, 8.098033729495246]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829572505549685, 5.577572505549685, 6.197572505549686, 6.477815254994717, 5.830033729495246], [6.477572505549685, 7.197572505549686, 7.997572505549686, 7.197815254994717, 6.4780337294952455], [7.197572505549686, 7.997572505549686, 9.997572505549686, 7.997815254994718, 7.198033729495246], [7.997572505549686, 9.997572505549686, 9.997572505549686, 9.997815254994718, 7.998033729495246], [7.197815254994717, 8.997815254994718, 9.997815254994718, 8.998033729495246, 8.098230356545722]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829815254994717, 5.577815254994717, 6.197815254994717, 6.4780337294952455, 5.830230356545721], [6.477815254994717, 7.197815254994717, 7.997815254994718, 7.198033729495246, 6.478230356545722], [7.197815254994717, 7.997815254994718, 9.997815254994718, 7.998033729495246, 7.1982303565457215], [7.997815254994718, 9.997815254994718, 9.997815254994718, 9.998033729495246, 7.998230356545722], [7.198033729495246, 8.998033729495246, 9.998033729495246, 8.998230356545722, 8.09840732089115]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830033729495246, 5.578033729495246, 6.198033729495246, 6.478230356545722, 5.830407320891149], [6.4780337294952455, 7.198033729495246, 7.998033729495246, 7.1982303565457215, 6.47840732089115], [7.198033729495246, 7.998033729495246, 9.998033729495246, 7.998230356545722, 7.1984073208911505], [7.998033729495246, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.99840732089115], [7.1982303565457215, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830230356545721, 5.578230356545721, 6.1982303565457215, 6.47840732089115, 5.830566588802035], [6.478230356545722, 7.1982303565457215, 7.998230356545722, 7.1984073208911505, 6.478566588802035], [7.1982303565457215, 7.998230356545722, 9.998230356545722, 7.99840732089115, 7.198566588802035], [7.998230356545722, 9.998230356545722, 9.998230356545722, 9.99840732089115, 7.998566588802035], [7.1984073208911505, 8.99840732089115, 9.99840732089115, 8.998566588802035, 8.098709929921831]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830407320891149, 5.5784073208911495, 6.1984073208911505, 6.478566588802035, 5.830709929921832], [6.47840732089115, 7.1984073208911505, 7.99840732089115, 7.198566588802035, 6.478709929921831], [7.1984073208911505, 7.99840732089115, 9.99840732089115, 7.998566588802035, 7.198709929921832], [7.99840732089115, 9.99840732089115, 9.99840732089115, 9.998566588802035, 7.998709929921832], [7.198566588802035, 8.998566588802035, 9.998566588802035, 8.998709929921832, 8.09883893692965]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830566588802035, 5.578566588802036, 6.198566588802035, 6.478709929921831, 5.8308389369296485], [6.478566588802035, 7.198566588802035, 7.998566588802035, 7.198709929921832, 6.478838936929649], [7.198566588802035, 7.998566588802035, 9.998566588802035, 7.998709929921832, 7.198838936929649], [7.998566588802035, 9.998566588802035, 9.998566588802035, 9.998709929921832, 7.9988389369296495], [7.198709929921832, 8.998709929921832, 9.998709929921832, 8.99883893692965, 8.098955043236685]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830709929921832, 5.578709929921832, 6.198709929921832, 6.478838936929649, 5.830955043236684], [6.478709929921831, 7.198709929921832, 7.998709929921832, 7.198838936929649, 6.4789550432366845], [7.198709929921832, 7.998709929921832, 9.998709929921832, 7.9988389369296495, 7.198955043236685], [7.998709929921832, 9.998709929921832, 9.998709929921832, 9.99883893692965, 7.998955043236684], [7.198838936929649, 8.99883893692965, 9.99883893692965, 8.998955043236684, 8.099059538913016]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8308389369296485, 5.578838936929649, 6.198838936929649, 6.4789550432366845, 5.831059538913016], [6.478838936929649, 7.198838936929649, 7.9988389369296495, 7.198955043236685, 6.479059538913017], [7.198838936929649, 7.9988389369296495, 9.99883893692965, 7.998955043236684, 7.199059538913016], [7.9988389369296495, 9.99883893692965, 9.99883893692965, 9.998955043236684, 7.999059538913016], [7.198955043236685, 8.998955043236684, 9.998955043236684, 8.999059538913016, 8.099153585021716]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830955043236684, 5.578955043236684, 6.198955043236685, 6.479059538913017, 5.831153585021715], [6.4789550432366845, 7.198955043236685, 7.998955043236684, 7.199059538913016, 6.479153585021714], [7.198955043236685, 7.998955043236684, 9.998955043236684, 7.999059538913016, 7.1991535850217145], [7.998955043236684, 9.998955043236684, 9.998955043236684, 9.999059538913016, 7.999153585021714], [7.199059538913016, 8.999059538913016, 9.999059538913016, 8.999153585021714, 8.099238226519542]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831059538913016, 5.579059538913016, 6.199059538913016, 6.479153585021714, 5.831238226519543], [6.479059538913017, 7.199059538913016, 7.999059538913016, 7.1991535850217145, 6.479238226519543], [7.199059538913016, 7.999059538913016, 9.999059538913016, 7.999153585021714, 7.199238226519543], [7.999059538913016, 9.999059538913016, 9.999059538913016, 9.999153585021714, 7.999238226519543], [7.1991535850217145, 8.999153585021714, 9.999153585021714, 8.999238226519543, 8.099314403867588]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831153585021715, 5.579153585021714, 6.1991535850217145, 6.479238226519543, 5.831314403867589], [6.479153585021714, 7.1991535850217145, 7.999153585021714, 7.199238226519543, 6.479314403867589], [7.1991535850217145, 7.999153585021714, 9.999153585021714, 7.999238226519543, 7.1993144038675885], [7.999153585021714, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.999314403867588], [7.199238226519543, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [8.999999920397968, 8.099999911553297, 7.289999911553298, 6.5609999115532975, 5.904899911553298, 5.314409911553298, 4.782968911553298, 4.304672011553297, 3.8742048015532977, 3.4867843125532976, 3.1381058724532984, 2.8242952763632982, 2.5418657398822977, 2.287679157049398, 2.058911232499788, 1.8530201004051392, 1.667718081519955, 1.5009462645232894, 1.3508516292262893, 1.2157664574589901, 1.0941898028684207, 0.9847708137369091, 0.8862937235185475, 0.7976643423220233, 0.7178978992451501, 0.6461081004759643, 0.5814972815836974, 0.5233475445806572, 0.47101278127792234, 0.42391149430546005, 0.3815203360302428, 0.3433682935825475, 0.30903145537962295, 0.2781283009969906, 0.2503154620526207, 0.2252839070026873, 0.2027555074577485, 0.18247994786730448, 0.1642319442359037, 0.14780874096764318, 0.13302785802620853, 0.11972506337891708, 0.1077525481963546, 0.09697728453204846, 0.08727954723417408, 0.07855158366608617, 0.0706964164548074, 0.06362676596465633, 0.05726408052352028, 0.051537663626497476, 0.046383888419176955, 0.041745490732588486, 0.03757093281465895, 0.033813830688523616, 0.03043243877499968, 0.027389186052829473, 0.024650258602875397, 0.02218522389791744, 0.019966692663454744, 0.017970014552439295, 0.01617300425252477, 0.014555694982601786, 0.013100116639670922, 0.011790096131034211, 0.01061107767325975, 0.009549961061264156, 0.00859495611046679, 0.007735451654749426, 0.006961897644605308, 0.006265699035474803, 0.0056391202872569934, 0.005075199413861142, 0.00456767062780461, 0.004110894720353642, 0.003699796403648037, 0.003329807918613703, 0.002996818282081648, 0.002697127609203598, 0.0024274060036137968, 0.002184656558581466, 0.0019661820580525458, 0.0017695550075771393, 0.0015925906621490071, 0.0014333227512626223, 0.0012899816314666523, 0.0011609746236498353, 0.0010448683166144335, 0.0009403726402821277, 0.0008463265315841184]}, "pi": {"frames": [{"V": [[0.0, -8.999153585021714, -9.999153585021714, -8.999314403867588, 0.0], [0.0, -9.999153585021714, -9.999238226519543, -9.999314403867588, 0.0], [0.0, -9.999153585021714, -9.999153585021714, 0.0, 0.0], [0.0, 9.999153585021714, 9.999153585021714, -9.999153585021714, -9.999238226519543], [0.0, -9.999153585021714, 9.999238226519543, 8.999314403867588, -9.999153585021714]], "policy": [[1, 2, 2, 3, 1], [0, 2, 0, 1, 0], [0, 1, 1, 3, 0], [3, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 7.999314403867588, 9.999314403867588, 0.0, 0.0], [7.999314403867588, 9.999314403867588, 9.999314403867588, 9.99938296348083, 0.0], [7.199382963480829, 8.99938296348083, 9.99938296348083, 8.999444667132748, 8.099500200419474]], "policy": [[1, 2, 2, 1, 1], [0, 1, 1, 0, 0], [1, 1, 1, 1, 0], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 7.199444667132747, 7.999444667132748, 0.0, 0.0], [7.199444667132747, 7.999444667132748, 9.999444667132748, 7.999500200419472, 0.0], [7.999444667132748, 9.999444667132748, 9.999444667132748, 9.999500200419472, 7.9995501803775255], [7.1995002004194735, 8.999500200419472, 9.999500200419472, 8.999550180377526, 8.099595162339773]], "policy": [[1, 1, 1, 1, 1], [1, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831595162339774, 5.479595162339773, 6.199595162339773, 6.479635646105796, 0.0], [6.479595162339773, 7.199595162339773, 7.999595162339773, 7.199635646105796, 0.0], [7.199595162339773, 7.999595162339773, 9.999595162339773, 7.999635646105796, 7.199672081495216], [7.999595162339773, 9.999595162339773, 9.999595162339773, 9.999635646105796, 7.999672081495216], [7.199635646105796, 8.999635646105796, 9.999635646105796, 8.999672081495216, 8.099704873345695]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831672081495216, 5.579672081495216, 6.199672081495216, 6.479704873345695, 5.831734386011126], [6.479672081495217, 7.199672081495216, 7.999672081495216, 7.199704873345695, 6.479734386011126], [7.199672081495216, 7.999672081495216, 9.999672081495216, 7.999704873345696, 7.1997343860111265], [7.999672081495216, 9.999672081495216, 9.999672081495216, 9.999704873345696, 7.999734386011127], [7.199704873345695, 8.999704873345696, 9.999704873345696, 8.999734386011127, 8.099760947410015]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8317048733456955, 5.579704873345695, 6.199704873345695, 6.479734386011126, 5.831760947410014], [6.479704873345695, 7.199704873345695, 7.999704873345696, 7.1997343860111265, 6.479760947410014], [7.199704873345695, 7.999704873345696, 9.999704873345696, 7.999734386011127, 7.199760947410015], [7.999704873345696, 9.999704873345696, 9.999704873345696, 9.999734386011127, 7.9997609474100155], [7.1997343860111265, 8.999734386011127, 9.999734386011127, 8.999760947410016, 8.099784852669014]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [19.999153505419685, 7.9999999283581715, 7.199999928358172, 6.479999928358171, 0.00032783005808223464, 0.0002950382076036817]}, "tpi": {"3": {"frames": [{"V": [[-1.71, -2.5389999999999997, 0.0, 0.0, 0.0], [-2.71, -2.439, -0.18099999999999994, 0.0, 0.0], [0.0, -0.18099999999999994, 0.8371000000000001, -1.81, -1.629], [-1.71, -0.16289999999999996, -0.24660999999999988, -1.629, -2.4661], [-2.71, -1.71, -2.71, -2.439, 0.0]], "policy": [[4, 3, 3, 1, 1], [1, 1, 0, 0, 0], [4, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 0, 0, 3, 4]]}, {"V": [[-1.24659, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.53022131, 0.0, 0.0], [0.0, 2.53022131, 2.53022131, 3.277199179, 0.0], [0.0, 1.2771991790000001, 3.277199179, 0.0, 0.0]], "policy": [[1, 3, 2, 1, 1], [1, 0, 1, 0, 0], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [3, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.55453133499, 0.0, 0.0], [0.0, 2.55453133499, 4.55453133499, 3.0990782014910003, 0.0], [2.55453133499, 4.55453133499, 4.55453133499, 5.099078201491, 3.5891703813419005], [2.199078201491, 4.099078201491, 5.099078201491, 4.5891703813419005, 3.2302533432077105]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 2.2302533432077105, 2.9072280088869396, 0.0], [0.0, 3.2302533432077105, 4.03025334320771, 3.6272280088869393, 0.0], [3.2302533432077105, 4.03025334320771, 6.03025334320771, 4.42722800888694, 3.9845052079982457], [4.03025334320771, 6.03025334320771, 6.03025334320771, 6.42722800888694, 4.7845052079982455], [3.527228008886939, 5.42722800888694, 6.42722800888694, 5.7845052079982455, 5.206054687198421]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.938054687198421, 2.686054687198421, 3.3060546871984213, 3.8754492184785794, 3.4879042966307217], [3.586054687198421, 4.306054687198421, 5.106054687198421, 4.59544921847858, 4.135904296630722], [4.306054687198421, 5.106054687198421, 7.106054687198421, 5.395449218478579, 4.8559042966307215], [5.106054687198421, 7.106054687198421, 7.106054687198421, 7.395449218478579, 5.655904296630721], [4.495449218478579, 6.395449218478579, 7.395449218478579, 6.655904296630721, 5.990313866967649]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.72231386696765, 3.4703138669676497, 4.09031386696765, 4.581282480270885, 4.123154232243797], [4.370313866967649, 5.09031386696765, 5.89031386696765, 5.301282480270885, 4.771154232243797], [5.09031386696765, 5.89031386696765, 7.89031386696765, 6.101282480270885, 5.4911542322437965], [5.89031386696765, 7.89031386696765, 7.89031386696765, 8.101282480270886, 6.291154232243797], [5.201282480270884, 7.101282480270885, 8.101282480270886, 7.291154232243797, 6.562038809019418]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}], "errors": [12.70999992039797, 8.999999928358172, 7.199999928358172, 6.479999928358171, 2.8939452243548773, 2.109686044585649]}, "9": {"frames": [{"V": [[0.0, -4.586795110000001, -4.415795110000001, -3.974215599000001, -6.12579511], [0.0, -4.415795110000001, -4.225795110000001, -5.12579511, -6.12579511], [-6.12579511, -5.1518940391, -4.803215599000001, -6.12579511, -5.5132155990000005], [-5.5132155990000005, -4.961894039100001, 6.12579511, -6.12579511, -6.5132155990000005], [-6.12579511, -5.465704635190001, 0.0, -6.5132155990000005, -6.12579511]], "policy": [[1, 2, 3, 4, 2], [0, 2, 0, 0, 2], [0, 4, 1, 0, 4], [4, 3, 4, 2, 0], [0, 3, 0, 2, 4]]}, {"V": [[0.0, 0.0, -1.5396925507560086, -1.5396925507560086, -1.3857232956804078], [0.0, 0.0, -1.3857232956804078, -1.3857232956804078, -1.247150966112367], [0.0, -1.9959493079043076, 8.49905364703001, -1.247150966112367, -2.1359326833270087], [-2.1359326833270087, 8.49905364703001, 8.49905364703001, 8.649148282327008, -1.9223394149943078], [-1.9223394149943078, 7.649148282327009, 8.649148282327008, 7.7842334540943074, -2.3732585370300097]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 1, 4], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 5.956652366972642, -0.48317183714807577], [0.0, 0.0, 7.4185026299696, 6.6766523669726405, -0.48317183714807577], [0.0, 7.4185026299696, 9.4185026299696, 7.47665236697264, -0.4348546534332682], [7.4185026299696, 9.4185026299696, 9.4185026299696, 9.47665236697264, 7.528987130275377], [6.57665236697264, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[1, 2, 1, 1, 2], [0, 1, 1, 1, 2], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 5.974716004550611, 6.27724440409555, 5.649519963685996], [0.0, 6.974716004550611, 7.77471600455061, 6.997244404095549, 6.297519963685994], [6.974716004550611, 7.77471600455061, 9.77471600455061, 7.797244404095549, 7.017519963685994], [7.77471600455061, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.817519963685994], [6.997244404095549, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.744720364319125, 5.4927203643191245, 6.112720364319125, 6.401448327887212, 5.761303495098491], [6.392720364319125, 7.112720364319125, 7.912720364319124, 7.1214483278872125, 6.4093034950984915], [7.112720364319125, 7.912720364319124, 9.912720364319124, 7.921448327887212, 7.129303495098491], [7.912720364319124, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.929303495098491], [7.1214483278872125, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [16.125795030397967, 10.473258472552365, 7.63485458179144, 6.479999911553298, 0.08727954723417408]}, "27": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, -9.4185026299696], [-8.4185026299696, 0.0, -5.241186537274057, -4.717067883546652, 0.0], [-9.4185026299696, -5.245361095191987, -4.717067883546652, -5.245361095191987, 0.0], [-5.245361095191987, -4.720824985672788, -5.245361095191987, -4.720824985672788, 0.0], [0.0, -8.4185026299696, -9.4185026299696, 0.0, 0.0]], "policy": [[3, 2, 2, 2, 1], [0, 0, 0, 0, 1], [1, 0, 1, 3, 0], [1, 3, 4, 1, 0], [4, 2, 3, 3, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, -1.0, 9.11348626179821, 0.0, 0.0], [0.0, 9.11348626179821, 9.11348626179821, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 0, 0], [0, 1, 1, 2, 0], [3, 3, 4, 2, 0], [0, 0, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 7.948449459273986, 0.0, 0.0], [0.0, 7.948449459273986, 9.948449459273986, 7.953604513346587, 0.0], [7.948449459273986, 9.948449459273986, 9.948449459273986, 9.953604513346587, 0.0], [7.153604513346588, 7.953604513346587, 9.953604513346587, 8.958244062011929, 0.0]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 0], [1, 1, 1, 1, 2], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 6.1970023496144195, 6.477302114652978, 0.0], [0.0, 7.1970023496144195, 7.997002349614419, 7.197302114652977, 0.0], [7.1970023496144195, 7.997002349614419, 9.99700234961442, 7.997302114652978, 7.19757190318768], [7.997002349614419, 9.99700234961442, 9.99700234961442, 9.997302114652978, 7.99757190318768], [7.197302114652977, 8.997302114652978, 9.997302114652978, 8.99757190318768, 8.097814712868912]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831153374991068, 5.579153374991068, 6.1991533749910674, 6.479238037491961, 5.8313142337427655], [6.479153374991069, 7.1991533749910674, 7.999153374991067, 7.199238037491961, 6.479314233742765], [7.1991533749910674, 7.999153374991067, 9.999153374991067, 7.999238037491962, 7.199314233742766], [7.999153374991067, 9.999153374991067, 9.999153374991067, 9.999238037491962, 7.999314233742766], [7.199238037491961, 8.999238037491962, 9.999238037491962, 8.999314233742766, 8.099382810368489]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8312380374919615, 5.579238037491961, 6.199238037491961, 6.479314233742765, 5.831382810368488], [6.479238037491961, 7.199238037491961, 7.999238037491962, 7.199314233742766, 6.479382810368489], [7.199238037491961, 7.999238037491962, 9.999238037491962, 7.999314233742766, 7.19938281036849], [7.999238037491962, 9.999238037491962, 9.999238037491962, 9.999314233742766, 7.999382810368489], [7.199314233742766, 8.999314233742766, 9.999314233742766, 8.99938281036849, 8.09944452933164]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [19.41850255036757, 9.999999920397968, 8.099999935522355, 6.479999928358171, 0.0008465365622303267, 0.0007618740613377639]}, "81": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, -9.998033729495246], [0.0, -9.998033729495246, -0.42631576435204876, -0.47368418791684386, -0.4263157691251595], [-8.098033729495246, -7.288230356545721, 0.5263158120831561, -0.5263157691251594, -0.4736841922126435], [-8.998033729495246, -9.999999570420037, -0.5263157691251594, 0.5263158077873564, -0.5263157729913792], [-9.998033729495246, -9.999999613378034, 0.5263158077873564, 0.4736842270086208, -9.998033729495246]], "policy": [[1, 2, 2, 2, 2], [0, 0, 0, 0, 4], [0, 3, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, -8.382521225429706e-05], [0.0, 7.997930241577945, 9.997930241577945, 0.0, -7.544269102886735e-05], [0.0, 9.997930241577945, 9.997930241577945, 9.998137217420151, -6.789842192598061e-05], [0.0, 8.998137217420151, 9.998137217420151, 8.998323495678136, 8.098491146110323]], "policy": [[1, 2, 2, 1, 2], [0, 1, 1, 0, 0], [3, 1, 1, 1, 2], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 7.199109036866685, 7.999109036866685, 0.0, 0.0], [7.199109036866685, 7.999109036866685, 9.999109036866685, 7.999198133180016, 7.199278319862015], [7.999109036866685, 9.999109036866685, 9.999109036866685, 9.999198133180016, 7.9992783198620145], [7.099198133180016, 8.999198133180016, 9.999198133180016, 8.999278319862015, 8.099350487875814]], "policy": [[1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831350487875814, 5.479350487875814, 6.199350487875813, 6.479415439088232, 5.831473895179409], [6.479350487875814, 7.199350487875813, 7.999350487875814, 7.199415439088233, 6.479473895179409], [7.199350487875813, 7.999350487875814, 9.999350487875814, 7.999415439088233, 7.19947389517941], [7.999350487875814, 9.999350487875814, 9.999350487875814, 9.999415439088233, 7.99947389517941], [7.199415439088233, 8.999415439088233, 9.999415439088233, 8.99947389517941, 8.09952650566147]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831473895179409, 5.57947389517941, 6.19947389517941, 6.479526505661469, 5.831573855095322], [6.479473895179409, 7.19947389517941, 7.99947389517941, 7.199526505661469, 6.479573855095322], [7.19947389517941, 7.99947389517941, 9.99947389517941, 7.9995265056614695, 7.1995738550953225], [7.99947389517941, 9.99947389517941, 9.99947389517941, 9.99952650566147, 7.999573855095322], [7.199526505661469, 8.99952650566147, 9.99952650566147, 8.999573855095322, 8.09961646958579]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [19.999999481973333, 8.000067826780098, 7.199999920397968, 0.10064942367748486, 0.0005260163738887158]}}, "q_learning": {"0.1": {"V": [[5.831999999999926, 4.863434415932092, 2.710386151958623, 0.025581525263538452, 0.0], [6.479999999999922, 6.5614435338786254, 1.0881686371966623, 0.0010370481643894095, 0.0], [7.199999999999918, 7.999999999999913, 9.999999999999908, 7.690968455475366, 0.0030418210559313872], [6.410244897625935, 9.999999999999908, 9.999999999999908, 9.999999999999908, 2.597309239001765], [0.5736313988512978, 8.952834970001263, 9.999999999999908, 8.94444297437442, 5.622924214268673]], "policy": [[1.0, 2.0, 2.0, 2.0, 1.0], [1.0, 1.0, 0.0, 0.0, 0.0], [3.0, 1.0, 1.0, 2.0, 1.0], [0.0, 3.0, 4.0, 2.0, 1.0], [0.0, 3.0, 0.0, 2.0, 2.0]]}, "0.2": {"V": [[5.831999999999926, 5.054838527727106, 2.258874582558485, 0.2151301749384092, 0.0], [6.479999999999922, 5.810659140451664, 7.9536160231339235, 3.9912694973282576, 0.8508502505586957], [7.199999999999918, 7.999999999999913, 9.999999999999908, 7.999999987839698, 7.196816874895778], [6.479983243237918, 9.999999999999908, 9.999999999999908, 9.999999999999908, 6.4417775984305], [4.922344381901697, 7.999998706980412, 9.999999999999908, 7.9999930450869305, 4.265066416960207]], "policy": [[1.0, 2.0, 2.0, 2.0, 0.0], [1.0, 2.0, 1.0, 1.0, 1.0], [3.0, 1.0, 1.0, 2.0, 2.0], [0.0, 3.0, 4.0, 2.0, 0.0], [3.0, 0.0, 0.0, 0.0, 2.0]]}, "0.5": {"V": [[5.831999999999926, 5.248655468644811, 5.683729220999611, 6.46691352375883, 4.417141935859117], [6.479999999999922, 7.199980769722492, 7.999999469618926, 7.199999999985147, 6.448661653382549], [7.199999999999918, 7.999999999999913, 9.999999999999908, 7.999999999999913, 7.199961177525813], [7.999999999999913, 9.999999999999908, 9.999999999999908, 9.999999999999908, 7.999999999993075], [7.1999999968986845, 8.999999999999908, 9.999999999999908, 8.999999999999908, 8.099516505531613]], "policy": [[1.0, 2.0, 3.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0, 2.0], [1.0, 1.0, 1.0, 2.0, 2.0], [3.0, 3.0, 4.0, 2.0, 2.0], [0.0, 3.0, 0.0, 2.0, 2.0]]}}, "td_linear": {"poly_1": {"V": [[-3.8425548851330005, -3.622294784371039, -3.4020346836090773, -3.1817745828471162, -2.9615144820851547], [-3.858548772329468, -3.6382886715675062, -3.4180285708055447, -3.1977684700435836, -2.977508369281622], [-3.8745426595259356, -3.654282558763974, -3.4340224580020124, -3.2137623572400513, -2.9935022564780898], [-3.890536546722403, -3.6702764459604413, -3.4500163451984798, -3.2297562444365187, -3.009496143674557], [-3.9065304339188702, -3.6862703331569087, -3.466010232394947, -3.245750131632986, -3.0254900308710244]]}, "poly_2": {"V": [[-3.8555177673306362, -3.672036509626925, -3.5143074931650102, -3.382330717944892, -3.2761061839665713], [-3.770872332226798, -3.575766840408385, -3.406413589831769, -3.262812580496949, -3.1449638124039265], [-3.8178113518652284, -3.611081625932114, -3.4301041412407955, -3.2748788977912744, -3.145405895583551], [-3.9963348262459273, -3.7779808661981114, -3.585379147392092, -3.418529669827869, -3.2774324335054437], [-4.306442755368895, -4.076464561206378, -3.872238608285657, -3.6937648966067322, -3.541043426169605]]}, "poly_3": {"V": [[-3.8859001020100106, -3.8184681538490075, -3.5588300658801937, -3.244196100166664, -3.0117765187715158], [-3.7799400076963017, -3.6744131043408594, -3.4185241879839587, -3.1494835206886944, -3.0045013645181653], [-3.7193504134918847, -3.556602765868777, -3.285337232050563, -3.0427640741003392, -2.9660935540812017], [-3.830834957784477, -3.5917407768204765, -3.285972836467723, -3.0507413987893126, -3.0232567258483405], [-4.241097278961796, -3.9065307755836773, -3.5471346396231582, -3.3001191331433333, -3.302694518207301]]}, "fourier_1": {"V": [[-4.011151920289312, -3.8606411918166716, -3.4972761498553684, -3.133911107894065, -2.983400379421425], [-4.0044491428359565, -3.865724787599597, -3.5023597456382936, -3.1272083304407094, -2.9600291530861287], [-3.988267206602496, -3.8495428513661367, -3.4743914361685526, -3.082571572089028, -2.9036060214981663], [-3.972085270369036, -3.821574541896396, -3.429754677816871, -3.0261484405010655, -2.847182889910204], [-3.9653824929156802, -3.7982033155610995, -3.394597078245294, -2.9909908409294883, -2.8238116635749075]]}, "fourier_2": {"V": [[-3.566621517307878, -3.7094878322878886, -3.7314046834083885, -3.2965405324169943, -2.982625845285111], [-3.5658649885638174, -3.820541465681745, -3.552460658325187, -2.9578635860954323, -2.810973395810492], [-3.6304866388031485, -3.650166000286223, -3.119428969748656, -2.6368558515236398, -2.694407346401129], [-3.789080053932168, -3.594025951334677, -3.0975303611765197, -2.8673216872143765, -2.9990501300155983], [-3.8822952900777956, -3.6664820850175097, -3.3194276371795772, -3.218396453983371, -3.2486065135648117]]}, "fourier_3": {"V": [[-4.127501613035327, -3.9520239703882267, -3.549790322307701, -3.1714970035211016, -3.019959690167928], [-3.5433144741346227, -3.713228530185597, -3.6367196179886707, -3.2264332890015393, -3.1344966911535774], [-3.425471106609029, -3.96621990163863, -3.313573503795337, -3.093338843522387, -3.1280981348013683], [-4.089799240863923, -3.741011861749615, -3.2146219544448225, -3.2060652037848163, -3.3037932459511765], [-4.287783603743706, -3.8445817557688744, -3.384105991614735, -3.4836279949371356, -3.600423914438843]]}}}, "-10": {"vi": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 1.0, 1.0, 1.9, 0.0], [0.0, 0.0, 1.9, 1.71, 1.539]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.9, 0.0, 0.0], [0.0, 1.9, 1.9, 2.71, 1.3851], [0.0, 1.71, 2.71, 2.439, 2.1951]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.71, 0.0, 1.24659], [0.0, 2.71, 2.71, 3.439, 1.9755900000000002], [0.0, 2.439, 3.439, 3.0951, 2.78559]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 1.121931], [0.0, 0.0, 3.439, 1.121931, 1.7780310000000001], [0.0, 3.439, 3.439, 4.0951, 2.507031], [0.0, 3.0951, 4.0951, 3.6855900000000004, 3.3170310000000005]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 1.0097379], [0.0, 0.0, 0.0, 1.0097379, 1.6002279000000001], [0.0, 0.0, 4.0951, 1.6002279000000001, 2.2563279], [0.0, 4.0951, 4.0951, 4.68559, 2.9853279000000006], [0.0, 3.6855900000000004, 4.68559, 4.217031, 3.7953279000000006]], "policy": [[1, 2, 2, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.90876411, 1.4402051100000002], [0.0, 0.0, 0.90876411, 1.4402051100000002, 2.03069511], [0.0, 0.0, 4.68559, 2.03069511, 2.6867951100000007], [0.0, 4.68559, 4.68559, 5.217031, 3.415795110000001], [0.0, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.817887699, 1.2961845990000003, 1.8276255989999999], [0.0, 0.0, 1.2961845990000003, 1.8276255989999999, 2.4181155990000005], [0.0, 0.0, 5.217031, 2.4181155990000005, 3.074215599000001], [0.0, 5.217031, 5.217031, 5.6953279000000006, 3.803215599000001], [0.0, 4.6953279000000006, 5.6953279000000006, 5.12579511, 4.613215599]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.7360989291000001, 1.1665661391000002, 1.6448630390999999, 2.1763040391000006], [0.0, 0.6624890361900001, 1.6448630390999999, 2.1763040391000006, 2.766794039100001], [0.0, 0.0, 5.6953279000000006, 2.766794039100001, 3.422894039100001], [0.0, 5.6953279000000006, 5.6953279000000006, 6.12579511, 4.1518940391], [0.0, 5.12579511, 6.12579511, 5.5132155990000005, 4.961894039100001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.6624890361900001, 1.0499095251900001, 1.48037673519, 1.9586736351900005, 2.4901146351900008], [0.5962401325710001, 0.9449185726710001, 1.9586736351900005, 2.4901146351900008, 3.0806046351900007], [0.5366161193139001, 0.48295450738251006, 6.12579511, 3.0806046351900007, 3.73670463519], [0.48295450738251006, 6.12579511, 6.12579511, 6.5132155990000005, 4.465704635190001], [0.4346590566442591, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.9449185726710001, 1.332339061671, 1.7628062716710005, 2.241103171671001, 2.772544171671001], [0.8504267154039001, 1.1991051555039, 2.241103171671001, 2.772544171671001, 3.3630341716710004], [0.7653840438635101, 0.6888456394771592, 6.5132155990000005, 3.3630341716710004, 4.019134171671001], [0.6888456394771592, 6.5132155990000005, 6.5132155990000005, 6.861894039100001, 4.748134171671001], [0.6199610755294432, 5.861894039100001, 6.861894039100001, 6.175704635190001, 5.558134171671001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.1991051555039, 1.5865256445039004, 2.0169928545039006, 2.495289754503901, 3.0267307545039004], [1.0791946399535102, 1.4278730800535104, 2.495289754503901, 3.0267307545039004, 3.6172207545039012], [0.9712751759581592, 0.8741476583623432, 6.861894039100001, 3.6172207545039012, 4.273320754503901], [0.8741476583623432, 6.861894039100001, 6.861894039100001, 7.175704635190001, 5.002320754503901], [0.7867328925261089, 6.175704635190001, 7.175704635190001, 6.458134171671, 5.812320754503901]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.4278730800535104, 1.8152935690535106, 2.245760779053511, 2.7240576790535105, 3.255498679053511], [1.2850857720481594, 1.6337642121481595, 2.7240576790535105, 3.255498679053511, 3.845988679053511], [1.1565771948433434, 1.0409194753590092, 7.175704635190001, 3.845988679053511, 4.502088679053511], [1.0409194753590092, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.231088679053511], [0.9368275278231083, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.6337642121481595, 2.02118470114816, 2.4516519111481596, 2.9299488111481597, 3.46138981114816], [1.4703877909333436, 1.8190662310333439, 2.9299488111481597, 3.46138981114816, 4.05187981114816], [1.3233490118400093, 1.1910141106560084, 7.458134171671, 4.05187981114816, 4.70797981114816], [1.1910141106560084, 7.458134171671, 7.458134171671, 7.7123207545039, 5.436979811148159], [1.0719126995904076, 6.7123207545039, 7.7123207545039, 6.94108867905351, 6.246979811148159]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.8190662310333439, 2.2064867200333436, 2.6369539300333438, 3.115250830033344, 3.646691830033344], [1.6371596079300095, 1.9858380480300093, 3.115250830033344, 3.646691830033344, 4.237181830033344], [1.4734436471370085, 1.3260992824233078, 7.7123207545039, 4.237181830033344, 4.893281830033343], [1.3260992824233078, 7.7123207545039, 7.7123207545039, 7.94108867905351, 5.6222818300333435], [1.193489354180977, 6.94108867905351, 7.94108867905351, 7.146979811148159, 6.432281830033343]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.9858380480300093, 2.3732585370300097, 2.8037257470300094, 3.2820226470300096, 3.8134636470300096], [1.7872542432270084, 2.1359326833270087, 3.2820226470300096, 3.8134636470300096, 4.40395364703001], [1.6085288189043077, 1.447675937013877, 7.94108867905351, 4.40395364703001, 5.060053647030009], [1.447675937013877, 7.94108867905351, 7.94108867905351, 8.14697981114816, 5.789053647030009], [1.3029083433124893, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.1359326833270087, 2.5233531723270084, 2.9538203823270086, 3.4321172823270087, 3.963558282327009], [1.9223394149943078, 2.2710178550943074, 3.4321172823270087, 3.963558282327009, 4.554048282327008], [1.730105473494877, 1.5570949261453895, 8.14697981114816, 4.554048282327008, 5.210148282327008], [1.5570949261453895, 8.14697981114816, 8.14697981114816, 8.332281830033345, 5.939148282327009], [1.4013854335308507, 7.332281830033344, 8.332281830033345, 7.499053647030011, 6.74914828232701]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.2710178550943074, 2.658438344094308, 3.088905554094308, 3.567202454094308, 4.098643454094307], [2.043916069584877, 2.3925945096848773, 3.567202454094308, 4.098643454094307, 4.689133454094308], [1.8395244626263891, 1.6555720163637502, 8.332281830033345, 4.689133454094308, 5.345233454094308], [1.6555720163637502, 8.332281830033345, 8.332281830033345, 8.49905364703001, 6.074233454094309], [1.4900148147273753, 7.499053647030011, 8.49905364703001, 7.649148282327009, 6.884233454094308]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.3925945096848773, 2.780014998684877, 3.210482208684877, 3.6887791086848765, 4.220220108684877], [2.1533350587163897, 2.5020134988163893, 3.6887791086848765, 4.220220108684877, 4.810710108684877], [1.9380015528447507, 1.7442013975602757, 8.49905364703001, 4.810710108684877, 5.466810108684879], [1.7442013975602757, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.195810108684877], [1.5697812578042483, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.5020134988163893, 2.8894339878163895, 3.319901197816389, 3.79819809781639, 4.32963909781639], [2.2518121489347505, 2.6004905890347505, 3.79819809781639, 4.32963909781639, 4.920129097816391], [2.0266309340412754, 1.8239678406371478, 8.649148282327008, 4.920129097816391, 5.576229097816389], [1.8239678406371478, 8.649148282327008, 8.649148282327008, 8.784233454094307, 6.305229097816389], [1.641571056573433, 7.7842334540943074, 8.784233454094307, 7.905810108684877, 7.115229097816389]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.6004905890347505, 2.98791107803475, 3.418378288034751, 3.896675188034751, 4.4281161880347515], [2.3404415301312755, 2.689119970231275, 3.896675188034751, 4.4281161880347515, 5.018606188034751], [2.106397377118148, 1.8957576394063334, 8.784233454094307, 5.018606188034751, 5.674706188034751], [1.8957576394063334, 8.784233454094307, 8.784233454094307, 8.905810108684877, 6.40370618803475], [1.7061818754657, 7.905810108684877, 8.905810108684877, 8.01522909781639, 7.213706188034751]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.689119970231275, 3.0765404592312757, 3.507007669231276, 3.9853045692312765, 4.516745569231276], [2.420207973208148, 2.7688864133081483, 3.9853045692312765, 4.516745569231276, 5.107235569231276], [2.178187175887333, 1.9603684582985998, 8.905810108684877, 5.107235569231276, 5.763335569231275], [1.9603684582985998, 8.905810108684877, 8.905810108684877, 9.01522909781639, 6.492335569231276], [1.7643316124687398, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.7688864133081483, 3.1563069023081485, 3.586774112308149, 4.065071012308148, 4.596512012308148], [2.4919977719773336, 2.8406762120773337, 4.065071012308148, 4.596512012308148, 5.187002012308148], [2.2427979947796004, 2.0185181953016404, 9.01522909781639, 5.187002012308148, 5.843102012308148], [2.0185181953016404, 9.01522909781639, 9.01522909781639, 9.113706188034751, 6.572102012308148], [1.8166663757714765, 8.113706188034751, 9.113706188034751, 8.202335569231277, 7.38210201230815]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.8406762120773337, 3.2280967010773343, 3.658563911077333, 4.136860811077334, 4.668301811077333], [2.5566085908696006, 2.905287030969601, 4.136860811077334, 4.668301811077333, 5.258791811077334], [2.3009477317826406, 2.0708529586043767, 9.113706188034751, 5.258791811077334, 5.914891811077334], [2.0708529586043767, 9.113706188034751, 9.113706188034751, 9.202335569231277, 6.643891811077335], [1.863767662743939, 8.202335569231277, 9.202335569231277, 8.28210201230815, 7.453891811077335]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.905287030969601, 3.2927075199696, 3.7231747299696005, 4.2014716299696, 4.732912629969601], [2.614758327872641, 2.96343676797264, 4.2014716299696, 4.732912629969601, 5.323402629969601], [2.3532824950853772, 2.1179542455768394, 9.202335569231277, 5.323402629969601, 5.979502629969602], [2.1179542455768394, 9.202335569231277, 9.202335569231277, 9.28210201230815, 6.708502629969601], [1.9061588210191556, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.96343676797264, 3.3508572569726405, 3.78132446697264, 4.259621366972641, 4.791062366972641], [2.667093091175376, 3.0157715312753766, 4.259621366972641, 4.791062366972641, 5.381552366972642], [2.4003837820578386, 2.160345403852055, 9.28210201230815, 5.381552366972642, 6.037652366972641], [2.160345403852055, 9.28210201230815, 9.28210201230815, 9.353891811077334, 6.76665236697264], [1.9443108634668493, 8.353891811077334, 9.353891811077334, 8.4185026299696, 7.57665236697264]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.0157715312753766, 3.403192020275376, 3.833659230275377, 4.311956130275377, 4.8433971302753775], [2.714194378147839, 3.0628728182478384, 4.311956130275377, 4.8433971302753775, 5.4338871302753775], [2.442774940333055, 2.1984974462997497, 9.353891811077334, 5.4338871302753775, 6.089987130275376], [2.1984974462997497, 9.353891811077334, 9.353891811077334, 9.4185026299696, 6.818987130275376], [1.9786477016697748, 8.4185026299696, 9.4185026299696, 8.47665236697264, 7.628987130275377]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.0628728182478384, 3.4502933072478394, 3.880760517247839, 4.35905741724784, 4.89049841724784], [2.7565855364230547, 3.1052639765230556, 4.35905741724784, 4.89049841724784, 5.480988417247839], [2.4809269827807494, 2.2328342845026747, 9.4185026299696, 5.480988417247839, 6.137088417247838], [2.2328342845026747, 9.4185026299696, 9.4185026299696, 9.47665236697264, 6.866088417247839], [2.009550856052407, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.1052639765230556, 3.4926844655230553, 3.923151675523056, 4.401448575523056, 4.932889575523055], [2.79473757887075, 3.14341601897075, 4.401448575523056, 4.932889575523055, 5.523379575523054], [2.5152638209836753, 2.263737438885308, 9.47665236697264, 5.523379575523054, 6.179479575523056], [2.263737438885308, 9.47665236697264, 9.47665236697264, 9.528987130275377, 6.908479575523056], [2.037363694996777, 8.528987130275377, 9.528987130275377, 8.57608841724784, 7.718479575523056]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.14341601897075, 3.5308365079707507, 3.9613037179707504, 4.43960061797075, 4.971041617970749], [2.829074417073675, 3.1777528571736755, 4.43960061797075, 4.971041617970749, 5.561531617970751], [2.5461669753663076, 2.291550277829677, 9.528987130275377, 5.561531617970751, 6.21763161797075], [2.291550277829677, 9.528987130275377, 9.528987130275377, 9.57608841724784, 6.946631617970751], [2.0623952500467095, 8.57608841724784, 9.57608841724784, 8.618479575523056, 7.756631617970751]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.1777528571736755, 3.5651733461736757, 3.995640556173675, 4.473937456173674, 5.005378456173676], [2.859977571456308, 3.2086560115563083, 4.473937456173674, 5.005378456173676, 5.595868456173675], [2.573979814310677, 2.3165818328796095, 9.57608841724784, 5.595868456173675, 6.251968456173676], [2.3165818328796095, 9.57608841724784, 9.57608841724784, 9.618479575523056, 6.980968456173676], [2.0849236495916488, 8.618479575523056, 9.618479575523056, 8.656631617970751, 7.790968456173676]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.2086560115563083, 3.5960765005563076, 4.026543710556307, 4.504840610556308, 5.0362816105563075], [2.8877904104006777, 3.236468850500677, 4.504840610556308, 5.0362816105563075, 5.626771610556309], [2.59901136936061, 2.339110232424549, 9.618479575523056, 5.626771610556309, 6.282871610556308], [2.339110232424549, 9.618479575523056, 9.618479575523056, 9.656631617970751, 7.011871610556309], [2.105199209182094, 8.656631617970751, 9.656631617970751, 8.690968456173676, 7.821871610556309]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.236468850500677, 3.6238893395006766, 4.054356549500677, 4.5326534495006765, 5.064094449500678], [2.9128219654506093, 3.261500405550609, 4.5326534495006765, 5.064094449500678, 5.654584449500677], [2.6215397689055484, 2.3593857920149937, 9.656631617970751, 5.654584449500677, 6.310684449500678], [2.3593857920149937, 9.656631617970751, 9.656631617970751, 9.690968456173676, 7.039684449500679], [2.1234472128134945, 8.690968456173676, 9.690968456173676, 8.72187161055631, 7.849684449500679]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.261500405550609, 3.6489208945506095, 4.079388104550609, 4.557685004550611, 5.08912600455061], [2.935350364995548, 3.2840288050955486, 4.557685004550611, 5.08912600455061, 5.67961600455061], [2.6418153284959933, 2.377633795646394, 9.690968456173676, 5.67961600455061, 6.335716004550611], [2.377633795646394, 9.690968456173676, 9.690968456173676, 9.72187161055631, 7.064716004550611], [2.1398704160817545, 8.72187161055631, 9.72187161055631, 8.749684449500679, 7.874716004550611]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.2840288050955486, 3.671449294095548, 4.101916504095549, 4.580213404095549, 5.111654404095549], [2.955625924585994, 3.304304364685993, 4.580213404095549, 5.111654404095549, 5.7021444040955505], [2.6600633321273945, 2.394056998914655, 9.72187161055631, 5.7021444040955505, 6.35824440409555], [2.394056998914655, 9.72187161055631, 9.72187161055631, 9.749684449500679, 7.08724440409555], [2.1546512990231896, 8.749684449500679, 9.749684449500679, 8.77471600455061, 7.89724440409555]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.304304364685993, 3.6917248536859946, 4.122192063685994, 4.600488963685994, 5.131929963685995], [2.973873928217394, 3.322552368317395, 4.600488963685994, 5.131929963685995, 5.722419963685995], [2.6764865353956546, 2.408837881856089, 9.749684449500679, 5.722419963685995, 6.378519963685995], [2.408837881856089, 9.749684449500679, 9.749684449500679, 9.77471600455061, 7.107519963685995], [2.16795409367048, 8.77471600455061, 9.77471600455061, 8.797244404095549, 7.9175199636859945]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.322552368317395, 3.709972857317395, 4.140440067317394, 4.618736967317396, 5.150177967317396], [2.9902971314856557, 3.3389755715856553, 4.618736967317396, 5.150177967317396, 5.740667967317395], [2.69126741833709, 2.422140676503381, 9.77471600455061, 5.740667967317395, 6.396767967317396], [2.422140676503381, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.125767967317395], [2.179926608853043, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.3389755715856553, 3.726396060585655, 4.1568632705856565, 4.635160170585657, 5.166601170585656], [3.00507801442709, 3.3537564545270895, 4.635160170585657, 5.166601170585656, 5.757091170585656], [2.704570212984381, 2.434113191685943, 9.797244404095549, 5.757091170585656, 6.413191170585655], [2.434113191685943, 9.797244404095549, 9.797244404095549, 9.817519963685994, 7.142191170585655], [2.190701872517349, 8.817519963685994, 9.817519963685994, 8.835767967317395, 7.952191170585656]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.3537564545270895, 3.741176943527091, 4.171644153527091, 4.64994105352709, 5.1813820535270905], [3.0183808090743804, 3.367059249174382, 4.64994105352709, 5.1813820535270905, 5.7718720535270895], [2.7165427281669423, 2.4448884553502483, 9.817519963685994, 5.7718720535270895, 6.42797205352709], [2.4448884553502483, 9.817519963685994, 9.817519963685994, 9.835767967317395, 7.15697205352709], [2.2003996098152236, 8.835767967317395, 9.835767967317395, 8.852191170585655, 7.96697205352709]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.367059249174382, 3.754479738174382, 4.184946948174382, 4.663243848174382, 5.194684848174381], [3.030353324256944, 3.379031764356944, 4.663243848174382, 5.194684848174381, 5.785174848174381], [2.7273179918312493, 2.4545861926481245, 9.835767967317395, 5.785174848174381, 6.441274848174381], [2.4545861926481245, 9.835767967317395, 9.835767967317395, 9.852191170585655, 7.1702748481743805], [2.209127573383312, 8.852191170585655, 9.852191170585655, 8.86697205352709, 7.980274848174382]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.379031764356944, 3.7664522533569436, 4.196919463356944, 4.6752163633569435, 5.206657363356943], [3.0411285879212495, 3.389807028021249, 4.6752163633569435, 5.206657363356943, 5.7971473633569435], [2.7370157291291246, 2.4633141562162124, 9.852191170585655, 5.7971473633569435, 6.453247363356943], [2.4633141562162124, 9.852191170585655, 9.852191170585655, 9.86697205352709, 7.182247363356944], [2.216982740594591, 8.86697205352709, 9.86697205352709, 8.880274848174382, 7.992247363356944]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.389807028021249, 3.7772275170212497, 4.2076947270212495, 4.685991627021249, 5.21743262702125], [3.0508263252191243, 3.399504765319125, 4.685991627021249, 5.21743262702125, 5.807922627021249], [2.745743692697212, 2.4711693234274907, 9.86697205352709, 5.807922627021249, 6.46402262702125], [2.4711693234274907, 9.86697205352709, 9.86697205352709, 9.880274848174382, 7.19302262702125], [2.224052391084742, 8.880274848174382, 9.880274848174382, 8.892247363356944, 8.00302262702125]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.399504765319125, 3.7869252543191245, 4.217392464319124, 4.695689364319125, 5.227130364319124], [3.0595542887872123, 3.4082327288872123, 4.695689364319125, 5.227130364319124, 5.817620364319125], [2.7535988599084913, 2.4782389739176423, 9.880274848174382, 5.817620364319125, 6.473720364319125], [2.4782389739176423, 9.880274848174382, 9.880274848174382, 9.892247363356944, 7.202720364319125], [2.230415076525878, 8.892247363356944, 9.892247363356944, 8.90302262702125, 8.012720364319124]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4082327288872123, 3.7956532178872116, 4.226120427887213, 4.704417327887212, 5.235858327887213], [3.067409455998491, 3.4160878960984906, 4.704417327887212, 5.235858327887213, 5.826348327887213], [2.760668510398642, 2.484601659358778, 9.892247363356944, 5.826348327887213, 6.482448327887213], [2.484601659358778, 9.892247363356944, 9.892247363356944, 9.90302262702125, 7.2114483278872115], [2.2361414934229003, 8.90302262702125, 9.90302262702125, 8.912720364319124, 8.021448327887212]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4160878960984906, 3.8035083850984917, 4.2339755950984905, 4.7122724950984916, 5.243713495098492], [3.0744791064886416, 3.4231575465886426, 4.7122724950984916, 5.243713495098492, 5.834203495098492], [2.7670311958397775, 2.4903280762557998, 9.90302262702125, 5.834203495098492, 6.49030349509849], [2.4903280762557998, 9.90302262702125, 9.90302262702125, 9.912720364319124, 7.219303495098491], [2.24129526863022, 8.912720364319124, 9.912720364319124, 8.921448327887212, 8.02930349509849]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4231575465886426, 3.8105780355886414, 4.2410452455886425, 4.719342145588643, 5.250783145588643], [3.0808417919297786, 3.4295202320297773, 4.719342145588643, 5.250783145588643, 5.841273145588641], [2.7727576127368008, 2.4954818514631207, 9.912720364319124, 5.841273145588641, 6.497373145588642], [2.4954818514631207, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.226373145588642], [2.245933666316809, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4295202320297773, 3.8169407210297783, 4.2474079310297785, 4.725704831029779, 5.257145831029777], [3.0865682088267996, 3.4352466489268005, 4.725704831029779, 5.257145831029777, 5.847635831029778], [2.7779113879441195, 2.5001202491497074, 9.921448327887212, 5.847635831029778, 6.503735831029778], [2.5001202491497074, 9.921448327887212, 9.921448327887212, 9.929303495098491, 7.232735831029778], [2.2501082242347366, 8.929303495098491, 9.929303495098491, 8.936373145588643, 8.042735831029779]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4352466489268005, 3.8226671379268007, 4.253134347926801, 4.7314312479268, 5.2628722479268], [3.0917219840341206, 3.4404004241341206, 4.7314312479268, 5.2628722479268, 5.853362247926801], [2.7825497856307084, 2.504294807067638, 9.929303495098491, 5.853362247926801, 6.509462247926801], [2.504294807067638, 9.929303495098491, 9.929303495098491, 9.936373145588643, 7.238462247926801], [2.253865326360874, 8.936373145588643, 9.936373145588643, 8.942735831029779, 8.048462247926802]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4404004241341206, 3.827820913134121, 4.25828812313412, 4.73658502313412, 5.26802602313412], [3.0963603817207086, 3.445038821820709, 4.73658502313412, 5.26802602313412, 5.858516023134121], [2.786724343548638, 2.508051909193774, 9.936373145588643, 5.858516023134121, 6.5146160231341215], [2.508051909193774, 9.936373145588643, 9.936373145588643, 9.942735831029779, 7.243616023134122], [2.2572467182743967, 8.942735831029779, 9.942735831029779, 8.948462247926802, 8.053616023134122]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.445038821820709, 3.8324593108207083, 4.2629265208207086, 4.741223420820709, 5.272664420820709], [3.100534939638638, 3.4492133797386377, 4.741223420820709, 5.272664420820709, 5.86315442082071], [2.790481445674774, 2.5114333011072967, 9.942735831029779, 5.86315442082071, 6.51925442082071], [2.5114333011072967, 9.942735831029779, 9.942735831029779, 9.948462247926802, 7.24825442082071], [2.260289970996567, 8.948462247926802, 9.948462247926802, 8.953616023134122, 8.05825442082071]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4492133797386377, 3.836633868738638, 4.267101078738638, 4.745397978738638, 5.276838978738639], [3.104292041764774, 3.452970481864774, 4.745397978738638, 5.276838978738639, 5.867328978738639], [2.793862837588297, 2.5144765538294673, 9.948462247926802, 5.867328978738639, 6.5234289787386395], [2.5144765538294673, 9.948462247926802, 9.948462247926802, 9.953616023134122, 7.252428978738639], [2.2630288984465206, 8.953616023134122, 9.953616023134122, 8.95825442082071, 8.06242897873864]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.452970481864774, 3.8403909708647745, 4.270858180864774, 4.749155080864775, 5.280596080864775], [3.1076734336782965, 3.456351873778297, 4.749155080864775, 5.280596080864775, 5.871086080864775], [2.796906090310467, 2.5172154812794205, 9.953616023134122, 5.871086080864775, 6.527186080864775], [2.5172154812794205, 9.953616023134122, 9.953616023134122, 9.95825442082071, 7.256186080864776], [2.2654939331514785, 8.95825442082071, 9.95825442082071, 8.96242897873864, 8.066186080864776]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.456351873778297, 3.843772362778297, 4.274239572778298, 4.752536472778298, 5.2839774727782975], [3.110716686400467, 3.4593951265004677, 4.752536472778298, 5.2839774727782975, 5.8744674727782975], [2.7996450177604206, 2.5196805159843785, 9.95825442082071, 5.8744674727782975, 6.530567472778299], [2.5196805159843785, 9.95825442082071, 9.95825442082071, 9.96242897873864, 7.259567472778299], [2.2677124643859408, 8.96242897873864, 9.96242897873864, 8.966186080864777, 8.0695674727783]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4593951265004677, 3.8468156155004687, 4.2772828255004685, 4.755579725500468, 5.287020725500468], [3.113455613850421, 3.4621340539504217, 4.755579725500468, 5.287020725500468, 5.877510725500469], [2.8021100524653786, 2.5218990472188407, 9.96242897873864, 5.877510725500469, 6.533610725500469], [2.5218990472188407, 9.96242897873864, 9.96242897873864, 9.966186080864777, 7.26261072550047], [2.2697091424969567, 8.966186080864777, 9.966186080864777, 8.9695674727783, 8.07261072550047]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4621340539504217, 3.849554542950422, 4.280021752950421, 4.758318652950421, 5.289759652950422], [3.1159206485553796, 3.4645990886553797, 4.758318652950421, 5.289759652950422, 5.880249652950422], [2.8043285836998417, 2.5238957253298575, 9.966186080864777, 5.880249652950422, 6.536349652950423], [2.5238957253298575, 9.966186080864777, 9.966186080864777, 9.9695674727783, 7.265349652950423], [2.2715061527968716, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4645990886553797, 3.852019577655379, 4.282486787655379, 4.76078368765538, 5.29222468765538], [3.118139179789842, 3.466817619889841, 4.76078368765538, 5.29222468765538, 5.882714687655381], [2.8063252618108576, 2.525692735629772, 9.9695674727783, 5.882714687655381, 6.538814687655381], [2.525692735629772, 9.9695674727783, 9.9695674727783, 9.97261072550047, 7.267814687655381], [2.273123462066795, 8.97261072550047, 9.97261072550047, 8.975349652950424, 8.077814687655382]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.466817619889841, 3.8542381088898408, 4.284705318889842, 4.7630022188898415, 5.2944432188898425], [3.120135857900857, 3.468814298000857, 4.7630022188898415, 5.2944432188898425, 5.884933218889843], [2.8081222721107713, 2.527310044899694, 9.97261072550047, 5.884933218889843, 6.541033218889843], [2.527310044899694, 9.97261072550047, 9.97261072550047, 9.975349652950424, 7.270033218889844], [2.2745790404097246, 8.975349652950424, 9.975349652950424, 8.977814687655382, 8.080033218889843]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.468814298000857, 3.856234787000858, 4.286701997000858, 4.764998897000859, 5.296439897000859], [3.1219328682007714, 3.4706113083007724, 4.764998897000859, 5.296439897000859, 5.886929897000859], [2.8097395813806942, 2.528765623242625, 9.975349652950424, 5.886929897000859, 6.543029897000859], [2.528765623242625, 9.975349652950424, 9.975349652950424, 9.977814687655382, 7.272029897000859], [2.2758890609183626, 8.977814687655382, 9.977814687655382, 8.980033218889844, 8.08202989700086]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4706113083007724, 3.858031797300772, 4.288499007300773, 4.766795907300773, 5.298236907300773], [3.1235501774706953, 3.472228617570695, 4.766795907300773, 5.298236907300773, 5.888726907300773], [2.811195159723626, 2.5300756437512635, 9.977814687655382, 5.888726907300773, 6.544826907300774], [2.5300756437512635, 9.977814687655382, 9.977814687655382, 9.980033218889844, 7.273826907300774], [2.277068079376137, 8.980033218889844, 9.980033218889844, 8.98202989700086, 8.083826907300775]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.472228617570695, 3.859649106570696, 4.290116316570696, 4.768413216570696, 5.299854216570696], [3.1250057558136253, 3.473684195913626, 4.768413216570696, 5.299854216570696, 5.890344216570696], [2.8125051802322627, 2.5312546622090366, 9.980033218889844, 5.890344216570696, 6.546444216570697], [2.5312546622090366, 9.980033218889844, 9.980033218889844, 9.98202989700086, 7.275444216570698], [2.278129195988133, 8.98202989700086, 9.98202989700086, 8.983826907300774, 8.085444216570696]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.473684195913626, 3.861104684913627, 4.291571894913627, 4.769868794913627, 5.301309794913627], [3.1263157763222638, 3.4749942164222642, 4.769868794913627, 5.301309794913627, 5.891799794913627], [2.8136841986900376, 2.532315778821034, 9.98202989700086, 5.891799794913627, 6.547899794913628], [2.532315778821034, 9.98202989700086, 9.98202989700086, 9.983826907300774, 7.276899794913627], [2.2790842009389305, 8.983826907300774, 9.983826907300774, 8.985444216570697, 8.086899794913627]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4749942164222642, 3.8624147054222644, 4.292881915422265, 4.771178815422265, 5.302619815422265], [3.127494794780038, 3.476173234880038, 4.771178815422265, 5.302619815422265, 5.893109815422266], [2.814745315302034, 2.533270783771831, 9.983826907300774, 5.893109815422266, 6.549209815422264], [2.533270783771831, 9.983826907300774, 9.983826907300774, 9.985444216570697, 7.278209815422264], [2.279943705394648, 8.985444216570697, 9.985444216570697, 8.986899794913628, 8.088209815422266]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.476173234880038, 3.8635937238800384, 4.294060933880038, 4.772357833880038, 5.303798833880039], [3.1285559113920343, 3.4772343514920347, 4.772357833880038, 5.303798833880039, 5.894288833880038], [2.815700320252831, 2.534130288227548, 9.985444216570697, 5.894288833880038, 6.550388833880038], [2.534130288227548, 9.985444216570697, 9.985444216570697, 9.986899794913628, 7.27938883388004], [2.2807172594047933, 8.986899794913628, 9.986899794913628, 8.988209815422264, 8.089388833880038]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4772343514920347, 3.8646548404920344, 4.295122050492035, 4.773418950492036, 5.304859950492035], [3.129510916342831, 3.4781893564428312, 4.773418950492036, 5.304859950492035, 5.895349950492034], [2.816559824708548, 2.5349038422376933, 9.986899794913628, 5.895349950492034, 6.551449950492036], [2.5349038422376933, 9.986899794913628, 9.986899794913628, 9.988209815422264, 7.280449950492034], [2.281413458013924, 8.988209815422264, 9.988209815422264, 8.989388833880039, 8.090449950492035]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4781893564428312, 3.8656098454428314, 4.296077055442832, 4.774373955442831, 5.30581495544283], [3.130370420798548, 3.479048860898548, 4.774373955442831, 5.30581495544283, 5.896304955442832], [2.8173333787186934, 2.535600040846824, 9.988209815422264, 5.896304955442832, 6.552404955442831], [2.535600040846824, 9.988209815422264, 9.988209815422264, 9.989388833880039, 7.281404955442832], [2.282040036762142, 8.989388833880039, 9.989388833880039, 8.990449950492035, 8.091404955442831]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.479048860898548, 3.8664693498985487, 4.2969365598985485, 4.775233459898548, 5.306674459898549], [3.1311439748086936, 3.479822414908694, 4.775233459898548, 5.306674459898549, 5.897164459898548], [2.8180295773278243, 2.536226619595042, 9.989388833880039, 5.897164459898548, 6.553264459898549], [2.536226619595042, 9.989388833880039, 9.989388833880039, 9.990449950492035, 7.282264459898548], [2.282603957635538, 8.990449950492035, 9.990449950492035, 8.991404955442832, 8.09226445989855]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.479822414908694, 3.8672429039086937, 4.2977101139086935, 4.776007013908694, 5.307448013908693], [3.1318401734178245, 3.4805186135178245, 4.776007013908694, 5.307448013908693, 5.8979380139086945], [2.818656156076042, 2.536790540468438, 9.990449950492035, 5.8979380139086945, 6.554038013908693], [2.536790540468438, 9.990449950492035, 9.990449950492035, 9.991404955442832, 7.283038013908695], [2.283111486421594, 8.991404955442832, 9.991404955442832, 8.992264459898548, 8.093038013908693]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4805186135178245, 3.8679391025178242, 4.298406312517824, 4.776703212517823, 5.308144212517825], [3.1324667521660423, 3.481145192266042, 4.776703212517823, 5.308144212517825, 5.898634212517824], [2.819220076949438, 2.5372980692544944, 9.991404955442832, 5.898634212517824, 6.554734212517825], [2.5372980692544944, 9.991404955442832, 9.991404955442832, 9.992264459898548, 7.283734212517824], [2.283568262329045, 8.992264459898548, 9.992264459898548, 8.993038013908693, 8.093734212517823]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.481145192266042, 3.8685656812660416, 4.299032891266041, 4.777329791266043, 5.308770791266042], [3.1330306730394377, 3.4817091131394373, 4.777329791266043, 5.308770791266042, 5.899260791266043], [2.819727605735494, 2.537754845161945, 9.992264459898548, 5.899260791266043, 6.555360791266041], [2.537754845161945, 9.992264459898548, 9.992264459898548, 9.993038013908693, 7.2843607912660415], [2.2839793606457506, 8.993038013908693, 9.993038013908693, 8.993734212517824, 8.094360791266041]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4817091131394373, 3.869129602139437, 4.299596812139439, 4.777893712139438, 5.309334712139439], [3.133538201825494, 3.4822166419254934, 4.777893712139438, 5.309334712139439, 5.899824712139438], [2.8201843816429446, 2.53816594347865, 9.993038013908693, 5.899824712139438, 6.555924712139437], [2.53816594347865, 9.993038013908693, 9.993038013908693, 9.993734212517824, 7.284924712139437], [2.2843493491307854, 8.993734212517824, 9.993734212517824, 8.994360791266041, 8.094924712139438]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4822166419254934, 3.869637130925495, 4.300104340925494, 4.778401240925495, 5.309842240925494], [3.1339949777329443, 3.4826734178329453, 4.778401240925495, 5.309842240925494, 5.9003322409254935], [2.8205954799596498, 2.538535931963685, 9.993734212517824, 5.9003322409254935, 6.556432240925494], [2.538535931963685, 9.993734212517824, 9.993734212517824, 9.994360791266041, 7.285432240925494], [2.2846823387673165, 8.994360791266041, 9.994360791266041, 8.994924712139438, 8.095432240925495]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4826734178329453, 3.870093906832945, 4.300561116832946, 4.778858016832945, 5.3102990168329445], [3.134406076049651, 3.4830845161496504, 4.778858016832945, 5.3102990168329445, 5.900789016832944], [2.820965468444686, 2.5388689216002174, 9.994360791266041, 5.900789016832944, 6.556889016832945], [2.5388689216002174, 9.994360791266041, 9.994360791266041, 9.994924712139438, 7.285889016832946], [2.284982029440196, 8.994924712139438, 9.994924712139438, 8.995432240925494, 8.095889016832945]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4830845161496504, 3.8705050051496515, 4.300972215149651, 4.77926911514965, 5.31071011514965], [3.1347760645346856, 3.4834545046346865, 4.77926911514965, 5.31071011514965, 5.90120011514965], [2.821298458081217, 2.5391686122730954, 9.994924712139438, 5.90120011514965, 6.557300115149651], [2.5391686122730954, 9.994924712139438, 9.994924712139438, 9.995432240925494, 7.286300115149651], [2.285251751045786, 8.995432240925494, 9.995432240925494, 8.995889016832944, 8.09630011514965]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4834545046346865, 3.870874993634686, 4.301342203634685, 4.779639103634685, 5.311080103634685], [3.135109054171218, 3.4837874942712173, 4.779639103634685, 5.311080103634685, 5.901570103634686], [2.8215981487540964, 2.539438333878687, 9.995432240925494, 5.901570103634686, 6.5576701036346865], [2.539438333878687, 9.995432240925494, 9.995432240925494, 9.995889016832944, 7.286670103634685], [2.2854945004908185, 8.995889016832944, 9.995889016832944, 8.99630011514965, 8.096670103634684]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4837874942712173, 3.8712079832712165, 4.301675193271217, 4.779972093271217, 5.311413093271217], [3.1354087448440957, 3.484087184944095, 4.779972093271217, 5.311413093271217, 5.901903093271218], [2.8218678703596862, 2.5396810833237176, 9.995889016832944, 5.901903093271218, 6.558003093271217], [2.5396810833237176, 9.995889016832944, 9.995889016832944, 9.99630011514965, 7.287003093271216], [2.285712974991346, 8.99630011514965, 9.99630011514965, 8.996670103634685, 8.097003093271217]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484087184944095, 3.8715076739440955, 4.301974883944096, 4.780271783944095, 5.311712783944096], [3.1356784664496855, 3.484356906549686, 4.780271783944095, 5.311712783944096, 5.902202783944095], [2.8221106198047172, 2.5398995578242456, 9.99630011514965, 5.902202783944095, 6.558302783944095], [2.5398995578242456, 9.99630011514965, 9.99630011514965, 9.996670103634685, 7.287302783944096], [2.285909602041821, 8.996670103634685, 9.996670103634685, 8.997003093271216, 8.097302783944095]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484356906549686, 3.8717773955496866, 4.302244605549686, 4.780541505549687, 5.311982505549686], [3.1359212158947174, 3.484599655994718, 4.780541505549687, 5.311982505549686, 5.902472505549685], [2.8223290943052457, 2.540096184874721, 9.996670103634685, 5.902472505549685, 6.558572505549686], [2.540096184874721, 9.996670103634685, 9.996670103634685, 9.997003093271216, 7.287572505549686], [2.286086566387249, 8.997003093271216, 9.997003093271216, 8.997302783944095, 8.097572505549685]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484599655994718, 3.8720201449947176, 4.302487354994718, 4.7807842549947175, 5.312225254994717], [3.1361396903952463, 3.484818130495246, 4.7807842549947175, 5.312225254994717, 5.9027152549947175], [2.8225257213557216, 2.5402731492201496, 9.997003093271216, 5.9027152549947175, 6.558815254994717], [2.5402731492201496, 9.997003093271216, 9.997003093271216, 9.997302783944095, 7.287815254994717], [2.2862458342981347, 8.997302783944095, 9.997302783944095, 8.997572505549686, 8.097815254994718]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484818130495246, 3.8722386194952465, 4.302705829495246, 4.7810027294952455, 5.312443729495246], [3.1363363174457213, 3.4850147575457218, 4.7810027294952455, 5.312443729495246, 5.9029337294952455], [2.8227026857011492, 2.540432417131034, 9.997302783944095, 5.9029337294952455, 6.559033729495246], [2.540432417131034, 9.997302783944095, 9.997302783944095, 9.997572505549686, 7.288033729495246], [2.2863891754179306, 8.997572505549686, 9.997572505549686, 8.997815254994718, 8.098033729495246]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4850147575457218, 3.872435246545722, 4.302902456545721, 4.781199356545721, 5.312640356545721], [3.13651328179115, 3.48519172189115, 4.781199356545721, 5.312640356545721, 5.903130356545722], [2.8228619536120347, 2.5405757582508315, 9.997572505549686, 5.903130356545722, 6.559230356545721], [2.5405757582508315, 9.997572505549686, 9.997572505549686, 9.997815254994718, 7.288230356545721], [2.2865181824257483, 8.997815254994718, 9.997815254994718, 8.998033729495246, 8.098230356545722]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.48519172189115, 3.8726122108911487, 4.303079420891149, 4.781376320891149, 5.31281732089115], [3.136672549702035, 3.485350989802034, 4.781376320891149, 5.31281732089115, 5.903307320891149], [2.8230052947318316, 2.5407047652586483, 9.997815254994718, 5.903307320891149, 6.559407320891149], [2.5407047652586483, 9.997815254994718, 9.997815254994718, 9.998033729495246, 7.2884073208911495], [2.2866342887327837, 8.998033729495246, 9.998033729495246, 8.998230356545722, 8.09840732089115]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485350989802034, 3.872771478802034, 4.303238688802034, 4.781535588802035, 5.312976588802035], [3.136815890821831, 3.485494330921831, 4.781535588802035, 5.312976588802035, 5.903466588802035], [2.823134301739648, 2.5408208715656833, 9.998033729495246, 5.903466588802035, 6.559566588802035], [2.5408208715656833, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.288566588802035], [2.286738784409115, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485494330921831, 3.872914819921831, 4.303382029921832, 4.781678929921831, 5.3131199299218315], [3.1369448978296477, 3.485623337929648, 4.781678929921831, 5.3131199299218315, 5.903609929921831], [2.823250408046683, 2.5409253672420147, 9.998230356545722, 5.903609929921831, 6.559709929921832], [2.5409253672420147, 9.998230356545722, 9.998230356545722, 9.99840732089115, 7.288709929921833], [2.286832830517813, 8.99840732089115, 9.99840732089115, 8.998566588802035, 8.098709929921831]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485623337929648, 3.873043826929649, 4.303511036929648, 4.781807936929648, 5.313248936929648], [3.1370610041366835, 3.4857394442366845, 4.781807936929648, 5.313248936929648, 5.903738936929649], [2.8233549037230152, 2.5410194133507136, 9.99840732089115, 5.903738936929649, 6.5598389369296495], [2.5410194133507136, 9.99840732089115, 9.99840732089115, 9.998566588802035, 7.288838936929649], [2.2869174720156424, 8.998566588802035, 9.998566588802035, 8.998709929921832, 8.09883893692965]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4857394442366845, 3.8731599332366833, 4.3036271432366835, 4.781924043236684, 5.313365043236685], [3.1371654998130163, 3.485843939913015, 4.781924043236684, 5.313365043236685, 5.9038550432366845], [2.8234489498317146, 2.5411040548485433, 9.998566588802035, 5.9038550432366845, 6.559955043236684], [2.5411040548485433, 9.998566588802035, 9.998566588802035, 9.998709929921832, 7.288955043236684], [2.286993649363689, 8.998709929921832, 9.998709929921832, 8.99883893692965, 8.098955043236685]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485843939913015, 3.873264428913015, 4.303731638913016, 4.782028538913016, 5.313469538913016], [3.1372595459217134, 3.485937986021714, 4.782028538913016, 5.313469538913016, 5.903959538913016], [2.823533591329542, 2.541180232196588, 9.998709929921832, 5.903959538913016, 6.560059538913015], [2.541180232196588, 9.998709929921832, 9.998709929921832, 9.99883893692965, 7.289059538913017], [2.2870622089769292, 8.99883893692965, 9.99883893692965, 8.998955043236684, 8.099059538913016]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485937986021714, 3.8733584750217145, 4.303825685021715, 4.782122585021715, 5.313563585021715], [3.1373441874195427, 3.486022627519543, 4.782122585021715, 5.313563585021715, 5.904053585021714], [2.8236097686775885, 2.5412487918098297, 9.99883893692965, 5.904053585021714, 6.560153585021716], [2.5412487918098297, 9.99883893692965, 9.99883893692965, 9.998955043236684, 7.289153585021714], [2.287123912628847, 8.998955043236684, 9.998955043236684, 8.999059538913016, 8.099153585021716]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486022627519543, 3.8734431165195433, 4.303910326519543, 4.782207226519543, 5.313648226519542], [3.137420364767589, 3.486098804867589, 4.782207226519543, 5.313648226519542, 5.904138226519545], [2.82367832829083, 2.5413104954617474, 9.998955043236684, 5.904138226519545, 6.560238226519543], [2.5413104954617474, 9.998955043236684, 9.998955043236684, 9.999059538913016, 7.289238226519545], [2.2871794459155725, 8.999059538913016, 9.999059538913016, 8.999153585021714, 8.099238226519542]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486098804867589, 3.873519293867589, 4.303986503867589, 4.782283403867588, 5.313724403867591], [3.1374889243808304, 3.48616736448083, 4.782283403867588, 5.313724403867591, 5.904214403867589], [2.8237400319427475, 2.541366028748473, 9.999059538913016, 5.904214403867589, 6.56031440386759], [2.541366028748473, 9.999059538913016, 9.999059538913016, 9.999153585021714, 7.289314403867588], [2.2872294258736257, 8.999153585021714, 9.999153585021714, 8.999238226519543, 8.099314403867588]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.48616736448083, 3.8735878534808297, 4.3040550634808294, 4.782351963480831, 5.31379296348083], [3.137550628032747, 3.486229068132747, 4.782351963480831, 5.31379296348083, 5.904282963480831], [2.8237955652294726, 2.5414160087065256, 9.999153585021714, 5.904282963480831, 6.56038296348083], [2.5414160087065256, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.289382963480829], [2.287274407835873, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [8.999999920397968, 8.099999911553297, 7.289999911553298, 6.5609999115532975, 5.904899911553297, 5.314409911553297, 4.782968911553297, 4.304672011553297, 3.8742048015532973, 3.486784312553297, 3.1381058724532966, 2.824295276363297, 2.5418657398822972, 2.2876791570493973, 2.0589112324997876, 1.8530201004051374, 1.6677180815199524, 1.5009462645232876, 1.3508516292262893, 1.2157664574589901, 1.0941898028684207, 0.9847708137369082, 0.8862937235185466, 0.7976643423220207, 0.7178978992451484, 0.6461081004759635, 0.5814972815836974, 0.5233475445806572, 0.47101278127792057, 0.4239114943054574, 0.38152033603024194, 0.3433682935825466, 0.3090314553796212, 0.27812830099698793, 0.2503154620526189, 0.2252839070026873, 0.2027555074577485, 0.1824799478673036, 0.16423194423590282, 0.1478087409676423, 0.13302785802620676, 0.11972506337891531, 0.10775254819635371, 0.09697728453204846, 0.0872795472341732, 0.07855158366608528, 0.07069641645480651, 0.06362676596465455, 0.0572640805235185, 0.0515376636264957, 0.04638388841917518, 0.0417454907325876, 0.037570932814658065, 0.03381383068852095, 0.030432438774997905, 0.027389186052827696, 0.02465025860287362, 0.022185223897915662, 0.019966692663453856, 0.01797001455243752, 0.01617300425252388, 0.014555694982600897, 0.013100116639670034, 0.011790096131033323, 0.010611077673258862, 0.00954996106126238, 0.008594956110465901, 0.007735451654749426, 0.00696189764460442, 0.006265699035473915, 0.005639120287256105, 0.005075199413859366, 0.004567670627803722, 0.004110894720353642, 0.003699796403648037, 0.003329807918612815, 0.002996818282081648, 0.0026971276092027097, 0.0024274060036120204, 0.0021846565585796895, 0.0019661820580516576, 0.001769555007575363, 0.0015925906621472308, 0.0014333227512626223, 0.0012899816314657642, 0.001160974623648059, 0.0010448683166135453, 0.0009403726402812396, 0.0008463265315832302]}, "pi": {"frames": [{"V": [[0.0, 0.0, -19.0, -8.999916647515823, -9.999916647515823], [0.0, 0.0, -10.0, 0.0, 0.0], [0.0, 0.0, 0.0, -99.99916647515822, -9.999916647515823], [0.0, -10.0, -99.99916647515822, -99.99916647515822, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 3, 3, 2], [0, 2, 2, 0, 0], [0, 0, 1, 1, 1], [0, 2, 3, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999153585021714, 0.0, 0.0], [0.0, 9.999153585021714, 9.999153585021714, 9.999238226519543, 0.0], [0.0, 0.0, 9.999238226519543, 8.999314403867588, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999314403867588, 0.0, 0.0], [0.0, 9.999314403867588, 9.999314403867588, 9.99938296348083, 0.0], [0.0, 8.99938296348083, 9.99938296348083, 8.999444667132748, 8.099500200419474]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999444667132748, 0.0, 0.0], [0.0, 9.999444667132748, 9.999444667132748, 9.999500200419472, 7.289595162339773], [0.0, 8.999500200419472, 9.999500200419472, 8.999550180377526, 8.099595162339773]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999550180377526, 0.0, 6.560672081495216], [0.0, 9.999550180377526, 9.999550180377526, 9.999595162339773, 7.289672081495216], [0.0, 8.999595162339773, 9.999595162339773, 8.999635646105796, 8.099672081495216]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.3141709474100125], [0.0, 0.0, 0.0, 0.0, 5.904660947410013], [0.0, 0.0, 9.999672081495216, 5.904660947410013, 6.560760947410014], [0.0, 9.999672081495216, 9.999672081495216, 9.999704873345696, 7.289760947410015], [0.0, 8.999704873345696, 9.999704873345696, 8.999734386011127, 8.099760947410015]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.782775367402111, 5.3142163674021115], [0.0, 0.0, 0.0, 5.3142163674021115, 5.904706367402112], [0.0, 0.0, 9.999734386011127, 5.904706367402112, 6.560806367402113], [0.0, 9.999734386011127, 9.999734386011127, 9.999760947410016, 7.289806367402113], [0.0, 8.999760947410016, 9.999760947410016, 8.999784852669015, 8.099806367402113]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.30451525759571, 4.7828121575957105, 5.3142531575957115], [0.0, 0.0, 4.7828121575957105, 5.3142531575957115, 5.904743157595712], [0.0, 0.0, 9.999784852669015, 5.904743157595712, 6.560843157595712], [0.0, 9.999784852669015, 9.999784852669015, 9.999806367402114, 7.289843157595712], [0.0, 8.999806367402114, 9.999806367402114, 8.999825730661902, 8.099843157595712]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.8740778476525257, 4.304545057652526, 4.782841957652527, 5.314282957652527], [0.0, 3.4866700628872733, 4.782841957652527, 5.314282957652527, 5.9047729576525265], [0.0, 0.0, 9.999825730661902, 5.9047729576525265, 6.560872957652527], [0.0, 9.999825730661902, 9.999825730661902, 9.999843157595713, 7.289872957652528], [0.0, 8.999843157595713, 9.999843157595713, 8.999858841836142, 8.099872957652527]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4866814966985467, 3.8741019856985477, 4.304569195698547, 4.782866095698547, 5.314307095698547], [3.138013347028692, 3.486691787128693, 4.782866095698547, 5.314307095698547, 5.904797095698548], [2.8242120123258228, 2.5417908110932403, 9.999858841836142, 5.904797095698548, 6.5608970956985475], [2.5417908110932403, 9.999858841836142, 9.999858841836142, 9.999872957652528, 7.2898970956985485], [2.2876117299839165, 8.999872957652528, 9.999872957652528, 8.999885661887275, 8.099897095698548]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [109.99916639555619, 9.999999920397968, 8.999999920397968, 7.289999935522355, 6.5609999355223545, 5.904899935522353, 5.314409935522355, 4.782968935522354, 3.874204825522354, 3.486784336522354, 0.00014106971715577288]}, "tpi": {"3": {"frames": [{"V": [[0.0, -10.0, 0.0, 0.0, -2.71], [0.0, 0.0, -16.471, 0.0, -2.439], [0.0, -16.471, -13.8239, 0.0, -2.1951], [0.0, -13.8239, -22.44151, -16.290000000000003, 0.0], [-27.1, -27.1, 0.0, -24.661, 0.0]], "policy": [[1, 2, 3, 1, 2], [0, 2, 0, 0, 2], [0, 2, 3, 0, 1], [0, 2, 1, 0, 1], [0, 3, 4, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.71, 0.0, 0.0], [0.0, 2.71, 2.71, 3.439, 0.0], [0.0, 0.0, 3.439, 3.0951, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 4.68559, 0.0, 0.0], [0.0, 4.68559, 4.68559, 5.217031, 0.0], [0.0, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 6.12579511, 0.0, 0.0], [0.0, 6.12579511, 6.12579511, 6.5132155990000005, 4.465704635190001], [0.0, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 7.175704635190001, 0.0, 4.502088679053511], [0.0, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.231088679053511], [0.0, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 3.8134636470300096], [0.0, 0.0, 0.0, 0.0, 4.40395364703001], [0.0, 0.0, 7.94108867905351, 4.40395364703001, 5.060053647030009], [0.0, 7.94108867905351, 7.94108867905351, 8.14697981114816, 5.789053647030009], [0.0, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 3.6887791086848765, 4.220220108684877], [0.0, 0.0, 0.0, 4.220220108684877, 4.810710108684877], [0.0, 0.0, 8.49905364703001, 4.810710108684877, 5.466810108684879], [0.0, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.195810108684877], [0.0, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 3.507007669231276, 3.9853045692312765, 4.516745569231276], [0.0, 0.0, 3.9853045692312765, 4.516745569231276, 5.107235569231276], [0.0, 0.0, 8.905810108684877, 5.107235569231276, 5.763335569231275], [0.0, 8.905810108684877, 8.905810108684877, 9.01522909781639, 6.492335569231276], [0.0, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.2927075199696, 3.7231747299696005, 4.2014716299696, 4.732912629969601], [0.0, 2.96343676797264, 4.2014716299696, 4.732912629969601, 5.323402629969601], [0.0, 0.0, 9.202335569231277, 5.323402629969601, 5.979502629969602], [0.0, 9.202335569231277, 9.202335569231277, 9.28210201230815, 6.708502629969601], [0.0, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.0628728182478384, 3.4502933072478394, 3.880760517247839, 4.35905741724784, 4.89049841724784], [2.7565855364230547, 3.1052639765230556, 4.35905741724784, 4.89049841724784, 5.480988417247839], [2.4809269827807494, 2.2328342845026747, 9.4185026299696, 5.480988417247839, 6.137088417247838], [2.2328342845026747, 9.4185026299696, 9.4185026299696, 9.47665236697264, 6.866088417247839], [2.009550856052407, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [36.09999992039797, 9.999999920397968, 8.999999920397968, 7.289999935522355, 6.5609999355223545, 5.904899935522353, 5.314409935522355, 4.782968935522354, 3.874204825522354, 3.486784336522354, 0.5814972815836974]}, "9": {"frames": [{"V": [[0.0, 0.0, -6.12579511, 0.0, -6.12579511], [0.0, 0.0, -5.5132155990000005, -5.12579511, -6.12579511], [0.0, 0.0, -12.074215599000002, -13.803215599000001, -6.12579511], [-5.12579511, -4.613215599, 3.8590957000175496, -4.613215599, -5.5132155990000005], [-6.12579511, -61.2579511, 4.473186130015795, -5.12579511, -6.12579511]], "policy": [[1, 2, 2, 4, 2], [0, 0, 3, 0, 2], [0, 2, 1, 0, 1], [0, 3, 4, 2, 4], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 7.620887853198598, 0.0, -2.1359326833270087], [0.0, 7.620887853198598, 7.620887853198598, 7.8587990678787385, -2.1359326833270087], [0.0, 6.8587990678787385, 7.8587990678787385, 7.072919161090865, 6.365627244981779]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.078283208700363, 0.0, 0.0], [0.0, 9.078283208700363, 9.078283208700363, 9.170454887830326, 6.618068459142565], [0.0, 8.170454887830326, 9.170454887830326, 8.253409399047294, 7.428068459142565]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.642908029995183, 0.0, 6.3006799538664895], [0.0, 9.642908029995183, 9.642908029995183, 9.678617226995666, 7.02967995386649], [0.0, 8.678617226995666, 9.678617226995666, 8.710755504296099, 7.839679953866489]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.213556680430455], [0.0, 0.0, 0.0, 0.0, 5.804046680430455], [0.0, 0.0, 9.861655254362764, 5.804046680430455, 6.460146680430456], [0.0, 9.861655254362764, 9.861655254362764, 9.875489728926489, 7.189146680430456], [0.0, 8.875489728926489, 9.875489728926489, 8.88794075603384, 7.9991466804304565]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.743896357615095, 5.275337357615094], [0.0, 0.0, 0.0, 5.275337357615094, 5.865827357615095], [0.0, 0.0, 9.946402410994644, 5.865827357615095, 6.521927357615096], [0.0, 9.946402410994644, 9.946402410994644, 9.95176216989518, 7.250927357615096], [0.0, 8.95176216989518, 9.95176216989518, 8.956585952905662, 8.060927357615096]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.289534557780719, 4.767831457780719, 5.29927245778072], [0.0, 0.0, 4.767831457780719, 5.29927245778072, 5.88976245778072], [0.0, 0.0, 9.979235195858326, 5.88976245778072, 6.54586245778072], [0.0, 9.979235195858326, 9.979235195858326, 9.981311676272494, 7.2748624577807215], [0.0, 8.981311676272494, 9.981311676272494, 8.983180508645244, 8.08486245778072]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.868340295991149, 4.298807505991149, 4.777104405991149, 5.308545405991149], [0.0, 3.481506266392034, 4.777104405991149, 5.308545405991149, 5.899035405991149], [0.0, 0.0, 9.991955289425444, 5.899035405991149, 6.55513540599115], [0.0, 9.991955289425444, 9.991955289425444, 9.992759760482901, 7.28413540599115], [0.0, 8.992759760482901, 9.992759760482901, 8.993483784434611, 8.09413540599115]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484512337121305, 3.8719328261213057, 4.302400036121307, 4.7806969361213065, 5.3121379361213075], [3.1360611034091748, 3.4847395435091753, 4.7806969361213065, 5.3121379361213075, 5.902627936121306], [2.8224549930682574, 2.5402094937614317, 9.996883314295344, 5.902627936121306, 6.558727936121306], [2.5402094937614317, 9.996883314295344, 9.996883314295344, 9.99719498286581, 7.287727936121307], [2.2861885443852885, 8.99719498286581, 9.99719498286581, 8.99747548457923, 8.097727936121307]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [70.25795102039797, 9.425932618849362, 6.5609999355223545, 5.904899935522353, 5.314409935522355, 4.782968935522354, 3.874204825522354, 3.486784336522354, 0.003116597257953657]}, "27": {"frames": [{"V": [[-9.4185026299696, -8.47665236697264, -9.4185026299696, -42.41186537274057, -38.17067883546652], [0.0, 0.0, -8.47665236697264, -47.17067883546652, -34.35361095191987], [0.0, -94.185026299696, -47.17067883546652, -52.45361095191987, 0.0], [-9.4185026299696, -94.185026299696, -52.45361095191987, -47.20824985672788, 0.0], [-9.4185026299696, -94.185026299696, -9.4185026299696, -9.4185026299696, -9.4185026299696]], "policy": [[1, 4, 2, 2, 1], [1, 2, 0, 2, 1], [0, 2, 0, 3, 1], [0, 2, 1, 3, 0], [0, 2, 3, 2, 0]]}, {"V": [[0.0, -0.49291510580565634, -0.4436235952250907, -0.39926123570258165, 0.0], [0.0, 0.0, -0.39926123570258165, -10.359335112132323, 0.0], [0.0, 0.0, -10.359335112132323, 0.0, 0.0], [0.0, 0.0, -0.0393180847289775, 0.0, 0.0], [0.0, 0.0, -0.03538627625607975, -0.03184764863047178, 0.0]], "policy": [[1, 2, 3, 3, 1], [0, 1, 0, 1, 0], [0, 2, 1, 3, 0], [0, 3, 4, 2, 0], [0, 2, 0, 3, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.416216293683147, 0.0, 0.0], [0.0, 9.416216293683147, 9.416216293683147, 9.474594664314832, 0.0], [0.0, 0.0, 9.474594664314832, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.966053131011018, 0.0, 0.0], [0.0, 9.966053131011018, 9.966053131011018, 9.969447817909916, 0.0], [0.0, 8.969447817909916, 9.969447817909916, 8.972503036118924, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.998025998496217, 0.0, 0.0], [0.0, 9.998025998496217, 9.998025998496217, 9.998223398646596, 0.0], [0.0, 8.998223398646596, 9.998223398646596, 8.998401058781937, 8.098560952903744]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999150257080133, 0.0, 0.0], [0.0, 9.999150257080133, 9.999150257080133, 9.99923523137212, 7.289380537411418], [0.0, 8.99923523137212, 9.99923523137212, 8.999311708234908, 8.099380537411417]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999311708234908, 0.0, 6.560498235303248], [0.0, 9.999311708234908, 9.999311708234908, 9.999380537411417, 7.289498235303248], [0.0, 8.999380537411417, 9.999380537411417, 8.999442483670276, 8.099498235303248]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.314044213536068], [0.0, 0.0, 0.0, 0.0, 5.904534213536068], [0.0, 0.0, 9.999498235303248, 5.904534213536068, 6.560634213536068], [0.0, 9.999498235303248, 9.999498235303248, 9.999548411772924, 7.289634213536068], [0.0, 8.999548411772924, 9.999548411772924, 8.999593570595632, 8.099634213536069]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.7826727129642155, 5.3141137129642155], [0.0, 0.0, 0.0, 5.3141137129642155, 5.9046037129642155], [0.0, 0.0, 9.999593570595632, 5.9046037129642155, 6.560703712964216], [0.0, 9.999593570595632, 9.999593570595632, 9.99963421353607, 7.289703712964217], [0.0, 8.99963421353607, 9.99963421353607, 8.999670792182462, 8.099703712964216]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.304432107501015, 4.782729007501015, 5.314170007501015], [0.0, 0.0, 4.782729007501015, 5.314170007501015, 5.904660007501016], [0.0, 0.0, 9.999670792182462, 5.904660007501016, 6.560760007501015], [0.0, 9.999670792182462, 9.999670792182462, 9.999703712964216, 7.289760007501016], [0.0, 8.999703712964216, 9.999703712964216, 8.999733341667795, 8.099760007501017]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.874010496075822, 4.304477706075822, 4.782774606075823, 5.314215606075823], [0.0, 3.48660944646824, 4.782774606075823, 5.314215606075823, 5.904705606075823], [0.0, 0.0, 9.999733341667795, 5.904705606075823, 6.560805606075824], [0.0, 9.999733341667795, 9.999733341667795, 9.999760007501017, 7.2898056060758245], [0.0, 8.999760007501017, 9.999760007501017, 8.999784006750916, 8.099805606075824]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486626941921416, 3.874047430921417, 4.304514640921417, 4.782811540921417, 5.3142525409214185], [3.1379642477292746, 3.486642687829275, 4.782811540921417, 5.3142525409214185, 5.904742540921418], [2.824167822956347, 2.5417510406607127, 9.999784006750916, 5.904742540921418, 6.560842540921418], [2.5417510406607127, 9.999784006750916, 9.999784006750916, 9.999805606075824, 7.289842540921418], [2.2875759365946413, 8.999805606075824, 9.999805606075824, 8.999825045468242, 8.099842540921419]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [104.18502621124931, 20.35933502368562, 8.999999928358172, 8.099999935522355, 7.289999935522355, 6.5609999355223545, 5.904899935522353, 5.314409935522355, 4.782968935522354, 3.874204825522354, 3.486784336522354, 0.00021590480238131704]}, "81": {"frames": [{"V": [[-9.998033729495246, -9.998033729495246, -9.998033729495246, -8.998230356545722, 0.0], [0.0, -52.63157643520488, -47.36841879168439, -52.63157691251595, 0.0], [-9.998033729495246, -57.36841879168439, -52.63157691251595, -57.36841922126436, 0.0], [-8.998230356545722, 9.998033729495246, 9.998033729495246, 9.998230356545722, -9.998033729495246], [-52.63157691251595, -47.36841922126436, -8.998033729495246, -9.998033729495246, -8.998230356545722]], "policy": [[1, 2, 3, 3, 1], [4, 2, 0, 3, 0], [0, 1, 1, 3, 0], [3, 3, 4, 2, 0], [0, 0, 0, 0, 4]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, -1.0000003866219664, 9.999999613378034, 0.0, 0.0], [-1.0000003866219664, 9.999999613378034, 9.999999613378034, 9.99999965204023, 0.0], [-0.9000003479597698, -1.0000003479597694, 9.99999965204023, -1.0000003131637918, -0.0017692954945071721]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [4, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999999999630775, 0.0, 0.0], [0.0, 9.999999999630775, 9.999999999630775, 9.999999999667699, 0.0], [-0.0008595047880204467, 8.999999999667699, 9.999999999667699, 8.999999999700929, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999999999700929, 0.0, 0.0], [0.0, 9.999999999700929, 9.999999999700929, 9.999999999730836, 0.0], [0.0, 8.999999999730836, 9.999999999730836, 8.999999999757753, 8.099999999781978]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999999999757753, 0.0, 0.0], [0.0, 9.999999999757753, 9.999999999757753, 9.999999999781977, 7.289999999823402], [0.0, 8.999999999781977, 9.999999999781977, 8.99999999980378, 8.099999999823403]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.99999999980378, 0.0, 6.560999999856957], [0.0, 9.99999999980378, 9.99999999980378, 9.999999999823402, 7.289999999856956], [0.0, 8.999999999823402, 9.999999999823402, 8.999999999841062, 8.099999999856957]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.314409999895721], [0.0, 0.0, 0.0, 0.0, 5.904899999895722], [0.0, 0.0, 9.999999999856957, 5.904899999895722, 6.560999999895722], [0.0, 9.999999999856957, 9.999999999856957, 9.999999999871262, 7.2899999998957234], [0.0, 8.999999999871262, 9.999999999871262, 8.999999999884135, 8.099999999895722]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.782968999915536, 5.314409999915535], [0.0, 0.0, 0.0, 5.314409999915535, 5.9048999999155365], [0.0, 0.0, 9.999999999884135, 5.9048999999155365, 6.560999999915535], [0.0, 9.999999999884135, 9.999999999884135, 9.999999999895723, 7.289999999915536], [0.0, 8.999999999895723, 9.999999999895723, 8.99999999990615, 8.099999999915536]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.304672099931583, 4.782968999931585, 5.314409999931583], [0.0, 0.0, 4.782968999931585, 5.314409999931583, 5.904899999931584], [0.0, 0.0, 9.99999999990615, 5.904899999931584, 6.5609999999315844], [0.0, 9.99999999990615, 9.99999999990615, 9.999999999915534, 7.289999999931583], [0.0, 8.999999999915534, 9.999999999915534, 8.99999999992398, 8.099999999931583]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.874204889944584, 4.304672099944582, 4.7829689999445835, 5.3144099999445835], [0.0, 3.4867844009501257, 4.7829689999445835, 5.3144099999445835, 5.904899999944582], [0.0, 0.0, 9.99999999992398, 5.904899999944582, 6.560999999944583], [0.0, 9.99999999992398, 9.99999999992398, 9.999999999931584, 7.289999999944583], [0.0, 8.999999999931584, 9.999999999931584, 8.999999999938426, 8.099999999944584]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486784400955112, 3.874204889955113, 4.304672099955114, 4.782968999955112, 5.314409999955113], [3.1381059608596007, 3.4867844009596016, 4.782968999955112, 5.314409999955113, 5.904899999955113], [2.824295364773641, 2.541865828296277, 9.999999999938426, 5.904899999955113, 6.560999999955114], [2.541865828296277, 9.999999999938426, 9.999999999938426, 9.999999999944583, 7.289999999955112], [2.2876792454666495, 8.999999999944583, 9.999999999944583, 8.999999999950125, 8.099999999955113]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [63.27331915678671, 10.000000268357738, 8.099999935522355, 7.289999935522355, 6.5609999355223545, 5.904899935522353, 5.314409935522355, 4.782968935522354, 3.874204825522354, 3.486784336522354, 8.838512854936198e-08]}}, "q_learning": {"0.1": {"V": [[3.486784400999941, 3.8742048899999384, 4.304672099999934, 4.78296899999993, 4.790718599875651], [3.1165591899125236, 0.5022775414048402, 3.7192119525132736, 5.314409999999928, 5.904899999999923], [2.668724268987878, 1.8261373362032771, 9.999999999999908, 5.782667023572063, 6.560999999999918], [1.3618821699772938, 9.999999999999908, 9.999999999999908, 9.999999999999908, 7.289999999999914], [0.12800472738319862, 8.95822487935752, 9.999999999999908, 8.999999999999908, 8.099999999999909]], "policy": [[3.0, 3.0, 3.0, 1.0, 1.0], [0.0, 1.0, 0.0, 3.0, 1.0], [0.0, 2.0, 1.0, 3.0, 1.0], [0.0, 3.0, 4.0, 2.0, 1.0], [0.0, 3.0, 0.0, 2.0, 2.0]]}, "0.2": {"V": [[3.4867844009999427, 3.8742048899999384, 4.304672099999934, 4.78296899999993, 5.303745716158152], [3.138105949132753, 2.78028051339855, 4.782476484055536, 5.314409999999928, 5.904899999999923], [2.8242882229979194, 2.5386033340672918, 9.999999999999908, 5.904899083197454, 6.560999999999918], [2.5336669889445216, 9.999999999999908, 9.999999999999908, 9.999999999999908, 7.289999999999914], [1.1413460773100568, 8.999981792388153, 9.999999999999908, 8.999999999999908, 8.099999999999909]], "policy": [[3.0, 3.0, 3.0, 1.0, 1.0], [0.0, 2.0, 3.0, 3.0, 1.0], [0.0, 2.0, 1.0, 3.0, 1.0], [0.0, 3.0, 4.0, 2.0, 1.0], [0.0, 3.0, 0.0, 2.0, 2.0]]}, "0.5": {"V": [[3.4867844009999427, 3.8742048899999384, 4.304672099999934, 4.78296899999993, 5.314392471989204], [3.1381059608999466, 3.486784400712542, 4.7829689999999285, 5.314409999999928, 5.904899999999923], [2.8242953648099505, 2.541865828324376, 9.999999999999908, 5.904899999999923, 6.560999999999918], [2.541865827634162, 9.999999999999908, 9.999999999999908, 9.999999999999908, 7.289999999999914], [2.286689227015423, 8.999999999999908, 9.999999999999908, 8.999999999999908, 8.099999999999909]], "policy": [[3.0, 3.0, 3.0, 1.0, 1.0], [0.0, 0.0, 3.0, 1.0, 1.0], [0.0, 2.0, 1.0, 3.0, 1.0], [0.0, 3.0, 4.0, 2.0, 1.0], [0.0, 3.0, 0.0, 2.0, 2.0]]}}, "td_linear": {"poly_1": {"V": [[-25.39102461941295, -23.61089358678402, -21.83076255415509, -20.05063152152616, -18.27050048889723], [-26.718623710725048, -24.938492678096118, -23.15836164546719, -21.37823061283826, -19.59809958020933], [-28.046222802037143, -26.266091769408213, -24.485960736779283, -22.705829704150354, -20.925698671521424], [-29.37382189334924, -27.59369086072031, -25.813559828091382, -24.033428795462452, -22.253297762833522], [-30.70142098466134, -28.92128995203241, -27.14115891940348, -25.36102788677455, -23.58089685414562]]}, "poly_2": {"V": [[-20.471528143609696, -24.793058616285876, -25.256657110691314, -21.86232362682599, -14.610058164689917], [-25.094566387352614, -29.23747830516273, -29.5224582447021, -25.949506205970707, -18.518622188968568], [-27.618618059102296, -31.582911422046344, -31.689272806719647, -27.93770221312219, -20.32819964125398], [-28.043683158858737, -31.82935796693672, -31.75710079674396, -27.82691164828043, -20.038790521546154], [-26.369761686621946, -29.976817939833857, -29.725942214775028, -25.617134511445435, -17.650394829845094]]}, "poly_3": {"V": [[-18.240409791699282, -22.02735706885891, -21.746250613664504, -18.10561538573391, -11.813976344684965], [-21.782248748751098, -25.767292598759035, -25.662106408915893, -22.175215138839505, -16.015143748147715], [-23.97760616694549, -28.002743884644225, -27.915475254994828, -24.424325237615133, -18.237818792122987], [-24.32220906857451, -28.229437948806538, -28.002084174193378, -24.348672704352865, -17.97772849890285], [-22.311784475930224, -25.94310181353803, -25.417660188803605, -21.443984561344756, -14.73059989077936]]}, "fourier_1": {"V": [[-22.517903375897216, -22.51603844516488, -22.511536104097992, -22.507033763031107, -22.505168832298768], [-24.20693540319721, -25.967824718284312, -25.963322377217423, -24.1960657903311, -21.701289898030165], [-28.284619430787394, -30.045508745874496, -28.27825215898817, -24.01808461053325, -19.760554472412878], [-32.362303458377575, -32.36043852764524, -28.100270979190316, -22.07734918491596, -17.819819046795587], [-34.051335485677576, -31.55655959337664, -25.53363779910228, -19.510716004827923, -17.015940112526987]]}, "fourier_2": {"V": [[-19.735979570925448, -24.401139766783402, -28.42353151126981, -22.206591002645105, -16.632418945391944], [-22.876348042766892, -28.841520106554462, -32.38888244276912, -24.65295703151871, -18.052633901868397], [-27.509961276885218, -33.428119467369285, -34.8095083312939, -25.619416312678084, -19.590724530143415], [-27.97460456207517, -31.945762314965286, -31.26767919706603, -22.86819156026195, -18.45508661919687], [-26.94600308498826, -28.42967332108625, -27.895206015334377, -21.539320754968145, -17.20157303645177]]}, "fourier_3": {"V": [[-21.564231896572345, -23.458017034325287, -23.95161357618726, -17.198004516960612, -11.844584053624931], [-21.613091720870653, -26.45944401372476, -29.894145996364692, -19.279732025854578, -14.00358143005089], [-22.42606941958886, -32.90124289454608, -33.43475525557155, -25.786587146321732, -17.981125505648727], [-27.08565084872844, -35.567872458253504, -35.266626627353574, -24.541855024857725, -19.39441081417283], [-30.98111440344813, -30.36417034466917, -26.490406105633195, -21.111367674450616, -18.989149423525056]]}}}};
\ No newline at end of file
+const RL_DATA = {"env": {"rows": 5, "cols": 5, "forbidden": [[1, 1], [1, 2], [2, 2], [3, 1], [3, 3], [4, 1]], "targets": [[3, 2]]}, "-1": {"vi": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 1.0, 1.0, 1.9, 0.71], [0.0, 0.0, 1.9, 1.71, 1.539]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 1, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.9, 0.71, 0.639], [0.0, 1.9, 1.9, 2.71, 1.439], [0.0, 1.71, 2.71, 2.439, 2.1951]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 1, 1], [0, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.71, 0.639, 0.5751000000000001], [0.0, 0.71, 2.71, 1.439, 1.2951000000000001], [0.71, 2.71, 2.71, 3.439, 2.0951], [0.639, 2.439, 3.439, 3.0951, 2.78559]], "policy": [[1, 2, 2, 1, 1], [0, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.5751000000000001, 0.5175900000000001], [0.0, 0.639, 1.439, 1.2951000000000001, 1.1655900000000001], [0.639, 1.439, 3.439, 2.0951, 1.88559], [1.439, 3.439, 3.439, 4.0951, 2.6855900000000004], [1.2951000000000001, 3.0951, 4.0951, 3.6855900000000004, 3.3170310000000005]], "policy": [[1, 2, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.5175900000000001, 1.1655900000000001, 1.049031], [0.5751000000000001, 1.2951000000000001, 2.0951, 1.88559, 1.6970310000000002], [1.2951000000000001, 2.0951, 4.0951, 2.6855900000000004, 2.4170310000000006], [2.0951, 4.0951, 4.0951, 4.68559, 3.2170310000000004], [1.88559, 3.6855900000000004, 4.68559, 4.217031, 3.7953279000000006]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.5175900000000001, 0.4658310000000001, 1.049031, 1.6970310000000002, 1.5273279000000002], [1.1655900000000001, 1.88559, 2.6855900000000004, 2.4170310000000006, 2.1753279000000005], [1.88559, 2.6855900000000004, 4.68559, 3.2170310000000004, 2.8953279000000003], [2.6855900000000004, 4.68559, 4.68559, 5.217031, 3.6953279000000006], [2.4170310000000006, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[1.049031, 0.9441279, 1.5273279000000002, 2.1753279000000005, 1.9577951100000006], [1.6970310000000002, 2.4170310000000006, 3.2170310000000004, 2.8953279000000003, 2.6057951100000003], [2.4170310000000006, 3.2170310000000004, 5.217031, 3.6953279000000006, 3.3257951100000005], [3.2170310000000004, 5.217031, 5.217031, 5.6953279000000006, 4.12579511], [2.8953279000000003, 4.6953279000000006, 5.6953279000000006, 5.12579511, 4.613215599]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[1.5273279000000002, 1.3745951100000002, 1.9577951100000006, 2.6057951100000003, 2.3452155990000003], [2.1753279000000005, 2.8953279000000003, 3.6953279000000006, 3.3257951100000005, 2.9932155990000004], [2.8953279000000003, 3.6953279000000006, 5.6953279000000006, 4.12579511, 3.713215599], [3.6953279000000006, 5.6953279000000006, 5.6953279000000006, 6.12579511, 4.5132155990000005], [3.3257951100000005, 5.12579511, 6.12579511, 5.5132155990000005, 4.961894039100001]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[1.9577951100000006, 1.7620155990000006, 2.3452155990000003, 2.9932155990000004, 2.6938940391000004], [2.6057951100000003, 3.3257951100000005, 4.12579511, 3.713215599, 3.3418940391], [3.3257951100000005, 4.12579511, 6.12579511, 4.5132155990000005, 4.0618940391], [4.12579511, 6.12579511, 6.12579511, 6.5132155990000005, 4.861894039100001], [3.713215599, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.3452155990000003, 2.1106940391, 2.713215599, 3.3418940391, 3.00770463519], [2.9932155990000004, 3.713215599, 4.5132155990000005, 4.0618940391, 3.65570463519], [3.713215599, 4.5132155990000005, 6.5132155990000005, 4.861894039100001, 4.375704635190001], [4.5132155990000005, 6.5132155990000005, 6.5132155990000005, 6.861894039100001, 5.175704635190001], [4.0618940391, 5.861894039100001, 6.861894039100001, 6.175704635190001, 5.558134171671001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.6938940391000004, 2.4418940391, 3.0618940391000002, 3.65570463519, 3.290134171671], [3.3418940391, 4.0618940391, 4.861894039100001, 4.375704635190001, 3.9381341716710008], [4.0618940391, 4.861894039100001, 6.861894039100001, 5.175704635190001, 4.6581341716710005], [4.861894039100001, 6.861894039100001, 6.861894039100001, 7.175704635190001, 5.458134171671], [4.375704635190001, 6.175704635190001, 7.175704635190001, 6.458134171671, 5.812320754503901]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.00770463519, 2.7557046351900003, 3.375704635190001, 3.9381341716710008, 3.5443207545039006], [3.65570463519, 4.375704635190001, 5.175704635190001, 4.6581341716710005, 4.192320754503901], [4.375704635190001, 5.175704635190001, 7.175704635190001, 5.458134171671, 4.9123207545039005], [5.175704635190001, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.7123207545039], [4.6581341716710005, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.290134171671, 3.038134171671001, 3.6581341716710005, 4.192320754503901, 3.7730886790535108], [3.9381341716710008, 4.6581341716710005, 5.458134171671, 4.9123207545039005, 4.42108867905351], [4.6581341716710005, 5.458134171671, 7.458134171671, 5.7123207545039, 5.14108867905351], [5.458134171671, 7.458134171671, 7.458134171671, 7.7123207545039, 5.94108867905351], [4.9123207545039005, 6.7123207545039, 7.7123207545039, 6.94108867905351, 6.246979811148159]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.5443207545039006, 3.2923207545039004, 3.9123207545039005, 4.42108867905351, 3.9789798111481596], [4.192320754503901, 4.9123207545039005, 5.7123207545039, 5.14108867905351, 4.62697981114816], [4.9123207545039005, 5.7123207545039, 7.7123207545039, 5.94108867905351, 5.3469798111481595], [5.7123207545039, 7.7123207545039, 7.7123207545039, 7.94108867905351, 6.146979811148159], [5.14108867905351, 6.94108867905351, 7.94108867905351, 7.146979811148159, 6.432281830033343]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.7730886790535108, 3.5210886790535105, 4.14108867905351, 4.62697981114816, 4.164281830033344], [4.42108867905351, 5.14108867905351, 5.94108867905351, 5.3469798111481595, 4.812281830033344], [5.14108867905351, 5.94108867905351, 7.94108867905351, 6.146979811148159, 5.532281830033344], [5.94108867905351, 7.94108867905351, 7.94108867905351, 8.14697981114816, 6.332281830033344], [5.3469798111481595, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.9789798111481596, 3.7269798111481593, 4.3469798111481595, 4.812281830033344, 4.33105364703001], [4.62697981114816, 5.3469798111481595, 6.146979811148159, 5.532281830033344, 4.9790536470300095], [5.3469798111481595, 6.146979811148159, 8.14697981114816, 6.332281830033344, 5.69905364703001], [6.146979811148159, 8.14697981114816, 8.14697981114816, 8.332281830033345, 6.499053647030011], [5.532281830033344, 7.332281830033344, 8.332281830033345, 7.499053647030011, 6.74914828232701]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.164281830033344, 3.9122818300333435, 4.532281830033344, 4.9790536470300095, 4.481148282327009], [4.812281830033344, 5.532281830033344, 6.332281830033344, 5.69905364703001, 5.12914828232701], [5.532281830033344, 6.332281830033344, 8.332281830033345, 6.499053647030011, 5.84914828232701], [6.332281830033344, 8.332281830033345, 8.332281830033345, 8.49905364703001, 6.649148282327009], [5.69905364703001, 7.499053647030011, 8.49905364703001, 7.649148282327009, 6.884233454094308]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.33105364703001, 4.079053647030009, 4.69905364703001, 5.12914828232701, 4.616233454094309], [4.9790536470300095, 5.69905364703001, 6.499053647030011, 5.84914828232701, 5.26423345409431], [5.69905364703001, 6.499053647030011, 8.49905364703001, 6.649148282327009, 5.9842334540943085], [6.499053647030011, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.7842334540943074], [5.84914828232701, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.481148282327009, 4.229148282327009, 4.84914828232701, 5.26423345409431, 4.7378101086848785], [5.12914828232701, 5.84914828232701, 6.649148282327009, 5.9842334540943085, 5.385810108684878], [5.84914828232701, 6.649148282327009, 8.649148282327008, 6.7842334540943074, 6.105810108684877], [6.649148282327009, 8.649148282327008, 8.649148282327008, 8.784233454094307, 6.905810108684877], [5.9842334540943085, 7.7842334540943074, 8.784233454094307, 7.905810108684877, 7.115229097816389]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.616233454094309, 4.364233454094309, 4.9842334540943085, 5.385810108684878, 4.84722909781639], [5.26423345409431, 5.9842334540943085, 6.7842334540943074, 6.105810108684877, 5.49522909781639], [5.9842334540943085, 6.7842334540943074, 8.784233454094307, 6.905810108684877, 6.2152290978163895], [6.7842334540943074, 8.784233454094307, 8.784233454094307, 8.905810108684877, 7.015229097816389], [6.105810108684877, 7.905810108684877, 8.905810108684877, 8.01522909781639, 7.213706188034751]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.7378101086848785, 4.485810108684878, 5.105810108684877, 5.49522909781639, 4.945706188034751], [5.385810108684878, 6.105810108684877, 6.905810108684877, 6.2152290978163895, 5.5937061880347505], [6.105810108684877, 6.905810108684877, 8.905810108684877, 7.015229097816389, 6.31370618803475], [6.905810108684877, 8.905810108684877, 8.905810108684877, 9.01522909781639, 7.113706188034751], [6.2152290978163895, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[4.84722909781639, 4.595229097816389, 5.2152290978163895, 5.5937061880347505, 5.034335569231276], [5.49522909781639, 6.2152290978163895, 7.015229097816389, 6.31370618803475, 5.682335569231276], [6.2152290978163895, 7.015229097816389, 9.01522909781639, 7.113706188034751, 6.402335569231276], [7.015229097816389, 9.01522909781639, 9.01522909781639, 9.113706188034751, 7.202335569231277], [6.31370618803475, 8.113706188034751, 9.113706188034751, 8.202335569231277, 7.38210201230815]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[4.945706188034751, 4.693706188034751, 5.31370618803475, 5.682335569231276, 5.114102012308148], [5.5937061880347505, 6.31370618803475, 7.113706188034751, 6.402335569231276, 5.762102012308149], [6.31370618803475, 7.113706188034751, 9.113706188034751, 7.202335569231277, 6.482102012308149], [7.113706188034751, 9.113706188034751, 9.113706188034751, 9.202335569231277, 7.282102012308149], [6.402335569231276, 8.202335569231277, 9.202335569231277, 8.28210201230815, 7.453891811077335]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.034335569231276, 4.782335569231275, 5.402335569231276, 5.762102012308149, 5.185891811077334], [5.682335569231276, 6.402335569231276, 7.202335569231277, 6.482102012308149, 5.833891811077335], [6.402335569231276, 7.202335569231277, 9.202335569231277, 7.282102012308149, 6.553891811077334], [7.202335569231277, 9.202335569231277, 9.202335569231277, 9.28210201230815, 7.353891811077334], [6.482102012308149, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.114102012308148, 4.862102012308148, 5.482102012308149, 5.833891811077335, 5.250502629969601], [5.762102012308149, 6.482102012308149, 7.282102012308149, 6.553891811077334, 5.898502629969601], [6.482102012308149, 7.282102012308149, 9.28210201230815, 7.353891811077334, 6.618502629969601], [7.282102012308149, 9.28210201230815, 9.28210201230815, 9.353891811077334, 7.4185026299696], [6.553891811077334, 8.353891811077334, 9.353891811077334, 8.4185026299696, 7.57665236697264]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.185891811077334, 4.933891811077334, 5.553891811077334, 5.898502629969601, 5.308652366972641], [5.833891811077335, 6.553891811077334, 7.353891811077334, 6.618502629969601, 5.956652366972642], [6.553891811077334, 7.353891811077334, 9.353891811077334, 7.4185026299696, 6.6766523669726405], [7.353891811077334, 9.353891811077334, 9.353891811077334, 9.4185026299696, 7.47665236697264], [6.618502629969601, 8.4185026299696, 9.4185026299696, 8.47665236697264, 7.628987130275377]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.250502629969601, 4.998502629969601, 5.618502629969601, 5.956652366972642, 5.360987130275378], [5.898502629969601, 6.618502629969601, 7.4185026299696, 6.6766523669726405, 6.008987130275377], [6.618502629969601, 7.4185026299696, 9.4185026299696, 7.47665236697264, 6.728987130275376], [7.4185026299696, 9.4185026299696, 9.4185026299696, 9.47665236697264, 7.528987130275377], [6.6766523669726405, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.308652366972641, 5.056652366972641, 5.6766523669726405, 6.008987130275377, 5.408088417247839], [5.956652366972642, 6.6766523669726405, 7.47665236697264, 6.728987130275376, 6.056088417247839], [6.6766523669726405, 7.47665236697264, 9.47665236697264, 7.528987130275377, 6.7760884172478395], [7.47665236697264, 9.47665236697264, 9.47665236697264, 9.528987130275377, 7.57608841724784], [6.728987130275376, 8.528987130275377, 9.528987130275377, 8.57608841724784, 7.718479575523056]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.360987130275378, 5.108987130275376, 5.728987130275376, 6.056088417247839, 5.4504795755230555], [6.008987130275377, 6.728987130275376, 7.528987130275377, 6.7760884172478395, 6.098479575523056], [6.728987130275376, 7.528987130275377, 9.528987130275377, 7.57608841724784, 6.818479575523057], [7.528987130275377, 9.528987130275377, 9.528987130275377, 9.57608841724784, 7.618479575523056], [6.7760884172478395, 8.57608841724784, 9.57608841724784, 8.618479575523056, 7.756631617970751]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.408088417247839, 5.1560884172478385, 5.7760884172478395, 6.098479575523056, 5.488631617970751], [6.056088417247839, 6.7760884172478395, 7.57608841724784, 6.818479575523057, 6.136631617970751], [6.7760884172478395, 7.57608841724784, 9.57608841724784, 7.618479575523056, 6.85663161797075], [7.57608841724784, 9.57608841724784, 9.57608841724784, 9.618479575523056, 7.656631617970751], [6.818479575523057, 8.618479575523056, 9.618479575523056, 8.656631617970751, 7.790968456173676]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.4504795755230555, 5.198479575523056, 5.818479575523057, 6.136631617970751, 5.522968456173676], [6.098479575523056, 6.818479575523057, 7.618479575523056, 6.85663161797075, 6.170968456173675], [6.818479575523057, 7.618479575523056, 9.618479575523056, 7.656631617970751, 6.890968456173676], [7.618479575523056, 9.618479575523056, 9.618479575523056, 9.656631617970751, 7.690968456173676], [6.85663161797075, 8.656631617970751, 9.656631617970751, 8.690968456173676, 7.821871610556309]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.488631617970751, 5.236631617970751, 5.85663161797075, 6.170968456173675, 5.553871610556308], [6.136631617970751, 6.85663161797075, 7.656631617970751, 6.890968456173676, 6.201871610556308], [6.85663161797075, 7.656631617970751, 9.656631617970751, 7.690968456173676, 6.921871610556309], [7.656631617970751, 9.656631617970751, 9.656631617970751, 9.690968456173676, 7.72187161055631], [6.890968456173676, 8.690968456173676, 9.690968456173676, 8.72187161055631, 7.849684449500679]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.522968456173676, 5.270968456173676, 5.890968456173676, 6.201871610556308, 5.581684449500678], [6.170968456173675, 6.890968456173676, 7.690968456173676, 6.921871610556309, 6.229684449500678], [6.890968456173676, 7.690968456173676, 9.690968456173676, 7.72187161055631, 6.949684449500679], [7.690968456173676, 9.690968456173676, 9.690968456173676, 9.72187161055631, 7.749684449500679], [6.921871610556309, 8.72187161055631, 9.72187161055631, 8.749684449500679, 7.874716004550611]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.553871610556308, 5.301871610556308, 5.921871610556309, 6.229684449500678, 5.60671600455061], [6.201871610556308, 6.921871610556309, 7.72187161055631, 6.949684449500679, 6.254716004550611], [6.921871610556309, 7.72187161055631, 9.72187161055631, 7.749684449500679, 6.974716004550611], [7.72187161055631, 9.72187161055631, 9.72187161055631, 9.749684449500679, 7.77471600455061], [6.949684449500679, 8.749684449500679, 9.749684449500679, 8.77471600455061, 7.89724440409555]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.581684449500678, 5.329684449500678, 5.949684449500679, 6.254716004550611, 5.62924440409555], [6.229684449500678, 6.949684449500679, 7.749684449500679, 6.974716004550611, 6.27724440409555], [6.949684449500679, 7.749684449500679, 9.749684449500679, 7.77471600455061, 6.997244404095549], [7.749684449500679, 9.749684449500679, 9.749684449500679, 9.77471600455061, 7.797244404095549], [6.974716004550611, 8.77471600455061, 9.77471600455061, 8.797244404095549, 7.9175199636859945]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.60671600455061, 5.354716004550611, 5.974716004550611, 6.27724440409555, 5.649519963685996], [6.254716004550611, 6.974716004550611, 7.77471600455061, 6.997244404095549, 6.297519963685994], [6.974716004550611, 7.77471600455061, 9.77471600455061, 7.797244404095549, 7.017519963685994], [7.77471600455061, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.817519963685994], [6.997244404095549, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.62924440409555, 5.37724440409555, 5.997244404095549, 6.297519963685994, 5.6677679673173955], [6.27724440409555, 6.997244404095549, 7.797244404095549, 7.017519963685994, 6.315767967317395], [6.997244404095549, 7.797244404095549, 9.797244404095549, 7.817519963685994, 7.035767967317395], [7.797244404095549, 9.797244404095549, 9.797244404095549, 9.817519963685994, 7.835767967317395], [7.017519963685994, 8.817519963685994, 9.817519963685994, 8.835767967317395, 7.952191170585656]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.649519963685996, 5.397519963685994, 6.017519963685994, 6.315767967317395, 5.684191170585656], [6.297519963685994, 7.017519963685994, 7.817519963685994, 7.035767967317395, 6.332191170585656], [7.017519963685994, 7.817519963685994, 9.817519963685994, 7.835767967317395, 7.0521911705856555], [7.817519963685994, 9.817519963685994, 9.817519963685994, 9.835767967317395, 7.852191170585655], [7.035767967317395, 8.835767967317395, 9.835767967317395, 8.852191170585655, 7.96697205352709]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.6677679673173955, 5.415767967317395, 6.035767967317395, 6.332191170585656, 5.698972053527091], [6.315767967317395, 7.035767967317395, 7.835767967317395, 7.0521911705856555, 6.34697205352709], [7.035767967317395, 7.835767967317395, 9.835767967317395, 7.852191170585655, 7.06697205352709], [7.835767967317395, 9.835767967317395, 9.835767967317395, 9.852191170585655, 7.866972053527091], [7.0521911705856555, 8.852191170585655, 9.852191170585655, 8.86697205352709, 7.980274848174382]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.684191170585656, 5.432191170585655, 6.0521911705856555, 6.34697205352709, 5.712274848174381], [6.332191170585656, 7.0521911705856555, 7.852191170585655, 7.06697205352709, 6.360274848174381], [7.0521911705856555, 7.852191170585655, 9.852191170585655, 7.866972053527091, 7.080274848174382], [7.852191170585655, 9.852191170585655, 9.852191170585655, 9.86697205352709, 7.880274848174382], [7.06697205352709, 8.86697205352709, 9.86697205352709, 8.880274848174382, 7.992247363356944]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.698972053527091, 5.44697205352709, 6.06697205352709, 6.360274848174381, 5.724247363356943], [6.34697205352709, 7.06697205352709, 7.866972053527091, 7.080274848174382, 6.372247363356943], [7.06697205352709, 7.866972053527091, 9.86697205352709, 7.880274848174382, 7.092247363356944], [7.866972053527091, 9.86697205352709, 9.86697205352709, 9.880274848174382, 7.892247363356944], [7.080274848174382, 8.880274848174382, 9.880274848174382, 8.892247363356944, 8.00302262702125]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.712274848174381, 5.4602748481743815, 6.080274848174382, 6.372247363356943, 5.735022627021249], [6.360274848174381, 7.080274848174382, 7.880274848174382, 7.092247363356944, 6.38302262702125], [7.080274848174382, 7.880274848174382, 9.880274848174382, 7.892247363356944, 7.103022627021249], [7.880274848174382, 9.880274848174382, 9.880274848174382, 9.892247363356944, 7.903022627021249], [7.092247363356944, 8.892247363356944, 9.892247363356944, 8.90302262702125, 8.012720364319124]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.724247363356943, 5.472247363356944, 6.092247363356944, 6.38302262702125, 5.744720364319125], [6.372247363356943, 7.092247363356944, 7.892247363356944, 7.103022627021249, 6.392720364319125], [7.092247363356944, 7.892247363356944, 9.892247363356944, 7.903022627021249, 7.112720364319125], [7.892247363356944, 9.892247363356944, 9.892247363356944, 9.90302262702125, 7.912720364319124], [7.103022627021249, 8.90302262702125, 9.90302262702125, 8.912720364319124, 8.021448327887212]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.735022627021249, 5.48302262702125, 6.103022627021249, 6.392720364319125, 5.753448327887212], [6.38302262702125, 7.103022627021249, 7.903022627021249, 7.112720364319125, 6.401448327887212], [7.103022627021249, 7.903022627021249, 9.90302262702125, 7.912720364319124, 7.1214483278872125], [7.903022627021249, 9.90302262702125, 9.90302262702125, 9.912720364319124, 7.921448327887212], [7.112720364319125, 8.912720364319124, 9.912720364319124, 8.921448327887212, 8.02930349509849]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.744720364319125, 5.4927203643191245, 6.112720364319125, 6.401448327887212, 5.761303495098491], [6.392720364319125, 7.112720364319125, 7.912720364319124, 7.1214483278872125, 6.4093034950984915], [7.112720364319125, 7.912720364319124, 9.912720364319124, 7.921448327887212, 7.129303495098491], [7.912720364319124, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.929303495098491], [7.1214483278872125, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.753448327887212, 5.501448327887212, 6.1214483278872125, 6.4093034950984915, 5.768373145588643], [6.401448327887212, 7.1214483278872125, 7.921448327887212, 7.129303495098491, 6.416373145588643], [7.1214483278872125, 7.921448327887212, 9.921448327887212, 7.929303495098491, 7.136373145588642], [7.921448327887212, 9.921448327887212, 9.921448327887212, 9.929303495098491, 7.936373145588643], [7.129303495098491, 8.929303495098491, 9.929303495098491, 8.936373145588643, 8.042735831029779]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.761303495098491, 5.509303495098491, 6.129303495098491, 6.416373145588643, 5.774735831029778], [6.4093034950984915, 7.129303495098491, 7.929303495098491, 7.136373145588642, 6.422735831029779], [7.129303495098491, 7.929303495098491, 9.929303495098491, 7.936373145588643, 7.142735831029779], [7.929303495098491, 9.929303495098491, 9.929303495098491, 9.936373145588643, 7.942735831029779], [7.136373145588642, 8.936373145588643, 9.936373145588643, 8.942735831029779, 8.048462247926802]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.768373145588643, 5.516373145588642, 6.136373145588642, 6.422735831029779, 5.780462247926801], [6.416373145588643, 7.136373145588642, 7.936373145588643, 7.142735831029779, 6.428462247926801], [7.136373145588642, 7.936373145588643, 9.936373145588643, 7.942735831029779, 7.148462247926801], [7.936373145588643, 9.936373145588643, 9.936373145588643, 9.942735831029779, 7.948462247926802], [7.142735831029779, 8.942735831029779, 9.942735831029779, 8.948462247926802, 8.053616023134122]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.774735831029778, 5.522735831029778, 6.142735831029779, 6.428462247926801, 5.785616023134121], [6.422735831029779, 7.142735831029779, 7.942735831029779, 7.148462247926801, 6.433616023134121], [7.142735831029779, 7.942735831029779, 9.942735831029779, 7.948462247926802, 7.153616023134122], [7.942735831029779, 9.942735831029779, 9.942735831029779, 9.948462247926802, 7.953616023134122], [7.148462247926801, 8.948462247926802, 9.948462247926802, 8.953616023134122, 8.05825442082071]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.780462247926801, 5.528462247926801, 6.148462247926801, 6.433616023134121, 5.790254420820709], [6.428462247926801, 7.148462247926801, 7.948462247926802, 7.153616023134122, 6.4382544208207095], [7.148462247926801, 7.948462247926802, 9.948462247926802, 7.953616023134122, 7.15825442082071], [7.948462247926802, 9.948462247926802, 9.948462247926802, 9.953616023134122, 7.95825442082071], [7.153616023134122, 8.953616023134122, 9.953616023134122, 8.95825442082071, 8.06242897873864]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.785616023134121, 5.533616023134122, 6.153616023134122, 6.4382544208207095, 5.7944289787386385], [6.433616023134121, 7.153616023134122, 7.953616023134122, 7.15825442082071, 6.442428978738639], [7.153616023134122, 7.953616023134122, 9.953616023134122, 7.95825442082071, 7.162428978738639], [7.953616023134122, 9.953616023134122, 9.953616023134122, 9.95825442082071, 7.9624289787386395], [7.15825442082071, 8.95825442082071, 9.95825442082071, 8.96242897873864, 8.066186080864776]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.790254420820709, 5.53825442082071, 6.15825442082071, 6.442428978738639, 5.798186080864776], [6.4382544208207095, 7.15825442082071, 7.95825442082071, 7.162428978738639, 6.446186080864775], [7.15825442082071, 7.95825442082071, 9.95825442082071, 7.9624289787386395, 7.166186080864776], [7.95825442082071, 9.95825442082071, 9.95825442082071, 9.96242897873864, 7.966186080864777], [7.162428978738639, 8.96242897873864, 9.96242897873864, 8.966186080864777, 8.0695674727783]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.7944289787386385, 5.54242897873864, 6.162428978738639, 6.446186080864775, 5.801567472778298], [6.442428978738639, 7.162428978738639, 7.9624289787386395, 7.166186080864776, 6.449567472778298], [7.162428978738639, 7.9624289787386395, 9.96242897873864, 7.966186080864777, 7.169567472778299], [7.9624289787386395, 9.96242897873864, 9.96242897873864, 9.966186080864777, 7.9695674727783], [7.166186080864776, 8.966186080864777, 9.966186080864777, 8.9695674727783, 8.07261072550047]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.798186080864776, 5.546186080864775, 6.166186080864776, 6.449567472778298, 5.804610725500469], [6.446186080864775, 7.166186080864776, 7.966186080864777, 7.169567472778299, 6.452610725500469], [7.166186080864776, 7.966186080864777, 9.966186080864777, 7.9695674727783, 7.17261072550047], [7.966186080864777, 9.966186080864777, 9.966186080864777, 9.9695674727783, 7.97261072550047], [7.169567472778299, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.801567472778298, 5.549567472778299, 6.169567472778299, 6.452610725500469, 5.807349652950423], [6.449567472778298, 7.169567472778299, 7.9695674727783, 7.17261072550047, 6.4553496529504235], [7.169567472778299, 7.9695674727783, 9.9695674727783, 7.97261072550047, 7.175349652950423], [7.9695674727783, 9.9695674727783, 9.9695674727783, 9.97261072550047, 7.975349652950424], [7.17261072550047, 8.97261072550047, 9.97261072550047, 8.975349652950424, 8.077814687655382]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.804610725500469, 5.552610725500469, 6.17261072550047, 6.4553496529504235, 5.809814687655381], [6.452610725500469, 7.17261072550047, 7.97261072550047, 7.175349652950423, 6.4578146876553815], [7.17261072550047, 7.97261072550047, 9.97261072550047, 7.975349652950424, 7.177814687655382], [7.97261072550047, 9.97261072550047, 9.97261072550047, 9.975349652950424, 7.977814687655382], [7.175349652950423, 8.975349652950424, 9.975349652950424, 8.977814687655382, 8.080033218889843]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.807349652950423, 5.555349652950423, 6.175349652950423, 6.4578146876553815, 5.812033218889844], [6.4553496529504235, 7.175349652950423, 7.975349652950424, 7.177814687655382, 6.460033218889844], [7.175349652950423, 7.975349652950424, 9.975349652950424, 7.977814687655382, 7.180033218889844], [7.975349652950424, 9.975349652950424, 9.975349652950424, 9.977814687655382, 7.980033218889844], [7.177814687655382, 8.977814687655382, 9.977814687655382, 8.980033218889844, 8.08202989700086]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.809814687655381, 5.557814687655381, 6.177814687655382, 6.460033218889844, 5.81402989700086], [6.4578146876553815, 7.177814687655382, 7.977814687655382, 7.180033218889844, 6.46202989700086], [7.177814687655382, 7.977814687655382, 9.977814687655382, 7.980033218889844, 7.182029897000859], [7.977814687655382, 9.977814687655382, 9.977814687655382, 9.980033218889844, 7.98202989700086], [7.180033218889844, 8.980033218889844, 9.980033218889844, 8.98202989700086, 8.083826907300775]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.812033218889844, 5.560033218889844, 6.180033218889844, 6.46202989700086, 5.815826907300774], [6.460033218889844, 7.180033218889844, 7.980033218889844, 7.182029897000859, 6.463826907300773], [7.180033218889844, 7.980033218889844, 9.980033218889844, 7.98202989700086, 7.183826907300774], [7.980033218889844, 9.980033218889844, 9.980033218889844, 9.98202989700086, 7.983826907300774], [7.182029897000859, 8.98202989700086, 9.98202989700086, 8.983826907300774, 8.085444216570696]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.81402989700086, 5.562029897000859, 6.182029897000859, 6.463826907300773, 5.817444216570696], [6.46202989700086, 7.182029897000859, 7.98202989700086, 7.183826907300774, 6.465444216570696], [7.182029897000859, 7.98202989700086, 9.98202989700086, 7.983826907300774, 7.185444216570697], [7.98202989700086, 9.98202989700086, 9.98202989700086, 9.983826907300774, 7.985444216570697], [7.183826907300774, 8.983826907300774, 9.983826907300774, 8.985444216570697, 8.086899794913627]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.815826907300774, 5.563826907300774, 6.183826907300774, 6.465444216570696, 5.8188997949136265], [6.463826907300773, 7.183826907300774, 7.983826907300774, 7.185444216570697, 6.466899794913627], [7.183826907300774, 7.983826907300774, 9.983826907300774, 7.985444216570697, 7.186899794913627], [7.983826907300774, 9.983826907300774, 9.983826907300774, 9.985444216570697, 7.986899794913628], [7.185444216570697, 8.985444216570697, 9.985444216570697, 8.986899794913628, 8.088209815422266]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.817444216570696, 5.565444216570697, 6.185444216570697, 6.466899794913627, 5.820209815422264], [6.465444216570696, 7.185444216570697, 7.985444216570697, 7.186899794913627, 6.468209815422265], [7.185444216570697, 7.985444216570697, 9.985444216570697, 7.986899794913628, 7.188209815422265], [7.985444216570697, 9.985444216570697, 9.985444216570697, 9.986899794913628, 7.988209815422264], [7.186899794913627, 8.986899794913628, 9.986899794913628, 8.988209815422264, 8.089388833880038]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8188997949136265, 5.566899794913628, 6.186899794913627, 6.468209815422265, 5.821388833880039], [6.466899794913627, 7.186899794913627, 7.986899794913628, 7.188209815422265, 6.469388833880039], [7.186899794913627, 7.986899794913628, 9.986899794913628, 7.988209815422264, 7.189388833880038], [7.986899794913628, 9.986899794913628, 9.986899794913628, 9.988209815422264, 7.989388833880039], [7.188209815422265, 8.988209815422264, 9.988209815422264, 8.989388833880039, 8.090449950492035]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.820209815422264, 5.568209815422264, 6.188209815422265, 6.469388833880039, 5.822449950492035], [6.468209815422265, 7.188209815422265, 7.988209815422264, 7.189388833880038, 6.470449950492035], [7.188209815422265, 7.988209815422264, 9.988209815422264, 7.989388833880039, 7.190449950492035], [7.988209815422264, 9.988209815422264, 9.988209815422264, 9.989388833880039, 7.990449950492035], [7.189388833880038, 8.989388833880039, 9.989388833880039, 8.990449950492035, 8.091404955442831]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.821388833880039, 5.569388833880039, 6.189388833880038, 6.470449950492035, 5.8234049554428315], [6.469388833880039, 7.189388833880038, 7.989388833880039, 7.190449950492035, 6.471404955442832], [7.189388833880038, 7.989388833880039, 9.989388833880039, 7.990449950492035, 7.191404955442832], [7.989388833880039, 9.989388833880039, 9.989388833880039, 9.990449950492035, 7.991404955442832], [7.190449950492035, 8.990449950492035, 9.990449950492035, 8.991404955442832, 8.09226445989855]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.822449950492035, 5.570449950492034, 6.190449950492035, 6.471404955442832, 5.824264459898549], [6.470449950492035, 7.190449950492035, 7.990449950492035, 7.191404955442832, 6.472264459898549], [7.190449950492035, 7.990449950492035, 9.990449950492035, 7.991404955442832, 7.192264459898548], [7.990449950492035, 9.990449950492035, 9.990449950492035, 9.991404955442832, 7.992264459898548], [7.191404955442832, 8.991404955442832, 9.991404955442832, 8.992264459898548, 8.093038013908693]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8234049554428315, 5.571404955442832, 6.191404955442832, 6.472264459898549, 5.825038013908694], [6.471404955442832, 7.191404955442832, 7.991404955442832, 7.192264459898548, 6.473038013908694], [7.191404955442832, 7.991404955442832, 9.991404955442832, 7.992264459898548, 7.193038013908693], [7.991404955442832, 9.991404955442832, 9.991404955442832, 9.992264459898548, 7.993038013908693], [7.192264459898548, 8.992264459898548, 9.992264459898548, 8.993038013908693, 8.093734212517823]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.824264459898549, 5.572264459898549, 6.192264459898548, 6.473038013908694, 5.825734212517824], [6.472264459898549, 7.192264459898548, 7.992264459898548, 7.193038013908693, 6.473734212517824], [7.192264459898548, 7.992264459898548, 9.992264459898548, 7.993038013908693, 7.193734212517824], [7.992264459898548, 9.992264459898548, 9.992264459898548, 9.993038013908693, 7.993734212517824], [7.193038013908693, 8.993038013908693, 9.993038013908693, 8.993734212517824, 8.094360791266041]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.825038013908694, 5.573038013908693, 6.193038013908693, 6.473734212517824, 5.826360791266042], [6.473038013908694, 7.193038013908693, 7.993038013908693, 7.193734212517824, 6.474360791266042], [7.193038013908693, 7.993038013908693, 9.993038013908693, 7.993734212517824, 7.194360791266042], [7.993038013908693, 9.993038013908693, 9.993038013908693, 9.993734212517824, 7.9943607912660415], [7.193734212517824, 8.993734212517824, 9.993734212517824, 8.994360791266041, 8.094924712139438]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.825734212517824, 5.573734212517824, 6.193734212517824, 6.474360791266042, 5.826924712139438], [6.473734212517824, 7.193734212517824, 7.993734212517824, 7.194360791266042, 6.474924712139438], [7.193734212517824, 7.993734212517824, 9.993734212517824, 7.9943607912660415, 7.1949247121394375], [7.993734212517824, 9.993734212517824, 9.993734212517824, 9.994360791266041, 7.994924712139438], [7.194360791266042, 8.994360791266041, 9.994360791266041, 8.994924712139438, 8.095432240925495]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.826360791266042, 5.574360791266042, 6.194360791266042, 6.474924712139438, 5.827432240925494], [6.474360791266042, 7.194360791266042, 7.9943607912660415, 7.1949247121394375, 6.475432240925494], [7.194360791266042, 7.9943607912660415, 9.994360791266041, 7.994924712139438, 7.195432240925495], [7.9943607912660415, 9.994360791266041, 9.994360791266041, 9.994924712139438, 7.995432240925494], [7.1949247121394375, 8.994924712139438, 9.994924712139438, 8.995432240925494, 8.095889016832945]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.826924712139438, 5.574924712139437, 6.1949247121394375, 6.475432240925494, 5.827889016832945], [6.474924712139438, 7.1949247121394375, 7.994924712139438, 7.195432240925495, 6.475889016832945], [7.1949247121394375, 7.994924712139438, 9.994924712139438, 7.995432240925494, 7.195889016832945], [7.994924712139438, 9.994924712139438, 9.994924712139438, 9.995432240925494, 7.995889016832944], [7.195432240925495, 8.995432240925494, 9.995432240925494, 8.995889016832944, 8.09630011514965]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.827432240925494, 5.575432240925494, 6.195432240925495, 6.475889016832945, 5.828300115149651], [6.475432240925494, 7.195432240925495, 7.995432240925494, 7.195889016832945, 6.476300115149651], [7.195432240925495, 7.995432240925494, 9.995432240925494, 7.995889016832944, 7.19630011514965], [7.995432240925494, 9.995432240925494, 9.995432240925494, 9.995889016832944, 7.99630011514965], [7.195889016832945, 8.995889016832944, 9.995889016832944, 8.99630011514965, 8.096670103634684]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.827889016832945, 5.575889016832946, 6.195889016832945, 6.476300115149651, 5.8286701036346855], [6.475889016832945, 7.195889016832945, 7.995889016832944, 7.19630011514965, 6.476670103634685], [7.195889016832945, 7.995889016832944, 9.995889016832944, 7.99630011514965, 7.196670103634685], [7.995889016832944, 9.995889016832944, 9.995889016832944, 9.99630011514965, 7.996670103634685], [7.19630011514965, 8.99630011514965, 9.99630011514965, 8.996670103634685, 8.097003093271217]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.828300115149651, 5.5763001151496505, 6.19630011514965, 6.476670103634685, 5.829003093271217], [6.476300115149651, 7.19630011514965, 7.99630011514965, 7.196670103634685, 6.477003093271216], [7.19630011514965, 7.99630011514965, 9.99630011514965, 7.996670103634685, 7.197003093271216], [7.99630011514965, 9.99630011514965, 9.99630011514965, 9.996670103634685, 7.997003093271216], [7.196670103634685, 8.996670103634685, 9.996670103634685, 8.997003093271216, 8.097302783944095]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8286701036346855, 5.576670103634685, 6.196670103634685, 6.477003093271216, 5.829302783944095], [6.476670103634685, 7.196670103634685, 7.996670103634685, 7.197003093271216, 6.477302783944094], [7.196670103634685, 7.996670103634685, 9.996670103634685, 7.997003093271216, 7.197302783944094], [7.996670103634685, 9.996670103634685, 9.996670103634685, 9.997003093271216, 7.997302783944095], [7.197003093271216, 8.997003093271216, 9.997003093271216, 8.997302783944095, 8.097572505549685]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829003093271217, 5.577003093271217, 6.197003093271216, 6.477302783944094, 5.829572505549685], [6.477003093271216, 7.197003093271216, 7.997003093271216, 7.197302783944094, 6.477572505549685], [7.197003093271216, 7.997003093271216, 9.997003093271216, 7.997302783944095, 7.197572505549686], [7.997003093271216, 9.997003093271216, 9.997003093271216, 9.997302783944095, 7.997572505549686], [7.197302783944094, 8.997302783944095, 9.997302783944095, 8.997572505549686, 8.097815254994718]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829302783944095, 5.577302783944095, 6.197302783944094, 6.477572505549685, 5.829815254994717], [6.477302783944094, 7.197302783944094, 7.997302783944095, 7.197572505549686, 6.477815254994717], [7.197302783944094, 7.997302783944095, 9.997302783944095, 7.997572505549686, 7.197815254994717], [7.997302783944095, 9.997302783944095, 9.997302783944095, 9.997572505549686, 7.997815254994718], [7.197572505549686, 8.997572505549686, 9.997572505549686, 8.997815254994718, 8.098033729495246]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829572505549685, 5.577572505549685, 6.197572505549686, 6.477815254994717, 5.830033729495246], [6.477572505549685, 7.197572505549686, 7.997572505549686, 7.197815254994717, 6.4780337294952455], [7.197572505549686, 7.997572505549686, 9.997572505549686, 7.997815254994718, 7.198033729495246], [7.997572505549686, 9.997572505549686, 9.997572505549686, 9.997815254994718, 7.998033729495246], [7.197815254994717, 8.997815254994718, 9.997815254994718, 8.998033729495246, 8.098230356545722]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.829815254994717, 5.577815254994717, 6.197815254994717, 6.4780337294952455, 5.830230356545721], [6.477815254994717, 7.197815254994717, 7.997815254994718, 7.198033729495246, 6.478230356545722], [7.197815254994717, 7.997815254994718, 9.997815254994718, 7.998033729495246, 7.1982303565457215], [7.997815254994718, 9.997815254994718, 9.997815254994718, 9.998033729495246, 7.998230356545722], [7.198033729495246, 8.998033729495246, 9.998033729495246, 8.998230356545722, 8.09840732089115]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830033729495246, 5.578033729495246, 6.198033729495246, 6.478230356545722, 5.830407320891149], [6.4780337294952455, 7.198033729495246, 7.998033729495246, 7.1982303565457215, 6.47840732089115], [7.198033729495246, 7.998033729495246, 9.998033729495246, 7.998230356545722, 7.1984073208911505], [7.998033729495246, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.99840732089115], [7.1982303565457215, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830230356545721, 5.578230356545721, 6.1982303565457215, 6.47840732089115, 5.830566588802035], [6.478230356545722, 7.1982303565457215, 7.998230356545722, 7.1984073208911505, 6.478566588802035], [7.1982303565457215, 7.998230356545722, 9.998230356545722, 7.99840732089115, 7.198566588802035], [7.998230356545722, 9.998230356545722, 9.998230356545722, 9.99840732089115, 7.998566588802035], [7.1984073208911505, 8.99840732089115, 9.99840732089115, 8.998566588802035, 8.098709929921831]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830407320891149, 5.5784073208911495, 6.1984073208911505, 6.478566588802035, 5.830709929921832], [6.47840732089115, 7.1984073208911505, 7.99840732089115, 7.198566588802035, 6.478709929921831], [7.1984073208911505, 7.99840732089115, 9.99840732089115, 7.998566588802035, 7.198709929921832], [7.99840732089115, 9.99840732089115, 9.99840732089115, 9.998566588802035, 7.998709929921832], [7.198566588802035, 8.998566588802035, 9.998566588802035, 8.998709929921832, 8.09883893692965]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830566588802035, 5.578566588802036, 6.198566588802035, 6.478709929921831, 5.8308389369296485], [6.478566588802035, 7.198566588802035, 7.998566588802035, 7.198709929921832, 6.478838936929649], [7.198566588802035, 7.998566588802035, 9.998566588802035, 7.998709929921832, 7.198838936929649], [7.998566588802035, 9.998566588802035, 9.998566588802035, 9.998709929921832, 7.9988389369296495], [7.198709929921832, 8.998709929921832, 9.998709929921832, 8.99883893692965, 8.098955043236685]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830709929921832, 5.578709929921832, 6.198709929921832, 6.478838936929649, 5.830955043236684], [6.478709929921831, 7.198709929921832, 7.998709929921832, 7.198838936929649, 6.4789550432366845], [7.198709929921832, 7.998709929921832, 9.998709929921832, 7.9988389369296495, 7.198955043236685], [7.998709929921832, 9.998709929921832, 9.998709929921832, 9.99883893692965, 7.998955043236684], [7.198838936929649, 8.99883893692965, 9.99883893692965, 8.998955043236684, 8.099059538913016]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8308389369296485, 5.578838936929649, 6.198838936929649, 6.4789550432366845, 5.831059538913016], [6.478838936929649, 7.198838936929649, 7.9988389369296495, 7.198955043236685, 6.479059538913017], [7.198838936929649, 7.9988389369296495, 9.99883893692965, 7.998955043236684, 7.199059538913016], [7.9988389369296495, 9.99883893692965, 9.99883893692965, 9.998955043236684, 7.999059538913016], [7.198955043236685, 8.998955043236684, 9.998955043236684, 8.999059538913016, 8.099153585021716]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.830955043236684, 5.578955043236684, 6.198955043236685, 6.479059538913017, 5.831153585021715], [6.4789550432366845, 7.198955043236685, 7.998955043236684, 7.199059538913016, 6.479153585021714], [7.198955043236685, 7.998955043236684, 9.998955043236684, 7.999059538913016, 7.1991535850217145], [7.998955043236684, 9.998955043236684, 9.998955043236684, 9.999059538913016, 7.999153585021714], [7.199059538913016, 8.999059538913016, 9.999059538913016, 8.999153585021714, 8.099238226519542]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831059538913016, 5.579059538913016, 6.199059538913016, 6.479153585021714, 5.831238226519543], [6.479059538913017, 7.199059538913016, 7.999059538913016, 7.1991535850217145, 6.479238226519543], [7.199059538913016, 7.999059538913016, 9.999059538913016, 7.999153585021714, 7.199238226519543], [7.999059538913016, 9.999059538913016, 9.999059538913016, 9.999153585021714, 7.999238226519543], [7.1991535850217145, 8.999153585021714, 9.999153585021714, 8.999238226519543, 8.099314403867588]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831153585021715, 5.579153585021714, 6.1991535850217145, 6.479238226519543, 5.831314403867589], [6.479153585021714, 7.1991535850217145, 7.999153585021714, 7.199238226519543, 6.479314403867589], [7.1991535850217145, 7.999153585021714, 9.999153585021714, 7.999238226519543, 7.1993144038675885], [7.999153585021714, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.999314403867588], [7.199238226519543, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [8.999999920397968, 8.099999911553297, 7.289999911553298, 6.5609999115532975, 5.904899911553298, 5.314409911553298, 4.782968911553298, 4.304672011553297, 3.8742048015532977, 3.4867843125532976, 3.1381058724532984, 2.8242952763632982, 2.5418657398822977, 2.287679157049398, 2.058911232499788, 1.8530201004051392, 1.667718081519955, 1.5009462645232894, 1.3508516292262893, 1.2157664574589901, 1.0941898028684207, 0.9847708137369091, 0.8862937235185475, 0.7976643423220233, 0.7178978992451501, 0.6461081004759643, 0.5814972815836974, 0.5233475445806572, 0.47101278127792234, 0.42391149430546005, 0.3815203360302428, 0.3433682935825475, 0.30903145537962295, 0.2781283009969906, 0.2503154620526207, 0.2252839070026873, 0.2027555074577485, 0.18247994786730448, 0.1642319442359037, 0.14780874096764318, 0.13302785802620853, 0.11972506337891708, 0.1077525481963546, 0.09697728453204846, 0.08727954723417408, 0.07855158366608617, 0.0706964164548074, 0.06362676596465633, 0.05726408052352028, 0.051537663626497476, 0.046383888419176955, 0.041745490732588486, 0.03757093281465895, 0.033813830688523616, 0.03043243877499968, 0.027389186052829473, 0.024650258602875397, 0.02218522389791744, 0.019966692663454744, 0.017970014552439295, 0.01617300425252477, 0.014555694982601786, 0.013100116639670922, 0.011790096131034211, 0.01061107767325975, 0.009549961061264156, 0.00859495611046679, 0.007735451654749426, 0.006961897644605308, 0.006265699035474803, 0.0056391202872569934, 0.005075199413861142, 0.00456767062780461, 0.004110894720353642, 0.003699796403648037, 0.003329807918613703, 0.002996818282081648, 0.002697127609203598, 0.0024274060036137968, 0.002184656558581466, 0.0019661820580525458, 0.0017695550075771393, 0.0015925906621490071, 0.0014333227512626223, 0.0012899816314666523, 0.0011609746236498353, 0.0010448683166144335, 0.0009403726402821277, 0.0008463265315841184]}, "pi": {"frames": [{"V": [[-9.999153585021714, -9.999153585021714, -9.999238226519543, 0.0, -9.999153585021714], [-9.999153585021714, -9.999153585021714, -9.999238226519543, 0.0, 0.0], [-9.999153585021714, 0.0, 0.7880197760475172, -0.29078220155723455, -9.999153585021714], [0.0, 0.0, -0.23553358326136004, 0.7880197750647759, -8.999238226519543], [0.0, -9.999153585021714, -0.26170398140151113, -0.2907822024417016, -0.26170398219753144]], "policy": [[1, 2, 3, 1, 1], [0, 1, 3, 0, 2], [1, 4, 1, 0, 0], [1, 3, 4, 2, 1], [0, 2, 0, 2, 4]]}, {"V": [[-7.959529741666413e-08, -7.163576767499772e-08, 0.0, 0.0, 0.0], [-7.163576767499772e-08, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999133649106438, 0.0, 0.0], [0.0, 9.999133649106438, 9.999133649106438, 9.999220284195795, -2.215101704094513e-05], [0.0, 0.0, 9.999220284195795, 8.999298255776216, -2.215101704094513e-05]], "policy": [[1, 3, 3, 1, 1], [1, 1, 1, 0, 0], [1, 1, 1, 1, 0], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831488428460863, 0.0, 0.0, 0.0, 0.0], [6.479488428460861, 7.199488428460862, 7.999488428460863, 0.0, 0.0], [7.199488428460862, 7.999488428460863, 9.999488428460863, 7.999539585614777, 0.0], [7.999488428460863, 9.999488428460863, 9.999488428460863, 9.999539585614777, 7.9995856270533], [7.199539585614777, 8.999539585614777, 9.999539585614777, 8.9995856270533, 8.09962706434797]], "policy": [[1, 1, 1, 1, 1], [1, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.83162706434797, 5.479627064347969, 6.19962706434797, 6.479664357913173, 0.0], [6.479627064347969, 7.19962706434797, 7.999627064347971, 7.199664357913174, 0.0], [7.19962706434797, 7.999627064347971, 9.99962706434797, 7.999664357913174, 7.199697922121857], [7.999627064347971, 9.99962706434797, 9.99962706434797, 9.999664357913174, 7.999697922121857], [7.199664357913174, 8.999664357913174, 9.999664357913174, 8.999697922121857, 8.099728129909671]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831697922121856, 5.579697922121857, 6.199697922121857, 6.479728129909671, 5.831755316918704], [6.479697922121857, 7.199697922121857, 7.999697922121857, 7.199728129909672, 6.4797553169187045], [7.199697922121857, 7.999697922121857, 9.999697922121857, 7.999728129909672, 7.199755316918704], [7.999697922121857, 9.999697922121857, 9.999697922121857, 9.999728129909672, 7.999755316918705], [7.199728129909672, 8.999728129909672, 9.999728129909672, 8.999755316918705, 8.099779785226835]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8317281299096715, 5.579728129909671, 6.199728129909672, 6.4797553169187045, 5.831779785226834], [6.479728129909671, 7.199728129909672, 7.999728129909672, 7.199755316918704, 6.479779785226834], [7.199728129909672, 7.999728129909672, 9.999728129909672, 7.999755316918705, 7.199779785226835], [7.999728129909672, 9.999728129909672, 9.999728129909672, 9.999755316918705, 7.999779785226835], [7.199755316918704, 8.999755316918705, 9.999755316918705, 8.999779785226835, 8.099801806704152]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [18.999153505419685, 8.999999920397968, 7.199999928358172, 6.479999928358171, 0.00030198943144199575, 0.00027178164362773316]}, "tpi": {"3": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, -2.71], [-1.0, 0.0, -0.91, 0.0, -2.439], [0.0, -0.91, 0.09999999999999998, 0.0, 0.0], [0.0, -0.8190000000000001, -1.0, 0.0, 0.0], [0.0, 0.0, 0.09999999999999998, -1.71, -2.71]], "policy": [[3, 2, 2, 1, 2], [0, 0, 0, 0, 1], [1, 2, 1, 0, 1], [0, 3, 4, 2, 0], [0, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.981, 0.0, 0.0], [0.0, 1.981, 1.981, 2.7829, 0.0], [0.0, 1.7829000000000002, 2.7829, 2.50461, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 0, 0], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.154149, 0.0, 0.0], [0.0, 2.154149, 4.154149, 2.7387341000000003, 0.0], [2.154149, 4.154149, 4.154149, 4.7387341, 3.264860690000001], [1.8387341, 3.7387341000000003, 4.7387341, 4.264860690000001, 3.8383746210000007]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 1.9383746210000008, 2.644537158900001, 0.0], [0.0, 2.938374621000001, 3.738374621000001, 3.364537158900001, 0.0], [2.938374621000001, 3.738374621000001, 5.738374621000001, 4.164537158900001, 3.4542750987090014], [3.738374621000001, 5.738374621000001, 5.738374621000001, 6.164537158900001, 4.183275098709001], [3.2645371589000014, 5.164537158900001, 6.164537158900001, 5.548083443010001, 4.9932750987090015]], "policy": [[1, 3, 3, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[2.7252750987090013, 2.4527475888381014, 3.035947588838101, 3.6839475888381013, 3.3155528299542913], [3.373275098709001, 4.093275098709001, 4.893275098709001, 4.4039475888381014, 3.9635528299542915], [4.093275098709001, 4.893275098709001, 6.893275098709001, 5.203947588838101, 4.683552829954292], [4.893275098709001, 6.893275098709001, 6.893275098709001, 7.203947588838101, 5.4835528299542915], [4.303947588838101, 6.203947588838101, 7.203947588838101, 6.4835528299542915, 5.835197546958862]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.5671975469588624, 3.3151975469588626, 3.9351975469588627, 4.441677792262976, 3.997510013036679], [4.215197546958863, 4.935197546958863, 5.7351975469588625, 5.161677792262976, 4.645510013036679], [4.935197546958863, 5.7351975469588625, 7.7351975469588625, 5.961677792262976, 5.365510013036679], [5.7351975469588625, 7.7351975469588625, 7.7351975469588625, 7.961677792262976, 6.165510013036679], [5.0616777922629765, 6.961677792262976, 7.961677792262976, 7.165510013036679, 6.448959011733011]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}], "errors": [10.999999911553298, 8.099999935522355, 7.199999928358172, 6.479999928358171, 3.1640523227151967, 2.264802364594436], "backups": 600}, "9": {"frames": [{"V": [[-5.12579511, -3.422894039100001, -4.1518940391, -4.961894039100001, -4.465704635190001], [-6.12579511, -6.12579511, -6.12579511, -5.861894039100001, -6.12579511], [0.0, 0.0, -6.5132155990000005, -6.861894039100001, 0.0], [-1.0, 0.0, 0.0, -5.12579511, 0.0], [-6.12579511, -6.12579511, 0.0, -6.12579511, -5.5132155990000005]], "policy": [[3, 4, 2, 2, 4], [1, 1, 0, 0, 1], [3, 2, 1, 3, 1], [0, 3, 4, 2, 0], [0, 3, 0, 2, 0]]}, {"V": [[-1.3260992824233078, -1.3260992824233078, -1.193489354180977, -1.0741404187628794, -1.730105473494877], [0.0, 0.0, -1.0741404187628794, -0.9667263768865915, 0.0], [0.0, 0.0, 6.12579511, 0.0, 0.0], [0.0, 6.12579511, 6.12579511, 6.5132155990000005, 0.0], [0.0, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 0.0]], "policy": [[1, 1, 3, 1, 1], [1, 1, 1, 1, 1], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 3.9790536470300095, 4.481148282327009, 5.12914828232701, 0.0], [0.0, 5.69905364703001, 6.499053647030011, 5.84914828232701, 0.0], [0.0, 6.499053647030011, 8.49905364703001, 6.649148282327009, 0.0], [6.499053647030011, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.7842334540943074], [5.74914828232701, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[3, 1, 1, 1, 2], [3, 1, 1, 1, 2], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[4.3505026299696015, 4.898502629969601, 5.618502629969601, 5.956652366972642, 5.360987130275378], [4.898502629969601, 6.618502629969601, 7.4185026299696, 6.6766523669726405, 6.008987130275377], [6.618502629969601, 7.4185026299696, 9.4185026299696, 7.47665236697264, 6.728987130275376], [7.4185026299696, 9.4185026299696, 9.4185026299696, 9.47665236697264, 7.528987130275377], [6.57665236697264, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.60671600455061, 5.354716004550611, 5.974716004550611, 6.27724440409555, 5.649519963685996], [6.254716004550611, 6.974716004550611, 7.77471600455061, 6.997244404095549, 6.297519963685994], [6.974716004550611, 7.77471600455061, 9.77471600455061, 7.797244404095549, 7.017519963685994], [7.77471600455061, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.817519963685994], [6.997244404095549, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [16.513215510553298, 9.074140330316176, 7.199999928358172, 1.5814972815836974, 0.2252839070026873], "backups": 1250}, "27": {"frames": [{"V": [[0.0, 0.0, -8.4185026299696, -9.4185026299696, 0.0], [0.0, -9.4185026299696, -7.57665236697264, 6.6766523669726405, 6.008987130275377], [-9.4185026299696, -9.47665236697264, 9.4185026299696, 7.47665236697264, 0.0], [-8.4185026299696, -8.528987130275377, 9.4185026299696, -8.4185026299696, -8.57665236697264], [-9.4185026299696, -8.67608841724784, -8.4185026299696, -9.4185026299696, -8.47665236697264]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 1, 2], [0, 3, 1, 2, 2], [4, 3, 4, 2, 0], [0, 3, 0, 2, 4]]}, {"V": [[0.0, 0.0, 0.0, 6.449567472778298, 5.804610725500469], [0.0, 0.0, 7.966186080864777, 7.169567472778299, 6.452610725500469], [0.0, 7.966186080864777, 9.966186080864777, 7.9695674727783, 7.17261072550047], [-0.4895337138921334, 9.966186080864777, 9.966186080864777, 9.9695674727783, 6.4553496529504235], [-0.44058034250292005, 8.9695674727783, 9.9695674727783, 8.97261072550047, -0.49291510580565634]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 1], [3, 1, 1, 1, 2], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 6.198033729495246, 6.478230356545722, 5.830407320891149], [0.0, 7.198033729495246, 7.998033729495246, 7.1982303565457215, 6.47840732089115], [7.198033729495246, 7.998033729495246, 9.998033729495246, 7.998230356545722, 7.1984073208911505], [7.998033729495246, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.99840732089115], [7.098230356545722, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831153585021715, 5.579153585021714, 6.1991535850217145, 6.479238226519543, 5.831314403867589], [6.479153585021714, 7.1991535850217145, 7.999153585021714, 7.199238226519543, 6.479314403867589], [7.1991535850217145, 7.999153585021714, 9.999153585021714, 7.999238226519543, 7.1993144038675885], [7.999153585021714, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.999314403867588], [7.199238226519543, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [18.528987041828675, 8.59291504132801, 6.479999911553298, 0.0008463265315841184], "backups": 2325}, "81": {"frames": [{"V": [[-8.998033729495246, -9.998033729495246, 0.0, 0.0, -9.998033729495246], [-9.998033729495246, -9.998033729495246, -9.998033729495246, 0.0, -8.998230356545722], [0.0, 0.0, -9.998230356545722, 0.0, -9.998033729495246], [0.0, 0.0, -8.098033729495246, -8.998033729495246, -9.998033729495246], [0.0, -1.0, -8.998033729495246, -9.998033729495246, -9.998033729495246]], "policy": [[4, 3, 3, 1, 2], [1, 1, 0, 0, 2], [1, 2, 2, 0, 2], [0, 0, 2, 0, 0], [0, 2, 2, 2, 0]]}, {"V": [[-0.0017692568323101926, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, -1.0, 0.0, 0.0], [0.0, 0.0, -1.0, -0.9, 0.0]], "policy": [[1, 3, 2, 1, 1], [1, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 3, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.997837102444771, 0.0, 0.0], [0.0, 9.997837102444771, 9.997837102444771, 9.998053392200294, 0.0], [0.0, 0.0, 9.998053392200294, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 0, 0], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [0, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 7.999162049171497, 0.0, 0.0], [0.0, 7.999162049171497, 9.999162049171497, 7.999245844254348, 0.0], [7.999162049171497, 9.999162049171497, 9.999162049171497, 9.999245844254348, 7.999321259828914], [7.199245844254348, 8.999245844254348, 9.999245844254348, 8.999321259828914, 7.199389133846023]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 6.199389133846023, 6.479450220461421, 0.0], [0.0, 7.199389133846023, 7.999389133846023, 7.199450220461421, 0.0], [7.199389133846023, 7.999389133846023, 9.999389133846023, 7.999450220461421, 7.199505198415279], [7.999389133846023, 9.999389133846023, 9.999389133846023, 9.999450220461421, 7.99950519841528], [7.199450220461421, 8.999450220461421, 9.999450220461421, 8.99950519841528, 8.099554678573751]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8315546785737515, 5.579554678573752, 6.199554678573752, 6.479599210716377, 5.831639289644739], [6.479554678573751, 7.199554678573752, 7.999554678573752, 7.199599210716377, 6.479639289644739], [7.199554678573752, 7.999554678573752, 9.999554678573752, 7.999599210716378, 7.19963928964474], [7.999554678573752, 9.999554678573752, 9.999554678573752, 9.999599210716378, 7.99963928964474], [7.199599210716377, 8.999599210716378, 9.999599210716378, 8.99963928964474, 8.099675360680267]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.8315992107163765, 5.579599210716377, 6.199599210716377, 6.479639289644739, 5.831675360680265], [6.479599210716377, 7.199599210716377, 7.999599210716378, 7.19963928964474, 6.4796753606802655], [7.199599210716377, 7.999599210716378, 9.999599210716378, 7.99963928964474, 7.199675360680266], [7.999599210716378, 9.999599210716378, 9.999599210716378, 9.99963928964474, 7.999675360680266], [7.19963928964474, 8.99963928964474, 9.99963928964474, 8.999675360680266, 8.09970782461224]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [19.99823026809902, 10.999999920397968, 8.999999928358172, 7.199999928358172, 6.479999928358171, 0.00044523297954679464, 0.0004007008369217857], "backups": 6650}, "adaptive": {"frames": [{"V": [[0.0, 0.0, -1.0, -0.9, -1.0], [0.0, 0.0, 0.0, -1.0, 0.0], [0.0, -1.0, -0.9, 0.0, -1.0], [0.0, 1.0, -1.81, 0.0, 0.0], [-1.0, -1.0, -0.629, -0.5661, -1.0]], "policy": [[1, 2, 2, 4, 1], [0, 0, 0, 1, 4], [0, 2, 3, 4, 0], [0, 2, 2, 0, 4], [0, 0, 3, 4, 0]]}, {"V": [[0.0, 0.0, 0.0, -0.7290000000000001, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, -1.0, 0.0, 0.0], [0.0, -1.0, -0.4585410000000001, -0.4585410000000001, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 1, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 3, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 5.738374621000001, 0.0, 0.0], [0.0, 5.738374621000001, 5.738374621000001, 6.164537158900001, 0.0], [0.0, 0.0, 6.164537158900001, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 1, 0, 0], [0, 1, 1, 1, 0], [3, 3, 4, 2, 2], [0, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 4.548083443010001, 0.0, 0.0], [0.0, 4.548083443010001, 6.548083443010001, 4.893275098709001, 0.0], [4.548083443010001, 6.548083443010001, 6.548083443010001, 6.893275098709001, 5.203947588838101], [4.093275098709001, 5.893275098709001, 6.893275098709001, 6.203947588838101, 4.683552829954292]], "policy": [[1, 2, 1, 1, 1], [0, 1, 1, 1, 0], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 3.6835528299542917, 4.215197546958863, 0.0], [0.0, 4.683552829954292, 5.4835528299542915, 4.935197546958863, 0.0], [4.683552829954292, 5.4835528299542915, 7.4835528299542915, 5.7351975469588625, 5.161677792262976], [5.4835528299542915, 7.4835528299542915, 7.4835528299542915, 7.7351975469588625, 5.961677792262976], [4.835197546958862, 6.7351975469588625, 7.7351975469588625, 6.961677792262976, 6.265510013036678]], "policy": [[1, 3, 1, 1, 2], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[3.997510013036679, 3.7455100130366787, 4.365510013036679, 4.828959011733011, 4.34606311055971], [4.645510013036679, 5.365510013036679, 6.165510013036679, 5.548959011733011, 4.99406311055971], [5.365510013036679, 6.165510013036679, 8.165510013036679, 6.348959011733011, 5.71406311055971], [6.165510013036679, 8.165510013036679, 8.165510013036679, 8.348959011733012, 6.514063110559711], [5.448959011733011, 7.348959011733011, 8.348959011733012, 7.514063110559711, 6.76265679950374]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [3, 3, 0, 2, 2]]}, {"V": [[5.769009414132756, 5.517009414132756, 6.1370094141327565, 6.423308472719481, 5.780977625447533], [6.417009414132757, 7.1370094141327565, 7.937009414132756, 7.143308472719481, 6.428977625447533], [7.1370094141327565, 7.937009414132756, 9.937009414132756, 7.943308472719481, 7.148977625447533], [7.937009414132756, 9.937009414132756, 9.937009414132756, 9.943308472719481, 7.948977625447533], [7.043308472719481, 8.943308472719481, 9.943308472719481, 8.948977625447533, 8.05407986290278]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.7985242200561276, 5.546524220056127, 6.166524220056127, 6.4498717980505145, 5.804884618245463], [6.446524220056127, 7.166524220056127, 7.966524220056128, 7.169871798050515, 6.452884618245464], [7.166524220056127, 7.966524220056128, 9.966524220056128, 7.969871798050516, 7.172884618245464], [7.966524220056128, 9.966524220056128, 9.966524220056128, 9.969871798050516, 7.972884618245464], [7.169871798050515, 8.969871798050516, 9.969871798050516, 8.972884618245464, 8.075596156420918]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, {"V": [[5.831162049171498, 5.579162049171498, 6.199162049171497, 6.479245844254348, 5.831321259828913], [6.4791620491714985, 7.199162049171497, 7.999162049171497, 7.199245844254348, 6.479321259828913], [7.199162049171497, 7.999162049171497, 9.999162049171497, 7.999245844254348, 7.199321259828913], [7.999162049171497, 9.999162049171497, 9.999162049171497, 9.999245844254348, 7.999321259828914], [7.199245844254348, 8.999245844254348, 9.999245844254348, 8.999321259828914, 8.099389133846023]], "policy": [[1, 3, 1, 1, 1], [1, 1, 1, 1, 1], [1, 1, 1, 1, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}], "errors": [11.809999911553298, 10.999999911553298, 8.999999928358172, 7.199999928358172, 6.479999928358171, 1.8344898985166198, 0.15669144767848664, 0.03347569149717167, 0.0008378623818003916], "backups": 2550}}, "q_learning": {"0.1": {"V": [[5.831999999763786, 3.560240296479938, 0.03897256061432513, 0.2821834652868442, 0.0004720524471590088], [6.479999999999843, 5.187186735199582, 4.7273316265090735, 6.74264640742574, 0.05017476454531533], [7.199999999999996, 7.999999999999995, 9.999999999999993, 7.999726294353697, 2.3629926340153693], [6.057867330996997, 9.999999999999995, 9.999999999999995, 9.977814673982152, 6.3585612295581475], [1.5337745515484795, 8.964578184510653, 9.999999999999995, 8.999999999999993, 8.055139658141348]], "policy": [[1, 2, 2, 1, 1], [1, 2, 3, 1, 1], [3, 1, 1, 2, 1], [0, 3, 4, 2, 1], [3, 3, 0, 2, 2]]}, "0.2": {"V": [[5.831999999999969, 4.498821117900364, 4.446046127841159, 5.136771926456101, 5.808947550000844], [6.479999999999996, 5.729467741142298, 3.713021763387684, 4.326018908044917, 6.477502955182334], [7.199999999999996, 7.999999999999995, 9.999999999999995, 7.999980569224185, 7.199760155611338], [7.999255156484254, 9.999999999999995, 9.999999999999995, 9.999999999999995, 7.99999983914497], [4.520328375338763, 8.999995766858467, 9.999999999999995, 8.99999942490015, 6.115554493243987]], "policy": [[1, 2, 3, 3, 1], [1, 2, 0, 3, 1], [3, 3, 1, 2, 1], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}, "0.5": {"V": [[5.831999999999994, 5.479720169591564, 5.750543455217169, 6.470063835074963, 4.581337821746736], [6.479999999999996, 7.199999999968037, 7.999999999999866, 7.199999519632477, 6.454315594063997], [7.199999999999996, 7.999999999999995, 9.999999999999995, 7.999999999999994, 7.199936442102645], [7.999999999999994, 9.999999999999995, 9.999999999999995, 9.999999999999995, 7.999999999971128], [7.199999417143639, 8.999999999999993, 9.999999999999995, 8.999999999999993, 8.09999404752851]], "policy": [[1, 1, 3, 1, 1], [1, 1, 1, 1, 2], [3, 1, 1, 2, 2], [3, 3, 4, 2, 2], [0, 3, 0, 2, 2]]}}, "td_linear": {"poly_1": {"V": [[-3.894222847601105, -3.6732035563863894, -3.4521842651716743, -3.231164973956959, -3.0101456827422437], [-3.952060939042904, -3.7310416478281883, -3.510022356613473, -3.2890030653987576, -3.0679837741840426], [-4.009899030484703, -3.7888797392699876, -3.5678604480552725, -3.346841156840557, -3.125821865625842], [-4.067737121926502, -3.8467178307117864, -3.6256985394970713, -3.404679248282356, -3.1836599570676407], [-4.125575213368301, -3.9045559221535857, -3.6835366309388706, -3.462517339724155, -3.24149804850944]]}, "poly_2": {"V": [[-3.9923909421032353, -3.860223944928851, -3.746277263085171, -3.6505508965721956, -3.573044845389924], [-3.86536361458311, -3.7083583251518797, -3.569573351051353, -3.4490086922815313, -3.3466643488424133], [-3.8475317168638083, -3.6656881351757313, -3.5020648688183584, -3.3566619177916905, -3.2294792820957263], [-3.93889524894533, -3.732213375000407, -3.543751816386188, -3.373510573102673, -3.2214896451498625], [-4.139454210827675, -3.9079340446259057, -3.69463419375484, -3.4995546582144788, -3.322695438004822]]}, "poly_3": {"V": [[-3.979194035491324, -3.9647456090530238, -3.7456166141341174, -3.455440226389551, -3.2278496214742747], [-3.887714314817037, -3.8304854670098196, -3.60662418474381, -3.3497636436739544, -3.193537019455202], [-3.8347796313289786, -3.714374723397749, -3.46538551502954, -3.221445181879299, -3.1161868996019755], [-3.942814057530292, -3.738837450719953, -3.44432467749445, -3.1929089135087274, -3.118223334417736], [-4.334241665924119, -4.026297721479574, -3.6658657446416805, -3.3865789110653823, -3.3220703964056275]]}, "fourier_1": {"V": [[-3.5581441197033876, -3.5026309076603184, -3.368610158255049, -3.2345894088497795, -3.1790761968067103], [-3.5962827303014753, -3.543863246011436, -3.4098424966061667, -3.2727280194478676, -3.2128396156581753], [-3.6883574812574462, -3.6359379969674066, -3.4988235198091076, -3.357333850904185, -3.2943517193614626], [-3.7804322322134163, -3.7249190201703475, -3.583429351265425, -3.4388459546074728, -3.375863823064751], [-3.818570842811505, -3.758682439021812, -3.61409904236386, -3.4695156457059078, -3.409627241916215]]}, "fourier_2": {"V": [[-3.8048150868509745, -3.865093876336672, -3.846460256845071, -3.5956700593668485, -3.4237922708659236], [-3.761585327547388, -3.9052368900192356, -3.7028571899052305, -3.33750790015395, -3.260604350566498], [-3.7656276123607584, -3.7675859552000706, -3.377407982536231, -3.0649800707085544, -3.125622886152279], [-3.9229821816926003, -3.768328571268986, -3.3716002501802858, -3.227905022670694, -3.3569072147962493], [-4.033064706907485, -3.829807887069142, -3.52857307002175, -3.4952900801838576, -3.5599850875550128]]}, "fourier_3": {"V": [[-4.218527143377485, -4.170809513631698, -4.013146048487479, -3.515956473464602, -3.1287127338401577], [-3.8187598401413245, -4.104879651089856, -3.872679615163419, -3.088135385710245, -2.835333994222405], [-3.5992894979120376, -3.804220231646312, -3.0615161600921486, -2.6206628979969038, -2.654101064114583], [-3.9376506396260247, -3.585594551468551, -3.1959895120922823, -2.8478096988092294, -3.3257817587182603], [-4.095714820333138, -3.900814157996314, -3.233649863705501, -3.3233514377817603, -3.8853166438120086]]}}}, "-10": {"vi": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 1.0, 1.0, 1.9, 0.0], [0.0, 0.0, 1.9, 1.71, 1.539]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.9, 0.0, 0.0], [0.0, 1.9, 1.9, 2.71, 1.3851], [0.0, 1.71, 2.71, 2.439, 2.1951]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 2.71, 0.0, 1.24659], [0.0, 2.71, 2.71, 3.439, 1.9755900000000002], [0.0, 2.439, 3.439, 3.0951, 2.78559]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 1.121931], [0.0, 0.0, 3.439, 1.121931, 1.7780310000000001], [0.0, 3.439, 3.439, 4.0951, 2.507031], [0.0, 3.0951, 4.0951, 3.6855900000000004, 3.3170310000000005]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 1.0097379], [0.0, 0.0, 0.0, 1.0097379, 1.6002279000000001], [0.0, 0.0, 4.0951, 1.6002279000000001, 2.2563279], [0.0, 4.0951, 4.0951, 4.68559, 2.9853279000000006], [0.0, 3.6855900000000004, 4.68559, 4.217031, 3.7953279000000006]], "policy": [[1, 2, 2, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.90876411, 1.4402051100000002], [0.0, 0.0, 0.90876411, 1.4402051100000002, 2.03069511], [0.0, 0.0, 4.68559, 2.03069511, 2.6867951100000007], [0.0, 4.68559, 4.68559, 5.217031, 3.415795110000001], [0.0, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.817887699, 1.2961845990000003, 1.8276255989999999], [0.0, 0.0, 1.2961845990000003, 1.8276255989999999, 2.4181155990000005], [0.0, 0.0, 5.217031, 2.4181155990000005, 3.074215599000001], [0.0, 5.217031, 5.217031, 5.6953279000000006, 3.803215599000001], [0.0, 4.6953279000000006, 5.6953279000000006, 5.12579511, 4.613215599]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.7360989291000001, 1.1665661391000002, 1.6448630390999999, 2.1763040391000006], [0.0, 0.6624890361900001, 1.6448630390999999, 2.1763040391000006, 2.766794039100001], [0.0, 0.0, 5.6953279000000006, 2.766794039100001, 3.422894039100001], [0.0, 5.6953279000000006, 5.6953279000000006, 6.12579511, 4.1518940391], [0.0, 5.12579511, 6.12579511, 5.5132155990000005, 4.961894039100001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.6624890361900001, 1.0499095251900001, 1.48037673519, 1.9586736351900005, 2.4901146351900008], [0.5962401325710001, 0.9449185726710001, 1.9586736351900005, 2.4901146351900008, 3.0806046351900007], [0.5366161193139001, 0.48295450738251006, 6.12579511, 3.0806046351900007, 3.73670463519], [0.48295450738251006, 6.12579511, 6.12579511, 6.5132155990000005, 4.465704635190001], [0.4346590566442591, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.9449185726710001, 1.332339061671, 1.7628062716710005, 2.241103171671001, 2.772544171671001], [0.8504267154039001, 1.1991051555039, 2.241103171671001, 2.772544171671001, 3.3630341716710004], [0.7653840438635101, 0.6888456394771592, 6.5132155990000005, 3.3630341716710004, 4.019134171671001], [0.6888456394771592, 6.5132155990000005, 6.5132155990000005, 6.861894039100001, 4.748134171671001], [0.6199610755294432, 5.861894039100001, 6.861894039100001, 6.175704635190001, 5.558134171671001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.1991051555039, 1.5865256445039004, 2.0169928545039006, 2.495289754503901, 3.0267307545039004], [1.0791946399535102, 1.4278730800535104, 2.495289754503901, 3.0267307545039004, 3.6172207545039012], [0.9712751759581592, 0.8741476583623432, 6.861894039100001, 3.6172207545039012, 4.273320754503901], [0.8741476583623432, 6.861894039100001, 6.861894039100001, 7.175704635190001, 5.002320754503901], [0.7867328925261089, 6.175704635190001, 7.175704635190001, 6.458134171671, 5.812320754503901]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.4278730800535104, 1.8152935690535106, 2.245760779053511, 2.7240576790535105, 3.255498679053511], [1.2850857720481594, 1.6337642121481595, 2.7240576790535105, 3.255498679053511, 3.845988679053511], [1.1565771948433434, 1.0409194753590092, 7.175704635190001, 3.845988679053511, 4.502088679053511], [1.0409194753590092, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.231088679053511], [0.9368275278231083, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.6337642121481595, 2.02118470114816, 2.4516519111481596, 2.9299488111481597, 3.46138981114816], [1.4703877909333436, 1.8190662310333439, 2.9299488111481597, 3.46138981114816, 4.05187981114816], [1.3233490118400093, 1.1910141106560084, 7.458134171671, 4.05187981114816, 4.70797981114816], [1.1910141106560084, 7.458134171671, 7.458134171671, 7.7123207545039, 5.436979811148159], [1.0719126995904076, 6.7123207545039, 7.7123207545039, 6.94108867905351, 6.246979811148159]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.8190662310333439, 2.2064867200333436, 2.6369539300333438, 3.115250830033344, 3.646691830033344], [1.6371596079300095, 1.9858380480300093, 3.115250830033344, 3.646691830033344, 4.237181830033344], [1.4734436471370085, 1.3260992824233078, 7.7123207545039, 4.237181830033344, 4.893281830033343], [1.3260992824233078, 7.7123207545039, 7.7123207545039, 7.94108867905351, 5.6222818300333435], [1.193489354180977, 6.94108867905351, 7.94108867905351, 7.146979811148159, 6.432281830033343]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[1.9858380480300093, 2.3732585370300097, 2.8037257470300094, 3.2820226470300096, 3.8134636470300096], [1.7872542432270084, 2.1359326833270087, 3.2820226470300096, 3.8134636470300096, 4.40395364703001], [1.6085288189043077, 1.447675937013877, 7.94108867905351, 4.40395364703001, 5.060053647030009], [1.447675937013877, 7.94108867905351, 7.94108867905351, 8.14697981114816, 5.789053647030009], [1.3029083433124893, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.1359326833270087, 2.5233531723270084, 2.9538203823270086, 3.4321172823270087, 3.963558282327009], [1.9223394149943078, 2.2710178550943074, 3.4321172823270087, 3.963558282327009, 4.554048282327008], [1.730105473494877, 1.5570949261453895, 8.14697981114816, 4.554048282327008, 5.210148282327008], [1.5570949261453895, 8.14697981114816, 8.14697981114816, 8.332281830033345, 5.939148282327009], [1.4013854335308507, 7.332281830033344, 8.332281830033345, 7.499053647030011, 6.74914828232701]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.2710178550943074, 2.658438344094308, 3.088905554094308, 3.567202454094308, 4.098643454094307], [2.043916069584877, 2.3925945096848773, 3.567202454094308, 4.098643454094307, 4.689133454094308], [1.8395244626263891, 1.6555720163637502, 8.332281830033345, 4.689133454094308, 5.345233454094308], [1.6555720163637502, 8.332281830033345, 8.332281830033345, 8.49905364703001, 6.074233454094309], [1.4900148147273753, 7.499053647030011, 8.49905364703001, 7.649148282327009, 6.884233454094308]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.3925945096848773, 2.780014998684877, 3.210482208684877, 3.6887791086848765, 4.220220108684877], [2.1533350587163897, 2.5020134988163893, 3.6887791086848765, 4.220220108684877, 4.810710108684877], [1.9380015528447507, 1.7442013975602757, 8.49905364703001, 4.810710108684877, 5.466810108684879], [1.7442013975602757, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.195810108684877], [1.5697812578042483, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.5020134988163893, 2.8894339878163895, 3.319901197816389, 3.79819809781639, 4.32963909781639], [2.2518121489347505, 2.6004905890347505, 3.79819809781639, 4.32963909781639, 4.920129097816391], [2.0266309340412754, 1.8239678406371478, 8.649148282327008, 4.920129097816391, 5.576229097816389], [1.8239678406371478, 8.649148282327008, 8.649148282327008, 8.784233454094307, 6.305229097816389], [1.641571056573433, 7.7842334540943074, 8.784233454094307, 7.905810108684877, 7.115229097816389]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.6004905890347505, 2.98791107803475, 3.418378288034751, 3.896675188034751, 4.4281161880347515], [2.3404415301312755, 2.689119970231275, 3.896675188034751, 4.4281161880347515, 5.018606188034751], [2.106397377118148, 1.8957576394063334, 8.784233454094307, 5.018606188034751, 5.674706188034751], [1.8957576394063334, 8.784233454094307, 8.784233454094307, 8.905810108684877, 6.40370618803475], [1.7061818754657, 7.905810108684877, 8.905810108684877, 8.01522909781639, 7.213706188034751]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.689119970231275, 3.0765404592312757, 3.507007669231276, 3.9853045692312765, 4.516745569231276], [2.420207973208148, 2.7688864133081483, 3.9853045692312765, 4.516745569231276, 5.107235569231276], [2.178187175887333, 1.9603684582985998, 8.905810108684877, 5.107235569231276, 5.763335569231275], [1.9603684582985998, 8.905810108684877, 8.905810108684877, 9.01522909781639, 6.492335569231276], [1.7643316124687398, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.7688864133081483, 3.1563069023081485, 3.586774112308149, 4.065071012308148, 4.596512012308148], [2.4919977719773336, 2.8406762120773337, 4.065071012308148, 4.596512012308148, 5.187002012308148], [2.2427979947796004, 2.0185181953016404, 9.01522909781639, 5.187002012308148, 5.843102012308148], [2.0185181953016404, 9.01522909781639, 9.01522909781639, 9.113706188034751, 6.572102012308148], [1.8166663757714765, 8.113706188034751, 9.113706188034751, 8.202335569231277, 7.38210201230815]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.8406762120773337, 3.2280967010773343, 3.658563911077333, 4.136860811077334, 4.668301811077333], [2.5566085908696006, 2.905287030969601, 4.136860811077334, 4.668301811077333, 5.258791811077334], [2.3009477317826406, 2.0708529586043767, 9.113706188034751, 5.258791811077334, 5.914891811077334], [2.0708529586043767, 9.113706188034751, 9.113706188034751, 9.202335569231277, 6.643891811077335], [1.863767662743939, 8.202335569231277, 9.202335569231277, 8.28210201230815, 7.453891811077335]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.905287030969601, 3.2927075199696, 3.7231747299696005, 4.2014716299696, 4.732912629969601], [2.614758327872641, 2.96343676797264, 4.2014716299696, 4.732912629969601, 5.323402629969601], [2.3532824950853772, 2.1179542455768394, 9.202335569231277, 5.323402629969601, 5.979502629969602], [2.1179542455768394, 9.202335569231277, 9.202335569231277, 9.28210201230815, 6.708502629969601], [1.9061588210191556, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.96343676797264, 3.3508572569726405, 3.78132446697264, 4.259621366972641, 4.791062366972641], [2.667093091175376, 3.0157715312753766, 4.259621366972641, 4.791062366972641, 5.381552366972642], [2.4003837820578386, 2.160345403852055, 9.28210201230815, 5.381552366972642, 6.037652366972641], [2.160345403852055, 9.28210201230815, 9.28210201230815, 9.353891811077334, 6.76665236697264], [1.9443108634668493, 8.353891811077334, 9.353891811077334, 8.4185026299696, 7.57665236697264]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.0157715312753766, 3.403192020275376, 3.833659230275377, 4.311956130275377, 4.8433971302753775], [2.714194378147839, 3.0628728182478384, 4.311956130275377, 4.8433971302753775, 5.4338871302753775], [2.442774940333055, 2.1984974462997497, 9.353891811077334, 5.4338871302753775, 6.089987130275376], [2.1984974462997497, 9.353891811077334, 9.353891811077334, 9.4185026299696, 6.818987130275376], [1.9786477016697748, 8.4185026299696, 9.4185026299696, 8.47665236697264, 7.628987130275377]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.0628728182478384, 3.4502933072478394, 3.880760517247839, 4.35905741724784, 4.89049841724784], [2.7565855364230547, 3.1052639765230556, 4.35905741724784, 4.89049841724784, 5.480988417247839], [2.4809269827807494, 2.2328342845026747, 9.4185026299696, 5.480988417247839, 6.137088417247838], [2.2328342845026747, 9.4185026299696, 9.4185026299696, 9.47665236697264, 6.866088417247839], [2.009550856052407, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.1052639765230556, 3.4926844655230553, 3.923151675523056, 4.401448575523056, 4.932889575523055], [2.79473757887075, 3.14341601897075, 4.401448575523056, 4.932889575523055, 5.523379575523054], [2.5152638209836753, 2.263737438885308, 9.47665236697264, 5.523379575523054, 6.179479575523056], [2.263737438885308, 9.47665236697264, 9.47665236697264, 9.528987130275377, 6.908479575523056], [2.037363694996777, 8.528987130275377, 9.528987130275377, 8.57608841724784, 7.718479575523056]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.14341601897075, 3.5308365079707507, 3.9613037179707504, 4.43960061797075, 4.971041617970749], [2.829074417073675, 3.1777528571736755, 4.43960061797075, 4.971041617970749, 5.561531617970751], [2.5461669753663076, 2.291550277829677, 9.528987130275377, 5.561531617970751, 6.21763161797075], [2.291550277829677, 9.528987130275377, 9.528987130275377, 9.57608841724784, 6.946631617970751], [2.0623952500467095, 8.57608841724784, 9.57608841724784, 8.618479575523056, 7.756631617970751]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.1777528571736755, 3.5651733461736757, 3.995640556173675, 4.473937456173674, 5.005378456173676], [2.859977571456308, 3.2086560115563083, 4.473937456173674, 5.005378456173676, 5.595868456173675], [2.573979814310677, 2.3165818328796095, 9.57608841724784, 5.595868456173675, 6.251968456173676], [2.3165818328796095, 9.57608841724784, 9.57608841724784, 9.618479575523056, 6.980968456173676], [2.0849236495916488, 8.618479575523056, 9.618479575523056, 8.656631617970751, 7.790968456173676]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.2086560115563083, 3.5960765005563076, 4.026543710556307, 4.504840610556308, 5.0362816105563075], [2.8877904104006777, 3.236468850500677, 4.504840610556308, 5.0362816105563075, 5.626771610556309], [2.59901136936061, 2.339110232424549, 9.618479575523056, 5.626771610556309, 6.282871610556308], [2.339110232424549, 9.618479575523056, 9.618479575523056, 9.656631617970751, 7.011871610556309], [2.105199209182094, 8.656631617970751, 9.656631617970751, 8.690968456173676, 7.821871610556309]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.236468850500677, 3.6238893395006766, 4.054356549500677, 4.5326534495006765, 5.064094449500678], [2.9128219654506093, 3.261500405550609, 4.5326534495006765, 5.064094449500678, 5.654584449500677], [2.6215397689055484, 2.3593857920149937, 9.656631617970751, 5.654584449500677, 6.310684449500678], [2.3593857920149937, 9.656631617970751, 9.656631617970751, 9.690968456173676, 7.039684449500679], [2.1234472128134945, 8.690968456173676, 9.690968456173676, 8.72187161055631, 7.849684449500679]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.261500405550609, 3.6489208945506095, 4.079388104550609, 4.557685004550611, 5.08912600455061], [2.935350364995548, 3.2840288050955486, 4.557685004550611, 5.08912600455061, 5.67961600455061], [2.6418153284959933, 2.377633795646394, 9.690968456173676, 5.67961600455061, 6.335716004550611], [2.377633795646394, 9.690968456173676, 9.690968456173676, 9.72187161055631, 7.064716004550611], [2.1398704160817545, 8.72187161055631, 9.72187161055631, 8.749684449500679, 7.874716004550611]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.2840288050955486, 3.671449294095548, 4.101916504095549, 4.580213404095549, 5.111654404095549], [2.955625924585994, 3.304304364685993, 4.580213404095549, 5.111654404095549, 5.7021444040955505], [2.6600633321273945, 2.394056998914655, 9.72187161055631, 5.7021444040955505, 6.35824440409555], [2.394056998914655, 9.72187161055631, 9.72187161055631, 9.749684449500679, 7.08724440409555], [2.1546512990231896, 8.749684449500679, 9.749684449500679, 8.77471600455061, 7.89724440409555]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.304304364685993, 3.6917248536859946, 4.122192063685994, 4.600488963685994, 5.131929963685995], [2.973873928217394, 3.322552368317395, 4.600488963685994, 5.131929963685995, 5.722419963685995], [2.6764865353956546, 2.408837881856089, 9.749684449500679, 5.722419963685995, 6.378519963685995], [2.408837881856089, 9.749684449500679, 9.749684449500679, 9.77471600455061, 7.107519963685995], [2.16795409367048, 8.77471600455061, 9.77471600455061, 8.797244404095549, 7.9175199636859945]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.322552368317395, 3.709972857317395, 4.140440067317394, 4.618736967317396, 5.150177967317396], [2.9902971314856557, 3.3389755715856553, 4.618736967317396, 5.150177967317396, 5.740667967317395], [2.69126741833709, 2.422140676503381, 9.77471600455061, 5.740667967317395, 6.396767967317396], [2.422140676503381, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.125767967317395], [2.179926608853043, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.3389755715856553, 3.726396060585655, 4.1568632705856565, 4.635160170585657, 5.166601170585656], [3.00507801442709, 3.3537564545270895, 4.635160170585657, 5.166601170585656, 5.757091170585656], [2.704570212984381, 2.434113191685943, 9.797244404095549, 5.757091170585656, 6.413191170585655], [2.434113191685943, 9.797244404095549, 9.797244404095549, 9.817519963685994, 7.142191170585655], [2.190701872517349, 8.817519963685994, 9.817519963685994, 8.835767967317395, 7.952191170585656]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.3537564545270895, 3.741176943527091, 4.171644153527091, 4.64994105352709, 5.1813820535270905], [3.0183808090743804, 3.367059249174382, 4.64994105352709, 5.1813820535270905, 5.7718720535270895], [2.7165427281669423, 2.4448884553502483, 9.817519963685994, 5.7718720535270895, 6.42797205352709], [2.4448884553502483, 9.817519963685994, 9.817519963685994, 9.835767967317395, 7.15697205352709], [2.2003996098152236, 8.835767967317395, 9.835767967317395, 8.852191170585655, 7.96697205352709]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.367059249174382, 3.754479738174382, 4.184946948174382, 4.663243848174382, 5.194684848174381], [3.030353324256944, 3.379031764356944, 4.663243848174382, 5.194684848174381, 5.785174848174381], [2.7273179918312493, 2.4545861926481245, 9.835767967317395, 5.785174848174381, 6.441274848174381], [2.4545861926481245, 9.835767967317395, 9.835767967317395, 9.852191170585655, 7.1702748481743805], [2.209127573383312, 8.852191170585655, 9.852191170585655, 8.86697205352709, 7.980274848174382]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.379031764356944, 3.7664522533569436, 4.196919463356944, 4.6752163633569435, 5.206657363356943], [3.0411285879212495, 3.389807028021249, 4.6752163633569435, 5.206657363356943, 5.7971473633569435], [2.7370157291291246, 2.4633141562162124, 9.852191170585655, 5.7971473633569435, 6.453247363356943], [2.4633141562162124, 9.852191170585655, 9.852191170585655, 9.86697205352709, 7.182247363356944], [2.216982740594591, 8.86697205352709, 9.86697205352709, 8.880274848174382, 7.992247363356944]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.389807028021249, 3.7772275170212497, 4.2076947270212495, 4.685991627021249, 5.21743262702125], [3.0508263252191243, 3.399504765319125, 4.685991627021249, 5.21743262702125, 5.807922627021249], [2.745743692697212, 2.4711693234274907, 9.86697205352709, 5.807922627021249, 6.46402262702125], [2.4711693234274907, 9.86697205352709, 9.86697205352709, 9.880274848174382, 7.19302262702125], [2.224052391084742, 8.880274848174382, 9.880274848174382, 8.892247363356944, 8.00302262702125]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.399504765319125, 3.7869252543191245, 4.217392464319124, 4.695689364319125, 5.227130364319124], [3.0595542887872123, 3.4082327288872123, 4.695689364319125, 5.227130364319124, 5.817620364319125], [2.7535988599084913, 2.4782389739176423, 9.880274848174382, 5.817620364319125, 6.473720364319125], [2.4782389739176423, 9.880274848174382, 9.880274848174382, 9.892247363356944, 7.202720364319125], [2.230415076525878, 8.892247363356944, 9.892247363356944, 8.90302262702125, 8.012720364319124]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4082327288872123, 3.7956532178872116, 4.226120427887213, 4.704417327887212, 5.235858327887213], [3.067409455998491, 3.4160878960984906, 4.704417327887212, 5.235858327887213, 5.826348327887213], [2.760668510398642, 2.484601659358778, 9.892247363356944, 5.826348327887213, 6.482448327887213], [2.484601659358778, 9.892247363356944, 9.892247363356944, 9.90302262702125, 7.2114483278872115], [2.2361414934229003, 8.90302262702125, 9.90302262702125, 8.912720364319124, 8.021448327887212]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4160878960984906, 3.8035083850984917, 4.2339755950984905, 4.7122724950984916, 5.243713495098492], [3.0744791064886416, 3.4231575465886426, 4.7122724950984916, 5.243713495098492, 5.834203495098492], [2.7670311958397775, 2.4903280762557998, 9.90302262702125, 5.834203495098492, 6.49030349509849], [2.4903280762557998, 9.90302262702125, 9.90302262702125, 9.912720364319124, 7.219303495098491], [2.24129526863022, 8.912720364319124, 9.912720364319124, 8.921448327887212, 8.02930349509849]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4231575465886426, 3.8105780355886414, 4.2410452455886425, 4.719342145588643, 5.250783145588643], [3.0808417919297786, 3.4295202320297773, 4.719342145588643, 5.250783145588643, 5.841273145588641], [2.7727576127368008, 2.4954818514631207, 9.912720364319124, 5.841273145588641, 6.497373145588642], [2.4954818514631207, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.226373145588642], [2.245933666316809, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4295202320297773, 3.8169407210297783, 4.2474079310297785, 4.725704831029779, 5.257145831029777], [3.0865682088267996, 3.4352466489268005, 4.725704831029779, 5.257145831029777, 5.847635831029778], [2.7779113879441195, 2.5001202491497074, 9.921448327887212, 5.847635831029778, 6.503735831029778], [2.5001202491497074, 9.921448327887212, 9.921448327887212, 9.929303495098491, 7.232735831029778], [2.2501082242347366, 8.929303495098491, 9.929303495098491, 8.936373145588643, 8.042735831029779]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4352466489268005, 3.8226671379268007, 4.253134347926801, 4.7314312479268, 5.2628722479268], [3.0917219840341206, 3.4404004241341206, 4.7314312479268, 5.2628722479268, 5.853362247926801], [2.7825497856307084, 2.504294807067638, 9.929303495098491, 5.853362247926801, 6.509462247926801], [2.504294807067638, 9.929303495098491, 9.929303495098491, 9.936373145588643, 7.238462247926801], [2.253865326360874, 8.936373145588643, 9.936373145588643, 8.942735831029779, 8.048462247926802]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4404004241341206, 3.827820913134121, 4.25828812313412, 4.73658502313412, 5.26802602313412], [3.0963603817207086, 3.445038821820709, 4.73658502313412, 5.26802602313412, 5.858516023134121], [2.786724343548638, 2.508051909193774, 9.936373145588643, 5.858516023134121, 6.5146160231341215], [2.508051909193774, 9.936373145588643, 9.936373145588643, 9.942735831029779, 7.243616023134122], [2.2572467182743967, 8.942735831029779, 9.942735831029779, 8.948462247926802, 8.053616023134122]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.445038821820709, 3.8324593108207083, 4.2629265208207086, 4.741223420820709, 5.272664420820709], [3.100534939638638, 3.4492133797386377, 4.741223420820709, 5.272664420820709, 5.86315442082071], [2.790481445674774, 2.5114333011072967, 9.942735831029779, 5.86315442082071, 6.51925442082071], [2.5114333011072967, 9.942735831029779, 9.942735831029779, 9.948462247926802, 7.24825442082071], [2.260289970996567, 8.948462247926802, 9.948462247926802, 8.953616023134122, 8.05825442082071]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4492133797386377, 3.836633868738638, 4.267101078738638, 4.745397978738638, 5.276838978738639], [3.104292041764774, 3.452970481864774, 4.745397978738638, 5.276838978738639, 5.867328978738639], [2.793862837588297, 2.5144765538294673, 9.948462247926802, 5.867328978738639, 6.5234289787386395], [2.5144765538294673, 9.948462247926802, 9.948462247926802, 9.953616023134122, 7.252428978738639], [2.2630288984465206, 8.953616023134122, 9.953616023134122, 8.95825442082071, 8.06242897873864]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.452970481864774, 3.8403909708647745, 4.270858180864774, 4.749155080864775, 5.280596080864775], [3.1076734336782965, 3.456351873778297, 4.749155080864775, 5.280596080864775, 5.871086080864775], [2.796906090310467, 2.5172154812794205, 9.953616023134122, 5.871086080864775, 6.527186080864775], [2.5172154812794205, 9.953616023134122, 9.953616023134122, 9.95825442082071, 7.256186080864776], [2.2654939331514785, 8.95825442082071, 9.95825442082071, 8.96242897873864, 8.066186080864776]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.456351873778297, 3.843772362778297, 4.274239572778298, 4.752536472778298, 5.2839774727782975], [3.110716686400467, 3.4593951265004677, 4.752536472778298, 5.2839774727782975, 5.8744674727782975], [2.7996450177604206, 2.5196805159843785, 9.95825442082071, 5.8744674727782975, 6.530567472778299], [2.5196805159843785, 9.95825442082071, 9.95825442082071, 9.96242897873864, 7.259567472778299], [2.2677124643859408, 8.96242897873864, 9.96242897873864, 8.966186080864777, 8.0695674727783]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4593951265004677, 3.8468156155004687, 4.2772828255004685, 4.755579725500468, 5.287020725500468], [3.113455613850421, 3.4621340539504217, 4.755579725500468, 5.287020725500468, 5.877510725500469], [2.8021100524653786, 2.5218990472188407, 9.96242897873864, 5.877510725500469, 6.533610725500469], [2.5218990472188407, 9.96242897873864, 9.96242897873864, 9.966186080864777, 7.26261072550047], [2.2697091424969567, 8.966186080864777, 9.966186080864777, 8.9695674727783, 8.07261072550047]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4621340539504217, 3.849554542950422, 4.280021752950421, 4.758318652950421, 5.289759652950422], [3.1159206485553796, 3.4645990886553797, 4.758318652950421, 5.289759652950422, 5.880249652950422], [2.8043285836998417, 2.5238957253298575, 9.966186080864777, 5.880249652950422, 6.536349652950423], [2.5238957253298575, 9.966186080864777, 9.966186080864777, 9.9695674727783, 7.265349652950423], [2.2715061527968716, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4645990886553797, 3.852019577655379, 4.282486787655379, 4.76078368765538, 5.29222468765538], [3.118139179789842, 3.466817619889841, 4.76078368765538, 5.29222468765538, 5.882714687655381], [2.8063252618108576, 2.525692735629772, 9.9695674727783, 5.882714687655381, 6.538814687655381], [2.525692735629772, 9.9695674727783, 9.9695674727783, 9.97261072550047, 7.267814687655381], [2.273123462066795, 8.97261072550047, 9.97261072550047, 8.975349652950424, 8.077814687655382]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.466817619889841, 3.8542381088898408, 4.284705318889842, 4.7630022188898415, 5.2944432188898425], [3.120135857900857, 3.468814298000857, 4.7630022188898415, 5.2944432188898425, 5.884933218889843], [2.8081222721107713, 2.527310044899694, 9.97261072550047, 5.884933218889843, 6.541033218889843], [2.527310044899694, 9.97261072550047, 9.97261072550047, 9.975349652950424, 7.270033218889844], [2.2745790404097246, 8.975349652950424, 9.975349652950424, 8.977814687655382, 8.080033218889843]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.468814298000857, 3.856234787000858, 4.286701997000858, 4.764998897000859, 5.296439897000859], [3.1219328682007714, 3.4706113083007724, 4.764998897000859, 5.296439897000859, 5.886929897000859], [2.8097395813806942, 2.528765623242625, 9.975349652950424, 5.886929897000859, 6.543029897000859], [2.528765623242625, 9.975349652950424, 9.975349652950424, 9.977814687655382, 7.272029897000859], [2.2758890609183626, 8.977814687655382, 9.977814687655382, 8.980033218889844, 8.08202989700086]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4706113083007724, 3.858031797300772, 4.288499007300773, 4.766795907300773, 5.298236907300773], [3.1235501774706953, 3.472228617570695, 4.766795907300773, 5.298236907300773, 5.888726907300773], [2.811195159723626, 2.5300756437512635, 9.977814687655382, 5.888726907300773, 6.544826907300774], [2.5300756437512635, 9.977814687655382, 9.977814687655382, 9.980033218889844, 7.273826907300774], [2.277068079376137, 8.980033218889844, 9.980033218889844, 8.98202989700086, 8.083826907300775]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.472228617570695, 3.859649106570696, 4.290116316570696, 4.768413216570696, 5.299854216570696], [3.1250057558136253, 3.473684195913626, 4.768413216570696, 5.299854216570696, 5.890344216570696], [2.8125051802322627, 2.5312546622090366, 9.980033218889844, 5.890344216570696, 6.546444216570697], [2.5312546622090366, 9.980033218889844, 9.980033218889844, 9.98202989700086, 7.275444216570698], [2.278129195988133, 8.98202989700086, 9.98202989700086, 8.983826907300774, 8.085444216570696]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.473684195913626, 3.861104684913627, 4.291571894913627, 4.769868794913627, 5.301309794913627], [3.1263157763222638, 3.4749942164222642, 4.769868794913627, 5.301309794913627, 5.891799794913627], [2.8136841986900376, 2.532315778821034, 9.98202989700086, 5.891799794913627, 6.547899794913628], [2.532315778821034, 9.98202989700086, 9.98202989700086, 9.983826907300774, 7.276899794913627], [2.2790842009389305, 8.983826907300774, 9.983826907300774, 8.985444216570697, 8.086899794913627]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4749942164222642, 3.8624147054222644, 4.292881915422265, 4.771178815422265, 5.302619815422265], [3.127494794780038, 3.476173234880038, 4.771178815422265, 5.302619815422265, 5.893109815422266], [2.814745315302034, 2.533270783771831, 9.983826907300774, 5.893109815422266, 6.549209815422264], [2.533270783771831, 9.983826907300774, 9.983826907300774, 9.985444216570697, 7.278209815422264], [2.279943705394648, 8.985444216570697, 9.985444216570697, 8.986899794913628, 8.088209815422266]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.476173234880038, 3.8635937238800384, 4.294060933880038, 4.772357833880038, 5.303798833880039], [3.1285559113920343, 3.4772343514920347, 4.772357833880038, 5.303798833880039, 5.894288833880038], [2.815700320252831, 2.534130288227548, 9.985444216570697, 5.894288833880038, 6.550388833880038], [2.534130288227548, 9.985444216570697, 9.985444216570697, 9.986899794913628, 7.27938883388004], [2.2807172594047933, 8.986899794913628, 9.986899794913628, 8.988209815422264, 8.089388833880038]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4772343514920347, 3.8646548404920344, 4.295122050492035, 4.773418950492036, 5.304859950492035], [3.129510916342831, 3.4781893564428312, 4.773418950492036, 5.304859950492035, 5.895349950492034], [2.816559824708548, 2.5349038422376933, 9.986899794913628, 5.895349950492034, 6.551449950492036], [2.5349038422376933, 9.986899794913628, 9.986899794913628, 9.988209815422264, 7.280449950492034], [2.281413458013924, 8.988209815422264, 9.988209815422264, 8.989388833880039, 8.090449950492035]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4781893564428312, 3.8656098454428314, 4.296077055442832, 4.774373955442831, 5.30581495544283], [3.130370420798548, 3.479048860898548, 4.774373955442831, 5.30581495544283, 5.896304955442832], [2.8173333787186934, 2.535600040846824, 9.988209815422264, 5.896304955442832, 6.552404955442831], [2.535600040846824, 9.988209815422264, 9.988209815422264, 9.989388833880039, 7.281404955442832], [2.282040036762142, 8.989388833880039, 9.989388833880039, 8.990449950492035, 8.091404955442831]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.479048860898548, 3.8664693498985487, 4.2969365598985485, 4.775233459898548, 5.306674459898549], [3.1311439748086936, 3.479822414908694, 4.775233459898548, 5.306674459898549, 5.897164459898548], [2.8180295773278243, 2.536226619595042, 9.989388833880039, 5.897164459898548, 6.553264459898549], [2.536226619595042, 9.989388833880039, 9.989388833880039, 9.990449950492035, 7.282264459898548], [2.282603957635538, 8.990449950492035, 9.990449950492035, 8.991404955442832, 8.09226445989855]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.479822414908694, 3.8672429039086937, 4.2977101139086935, 4.776007013908694, 5.307448013908693], [3.1318401734178245, 3.4805186135178245, 4.776007013908694, 5.307448013908693, 5.8979380139086945], [2.818656156076042, 2.536790540468438, 9.990449950492035, 5.8979380139086945, 6.554038013908693], [2.536790540468438, 9.990449950492035, 9.990449950492035, 9.991404955442832, 7.283038013908695], [2.283111486421594, 8.991404955442832, 9.991404955442832, 8.992264459898548, 8.093038013908693]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4805186135178245, 3.8679391025178242, 4.298406312517824, 4.776703212517823, 5.308144212517825], [3.1324667521660423, 3.481145192266042, 4.776703212517823, 5.308144212517825, 5.898634212517824], [2.819220076949438, 2.5372980692544944, 9.991404955442832, 5.898634212517824, 6.554734212517825], [2.5372980692544944, 9.991404955442832, 9.991404955442832, 9.992264459898548, 7.283734212517824], [2.283568262329045, 8.992264459898548, 9.992264459898548, 8.993038013908693, 8.093734212517823]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.481145192266042, 3.8685656812660416, 4.299032891266041, 4.777329791266043, 5.308770791266042], [3.1330306730394377, 3.4817091131394373, 4.777329791266043, 5.308770791266042, 5.899260791266043], [2.819727605735494, 2.537754845161945, 9.992264459898548, 5.899260791266043, 6.555360791266041], [2.537754845161945, 9.992264459898548, 9.992264459898548, 9.993038013908693, 7.2843607912660415], [2.2839793606457506, 8.993038013908693, 9.993038013908693, 8.993734212517824, 8.094360791266041]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4817091131394373, 3.869129602139437, 4.299596812139439, 4.777893712139438, 5.309334712139439], [3.133538201825494, 3.4822166419254934, 4.777893712139438, 5.309334712139439, 5.899824712139438], [2.8201843816429446, 2.53816594347865, 9.993038013908693, 5.899824712139438, 6.555924712139437], [2.53816594347865, 9.993038013908693, 9.993038013908693, 9.993734212517824, 7.284924712139437], [2.2843493491307854, 8.993734212517824, 9.993734212517824, 8.994360791266041, 8.094924712139438]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4822166419254934, 3.869637130925495, 4.300104340925494, 4.778401240925495, 5.309842240925494], [3.1339949777329443, 3.4826734178329453, 4.778401240925495, 5.309842240925494, 5.9003322409254935], [2.8205954799596498, 2.538535931963685, 9.993734212517824, 5.9003322409254935, 6.556432240925494], [2.538535931963685, 9.993734212517824, 9.993734212517824, 9.994360791266041, 7.285432240925494], [2.2846823387673165, 8.994360791266041, 9.994360791266041, 8.994924712139438, 8.095432240925495]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4826734178329453, 3.870093906832945, 4.300561116832946, 4.778858016832945, 5.3102990168329445], [3.134406076049651, 3.4830845161496504, 4.778858016832945, 5.3102990168329445, 5.900789016832944], [2.820965468444686, 2.5388689216002174, 9.994360791266041, 5.900789016832944, 6.556889016832945], [2.5388689216002174, 9.994360791266041, 9.994360791266041, 9.994924712139438, 7.285889016832946], [2.284982029440196, 8.994924712139438, 9.994924712139438, 8.995432240925494, 8.095889016832945]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4830845161496504, 3.8705050051496515, 4.300972215149651, 4.77926911514965, 5.31071011514965], [3.1347760645346856, 3.4834545046346865, 4.77926911514965, 5.31071011514965, 5.90120011514965], [2.821298458081217, 2.5391686122730954, 9.994924712139438, 5.90120011514965, 6.557300115149651], [2.5391686122730954, 9.994924712139438, 9.994924712139438, 9.995432240925494, 7.286300115149651], [2.285251751045786, 8.995432240925494, 9.995432240925494, 8.995889016832944, 8.09630011514965]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4834545046346865, 3.870874993634686, 4.301342203634685, 4.779639103634685, 5.311080103634685], [3.135109054171218, 3.4837874942712173, 4.779639103634685, 5.311080103634685, 5.901570103634686], [2.8215981487540964, 2.539438333878687, 9.995432240925494, 5.901570103634686, 6.5576701036346865], [2.539438333878687, 9.995432240925494, 9.995432240925494, 9.995889016832944, 7.286670103634685], [2.2854945004908185, 8.995889016832944, 9.995889016832944, 8.99630011514965, 8.096670103634684]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4837874942712173, 3.8712079832712165, 4.301675193271217, 4.779972093271217, 5.311413093271217], [3.1354087448440957, 3.484087184944095, 4.779972093271217, 5.311413093271217, 5.901903093271218], [2.8218678703596862, 2.5396810833237176, 9.995889016832944, 5.901903093271218, 6.558003093271217], [2.5396810833237176, 9.995889016832944, 9.995889016832944, 9.99630011514965, 7.287003093271216], [2.285712974991346, 8.99630011514965, 9.99630011514965, 8.996670103634685, 8.097003093271217]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484087184944095, 3.8715076739440955, 4.301974883944096, 4.780271783944095, 5.311712783944096], [3.1356784664496855, 3.484356906549686, 4.780271783944095, 5.311712783944096, 5.902202783944095], [2.8221106198047172, 2.5398995578242456, 9.99630011514965, 5.902202783944095, 6.558302783944095], [2.5398995578242456, 9.99630011514965, 9.99630011514965, 9.996670103634685, 7.287302783944096], [2.285909602041821, 8.996670103634685, 9.996670103634685, 8.997003093271216, 8.097302783944095]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484356906549686, 3.8717773955496866, 4.302244605549686, 4.780541505549687, 5.311982505549686], [3.1359212158947174, 3.484599655994718, 4.780541505549687, 5.311982505549686, 5.902472505549685], [2.8223290943052457, 2.540096184874721, 9.996670103634685, 5.902472505549685, 6.558572505549686], [2.540096184874721, 9.996670103634685, 9.996670103634685, 9.997003093271216, 7.287572505549686], [2.286086566387249, 8.997003093271216, 9.997003093271216, 8.997302783944095, 8.097572505549685]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484599655994718, 3.8720201449947176, 4.302487354994718, 4.7807842549947175, 5.312225254994717], [3.1361396903952463, 3.484818130495246, 4.7807842549947175, 5.312225254994717, 5.9027152549947175], [2.8225257213557216, 2.5402731492201496, 9.997003093271216, 5.9027152549947175, 6.558815254994717], [2.5402731492201496, 9.997003093271216, 9.997003093271216, 9.997302783944095, 7.287815254994717], [2.2862458342981347, 8.997302783944095, 9.997302783944095, 8.997572505549686, 8.097815254994718]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.484818130495246, 3.8722386194952465, 4.302705829495246, 4.7810027294952455, 5.312443729495246], [3.1363363174457213, 3.4850147575457218, 4.7810027294952455, 5.312443729495246, 5.9029337294952455], [2.8227026857011492, 2.540432417131034, 9.997302783944095, 5.9029337294952455, 6.559033729495246], [2.540432417131034, 9.997302783944095, 9.997302783944095, 9.997572505549686, 7.288033729495246], [2.2863891754179306, 8.997572505549686, 9.997572505549686, 8.997815254994718, 8.098033729495246]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4850147575457218, 3.872435246545722, 4.302902456545721, 4.781199356545721, 5.312640356545721], [3.13651328179115, 3.48519172189115, 4.781199356545721, 5.312640356545721, 5.903130356545722], [2.8228619536120347, 2.5405757582508315, 9.997572505549686, 5.903130356545722, 6.559230356545721], [2.5405757582508315, 9.997572505549686, 9.997572505549686, 9.997815254994718, 7.288230356545721], [2.2865181824257483, 8.997815254994718, 9.997815254994718, 8.998033729495246, 8.098230356545722]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.48519172189115, 3.8726122108911487, 4.303079420891149, 4.781376320891149, 5.31281732089115], [3.136672549702035, 3.485350989802034, 4.781376320891149, 5.31281732089115, 5.903307320891149], [2.8230052947318316, 2.5407047652586483, 9.997815254994718, 5.903307320891149, 6.559407320891149], [2.5407047652586483, 9.997815254994718, 9.997815254994718, 9.998033729495246, 7.2884073208911495], [2.2866342887327837, 8.998033729495246, 9.998033729495246, 8.998230356545722, 8.09840732089115]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485350989802034, 3.872771478802034, 4.303238688802034, 4.781535588802035, 5.312976588802035], [3.136815890821831, 3.485494330921831, 4.781535588802035, 5.312976588802035, 5.903466588802035], [2.823134301739648, 2.5408208715656833, 9.998033729495246, 5.903466588802035, 6.559566588802035], [2.5408208715656833, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.288566588802035], [2.286738784409115, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485494330921831, 3.872914819921831, 4.303382029921832, 4.781678929921831, 5.3131199299218315], [3.1369448978296477, 3.485623337929648, 4.781678929921831, 5.3131199299218315, 5.903609929921831], [2.823250408046683, 2.5409253672420147, 9.998230356545722, 5.903609929921831, 6.559709929921832], [2.5409253672420147, 9.998230356545722, 9.998230356545722, 9.99840732089115, 7.288709929921833], [2.286832830517813, 8.99840732089115, 9.99840732089115, 8.998566588802035, 8.098709929921831]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485623337929648, 3.873043826929649, 4.303511036929648, 4.781807936929648, 5.313248936929648], [3.1370610041366835, 3.4857394442366845, 4.781807936929648, 5.313248936929648, 5.903738936929649], [2.8233549037230152, 2.5410194133507136, 9.99840732089115, 5.903738936929649, 6.5598389369296495], [2.5410194133507136, 9.99840732089115, 9.99840732089115, 9.998566588802035, 7.288838936929649], [2.2869174720156424, 8.998566588802035, 9.998566588802035, 8.998709929921832, 8.09883893692965]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4857394442366845, 3.8731599332366833, 4.3036271432366835, 4.781924043236684, 5.313365043236685], [3.1371654998130163, 3.485843939913015, 4.781924043236684, 5.313365043236685, 5.9038550432366845], [2.8234489498317146, 2.5411040548485433, 9.998566588802035, 5.9038550432366845, 6.559955043236684], [2.5411040548485433, 9.998566588802035, 9.998566588802035, 9.998709929921832, 7.288955043236684], [2.286993649363689, 8.998709929921832, 9.998709929921832, 8.99883893692965, 8.098955043236685]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485843939913015, 3.873264428913015, 4.303731638913016, 4.782028538913016, 5.313469538913016], [3.1372595459217134, 3.485937986021714, 4.782028538913016, 5.313469538913016, 5.903959538913016], [2.823533591329542, 2.541180232196588, 9.998709929921832, 5.903959538913016, 6.560059538913015], [2.541180232196588, 9.998709929921832, 9.998709929921832, 9.99883893692965, 7.289059538913017], [2.2870622089769292, 8.99883893692965, 9.99883893692965, 8.998955043236684, 8.099059538913016]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.485937986021714, 3.8733584750217145, 4.303825685021715, 4.782122585021715, 5.313563585021715], [3.1373441874195427, 3.486022627519543, 4.782122585021715, 5.313563585021715, 5.904053585021714], [2.8236097686775885, 2.5412487918098297, 9.99883893692965, 5.904053585021714, 6.560153585021716], [2.5412487918098297, 9.99883893692965, 9.99883893692965, 9.998955043236684, 7.289153585021714], [2.287123912628847, 8.998955043236684, 9.998955043236684, 8.999059538913016, 8.099153585021716]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486022627519543, 3.8734431165195433, 4.303910326519543, 4.782207226519543, 5.313648226519542], [3.137420364767589, 3.486098804867589, 4.782207226519543, 5.313648226519542, 5.904138226519545], [2.82367832829083, 2.5413104954617474, 9.998955043236684, 5.904138226519545, 6.560238226519543], [2.5413104954617474, 9.998955043236684, 9.998955043236684, 9.999059538913016, 7.289238226519545], [2.2871794459155725, 8.999059538913016, 9.999059538913016, 8.999153585021714, 8.099238226519542]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486098804867589, 3.873519293867589, 4.303986503867589, 4.782283403867588, 5.313724403867591], [3.1374889243808304, 3.48616736448083, 4.782283403867588, 5.313724403867591, 5.904214403867589], [2.8237400319427475, 2.541366028748473, 9.999059538913016, 5.904214403867589, 6.56031440386759], [2.541366028748473, 9.999059538913016, 9.999059538913016, 9.999153585021714, 7.289314403867588], [2.2872294258736257, 8.999153585021714, 9.999153585021714, 8.999238226519543, 8.099314403867588]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.48616736448083, 3.8735878534808297, 4.3040550634808294, 4.782351963480831, 5.31379296348083], [3.137550628032747, 3.486229068132747, 4.782351963480831, 5.31379296348083, 5.904282963480831], [2.8237955652294726, 2.5414160087065256, 9.999153585021714, 5.904282963480831, 6.56038296348083], [2.5414160087065256, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.289382963480829], [2.287274407835873, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [8.999999920397968, 8.099999911553297, 7.289999911553298, 6.5609999115532975, 5.904899911553297, 5.314409911553297, 4.782968911553297, 4.304672011553297, 3.8742048015532973, 3.486784312553297, 3.1381058724532966, 2.824295276363297, 2.5418657398822972, 2.2876791570493973, 2.0589112324997876, 1.8530201004051374, 1.6677180815199524, 1.5009462645232876, 1.3508516292262893, 1.2157664574589901, 1.0941898028684207, 0.9847708137369082, 0.8862937235185466, 0.7976643423220207, 0.7178978992451484, 0.6461081004759635, 0.5814972815836974, 0.5233475445806572, 0.47101278127792057, 0.4239114943054574, 0.38152033603024194, 0.3433682935825466, 0.3090314553796212, 0.27812830099698793, 0.2503154620526189, 0.2252839070026873, 0.2027555074577485, 0.1824799478673036, 0.16423194423590282, 0.1478087409676423, 0.13302785802620676, 0.11972506337891531, 0.10775254819635371, 0.09697728453204846, 0.0872795472341732, 0.07855158366608528, 0.07069641645480651, 0.06362676596465455, 0.0572640805235185, 0.0515376636264957, 0.04638388841917518, 0.0417454907325876, 0.037570932814658065, 0.03381383068852095, 0.030432438774997905, 0.027389186052827696, 0.02465025860287362, 0.022185223897915662, 0.019966692663453856, 0.01797001455243752, 0.01617300425252388, 0.014555694982600897, 0.013100116639670034, 0.011790096131033323, 0.010611077673258862, 0.00954996106126238, 0.008594956110465901, 0.007735451654749426, 0.00696189764460442, 0.006265699035473915, 0.005639120287256105, 0.005075199413859366, 0.004567670627803722, 0.004110894720353642, 0.003699796403648037, 0.003329807918612815, 0.002996818282081648, 0.0026971276092027097, 0.0024274060036120204, 0.0021846565585796895, 0.0019661820580516576, 0.001769555007575363, 0.0015925906621472308, 0.0014333227512626223, 0.0012899816314657642, 0.001160974623648059, 0.0010448683166135453, 0.0009403726402812396, 0.0008463265315832302]}, "pi": {"frames": [{"V": [[-8.999153585021714, 0.0, 0.0, -9.999153585021714, -9.999153585021714], [-9.999153585021714, -99.99999920397967, -99.9999992835817, -8.999238226519543, -8.999238226519543], [0.0, 0.0, -99.99999935522354, 0.0, 0.0], [-9.999153585021714, -52.63157848185946, -52.63157848185946, -47.36842063367351, -52.63157857030616], [-52.63157848185946, -47.36842063367351, -52.63157857030616, -47.36842071327555, 0.0]], "policy": [[3, 3, 2, 2, 1], [1, 0, 0, 1, 1], [3, 2, 2, 3, 2], [0, 0, 4, 0, 0], [0, 1, 3, 3, 4]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999115904138172, 0.0, 0.0], [0.0, -10.00052748576431, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.99928388235192, 0.0, 0.0], [0.0, 9.99928388235192, 9.99928388235192, 9.999355494116728, 0.0], [0.0, 0.0, 9.999355494116728, 8.999419944705055, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999419944705055, 0.0, 0.0], [0.0, 9.999419944705055, 9.999419944705055, 9.99947795023455, 0.0], [0.0, 8.99947795023455, 9.99947795023455, 8.999530155211096, 8.099577139689986]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999530155211096, 0.0, 0.0], [0.0, 9.999530155211096, 9.999530155211096, 9.999577139689986, 7.289657483148889], [0.0, 8.999577139689986, 9.999577139689986, 8.999619425720988, 8.09965748314889]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999619425720988, 0.0, 6.560722561350601], [0.0, 9.999619425720988, 9.999619425720988, 9.999657483148889, 7.2897225613506], [0.0, 8.999657483148889, 9.999657483148889, 8.999691734834, 8.0997225613506]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.3142077472245886], [0.0, 0.0, 0.0, 0.0, 5.904697747224588], [0.0, 0.0, 9.9997225613506, 5.904697747224588, 6.560797747224588], [0.0, 9.9997225613506, 9.9997225613506, 9.99975030521554, 7.289797747224587], [0.0, 8.99975030521554, 9.99975030521554, 8.999775274693986, 8.099797747224589]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.782805175251917, 5.314246175251917], [0.0, 0.0, 0.0, 5.314246175251917, 5.904736175251916], [0.0, 0.0, 9.999775274693986, 5.904736175251916, 6.560836175251917], [0.0, 9.999775274693986, 9.999775274693986, 9.999797747224587, 7.289836175251915], [0.0, 8.999797747224587, 9.999797747224587, 8.999817972502129, 8.099836175251916]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.304539401954053, 4.7828363019540525, 5.3142773019540535], [0.0, 0.0, 4.7828363019540525, 5.3142773019540535, 5.904767301954052], [0.0, 0.0, 9.999817972502129, 5.904767301954052, 6.560867301954052], [0.0, 9.999817972502129, 9.999817972502129, 9.999836175251916, 7.289867301954053], [0.0, 8.999836175251916, 9.999836175251916, 8.999852557726724, 8.099867301954053]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.8740974045827823, 4.304564614582784, 4.782861514582782, 5.314302514582782], [0.0, 3.486687664124504, 4.782861514582782, 5.314302514582782, 5.904792514582783], [0.0, 0.0, 9.999852557726724, 5.904792514582783, 6.560892514582783], [0.0, 9.999852557726724, 9.999852557726724, 9.999867301954051, 7.289892514582782], [0.0, 8.999867301954051, 9.999867301954051, 8.999880571758647, 8.099892514582782]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486697337812055, 3.874117826812054, 4.304585036812053, 4.782881936812054, 5.314322936812055], [3.13802760403085, 3.4867060441308486, 4.782881936812054, 5.314322936812055, 5.904812936812053], [2.824224843627765, 2.5418023592649885, 9.999880571758647, 5.904812936812053, 6.560912936812054], [2.5418023592649885, 9.999880571758647, 9.999880571758647, 9.999892514582783, 7.289912936812055], [2.28762212333849, 8.999892514582783, 9.999892514582783, 8.999903263124505, 8.099912936812055]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [109.99999926677684, 19.000527406162277, 8.999999920397968, 7.28999994197012, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.00011933979465084121]}, "tpi": {"3": {"frames": [{"V": [[-2.71, -2.439, 0.0, -0.81, -0.7290000000000001], [0.0, -2.1951, -27.1, -1.71, -2.71], [0.0, -27.1, -34.39, -40.951, -2.71], [0.0, -27.1, 0.0, -36.8559, -2.71], [0.0, 0.0, 0.0, -43.17031, -2.71]], "policy": [[1, 3, 4, 2, 4], [1, 2, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, -0.5314410000000002], [0.0, 0.0, 0.0, 0.0, -0.47829690000000014], [0.0, 0.0, 2.71, 0.0, -0.43046721000000016], [0.0, 2.71, 2.71, 3.439, -0.38742048900000015], [0.0, 0.0, 3.439, 3.0951, -0.34867844010000015]], "policy": [[1, 2, 2, 1, 2], [0, 0, 0, 0, 2], [0, 2, 1, 0, 2], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 4.68559, 0.0, 0.0], [0.0, 4.68559, 4.68559, 5.217031, 3.415795110000001], [0.0, 4.217031, 5.217031, 4.6953279000000006, 4.225795110000001]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 6.12579511, 0.0, 3.73670463519], [0.0, 6.12579511, 6.12579511, 6.5132155990000005, 4.465704635190001], [0.0, 5.5132155990000005, 6.5132155990000005, 5.861894039100001, 5.275704635190001]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 3.255498679053511], [0.0, 0.0, 0.0, 0.0, 3.845988679053511], [0.0, 0.0, 7.175704635190001, 3.845988679053511, 4.502088679053511], [0.0, 7.175704635190001, 7.175704635190001, 7.458134171671, 5.231088679053511], [0.0, 6.458134171671, 7.458134171671, 6.7123207545039, 6.0410886790535105]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 3.2820226470300096, 3.8134636470300096], [0.0, 0.0, 0.0, 3.8134636470300096, 4.40395364703001], [0.0, 0.0, 7.94108867905351, 4.40395364703001, 5.060053647030009], [0.0, 7.94108867905351, 7.94108867905351, 8.14697981114816, 5.789053647030009], [0.0, 7.146979811148159, 8.14697981114816, 7.332281830033344, 6.59905364703001]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 3.210482208684877, 3.6887791086848765, 4.220220108684877], [0.0, 0.0, 3.6887791086848765, 4.220220108684877, 4.810710108684877], [0.0, 0.0, 8.49905364703001, 4.810710108684877, 5.466810108684879], [0.0, 8.49905364703001, 8.49905364703001, 8.649148282327008, 6.195810108684877], [0.0, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 7.0058101086848765]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.0765404592312757, 3.507007669231276, 3.9853045692312765, 4.516745569231276], [0.0, 2.7688864133081483, 3.9853045692312765, 4.516745569231276, 5.107235569231276], [0.0, 0.0, 8.905810108684877, 5.107235569231276, 5.763335569231275], [0.0, 8.905810108684877, 8.905810108684877, 9.01522909781639, 6.492335569231276], [0.0, 8.01522909781639, 9.01522909781639, 8.113706188034751, 7.302335569231276]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[2.905287030969601, 3.2927075199696, 3.7231747299696005, 4.2014716299696, 4.732912629969601], [2.614758327872641, 2.96343676797264, 4.2014716299696, 4.732912629969601, 5.323402629969601], [2.3532824950853772, 2.1179542455768394, 9.202335569231277, 5.323402629969601, 5.979502629969602], [2.1179542455768394, 9.202335569231277, 9.202335569231277, 9.28210201230815, 6.708502629969601], [1.9061588210191556, 8.28210201230815, 9.28210201230815, 8.353891811077334, 7.518502629969601]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [52.17030992835817, 8.999999920397968, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.7976643423220207], "backups": 900}, "9": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, -6.12579511], [-4.225795110000001, 0.0, 0.0, -10.0, -5.5132155990000005], [-5.12579511, 0.0, -61.2579511, -9.0, -4.961894039100001], [-6.12579511, -5.5132155990000005, 6.12579511, -8.1, 0.0], [-5.5132155990000005, -61.2579511, 6.5132155990000005, -6.12579511, -5.5132155990000005]], "policy": [[3, 2, 2, 2, 2], [0, 0, 0, 0, 1], [3, 4, 1, 3, 1], [0, 3, 4, 2, 4], [4, 3, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 8.49905364703001, 0.0, 0.0], [0.0, 8.49905364703001, 8.49905364703001, 8.649148282327008, 0.0], [-2.1359326833270087, 7.649148282327009, 8.649148282327008, 7.7842334540943074, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.4185026299696, 0.0, 0.0], [0.0, 9.4185026299696, 9.4185026299696, 9.47665236697264, 0.0], [0.0, 8.47665236697264, 9.47665236697264, 8.528987130275377, 7.67608841724784]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.77471600455061, 0.0, 0.0], [0.0, 9.77471600455061, 9.77471600455061, 9.797244404095549, 7.125767967317395], [0.0, 8.797244404095549, 9.797244404095549, 8.817519963685994, 7.935767967317394]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.912720364319124, 0.0, 6.497373145588642], [0.0, 9.912720364319124, 9.912720364319124, 9.921448327887212, 7.226373145588642], [0.0, 8.921448327887212, 9.921448327887212, 8.929303495098491, 8.036373145588643]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.289759652950422], [0.0, 0.0, 0.0, 0.0, 5.880249652950422], [0.0, 0.0, 9.966186080864777, 5.880249652950422, 6.536349652950423], [0.0, 9.966186080864777, 9.966186080864777, 9.9695674727783, 7.265349652950423], [0.0, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.773418950492036, 5.304859950492035], [0.0, 0.0, 0.0, 5.304859950492035, 5.895349950492034], [0.0, 0.0, 9.986899794913628, 5.895349950492034, 6.551449950492036], [0.0, 9.986899794913628, 9.986899794913628, 9.988209815422264, 7.280449950492034], [0.0, 8.988209815422264, 9.988209815422264, 8.989388833880039, 8.090449950492035]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.300972215149651, 4.77926911514965, 5.31071011514965], [0.0, 0.0, 4.77926911514965, 5.31071011514965, 5.90120011514965], [0.0, 0.0, 9.994924712139438, 5.90120011514965, 6.557300115149651], [0.0, 9.994924712139438, 9.994924712139438, 9.995432240925494, 7.286300115149651], [0.0, 8.995432240925494, 9.995432240925494, 8.995889016832944, 8.09630011514965]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.872771478802034, 4.303238688802034, 4.781535588802035, 5.312976588802035], [0.0, 3.485494330921831, 4.781535588802035, 5.312976588802035, 5.903466588802035], [0.0, 0.0, 9.998033729495246, 5.903466588802035, 6.559566588802035], [0.0, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.288566588802035], [0.0, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.48616736448083, 3.8735878534808297, 4.3040550634808294, 4.782351963480831, 5.31379296348083], [3.137550628032747, 3.486229068132747, 4.782351963480831, 5.31379296348083, 5.904282963480831], [2.8237955652294726, 2.5414160087065256, 9.999153585021714, 5.904282963480831, 6.56038296348083], [2.5414160087065256, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.289382963480829], [2.287274407835873, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [71.2579510115533, 8.099999935522355, 7.28999994197012, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.0008463265315832302], "backups": 2475}, "27": {"frames": [{"V": [[-9.4185026299696, -22.580988417247838, -25.13708841724784, -22.623379575523057, 0.0], [-8.47665236697264, -7.628987130275377, -16.866088417247838, 0.0, 0.0], [-8.4185026299696, -94.185026299696, -94.185026299696, -8.4185026299696, -9.4185026299696], [-9.4185026299696, -94.185026299696, -94.76652366972641, -94.185026299696, -9.4185026299696], [0.0, -47.17067883546652, -52.45361095191987, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [1, 2, 3, 3, 0], [4, 2, 3, 0, 0], [1, 2, 1, 1, 1], [4, 2, 3, 3, 2]]}, {"V": [[-0.4895337138921334, -0.44058034250292005, -0.3965223082526281, 0.0, 0.0], [-0.4895337138921334, -0.44058034250292005, 0.0, 0.0, 0.0], [-0.4895337138921334, -0.44058034250292005, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 0, 0], [1, 4, 1, 0, 0], [1, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, -0.02561963104525413, 9.4185026299696, 0.0, 0.0], [0.0, 9.4185026299696, 9.4185026299696, 9.47665236697264, 0.0], [0.0, 0.0, 9.47665236697264, 8.528987130275377, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.966186080864777, 0.0, 0.0], [0.0, 9.966186080864777, 9.966186080864777, 9.9695674727783, 0.0], [0.0, 8.9695674727783, 9.9695674727783, 8.97261072550047, 8.075349652950424]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.998033729495246, 0.0, 0.0], [0.0, 9.998033729495246, 9.998033729495246, 9.998230356545722, 7.288566588802035], [0.0, 8.998230356545722, 9.998230356545722, 8.99840732089115, 8.098566588802036]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999153585021714, 0.0, 6.56038296348083], [0.0, 9.999153585021714, 9.999153585021714, 9.999238226519543, 7.289382963480829], [0.0, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.313960180377525], [0.0, 0.0, 0.0, 0.0, 5.904450180377525], [0.0, 0.0, 9.99938296348083, 5.904450180377525, 6.5605501803775255], [0.0, 9.99938296348083, 9.99938296348083, 9.999444667132748, 7.2895501803775264], [0.0, 8.999444667132748, 9.999444667132748, 8.999500200419472, 8.099550180377525]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.782604646105796, 5.3140456461057965], [0.0, 0.0, 0.0, 5.3140456461057965, 5.9045356461057965], [0.0, 0.0, 9.999500200419472, 5.9045356461057965, 6.560635646105796], [0.0, 9.999500200419472, 9.999500200419472, 9.999550180377526, 7.289635646105795], [0.0, 8.999550180377526, 9.999550180377526, 8.999595162339773, 8.099635646105796]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.304376973345695, 4.782673873345695, 5.314114873345695], [0.0, 0.0, 4.782673873345695, 5.314114873345695, 5.904604873345694], [0.0, 0.0, 9.999595162339773, 5.904604873345694, 6.560704873345695], [0.0, 9.999595162339773, 9.999595162339773, 9.999635646105796, 7.289704873345695], [0.0, 8.999635646105796, 9.999635646105796, 8.999672081495216, 8.099704873345695]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.8739658374100134, 4.304433047410013, 4.7827299474100124, 5.3141709474100125], [0.0, 3.4865692536690123, 4.7827299474100124, 5.3141709474100125, 5.904660947410013], [0.0, 0.0, 9.999672081495216, 5.904660947410013, 6.560760947410014], [0.0, 9.999672081495216, 9.999672081495216, 9.999704873345696, 7.289760947410015], [0.0, 8.999704873345696, 9.999704873345696, 8.999734386011127, 8.099760947410015]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.486590768402111, 3.87401125740211, 4.30447846740211, 4.782775367402111, 5.3142163674021115], [3.1379316915618998, 3.4866101316618994, 4.782775367402111, 5.3142163674021115, 5.904706367402112], [2.82413852240571, 2.541724670165139, 9.999734386011127, 5.904706367402112, 6.560806367402113], [2.541724670165139, 9.999734386011127, 9.999734386011127, 9.999760947410016, 7.289806367402113], [2.287552203148625, 8.999760947410016, 9.999760947410016, 8.999784852669015, 8.099806367402113]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [104.76652358127971, 9.999999920397968, 8.999999920397968, 7.28999994197012, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.00026552554217040836], "backups": 4125}, "81": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, -9.998033729495246], [0.0, 0.0, -99.98033729495245, 0.0, 0.0], [0.0, -99.9823035654572, -99.9823035654572, -99.98407320891148, 0.0], [0.0, -10.0, -19.0, -99.98033729495245, -99.9823035654572], [-9.998033729495246, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 0, 0], [0, 2, 1, 1, 0], [0, 3, 3, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.998033729495246, 0.0, 0.0], [0.0, 9.998033729495246, 9.998033729495246, 9.998230356545722, 0.0], [0.0, 0.0, 9.998230356545722, 8.99840732089115, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999153585021714, 0.0, 0.0], [0.0, 9.999153585021714, 9.999153585021714, 9.999238226519543, 0.0], [0.0, 8.999238226519543, 9.999238226519543, 8.999314403867588, 8.09938296348083]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999314403867588, 0.0, 0.0], [0.0, 9.999314403867588, 9.999314403867588, 9.99938296348083, 7.289500200419472], [0.0, 8.99938296348083, 9.99938296348083, 8.999444667132748, 8.099500200419474]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.999444667132748, 0.0, 6.560595162339774], [0.0, 9.999444667132748, 9.999444667132748, 9.999500200419472, 7.289595162339773], [0.0, 8.999500200419472, 9.999500200419472, 8.999550180377526, 8.099595162339773]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 5.314114873345695], [0.0, 0.0, 0.0, 0.0, 5.904604873345694], [0.0, 0.0, 9.999595162339773, 5.904604873345694, 6.560704873345695], [0.0, 9.999595162339773, 9.999595162339773, 9.999635646105796, 7.289704873345695], [0.0, 8.999635646105796, 9.999635646105796, 8.999672081495216, 8.099704873345695]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.7827299474100124, 5.3141709474100125], [0.0, 0.0, 0.0, 5.3141709474100125, 5.904660947410013], [0.0, 0.0, 9.999672081495216, 5.904660947410013, 6.560760947410014], [0.0, 9.999672081495216, 9.999672081495216, 9.999704873345696, 7.289760947410015], [0.0, 8.999704873345696, 9.999704873345696, 8.999734386011127, 8.099760947410015]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.30447846740211, 4.782775367402111, 5.3142163674021115], [0.0, 0.0, 4.782775367402111, 5.3142163674021115, 5.904706367402112], [0.0, 0.0, 9.999734386011127, 5.904706367402112, 6.560806367402113], [0.0, 9.999734386011127, 9.999734386011127, 9.999760947410016, 7.289806367402113], [0.0, 8.999760947410016, 9.999760947410016, 8.999784852669015, 8.099806367402113]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.8740480475957106, 4.30451525759571, 4.7828121575957105, 5.3142531575957115], [0.0, 3.4866432428361396, 4.7828121575957105, 5.3142531575957115, 5.904743157595712], [0.0, 0.0, 9.999784852669015, 5.904743157595712, 6.560843157595712], [0.0, 9.999784852669015, 9.999784852669015, 9.999806367402114, 7.289843157595712], [0.0, 8.999806367402114, 9.999806367402114, 8.999825730661902, 8.099843157595712]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4866573586525256, 3.8740778476525257, 4.304545057652526, 4.782841957652527, 5.314282957652527], [3.1379916227872733, 3.4866700628872733, 4.782841957652527, 5.314282957652527, 5.9047729576525265], [2.824192460508546, 2.5417732144576917, 9.999825730661902, 5.9047729576525265, 6.560872957652527], [2.5417732144576917, 9.999825730661902, 9.999825730661902, 9.999843157595713, 7.289872957652528], [2.2875958930119227, 8.999843157595713, 9.999843157595713, 8.999858841836142, 8.099872957652527]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [109.9823034770105, 9.999999920397968, 8.999999920397968, 7.28999994197012, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.00017418089139553672], "backups": 4975}, "adaptive": {"frames": [{"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, -10.0, -19.0, 0.0], [0.0, -10.0, 0.0, 0.0, 0.0], [0.0, 0.0, -10.0, 0.0, 0.0], [-10.0, -1.0, -8.0, -1.0, 0.0]], "policy": [[1, 2, 2, 2, 1], [0, 0, 0, 0, 0], [0, 2, 3, 3, 0], [0, 2, 1, 0, 0], [0, 1, 3, 3, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, -0.81, 0.0, 0.0], [0.0, -2.71, 0.0, 0.0, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 2, 0, 2, 0]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 1.2439, 0.0, 0.0], [0.0, 1.2439, 1.2439, 2.11951, 0.0], [0.0, 0.0, 2.11951, 1.907559, 0.0]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 0], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 8.685756363875946, 0.0, 0.0], [0.0, 8.685756363875946, 8.685756363875946, 8.817180727488353, 0.0], [0.0, 7.817180727488352, 8.817180727488353, 7.935462654739518, 7.141916389265567]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 0], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 8.935462654739517, 0.0, 0.0], [0.0, 8.935462654739517, 8.935462654739517, 9.041916389265566, 6.513952275305109], [0.0, 8.041916389265566, 9.041916389265566, 8.137724750339009, 7.323952275305109]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 0], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 9.137724750339009, 0.0, 5.932401342997139], [0.0, 9.137724750339009, 9.137724750339009, 9.223952275305109, 6.661401342997138], [0.0, 8.223952275305109, 9.223952275305109, 8.3015570477746, 7.471401342997139]], "policy": [[1, 2, 2, 1, 1], [0, 0, 0, 0, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 0.0, 4.8561615790449135], [0.0, 0.0, 0.0, 0.0, 5.446651579044915], [0.0, 0.0, 9.371401342997139, 5.446651579044915, 6.102751579044915], [0.0, 9.371401342997139, 9.371401342997139, 9.434261208697425, 6.831751579044914], [0.0, 8.434261208697425, 9.434261208697425, 8.490835087827683, 7.641751579044915]], "policy": [[1, 2, 2, 3, 1], [0, 0, 0, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 0.0, 4.4117877790263815, 4.943228779026382], [0.0, 0.0, 0.0, 4.943228779026382, 5.533718779026381], [0.0, 0.0, 9.490835087827683, 5.533718779026381, 6.189818779026382], [0.0, 9.490835087827683, 9.490835087827683, 9.541751579044915, 6.918818779026382], [0.0, 8.541751579044915, 9.541751579044915, 8.587576421140424, 7.728818779026382]], "policy": [[1, 2, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 0.0, 4.004015311011369, 4.482312211011369, 5.01375321101137], [0.0, 0.0, 4.482312211011369, 5.01375321101137, 5.60424321101137], [0.0, 0.0, 9.587576421140424, 5.60424321101137, 6.26034321101137], [0.0, 9.587576421140424, 9.587576421140424, 9.628818779026382, 6.989343211011369], [0.0, 8.628818779026382, 9.628818779026382, 8.665936901123745, 7.7993432110113705]], "policy": [[1, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[0.0, 3.630672890919209, 4.061140100919209, 4.539437000919209, 5.07087800091921], [0.0, 3.2676056018272885, 4.539437000919209, 5.07087800091921, 5.661368000919209], [0.0, 0.0, 9.665936901123745, 5.661368000919209, 6.31746800091921], [0.0, 9.665936901123745, 9.665936901123745, 9.69934321101137, 7.046468000919211], [0.0, 8.69934321101137, 9.69934321101137, 8.729408889910234, 7.856468000919211]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.2895234817445593, 3.6769439707445595, 4.107411180744561, 4.58570808074456, 5.11714908074456], [2.9605711335701033, 3.3092495736701038, 4.58570808074456, 5.11714908074456, 5.707639080744562], [2.664514020213093, 2.398062618191784, 9.729408889910234, 5.707639080744562, 6.363739080744561], [2.398062618191784, 9.729408889910234, 9.729408889910234, 9.756468000919211, 7.092739080744561], [2.1582563563726054, 8.756468000919211, 9.756468000919211, 8.78082120082729, 7.902739080744562]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, {"V": [[3.4861840861705, 3.8736045751705004, 4.304071785170501, 4.782368685170501, 5.313809685170503], [3.1375656775534497, 3.48624411765345, 4.782368685170501, 5.313809685170503, 5.904299685170501], [2.8238091097981046, 2.541428198818294, 9.999176522867629, 5.904299685170501, 6.560399685170503], [2.541428198818294, 9.999176522867629, 9.999176522867629, 9.999258870580865, 7.2893996851705], [2.2872853789364647, 8.999258870580865, 9.999258870580865, 8.999332983522779, 8.099399685170502]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}], "errors": [24.314409957696217, 11.70999992039797, 8.999999920397968, 7.28999994197012, 6.560999947773108, 5.904899952995797, 5.314409957696218, 4.7829689619265965, 3.874204859160543, 3.4867843732444888, 0.2705910216430638, 0.000823388685669002], "backups": 2625}}, "q_learning": {"0.1": {"V": [[3.4867322481305996, 3.874202767631671, 4.304672080793843, 4.782968999790902, 4.943095700863305], [2.82367001059643, 2.7905875894306424, 3.3872539452586263, 5.3144099999985155, 5.904899999999979], [1.7770964011686108, 0.6319006256383184, 9.999999999999993, 4.7745768528487975, 6.5609999999999955], [0.46344543133202604, 9.999999999999993, 9.999999999999995, 9.999999999999993, 7.2899999999999965], [0.0032282510464752665, 8.72184483415067, 9.999999999999995, 8.999999999999995, 8.099999999999996]], "policy": [[3, 3, 3, 1, 1], [0, 0, 0, 3, 1], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, "0.2": {"V": [[3.486784400999715, 3.874204889999995, 4.304672099999997, 4.782968999999998, 5.314409999999998], [3.1381054810305247, 2.7566624134362976, 4.773032041916798, 5.314409999159211, 5.904899999999998], [2.824231881401621, 2.5334013118374905, 9.999999999999993, 4.782910530704341, 6.560999999999997], [2.518725738807576, 9.999999999999993, 9.999999999999995, 9.999999999999993, 7.2899999999999965], [1.333212174508685, 8.999997913400982, 9.999999999999995, 8.999999999999995, 8.099999999999996]], "policy": [[3, 3, 3, 3, 1], [0, 2, 3, 3, 1], [0, 2, 1, 0, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}, "0.5": {"V": [[3.4867844009999955, 3.8742048899999952, 4.304672099999995, 4.782968999999994, 5.2543378779744145], [3.1381059608999955, 3.486784400619197, 4.782968999999993, 5.314409999999994, 5.904899999999898], [2.8242953648099953, 2.5418658283157813, 9.999999999999993, 5.904899999999994, 6.560999999999995], [2.541865828030875, 9.999999999999993, 9.999999999999995, 9.999999999999993, 7.289999999999995], [2.287237927482108, 8.999999999999993, 9.999999999999995, 8.999999999999995, 8.099999999999994]], "policy": [[3, 3, 3, 1, 1], [0, 0, 3, 1, 1], [0, 2, 1, 3, 1], [0, 3, 4, 2, 1], [0, 3, 0, 2, 2]]}}, "td_linear": {"poly_1": {"V": [[-25.018447311054782, -23.31574128089649, -21.613035250738193, -19.9103292205799, -18.207623190421607], [-26.569757077941702, -24.86705104778341, -23.164345017625113, -21.46163898746682, -19.758932957308527], [-28.121066844828622, -26.41836081467033, -24.715654784512033, -23.01294875435374, -21.310242724195447], [-29.672376611715542, -27.96967058155725, -26.266964551398953, -24.56425852124066, -22.861552491082367], [-31.22368637860246, -29.52098034844417, -27.818274318285873, -26.115568288127577, -24.412862257969287]]}, "poly_2": {"V": [[-19.444371928555768, -23.69857742426091, -24.138054538280414, -20.762803270614285, -13.572823621262522], [-24.428636357918357, -28.56518626343922, -28.887007787274438, -25.394100929424027, -18.08646568988798], [-27.545462705441246, -31.564357020777816, -31.76852295442876, -28.15796050639407, -20.73266967667374], [-28.79485097112444, -32.69608969627673, -32.78260003974339, -29.054382001524413, -21.511435581619804], [-28.176801154967936, -31.960384289935938, -31.92923904321832, -28.083365414815063, -20.42276340472617]]}, "poly_3": {"V": [[-20.761294243938853, -24.59968000657787, -24.20823315709735, -20.21401604605211, -13.244091023996978], [-24.941017481112322, -28.976537536745347, -28.723002486775908, -24.807474681758826, -17.857016472248933], [-28.083964138339663, -32.177603917608515, -31.922966097791985, -27.947113029444896, -20.87710706312206], [-29.78915232180262, -33.801897255349154, -33.40714209632736, -29.231949195292085, -21.903380902798148], [-29.65560013768299, -33.448435656148995, -32.77454858856379, -28.261001285482163, -20.53485609745895]]}, "fourier_1": {"V": [[-21.9221933266768, -21.826963952291592, -21.59705990511451, -21.36715585793743, -21.271926483552217], [-23.768575343662533, -25.461049589561938, -25.231145542384855, -23.213537874923162, -20.590113795227964], [-28.226135850391277, -29.91861009629068, -27.901002428828985, -23.355200056057306, -18.944072356077495], [-32.68369635712002, -32.588466982734815, -28.04266460996313, -21.709158616906837, -17.298030916927026], [-34.530078374105756, -31.906654294410558, -25.573148301354262, -19.23964230829797, -16.616218228602772]]}, "fourier_2": {"V": [[-19.20088779347083, -22.333597020798752, -24.479509211835044, -18.96446119618232, -14.43621021682122], [-22.966332316446454, -27.03383964692586, -29.059134996136986, -22.61543590705334, -17.33863162296013], [-29.293933704420784, -33.69111201899668, -34.343615498575794, -26.701075278838395, -21.5530304125864], [-31.714083033852415, -34.732322449075724, -33.54918164761121, -26.029253815994466, -21.81800259918944], [-31.57207549828532, -32.30438280654336, -30.79971359699841, -24.66686724075028, -20.770997402305124]]}, "fourier_3": {"V": [[-20.65733542829557, -25.707766331784015, -22.925621426121197, -14.494675697508363, -13.896305778046798], [-19.96880389214628, -26.72339781630004, -25.787262834658147, -18.35914936280867, -14.771039620320117], [-23.266985186239534, -32.09648724209516, -28.60781594064375, -24.15746191253653, -18.688520203446867], [-26.686659350696655, -30.256629809314095, -29.422007001899676, -25.315644277876277, -20.230304892575088], [-26.11962068491123, -25.918343955434544, -26.804162423644676, -23.31030023109069, -18.729342840849885]]}}}};
\ No newline at end of file
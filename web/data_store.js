@@ -0,0 +1,113 @@
+// Data access for the dashboard.
+// Prefers the chunked export written by `generate_web_data.py --format binary`
+// (data/manifest.json plus typed-array chunks fetched lazily per
+// reward/algorithm). Falls back to the legacy single-file data.js (RL_DATA),
+// e.g. when the page is opened from disk and fetch() is unavailable.
+
+// Uniform view over one experiment:
+//   length       number of frames (1 for Q-learning / TD snapshots)
+//   errors       convergence errors (frames experiments only)
+//   backups      Bellman backups performed, if the experiment reports them
+//   frame(i)     {V, policy} as row-indexable grids (policy may be null)
+class ChunkEntry {
+    constructor(meta, values, policy, rows, cols) {
+        this.length = meta.frames;
+        this.errors = meta.errors || [];
+        this.backups = meta.backups ?? null;
+        this.values = values;
+        this.policy = policy;
+        this.rows = rows;
+        this.cols = cols;
+    }
+
+    frame(i) {
+        const size = this.rows * this.cols;
+        const grid = (arr) => Array.from({length: this.rows},
+            (_, r) => arr.subarray(i * size + r * this.cols, i * size + (r + 1) * this.cols));
+        return {
+            V: grid(this.values),
+            policy: this.policy ? grid(this.policy) : null
+        };
+    }
+}
+
+class LegacyEntry {
+    constructor(node) {
+        this.node = node;
+        this.length = node.frames ? node.frames.length : 1;
+        this.errors = node.errors || [];
+        this.backups = node.backups ?? null;
+    }
+
+    frame(i) {
+        const f = this.node.frames ? this.node.frames[i] : this.node;
+        return {V: f.V, policy: f.policy || null};
+    }
+}
+
+function loadScript(src) {
+    return new Promise((resolve, reject) => {
+        const el = document.createElement('script');
+        el.src = src;
+        el.onload = resolve;
+        el.onerror = reject;
+        document.head.appendChild(el);
+    });
+}
+
+const DataStore = {
+    manifest: null,
+    legacy: null,
+    chunks: {},
+
+    // Returns the environment layout, or null if the data does not carry one.
+    async init() {
+        try {
+            const resp = await fetch('data/manifest.json');
+            if (resp.ok) {
+                this.manifest = await resp.json();
+                return this.manifest.env;
+            }
+        } catch (e) {
+            // No server (file://) or no binary export; use data.js below
+        }
+        await loadScript('data.js');
+        this.legacy = RL_DATA;
+        return RL_DATA.env || null;
+    },
+
+    async fetchChunk(name, ArrayType) {
+        if (!(name in this.chunks)) {
+            this.chunks[name] = fetch('data/' + name)
+                .then(resp => resp.arrayBuffer())
+                .then(buf => new ArrayType(buf));
+        }
+        return this.chunks[name];
+    },
+
+    // Whether an experiment was exported, e.g. has('-1', 'tpi', 'adaptive').
+    // Data files written by older versions of generate_web_data.py lack
+    // some of the entries the page offers.
+    has(...path) {
+        let node = this.legacy || this.manifest.entries;
+        for (const key of path) {
+            if (node == null || !(key in node)) return false;
+            node = node[key];
+        }
+        return true;
+    },
+
+    // getEntry('-1', 'tpi', '9') -> ChunkEntry / LegacyEntry
+    async getEntry(...path) {
+        if (this.legacy) {
+            return new LegacyEntry(path.reduce((node, key) => node[key], this.legacy));
+        }
+        const meta = path.reduce((node, key) => node[key], this.manifest.entries);
+        const [values, policy] = await Promise.all([
+            this.fetchChunk(meta.values, Float32Array),
+            meta.policy ? this.fetchChunk(meta.policy, Uint8Array) : null
+        ]);
+        const env = this.manifest.env;
+        return new ChunkEntry(meta, values, policy, env.rows, env.cols);
+    }
+};
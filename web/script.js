@@ -6,23 +6,35 @@ let currentQEps = "0.1";
 let currentTD = "poly_1";
 let convergenceChart = null;
 
-// Environment Constants (0-indexed)
-const ROWS = 5;
-const COLS = 5;
-const FORBIDDEN = [
-    [1, 1], [1, 2], 
-    [2, 2], 
-    [3, 1], [3, 3], 
-    [4, 1]
-];
-const TARGET = [3, 2];
+// Environment Layout (0-indexed)
+// Read from the generated data; falls back to the 5x5 homework map for older data files.
+const DEFAULT_ENV = {
+    rows: 5,
+    cols: 5,
+    forbidden: [
+        [1, 1], [1, 2], 
+        [2, 2], 
+        [3, 1], [3, 3], 
+        [4, 1]
+    ],
+    targets: [[3, 2]]
+};
+let ROWS, COLS, FORBIDDEN, TARGETS;
 
 // Action Map
 const ACTIONS = ['↑', '↓', '←', '→', '•']; // up, down, left, right, stay
 const ACTION_DIRS = [[-1, 0], [1, 0], [0, -1], [0, 1], [0, 0]];
 
 // Initialization
-window.onload = function() {
+window.onload = async function() {
+    const env = (await DataStore.init()) || DEFAULT_ENV;
+    ROWS = env.rows;
+    COLS = env.cols;
+    FORBIDDEN = env.forbidden;
+    TARGETS = env.targets;
+    customPolicy = Array(ROWS).fill().map(() => Array(COLS).fill(0)); // 0=Up default
+    
+    hideMissingTabs();
     renderEnvGrid();
     renderPolicyGrid(); // Initial random policy
     updateOptimalityView();
@@ -40,9 +52,21 @@ function showModule(modId) {
     event.target.classList.add('active');
 }
 
+// Tabs whose experiment is missing from the loaded data are hidden
+const TAB_GROUPS = [['.tpi-k-tab', 'tpi'], ['.q-tab', 'q_learning'], ['.td-tab', 'td_linear']];
+
+function hideMissingTabs() {
+    for (const [selector, algo] of TAB_GROUPS) {
+        document.querySelectorAll(selector).forEach(el => {
+            el.classList.toggle('hidden', !DataStore.has(currentReward, algo, el.dataset.key));
+        });
+    }
+}
+
 // Reward
 function updateReward(val) {
     currentReward = val;
+    hideMissingTabs();
     // Reset views
     updateOptimalityView();
     renderConvergenceChart();
@@ -56,12 +80,17 @@ function isForbidden(r, c) {
 }
 
 function isTarget(r, c) {
-    return TARGET[0] === r && TARGET[1] === c;
+    return TARGETS.some(([tr, tc]) => tr === r && tc === c);
+}
+
+function prepareGrid(container) {
+    container.innerHTML = '';
+    container.style.gridTemplateColumns = `repeat(${COLS}, 50px)`;
 }
 
 function renderEnvGrid() {
     const container = document.getElementById('env-grid');
-    container.innerHTML = '';
+    prepareGrid(container);
     
     for (let r = 0; r < ROWS; r++) {
         for (let c = 0; c < COLS; c++) {
@@ -79,7 +108,7 @@ function renderEnvGrid() {
 // Generic Grid Renderer
 function renderGrid(containerId, data, type) {
     const container = document.getElementById(containerId);
-    container.innerHTML = '';
+    prepareGrid(container);
     
     // Find min/max for heatmap
     let minVal = Infinity, maxVal = -Infinity;
@@ -146,35 +175,34 @@ function switchTPIK(k) {
     }
 }
 
-function updateOptimalityView() {
-    let dataObj;
+async function updateOptimalityView() {
+    let entry;
     if (currentOptAlgo === 'tpi') {
-        dataObj = RL_DATA[currentReward]['tpi'][currentTPIK];
+        entry = await DataStore.getEntry(currentReward, 'tpi', currentTPIK);
     } else {
-        dataObj = RL_DATA[currentReward][currentOptAlgo];
+        entry = await DataStore.getEntry(currentReward, currentOptAlgo);
     }
     
-    const frames = dataObj.frames;
     const slider = document.getElementById('iter-slider');
     const display = document.getElementById('iter-display');
     
     // Update slider range
-    slider.max = frames.length - 1;
+    slider.max = entry.length - 1;
     
     // If current value is out of bounds, reset
-    if (parseInt(slider.value) >= frames.length) {
-        slider.value = frames.length - 1;
+    if (parseInt(slider.value) >= entry.length) {
+        slider.value = entry.length - 1;
     }
     
     const idx = parseInt(slider.value);
     display.innerText = idx;
     
-    const frame = frames[idx];
+    const frame = entry.frame(idx);
     renderGrid('opt-value-grid', frame.V, 'value');
     renderGrid('opt-policy-grid', frame.policy, 'policy');
 }
 
-function renderConvergenceChart() {
+async function renderConvergenceChart() {
     const ctx = document.getElementById('convergenceChart').getContext('2d');
     
     // Prepare datasets
@@ -183,8 +211,10 @@ function renderConvergenceChart() {
     // So let's show: PI (baseline) and TPI (current k).
     // Maybe VI too for context.
     
-    const piData = RL_DATA[currentReward]['pi'].errors;
-    const tpiData = RL_DATA[currentReward]['tpi'][currentTPIK].errors;
+    const piData = (await DataStore.getEntry(currentReward, 'pi')).errors;
+    const tpiEntry = await DataStore.getEntry(currentReward, 'tpi', currentTPIK);
+    const tpiData = tpiEntry.errors;
+    const tpiBackups = tpiEntry.backups !== null ? `, ${tpiEntry.backups} backups` : '';
     
     // Labels (Iterations) - use the max length
     const maxLen = Math.max(piData.length, tpiData.length);
@@ -199,7 +229,7 @@ function renderConvergenceChart() {
             tension: 0.1
         },
         {
-            label: `Truncated PI (k=${currentTPIK})`,
+            label: `Truncated PI (k=${currentTPIK}${tpiBackups})`,
             data: tpiData,
             borderColor: '#ffc107',
             backgroundColor: 'rgba(255, 193, 7, 0.1)',
@@ -253,8 +283,8 @@ function switchQTab(eps) {
     updateQView();
 }
 
-function updateQView() {
-    const data = RL_DATA[currentReward]['q_learning'][currentQEps];
+async function updateQView() {
+    const data = (await DataStore.getEntry(currentReward, 'q_learning', currentQEps)).frame(0);
     renderGrid('q-value-grid', data.V, 'value');
     renderGrid('q-policy-grid', data.policy, 'policy');
 }
@@ -267,19 +297,19 @@ function switchTDTab(key) {
     updateTDView();
 }
 
-function updateTDView() {
-    const data = RL_DATA[currentReward]['td_linear'][currentTD];
+async function updateTDView() {
+    const data = (await DataStore.getEntry(currentReward, 'td_linear', currentTD)).frame(0);
     // renderGrid('td-value-grid', data.V, 'value'); // Old 2D grid
-    renderTD3DPlot(data.V);
+    renderTD3DPlot(data.V.map(row => Array.from(row)));
 }
 
 function renderTD3DPlot(zData) {
-    // zData is a 5x5 2D array
-    // Rows are y (0 to 4), Cols are x (0 to 4)
+    // zData is a ROWS x COLS 2D array
+    // Rows are y (0 to ROWS-1), Cols are x (0 to COLS-1)
     
     // Create 1-based coordinates
-    const x = [1, 2, 3, 4, 5];
-    const y = [1, 2, 3, 4, 5];
+    const x = Array.from({length: COLS}, (_, i) => i + 1);
+    const y = Array.from({length: ROWS}, (_, i) => i + 1);
     
     const data = [{
         z: zData,
@@ -314,13 +344,13 @@ function renderTD3DPlot(zData) {
         scene: {
             xaxis: { 
                 title: 'Col',
-                tickvals: [1, 2, 3, 4, 5],
-                ticktext: ['1', '2', '3', '4', '5']
+                tickvals: x,
+                ticktext: x.map(String)
             },
             yaxis: { 
                 title: 'Row',
-                tickvals: [1, 2, 3, 4, 5],
-                ticktext: ['1', '2', '3', '4', '5'],
+                tickvals: y,
+                ticktext: y.map(String),
                 autorange: 'reversed' // Row 1 at top/back, Row 5 at bottom/front
             },
             zaxis: { title: 'Value' },
@@ -334,11 +364,11 @@ function renderTD3DPlot(zData) {
 }
 
 // Policy Module Logic (Interactive)
-let customPolicy = Array(ROWS).fill().map(() => Array(COLS).fill(0)); // 0=Up default
+let customPolicy = null; // Filled with 0=Up once the map size is known
 
 function renderPolicyGrid() {
     const container = document.getElementById('policy-grid');
-    container.innerHTML = '';
+    prepareGrid(container);
     
     for (let r = 0; r < ROWS; r++) {
         for (let c = 0; c < COLS; c++) {